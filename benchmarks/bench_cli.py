@@ -0,0 +1,195 @@
+"""End-to-end CLI benchmark against the fake `obsidian` binary.
+
+Generates a synthetic vault, installs the stand-in executable from
+`aiobsidian.testing`, and drives every `aiobsidian.cli` resource
+through real `obsidian` subprocesses at several concurrency levels.
+Reports throughput and latency percentiles (queue time included) per
+operation. Runs offline; needs a POSIX shell.
+
+    python benchmarks/bench_cli.py --notes 2000 --ops 40 --concurrency 1 4 16
+    python benchmarks/bench_cli.py --only vault. search. --latency 0.02
+    python benchmarks/bench_cli.py --only vault. random. --read-backend filesystem
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from aiobsidian import CLICall, ObsidianCLI
+from aiobsidian._vaultfs import ReadBackend
+from aiobsidian.testing import generate_vault, write_fake_binary
+
+Operation = Callable[[ObsidianCLI, str, int], Awaitable[Any]]
+
+# (name, operation); operations get a random note path and a sequence number.
+SCENARIOS: list[tuple[str, Operation]] = [
+    ("vault.read", lambda cli, path, i: cli.vault.read(path)),
+    ("vault.list", lambda cli, path, i: cli.vault.list(folder="folder-01")),
+    ("vault.file_info", lambda cli, path, i: cli.vault.file_info(path)),
+    ("vault.folders", lambda cli, path, i: cli.vault.folders()),
+    ("vault.wordcount", lambda cli, path, i: cli.vault.wordcount(path)),
+    ("vault.info", lambda cli, path, i: cli.vault.info()),
+    ("vault.read_many", lambda cli, path, i: cli.vault.read_many([path] * 8)),
+    ("vault.append", lambda cli, path, i: cli.vault.append(_scratch(i), f"line {i}")),
+    ("daily.path", lambda cli, path, i: cli.daily.path()),
+    ("search.query", lambda cli, path, i: cli.search.query("cache", limit=20)),
+    ("search.context", lambda cli, path, i: cli.search.context("vector", limit=20)),
+    ("properties.list", lambda cli, path, i: cli.properties.list(path)),
+    ("properties.read", lambda cli, path, i: cli.properties.read(path, "status")),
+    (
+        "properties.set",
+        lambda cli, path, i: cli.properties.set(_scratch(i), "seen", str(i)),
+    ),
+    ("tags.list", lambda cli, path, i: cli.tags.list(counts=True)),
+    ("tags.get", lambda cli, path, i: cli.tags.get("status/active")),
+    ("links.outgoing", lambda cli, path, i: cli.links.outgoing(path)),
+    ("links.incoming", lambda cli, path, i: cli.links.incoming(path)),
+    ("links.unresolved", lambda cli, path, i: cli.links.unresolved()),
+    ("links.orphans", lambda cli, path, i: cli.links.orphans()),
+    ("links.deadends", lambda cli, path, i: cli.links.deadends()),
+    ("tasks.list", lambda cli, path, i: cli.tasks.list(path="folder-02")),
+    ("outline.get", lambda cli, path, i: cli.outline.get(path)),
+    ("aliases.get", lambda cli, path, i: cli.aliases.get(path)),
+    ("random.read", lambda cli, path, i: cli.random.read()),
+    ("templates.list", lambda cli, path, i: cli.templates.list()),
+    ("bookmarks.list", lambda cli, path, i: cli.bookmarks.list()),
+    ("commands.list", lambda cli, path, i: cli.commands.list()),
+    ("hotkeys.list", lambda cli, path, i: cli.hotkeys.list()),
+    ("plugins.list", lambda cli, path, i: cli.plugins.list()),
+    ("themes.list", lambda cli, path, i: cli.themes.list()),
+    ("snippets.list", lambda cli, path, i: cli.snippets.list()),
+    ("sync.status", lambda cli, path, i: cli.sync.status()),
+    ("publish.list", lambda cli, path, i: cli.publish.list()),
+    ("history.list", lambda cli, path, i: cli.history.list()),
+    ("workspaces.list", lambda cli, path, i: cli.workspaces.list()),
+    ("tabs.list", lambda cli, path, i: cli.tabs.list()),
+    ("bases.list", lambda cli, path, i: cli.bases.list()),
+    ("dev.errors", lambda cli, path, i: cli.dev.errors()),
+    ("system.version", lambda cli, path, i: cli.system.version()),
+    ("web.open", lambda cli, path, i: cli.web.open("https://example.invalid")),
+    ("script.run", lambda cli, path, i: _script(cli, path)),
+    ("snapshot", lambda cli, path, i: _drain(cli.snapshot("folder-03/"))),
+    (
+        "run_many",
+        lambda cli, path, i: cli.run_many(
+            CLICall("outline", params={"file": path}) for _ in range(8)
+        ),
+    ),
+]
+
+
+def _scratch(i: int) -> str:
+    return f"bench/scratch-{i % 8}.md"
+
+
+async def _script(cli: ObsidianCLI, path: str) -> list[Any]:
+    batch = cli.script()
+    batch.read(path)
+    batch.properties(path)
+    batch.links(path)
+    batch.outline(path)
+    return await batch.run()
+
+
+async def _drain(iterator: Any) -> int:
+    return len([item async for item in iterator])
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+async def measure(
+    binary: str,
+    vault: str,
+    operation: Operation,
+    paths: list[str],
+    *,
+    ops: int,
+    concurrency: int,
+    read_backend: ReadBackend,
+) -> tuple[float, list[float]]:
+    cli = ObsidianCLI(
+        vault, binary=binary, max_concurrency=concurrency, read_backend=read_backend
+    )
+    rng = random.Random(0)
+    latencies: list[float] = []
+
+    async def one(i: int) -> None:
+        start = time.perf_counter()
+        await operation(cli, rng.choice(paths), i)
+        latencies.append(time.perf_counter() - start)
+
+    # Untimed warm-up, so one-time setup (e.g. locating the vault for
+    # the filesystem backend) is not charged to the first operations.
+    await operation(cli, paths[0], ops)
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(ops)))
+    return time.perf_counter() - start, latencies
+
+
+async def run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        vault = generate_vault(root / "vaults" / "Bench", notes=args.notes)
+        for i in range(8):
+            (vault / "bench").mkdir(exist_ok=True)
+            (vault / "bench" / f"scratch-{i}.md").write_text("# Scratch\n")
+        binary = write_fake_binary(root / "bin", root / "vaults", latency=args.latency)
+        paths = [
+            p.relative_to(vault).as_posix() for p in sorted(vault.glob("folder-*/*.md"))
+        ]
+
+        print(
+            f"{args.notes} notes, {args.ops} ops per cell, latency={args.latency}s, "
+            f"read backend {args.read_backend}"
+        )
+        print(
+            f"{'operation':<20}{'conc':>5}{'ops/s':>9}"
+            f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        )
+        for name, operation in SCENARIOS:
+            if args.only and not name.startswith(tuple(args.only)):
+                continue
+            for level in args.concurrency:
+                elapsed, samples = await measure(
+                    binary,
+                    "Bench",
+                    operation,
+                    paths,
+                    ops=args.ops,
+                    concurrency=level,
+                    read_backend=args.read_backend,
+                )
+                print(
+                    f"{name:<20}{level:>5}{len(samples) / elapsed:>9.1f}"
+                    f"{statistics.median(samples) * 1e3:>9.1f}"
+                    f"{percentile(samples, 0.95) * 1e3:>9.1f}"
+                    f"{percentile(samples, 0.99) * 1e3:>9.1f}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notes", type=int, default=2000)
+    parser.add_argument("--ops", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--read-backend", choices=["cli", "filesystem"], default="cli")
+    parser.add_argument(
+        "--only", nargs="*", default=[], help="operation name prefixes to run"
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Run time of the link-graph algorithms on a synthetic vault graph.
+
+Generates a directed graph shaped like a note vault (a few hub notes
+collect most links, many notes link to nobody and some to themselves)
+and times building `GraphAnalytics`, PageRank, connected and strongly
+connected components, k-hop neighbourhoods and BFS shortest paths.
+
+    python benchmarks/bench_graph.py --edges 200000
+    python benchmarks/bench_graph.py --notes 100000 --edges 1000000 --queries 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+from aiobsidian.index import GraphAnalytics
+
+
+def make_links(notes: int, edges: int, seed: int) -> dict[str, list[str]]:
+    """`edges` distinct links, half of them biased towards a few hub notes."""
+    rng = random.Random(seed)
+    paths = [f"folder-{i % 40:02d}/note-{i:07d}.md" for i in range(notes)]
+    links: dict[str, set[str]] = {path: set() for path in paths}
+    count = 0
+    while count < edges:
+        source = links[paths[rng.randrange(notes)]]
+        if rng.random() < 0.5:
+            target = paths[rng.randrange(notes)]
+        else:
+            target = paths[min(int(rng.paretovariate(0.6)) - 1, notes - 1)]
+        if target not in source:
+            source.add(target)
+            count += 1
+    return {path: sorted(targets) for path, targets in links.items()}
+
+
+def timed(func: Callable[[], Any], runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def report(label: str, samples: list[float]) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+    print(f"  {label:<24}{statistics.median(samples) * 1e3:>10.2f}{p95 * 1e3:>10.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notes", type=int, default=40_000)
+    parser.add_argument("--edges", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    links = make_links(args.notes, args.edges, args.seed)
+    start = time.perf_counter()
+    graph = GraphAnalytics.from_links(links)
+    built = time.perf_counter() - start
+    print(f"{graph!r}, built in {built:.2f} s")
+
+    rng = random.Random(args.seed)
+    paths = graph.paths
+    pairs = [(rng.choice(paths), rng.choice(paths)) for _ in range(args.queries)]
+    print(f"  {'operation':<24}{'p50 ms':>10}{'p95 ms':>10}")
+    report("pagerank", timed(graph.pagerank, 5))
+    report("components", timed(graph.components, 3))
+    report("strongly_connected", timed(graph.strongly_connected, 3))
+    for hops in (1, 2, 3):
+        samples = [
+            timed(lambda source=source: graph.neighbourhood(source, hops), 1)[0]
+            for source, _ in pairs
+        ]
+        report(f"neighbourhood hops={hops}", samples)
+    samples = [
+        timed(lambda s=source, t=target: graph.shortest_path(s, t), 1)[0]
+        for source, target in pairs
+    ]
+    report("shortest_path", samples)
+    samples = [
+        timed(
+            lambda s=source, t=target: graph.shortest_path(s, t, direction="both"), 1
+        )[0]
+        for source, target in pairs
+    ]
+    report("shortest_path both", samples)
+
+    ranks = graph.pagerank()
+    components = graph.strongly_connected()
+    print(
+        f"  top note {next(iter(ranks))} ({next(iter(ranks.values())):.4f}), "
+        f"largest strong component {len(components[0])} notes"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Cold import time of aiobsidian entry points.
+
+Runs each statement in fresh interpreters with `-X importtime` and
+reports the median cumulative import time of the `aiobsidian` modules
+plus the wall time of the whole process, against a bare interpreter
+as baseline. `--top` lists the slowest modules behind a statement.
+
+    python benchmarks/bench_import.py --runs 20
+    python benchmarks/bench_import.py --top 15 --only cli
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    "package": "import aiobsidian",
+    "cli": "from aiobsidian import ObsidianCLI",
+    "cli+records": "from aiobsidian import ObsidianCLI, TaskRecord",
+    "client": "from aiobsidian import ObsidianClient",
+    "models": "from aiobsidian import NoteJson",
+    "testing": "import aiobsidian.testing",
+}
+
+
+def importtime(statement: str) -> tuple[float, dict[str, tuple[int, bool]]]:
+    """Run `statement` in a fresh interpreter.
+
+    Returns the wall time in seconds and, per imported module, its
+    cumulative import time in microseconds and whether it was imported
+    directly by the statement (rather than by another module).
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+    modules: dict[str, tuple[int, bool]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        modules[name.strip()] = (int(cumulative), not name[1:].startswith(" "))
+    return wall, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=0)
+    parser.add_argument("--only", nargs="*", default=[], choices=sorted(STATEMENTS))
+    args = parser.parse_args()
+
+    runs = [importtime("pass") for _ in range(args.runs)]
+    baseline = statistics.median(wall for wall, _ in runs)
+    startup = set(runs[0][1])
+    print(f"python {sys.version.split()[0]}, bare interpreter {baseline * 1e3:.1f} ms")
+    print(f"{'entry point':<14}{'import ms':>11}{'process ms':>12}{'modules':>9}")
+    for label, statement in STATEMENTS.items():
+        if args.only and label not in args.only:
+            continue
+        walls, totals = [], []
+        modules: dict[str, tuple[int, bool]] = {}
+        for _ in range(args.runs):
+            wall, modules = importtime(statement)
+            walls.append(wall)
+            totals.append(
+                sum(
+                    us
+                    for name, (us, direct) in modules.items()
+                    if direct and name not in startup
+                )
+            )
+        print(
+            f"{label:<14}{statistics.median(totals) / 1e3:>11.1f}"
+            f"{statistics.median(walls) * 1e3:>12.1f}"
+            f"{len(modules.keys() - startup):>9}"
+        )
+        if args.top:
+            ranked = sorted(
+                (
+                    (us, name)
+                    for name, (us, _) in modules.items()
+                    if name not in startup
+                ),
+                reverse=True,
+            )
+            for us, name in ranked[: args.top]:
+                print(f"    {us / 1e3:>8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
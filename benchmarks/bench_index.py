@@ -0,0 +1,383 @@
+"""Build cost, memory and query latency of the in-process vault indexes.
+
+Generates a synthetic vault, builds each index from it and reports the
+build time, retained and peak memory (measured with `tracemalloc` in a
+second build), query latency percentiles and the cost of incremental
+updates. `--compare-cli` runs the same queries once through the fake
+`obsidian` binary for reference.
+
+    python benchmarks/bench_index.py --notes 5000
+    python benchmarks/bench_index.py --notes 20000 --queries 200 --compare-cli
+    python benchmarks/bench_index.py --notes 100000 --only bm25
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from aiobsidian import ObsidianCLI
+from aiobsidian.index import (
+    BM25Index,
+    LinkGraph,
+    PropertyIndex,
+    QuickSwitcher,
+    SearchIndex,
+    TagIndex,
+    TaskIndex,
+    VaultIndex,
+)
+from aiobsidian.testing import generate_vault, write_fake_binary
+
+# (label, SearchIndex.search keyword arguments)
+FULLTEXT_QUERIES: list[tuple[str, dict[str, Any]]] = [
+    ("word", {"query": "cache"}),
+    ("phrase", {"query": "cache index"}),
+    ("two chars", {"query": "ca"}),
+    ("case", {"query": "Section", "case": True}),
+    ("path", {"query": "latency", "path": "folder-03"}),
+    ("limit+matches", {"query": "vector", "limit": 20, "matches": True}),
+    ("no match", {"query": "zyzzyva"}),
+]
+
+# (label, BM25Index.top keyword arguments)
+BM25_QUERIES: list[tuple[str, dict[str, Any]]] = [
+    ("one term", {"query": "cache"}),
+    ("three terms", {"query": "async parser latency"}),
+    ("six terms", {"query": "vector index query graph node edge"}),
+    ("top 100", {"query": "stream buffer", "limit": 100}),
+    ("path", {"query": "cache index", "path": "folder-03"}),
+    ("no match", {"query": "zyzzyva"}),
+]
+
+# (label, QuickSwitcher.match keyword arguments)
+SWITCHER_QUERIES: list[tuple[str, dict[str, Any]]] = [
+    ("name", {"query": "note-01234"}),
+    ("alias", {"query": "N4321"}),
+    ("words", {"query": "folder 07 note 123"}),
+    ("initials", {"query": "f7n123"}),
+    ("two chars", {"query": "n9"}),
+    ("no match", {"query": "zyzzyva"}),
+]
+
+# (label, PropertyIndex.where conditions)
+PROPERTY_QUERIES: list[tuple[str, list[Any]]] = [
+    ("equal", [("status", "==", "active")]),
+    ("equal+range", [("status", "==", "active"), ("priority", ">", 3)]),
+    ("date range", [("created", ">=", "2024-03-01"), ("created", "<", "2024-03-08")]),
+    ("list item", [("tags", "==", "topic/cache")]),
+    ("not equal", [("done", "!=", True), ("priority", "==", 5)]),
+    ("no match", [("status", "==", "zyzzyva")]),
+]
+
+TAG_QUERIES: list[tuple[str, Callable[[TagIndex], Any]]] = [
+    ("get topic", lambda index: index.get("topic")),
+    ("get topic/cache", lambda index: index.get("topic/cache")),
+    ("list", lambda index: index.tags()),
+    ("list by count", lambda index: index.tags(sort="count", counts=True)),
+    ("list folder", lambda index: index.tags(path="folder-01", counts=True)),
+    ("children", lambda index: index.children("topic")),
+]
+
+TASK_QUERIES: list[tuple[str, Callable[[TaskIndex], Any]]] = [
+    ("open", lambda index: index.tasks()),
+    ("all folder", lambda index: index.tasks(path="folder-01", done=True)),
+    ("open tag", lambda index: index.query(completed=False, tag="topic/cache")),
+    (
+        "due range",
+        lambda index: index.query(due_from="2024-03-01", due_to="2024-03-31"),
+    ),
+    ("open by due", lambda index: index.query(completed=False, sort="due", limit=50)),
+]
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+def timed(func: Callable[[], Any], runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def memory(index: VaultIndex) -> tuple[float, float]:
+    """Retained and peak memory of building `index`, in MiB."""
+    tracemalloc.start()
+    try:
+        index.build()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current / 2**20, peak / 2**20
+
+
+def fulltext(vault: Path, args: argparse.Namespace) -> None:
+    index = SearchIndex(vault)
+    index.build()
+    stats = index.stats()
+    retained, peak = memory(SearchIndex(vault))
+    print(
+        f"fulltext: {stats.files} notes, {stats.characters / 2**20:.1f} MiB text, "
+        f"{stats.grams} trigrams, {stats.postings} positions"
+    )
+    print(
+        f"  build {stats.build_time:.2f} s "
+        f"({stats.characters / 2**20 / stats.build_time:.1f} MiB/s), "
+        f"memory {stats.memory / 2**20:.1f} MiB estimated, "
+        f"{retained:.1f} MiB retained / {peak:.1f} MiB peak (tracemalloc)"
+    )
+    print(f"  {'query':<16}{'hits':>7}{'p50 us':>10}{'p95 us':>10}")
+    for label, kwargs in FULLTEXT_QUERIES:
+        hits = len(index.search(**kwargs))
+        samples = timed(lambda kwargs=kwargs: index.search(**kwargs), args.queries)
+        print(
+            f"  {label:<16}{hits:>7}{statistics.median(samples) * 1e6:>10.0f}"
+            f"{percentile(samples, 0.95) * 1e6:>10.0f}"
+        )
+
+    notes = sorted(vault.rglob("*.md"))[: args.queries]
+    paths = [note.relative_to(vault).as_posix() for note in notes]
+    updates = [timed(lambda path=path: index.update(path), 1)[0] for path in paths]
+    refresh = timed(index.refresh, 3)
+    print(
+        f"  update one note p50 {statistics.median(updates) * 1e6:.0f} us, "
+        f"refresh (no changes) {statistics.median(refresh) * 1e3:.1f} ms"
+    )
+
+
+def bm25(vault: Path, args: argparse.Namespace) -> None:
+    index = BM25Index(vault, boosts={"title": 3.0, "headings": 2.0})
+    index.build()
+    stats = index.stats()
+    retained, peak = memory(BM25Index(vault, boosts=index.boosts))
+    print(
+        f"bm25: {stats.files} notes, {stats.terms} terms, {stats.postings} postings, "
+        f"average length {stats.average_length:.0f}"
+    )
+    print(
+        f"  build {stats.build_time:.2f} s, "
+        f"memory {stats.memory / 2**20:.1f} MiB estimated, "
+        f"{retained:.1f} MiB retained / {peak:.1f} MiB peak (tracemalloc)"
+    )
+    print(f"  {'query':<16}{'hits':>7}{'p50 ms':>10}{'p95 ms':>10}")
+    for label, kwargs in BM25_QUERIES:
+        hits = len(index.top(**kwargs))
+        index.top(**kwargs)  # warm the folder mask of path queries
+        samples = timed(lambda kwargs=kwargs: index.top(**kwargs), args.queries)
+        print(
+            f"  {label:<16}{hits:>7}{statistics.median(samples) * 1e3:>10.2f}"
+            f"{percentile(samples, 0.95) * 1e3:>10.2f}"
+        )
+    samples = timed(lambda: index.search("cache index", context_length=50), 20)
+    print(f"  search() with matches p50 {statistics.median(samples) * 1e3:.2f} ms")
+
+
+def switcher(vault: Path, args: argparse.Namespace) -> None:
+    index = QuickSwitcher(vault)
+    index.build()
+    stats = index.stats()
+    retained, peak = memory(QuickSwitcher(vault))
+    print(
+        f"switcher: {stats.files} notes, {stats.entries} paths and aliases, "
+        f"{stats.grams} trigrams"
+    )
+    print(
+        f"  build {stats.build_time:.2f} s, "
+        f"memory {stats.memory / 2**20:.1f} MiB estimated, "
+        f"{retained:.1f} MiB retained / {peak:.1f} MiB peak (tracemalloc)"
+    )
+    print(f"  {'query':<16}{'hits':>7}{'p50 us':>10}{'p95 us':>10}")
+    for label, kwargs in SWITCHER_QUERIES:
+        hits = len(index.match(**kwargs))
+        samples = timed(lambda kwargs=kwargs: index.match(**kwargs), args.queries)
+        print(
+            f"  {label:<16}{hits:>7}{statistics.median(samples) * 1e6:>10.0f}"
+            f"{percentile(samples, 0.95) * 1e6:>10.0f}"
+        )
+    notes = sorted(vault.rglob("*.md"))[: args.queries]
+    paths = [note.relative_to(vault).as_posix() for note in notes]
+    updates = [timed(lambda path=path: index.update(path), 1)[0] for path in paths]
+    print(f"  update one note p50 {statistics.median(updates) * 1e6:.0f} us")
+
+
+def properties(vault: Path, args: argparse.Namespace) -> None:
+    index = PropertyIndex(vault)
+    index.build()
+    stats = index.stats()
+    retained, peak = memory(PropertyIndex(vault))
+    print(
+        f"properties: {stats.files} notes, {stats.keys} keys, "
+        f"{stats.values} distinct values, {stats.sorted} sorted entries"
+    )
+    print(
+        f"  build {stats.build_time:.2f} s, "
+        f"memory {stats.memory / 2**20:.1f} MiB estimated, "
+        f"{retained:.1f} MiB retained / {peak:.1f} MiB peak (tracemalloc)"
+    )
+    print(f"  {'query':<16}{'hits':>7}{'p50 us':>10}{'p95 us':>10}")
+    for label, conditions in PROPERTY_QUERIES:
+        hits = len(index.where(*conditions))
+        samples = timed(lambda c=conditions: index.where(*c), args.queries)
+        print(
+            f"  {label:<16}{hits:>7}{statistics.median(samples) * 1e6:>10.0f}"
+            f"{percentile(samples, 0.95) * 1e6:>10.0f}"
+        )
+    notes = sorted(vault.rglob("*.md"))[: args.queries]
+    paths = [note.relative_to(vault).as_posix() for note in notes]
+    updates = [timed(lambda path=path: index.update(path), 1)[0] for path in paths]
+    refresh = timed(index.refresh, 3)
+    print(
+        f"  update one note p50 {statistics.median(updates) * 1e6:.0f} us, "
+        f"refresh (no changes) {statistics.median(refresh) * 1e3:.1f} ms"
+    )
+
+
+def links(vault: Path, args: argparse.Namespace) -> None:
+    graph = LinkGraph(vault)
+    graph.build()
+    stats = graph.stats()
+    retained, peak = memory(LinkGraph(vault))
+    print(
+        f"links: {stats.files} notes, {stats.links} links, {stats.edges} edges, "
+        f"{stats.unresolved} unresolved"
+    )
+    print(
+        f"  build {stats.build_time:.2f} s, "
+        f"memory {stats.memory / 2**20:.1f} MiB estimated, "
+        f"{retained:.1f} MiB retained / {peak:.1f} MiB peak (tracemalloc)"
+    )
+    notes = sorted(vault.rglob("*.md"))[: args.queries]
+    paths = [note.relative_to(vault).as_posix() for note in notes]
+    queries = {
+        "outgoing": lambda: [graph.outgoing(path) for path in paths],
+        "backlinks": lambda: [graph.backlinks(path) for path in paths],
+        "orphans": graph.orphans,
+        "deadends": graph.deadends,
+        "unresolved": graph.unresolved,
+        "adjacency": graph.adjacency,
+    }
+    print(f"  {'query':<16}{'p50 us':>10}{'p95 us':>10}")
+    for label, query in queries.items():
+        per_note = label in ("outgoing", "backlinks")
+        samples = [
+            sample / (len(paths) if per_note else 1)
+            for sample in timed(query, 20 if per_note else args.queries)
+        ]
+        print(
+            f"  {label:<16}{statistics.median(samples) * 1e6:>10.1f}"
+            f"{percentile(samples, 0.95) * 1e6:>10.1f}"
+        )
+    updates = [timed(lambda path=path: graph.update(path), 1)[0] for path in paths]
+    print(f"  update one note p50 {statistics.median(updates) * 1e6:.0f} us")
+
+
+def tags(vault: Path, args: argparse.Namespace) -> None:
+    index = TagIndex(vault)
+    index.build()
+    stats = index.stats()
+    retained, peak = memory(TagIndex(vault))
+    print(
+        f"tags: {stats.files} notes, {stats.tags} tags, {stats.nodes} trie nodes, "
+        f"{stats.occurrences} occurrences"
+    )
+    print(
+        f"  build {stats.build_time:.2f} s, "
+        f"memory {stats.memory / 2**20:.1f} MiB estimated, "
+        f"{retained:.1f} MiB retained / {peak:.1f} MiB peak (tracemalloc)"
+    )
+    print(f"  {'query':<16}{'hits':>7}{'p50 us':>10}{'p95 us':>10}")
+    for label, query in TAG_QUERIES:
+        hits = len(query(index))
+        samples = timed(lambda query=query: query(index), args.queries)
+        print(
+            f"  {label:<16}{hits:>7}{statistics.median(samples) * 1e6:>10.0f}"
+            f"{percentile(samples, 0.95) * 1e6:>10.0f}"
+        )
+    notes = sorted(vault.rglob("*.md"))[: args.queries]
+    paths = [note.relative_to(vault).as_posix() for note in notes]
+    updates = [timed(lambda path=path: index.update(path), 1)[0] for path in paths]
+    print(f"  update one note p50 {statistics.median(updates) * 1e6:.0f} us")
+
+
+def tasks(vault: Path, args: argparse.Namespace) -> None:
+    index = TaskIndex(vault)
+    index.build()
+    stats = index.stats()
+    retained, peak = memory(TaskIndex(vault))
+    print(f"tasks: {stats.files} notes, {stats.tasks} tasks, {stats.open} open")
+    print(
+        f"  build {stats.build_time:.2f} s, "
+        f"memory {stats.memory / 2**20:.1f} MiB estimated, "
+        f"{retained:.1f} MiB retained / {peak:.1f} MiB peak (tracemalloc)"
+    )
+    print(f"  {'query':<16}{'hits':>7}{'p50 us':>10}{'p95 us':>10}")
+    for label, query in TASK_QUERIES:
+        hits = len(query(index))
+        samples = timed(lambda query=query: query(index), args.queries)
+        print(
+            f"  {label:<16}{hits:>7}{statistics.median(samples) * 1e6:>10.0f}"
+            f"{percentile(samples, 0.95) * 1e6:>10.0f}"
+        )
+    notes = sorted(vault.rglob("*.md"))[: args.queries]
+    paths = [note.relative_to(vault).as_posix() for note in notes]
+    updates = [timed(lambda path=path: index.update(path), 1)[0] for path in paths]
+    print(f"  update one note p50 {statistics.median(updates) * 1e6:.0f} us")
+
+
+SECTIONS = {
+    "fulltext": fulltext,
+    "bm25": bm25,
+    "switcher": switcher,
+    "properties": properties,
+    "links": links,
+    "tags": tags,
+    "tasks": tasks,
+}
+
+
+async def compare_cli(root: Path, vault: Path) -> None:
+    binary = write_fake_binary(root / "bin", vault.parent)
+    print(f"  {'fake obsidian':<16}{'hits':>7}{'ms':>10}")
+    async with ObsidianCLI(vault.name, binary=binary) as cli:
+        for label, kwargs in FULLTEXT_QUERIES:
+            start = time.perf_counter()
+            hits = await cli.search.query(raw=True, **kwargs)
+            elapsed = time.perf_counter() - start
+            print(f"  {label:<16}{len(hits):>7}{elapsed * 1e3:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notes", type=int, default=5000)
+    parser.add_argument("--words", type=int, default=150)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--compare-cli", action="store_true")
+    parser.add_argument("--only", nargs="*", default=[], choices=sorted(SECTIONS))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        vault = generate_vault(
+            root / "vaults" / "Bench", notes=args.notes, words=args.words
+        )
+        for name, section in SECTIONS.items():
+            if not args.only or name in args.only:
+                section(vault, args)
+        if args.compare_cli and (not args.only or "fulltext" in args.only):
+            asyncio.run(compare_cli(root, vault))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compare JSON backends on a large `files` listing.
+
+Generates the output of `obsidian files format=json` for a synthetic
+vault and times each installed decoder on the raw process bytes, plus
+the previous `bytes.decode()` + `json.loads` path as a baseline.
+
+    python benchmarks/bench_json.py --files 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from aiobsidian._json import get_loads
+
+
+def make_output(count: int) -> bytes:
+    files = [
+        {
+            "path": f"Projects/area-{i % 50:02d}/note-{i:06d}.md",
+            "name": f"note-{i:06d}",
+            "extension": "md",
+            "size": 512 + i % 4096,
+            "ctime": 1_700_000_000_000 + i,
+            "mtime": 1_700_000_500_000 + i,
+        }
+        for i in range(count)
+    ]
+    return json.dumps(files).encode()
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = make_output(args.files)
+    print(f"{args.files} files, {len(data) / 1e6:.1f} MB of JSON")
+
+    baseline = measure(lambda: json.loads(data.decode()), args.repeat)
+    print(f"{'decode + json.loads':<22}{baseline * 1e3:9.1f} ms")
+    for backend in ("json", "orjson", "msgspec"):
+        try:
+            loads = get_loads(backend)
+        except ImportError:
+            print(f"{backend:<22}{'not installed':>12}")
+            continue
+        elapsed = measure(lambda: loads(data), args.repeat)
+        print(f"{backend:<22}{elapsed * 1e3:9.1f} ms  {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Load test for `ObsidianClient` against the local REST API stand-in.
+
+Serves a synthetic vault with `aiobsidian.testing.FakeRESTServer` and
+runs concurrent `vault.get` / `vault.update` traffic through real
+sockets at several concurrency levels. Reports throughput, latency
+percentiles and how many requests each TCP connection carried.
+
+The server runs in a thread of the same process, so client and server
+share the GIL: absolute numbers are pessimistic, comparisons between
+settings (pool size, TLS, write ratio) are what to look at.
+
+    python benchmarks/bench_rest.py --notes 2000 --requests 2000
+    python benchmarks/bench_rest.py --tls --max-connections 4 --write-ratio 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from aiobsidian import ObsidianClient
+from aiobsidian.testing import FakeRESTServer, generate_vault
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+async def measure(
+    server: FakeRESTServer,
+    paths: list[str],
+    *,
+    requests: int,
+    concurrency: int,
+    write_ratio: float,
+    max_connections: int | None,
+) -> tuple[float, list[float]]:
+    limits = httpx.Limits(
+        max_connections=max_connections, max_keepalive_connections=max_connections
+    )
+    http = httpx.AsyncClient(
+        base_url=server.base_url,
+        headers={"Authorization": f"Bearer {server.api_key}"},
+        verify=False,
+        limits=limits,
+    )
+    rng = random.Random(0)
+    latencies: list[float] = []
+    queue = iter(range(requests))
+
+    async with http, ObsidianClient(server.api_key, http_client=http) as client:
+
+        async def worker() -> None:
+            for i in queue:
+                path = rng.choice(paths)
+                start = time.perf_counter()
+                if rng.random() < write_ratio:
+                    await client.vault.update(path, f"# Rewritten {i}\n")
+                else:
+                    await client.vault.get(path)
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - start, latencies
+
+
+async def run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = generate_vault(Path(tmp) / "Bench", notes=args.notes)
+        paths = [p.relative_to(vault).as_posix() for p in sorted(vault.rglob("*.md"))]
+        server = FakeRESTServer(vault, tls=args.tls, latency=args.latency)
+        with server:
+            print(
+                f"{server.base_url}, {args.notes} notes, {args.requests} requests, "
+                f"write ratio {args.write_ratio}, "
+                f"max connections {args.max_connections or 'unlimited'}"
+            )
+            print(
+                f"{'conc':>5}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}"
+                f"{'p99 ms':>9}{'conns':>7}{'req/conn':>10}"
+            )
+            for level in args.concurrency:
+                server.reset_stats()
+                elapsed, samples = await measure(
+                    server,
+                    paths,
+                    requests=args.requests,
+                    concurrency=level,
+                    write_ratio=args.write_ratio,
+                    max_connections=args.max_connections,
+                )
+                stats = server.stats()
+                print(
+                    f"{level:>5}{len(samples) / elapsed:>9.1f}"
+                    f"{statistics.median(samples) * 1e3:>9.2f}"
+                    f"{percentile(samples, 0.95) * 1e3:>9.2f}"
+                    f"{percentile(samples, 0.99) * 1e3:>9.2f}"
+                    f"{stats.connections:>7}{stats.requests_per_connection:>10.1f}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notes", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--tls", action="store_true")
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=None,
+        help="httpx connection pool size (default: unlimited)",
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,170 @@
 """Async Python client for Obsidian CLI and Local REST API plugin."""
 
-from ._cli import ObsidianCLI
-from ._client import ObsidianClient
-from ._exceptions import (
-    APIError,
-    AuthenticationError,
-    BinaryNotFoundError,
-    CLIError,
-    CLITimeoutError,
-    CommandError,
-    NotFoundError,
-    ObsidianError,
-)
-from ._types import ContentType, PatchOperation, Period, TargetType
-from .models.commands import Command
-from .models.search import MatchSpan, SearchMatch, SearchResult
-from .models.system import ServerStatus, Versions
-from .models.vault import DocumentMap, FileStat, NoteJson, VaultDirectory
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._batch import CLICall
+    from ._cache import CacheStats, CLICache
+    from ._cli import ObsidianCLI
+    from ._client import ObsidianClient
+    from ._exceptions import (
+        APIError,
+        AuthenticationError,
+        BinaryNotFoundError,
+        CLIError,
+        CLITimeoutError,
+        CommandError,
+        NotFoundError,
+        ObsidianError,
+    )
+    from ._hooks import CommandEvent, CommandHooks
+    from ._metrics import (
+        CommandMetrics,
+        LatencySummary,
+        MetricsRegistry,
+        MetricsSnapshot,
+        render_prometheus,
+    )
+    from ._scheduler import CLIScheduler, LaneStats, SchedulerStats
+    from ._tracing import TracingHooks
+    from ._types import ContentType, PatchOperation, Period, Priority, TargetType
+    from ._watch import VaultEvent, VaultWatcher
+    from .index import (
+        BM25Index,
+        GraphAnalytics,
+        LinkGraph,
+        PropertyIndex,
+        QuickSwitcher,
+        SearchIndex,
+        TagIndex,
+        TaskIndex,
+    )
+    from .models.commands import Command
+    from .models.records import (
+        BookmarkRecord,
+        FileRecord,
+        LinkRecord,
+        NoteRecord,
+        SearchHitRecord,
+        TagRecord,
+        TaskRecord,
+        UnresolvedLinkRecord,
+        VersionRecord,
+    )
+    from .models.search import MatchSpan, SearchMatch, SearchResult
+    from .models.system import ServerStatus, Versions
+    from .models.vault import DocumentMap, FileStat, NoteJson, VaultDirectory
+
+# Exports are imported on first access, so CLI-only programs never load
+# httpx or pydantic (the REST client and its response models).
+_EXPORTS: dict[str, str] = {
+    "APIError": "._exceptions",
+    "AuthenticationError": "._exceptions",
+    "BinaryNotFoundError": "._exceptions",
+    "BM25Index": ".index",
+    "BookmarkRecord": ".models.records",
+    "CacheStats": "._cache",
+    "CLICache": "._cache",
+    "CLICall": "._batch",
+    "CLIError": "._exceptions",
+    "CLIScheduler": "._scheduler",
+    "CLITimeoutError": "._exceptions",
+    "Command": ".models.commands",
+    "CommandError": "._exceptions",
+    "CommandEvent": "._hooks",
+    "CommandHooks": "._hooks",
+    "CommandMetrics": "._metrics",
+    "ContentType": "._types",
+    "DocumentMap": ".models.vault",
+    "FileRecord": ".models.records",
+    "FileStat": ".models.vault",
+    "GraphAnalytics": ".index",
+    "LaneStats": "._scheduler",
+    "LatencySummary": "._metrics",
+    "LinkGraph": ".index",
+    "LinkRecord": ".models.records",
+    "MatchSpan": ".models.search",
+    "MetricsRegistry": "._metrics",
+    "MetricsSnapshot": "._metrics",
+    "NoteRecord": ".models.records",
+    "NotFoundError": "._exceptions",
+    "NoteJson": ".models.vault",
+    "ObsidianCLI": "._cli",
+    "ObsidianClient": "._client",
+    "ObsidianError": "._exceptions",
+    "PatchOperation": "._types",
+    "Period": "._types",
+    "Priority": "._types",
+    "PropertyIndex": ".index",
+    "QuickSwitcher": ".index",
+    "SchedulerStats": "._scheduler",
+    "SearchHitRecord": ".models.records",
+    "SearchIndex": ".index",
+    "SearchMatch": ".models.search",
+    "SearchResult": ".models.search",
+    "ServerStatus": ".models.system",
+    "TagIndex": ".index",
+    "TagRecord": ".models.records",
+    "TargetType": "._types",
+    "TaskIndex": ".index",
+    "TaskRecord": ".models.records",
+    "TracingHooks": "._tracing",
+    "UnresolvedLinkRecord": ".models.records",
+    "VaultEvent": "._watch",
+    "VaultWatcher": "._watch",
+    "VersionRecord": ".models.records",
+    "Versions": ".models.system",
+    "VaultDirectory": ".models.vault",
+    "render_prometheus": "._metrics",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "APIError",
     "AuthenticationError",
     "BinaryNotFoundError",
+    "BM25Index",
+    "BookmarkRecord",
+    "CacheStats",
+    "CLICache",
+    "CLICall",
     "CLIError",
+    "CLIScheduler",
     "CLITimeoutError",
     "Command",
     "CommandError",
+    "CommandEvent",
+    "CommandHooks",
+    "CommandMetrics",
     "ContentType",
     "DocumentMap",
+    "FileRecord",
     "FileStat",
+    "GraphAnalytics",
+    "LaneStats",
+    "LatencySummary",
+    "LinkGraph",
+    "LinkRecord",
     "MatchSpan",
+    "MetricsRegistry",
+    "MetricsSnapshot",
+    "NoteRecord",
     "NotFoundError",
     "NoteJson",
     "ObsidianCLI",
@@ -37,10 +172,26 @@ __all__ = [
     "ObsidianError",
     "PatchOperation",
     "Period",
+    "Priority",
+    "PropertyIndex",
+    "QuickSwitcher",
+    "SchedulerStats",
+    "SearchHitRecord",
+    "SearchIndex",
     "SearchMatch",
     "SearchResult",
     "ServerStatus",
+    "TagIndex",
+    "TagRecord",
     "TargetType",
+    "TaskIndex",
+    "TaskRecord",
+    "TracingHooks",
+    "UnresolvedLinkRecord",
+    "VaultEvent",
+    "VaultWatcher",
+    "VersionRecord",
     "Versions",
     "VaultDirectory",
+    "render_prometheus",
 ]
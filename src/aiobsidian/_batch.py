@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+
+from ._exceptions import CLIError
+from ._types import Priority
+
+
+@dataclass(frozen=True, slots=True)
+class CLICall:
+    """Descriptor of a single CLI command for batch execution.
+
+    Mirrors the arguments of `ObsidianCLI._execute`:
+
+    ```python
+    CLICall("read", params={"path": "note.md"})
+    ```
+
+    Attributes:
+        command: CLI command name (e.g. `"read"`, `"links"`).
+        params: Key-value parameters passed as `key=value` arguments.
+        flags: Extra CLI flags (e.g. `["--counts"]`).
+        timeout: Override the default timeout for this command.
+    """
+
+    command: str
+    params: dict[str, str] | None = None
+    flags: list[str] | None = None
+    timeout: float | None = None
+
+
+Executor = Callable[[CLICall, Priority], Awaitable[str]]
+
+
+async def iter_calls(
+    execute: Executor,
+    calls: Iterable[CLICall],
+    *,
+    concurrency: int,
+    priority: Priority,
+) -> AsyncGenerator[tuple[int, str | CLIError]]:
+    """Run calls with a fixed worker pool, yielding in completion order.
+
+    `CLIError` raised by a call is yielded in place of its output;
+    any other exception stops the batch and is re-raised. Closing the
+    iterator early cancels the commands still running.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    pending = iter(enumerate(calls))
+    done: asyncio.Queue[tuple[int, str | CLIError] | BaseException | None] = (
+        asyncio.Queue()
+    )
+
+    async def worker() -> None:
+        try:
+            for index, call in pending:
+                try:
+                    result: str | CLIError = await execute(call, priority)
+                except CLIError as exc:
+                    result = exc
+                await done.put((index, result))
+        except Exception as exc:
+            await done.put(exc)
+        finally:
+            await done.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        running = len(workers)
+        while running:
+            item = await done.get()
+            if item is None:
+                running -= 1
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                yield item
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import posixpath
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from ._constants import (
+    DEFAULT_CLI_CACHE_MAX_BYTES,
+    DEFAULT_CLI_CACHE_NEGATIVE_TTL,
+    DEFAULT_CLI_CACHE_TTL,
+)
+from ._exceptions import CommandError
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...], tuple[str, ...]]
+
+# stderr of a read whose file does not exist: `Error: File "a.md" not found.`
+_NOT_FOUND = re.compile(r'File ".*" not found')
+
+FILE_READS = frozenset(
+    {
+        "aliases",
+        "file",
+        "links",
+        "outline",
+        "properties",
+        "property:read",
+        "read",
+        "wordcount",
+    }
+)
+"""Read commands whose output depends only on the file named in `path`/`file`."""
+
+VAULT_READS = frozenset(
+    {
+        "backlinks",
+        "deadends",
+        "files",
+        "folder",
+        "folders",
+        "orphans",
+        "search",
+        "search:context",
+        "tag",
+        "tags",
+        "tasks",
+        "unresolved",
+    }
+)
+"""Read commands whose output may change when any file changes."""
+
+FILE_WRITES = frozenset(
+    {
+        "append",
+        "create",
+        "delete",
+        "move",
+        "prepend",
+        "property:remove",
+        "property:set",
+        "rename",
+        "task",
+    }
+)
+"""Mutating commands that only touch the files named in their parameters."""
+
+VAULT_WRITES = frozenset(
+    {
+        "base:create",
+        "command",
+        "daily",
+        "daily:append",
+        "daily:prepend",
+        "history:restore",
+        "sync:restore",
+        "tags:rename",
+        "task:complete",
+        "task:create",
+        "template:insert",
+    }
+)
+"""Mutating commands whose affected files are not known up front."""
+
+# Approximate per-entry bookkeeping cost counted against `max_bytes`.
+_ENTRY_OVERHEAD = 256
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Snapshot of `CLICache` counters.
+
+    Attributes:
+        hits: Lookups answered from the cache (including cached errors).
+        misses: Lookups that had to run the command.
+        evictions: Entries dropped to stay under `max_bytes`.
+        invalidations: Entries dropped because of a mutating command.
+        entries: Number of cached results.
+        size: Approximate memory held by cached results, in bytes.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    size: int
+
+
+class _Entry:
+    __slots__ = ("value", "expires", "scope", "size")
+
+    def __init__(
+        self,
+        value: bytes | CommandError,
+        expires: float,
+        scope: str | None,
+        size: int,
+    ) -> None:
+        self.value = value
+        self.expires = expires
+        self.scope = scope
+        self.size = size
+
+
+class CLICache:
+    """Read-through cache for `ObsidianCLI` read commands.
+
+    Results of read-only commands (`read`, `files`, `tags`,
+    `properties`, `backlinks`, `outline`, ...) are kept for `ttl`
+    seconds, evicting the least recently used entries once the cached
+    output exceeds `max_bytes`. A read that fails because its file does
+    not exist is cached for `negative_ttl` seconds; other errors are
+    not cached.
+
+    Mutating commands sent through the same `ObsidianCLI` invalidate
+    the cache: writes to known paths (`create`, `append`, `move`,
+    `property:set`, ...) drop the entries for those files plus every
+    vault-wide listing; commands with unknown reach (`tags:rename`,
+    `task:create`, ...) clear everything.
+
+    Changes made outside this client (in the Obsidian UI, by other
+    processes, or with `eval`) are only picked up when entries expire
+    or after `clear()`.
+
+    ```python
+    cli = ObsidianCLI("MyVault", cache=CLICache(ttl=30))
+    ```
+
+    Args:
+        ttl: Lifetime of cached results in seconds.
+        max_bytes: Upper bound for the total size of cached output.
+        negative_ttl: Lifetime of cached "file not found" errors in
+            seconds.
+            `0` disables negative caching.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_CLI_CACHE_TTL,
+        max_bytes: int = DEFAULT_CLI_CACHE_MAX_BYTES,
+        negative_ttl: float = DEFAULT_CLI_CACHE_NEGATIVE_TTL,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._negative_ttl = negative_ttl
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._size = 0
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"CLICache(ttl={self._ttl!r}, max_bytes={self._max_bytes!r}, "
+            f"entries={len(self._entries)!r})"
+        )
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every invalidation.
+
+        A result is only stored if no invalidation happened while its
+        command was running, so a read racing a write cannot repopulate
+        the cache with stale data.
+        """
+        return self._generation
+
+    @staticmethod
+    def key(
+        command: str,
+        params: dict[str, str] | None,
+        flags: list[str] | None,
+    ) -> CacheKey | None:
+        """Return the cache key for a command, or `None` if it is not cacheable.
+
+        Parameters are sorted, so their order does not matter.
+        """
+        if command not in FILE_READS and command not in VAULT_READS:
+            return None
+        return (
+            command,
+            tuple(sorted(params.items())) if params else (),
+            tuple(flags) if flags else (),
+        )
+
+    def get(self, key: CacheKey) -> bytes | CommandError | None:
+        """Look up a cached result.
+
+        Returns:
+            The cached stdout, a cached `CommandError`, or `None` on a
+            miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry.expires <= time.monotonic():
+            self._remove(key)
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    def put(
+        self, key: CacheKey, value: bytes | CommandError, *, generation: int
+    ) -> None:
+        """Store a command result.
+
+        Args:
+            key: Key returned by `key()`.
+            value: Command stdout, or the `CommandError` it raised.
+            generation: Value of `generation` when the command started.
+                The result is dropped if the cache was invalidated since.
+        """
+        if generation != self._generation:
+            return
+        if isinstance(value, CommandError):
+            if (
+                self._negative_ttl <= 0
+                or key[0] not in FILE_READS
+                or not _NOT_FOUND.search(value.stderr)
+            ):
+                return
+            ttl = self._negative_ttl
+            size = len(value.stderr)
+        else:
+            ttl = self._ttl
+            size = len(value)
+        size += _ENTRY_OVERHEAD + sum(len(k) + len(v) for k, v in key[1])
+        if size > self._max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        scope = _scope(key) if key[0] in FILE_READS else None
+        self._entries[key] = _Entry(value, time.monotonic() + ttl, scope, size)
+        self._size += size
+        while self._size > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def invalidate(self, command: str, params: dict[str, str] | None) -> None:
+        """Drop entries affected by a mutating command.
+
+        Read-only and unknown commands are ignored.
+
+        Args:
+            command: CLI command name that was executed.
+            params: Parameters the command was executed with.
+        """
+        if command in VAULT_WRITES:
+            self.clear()
+        elif command in FILE_WRITES:
+            paths = written_paths(command, params or {})
+            if paths:
+                self.invalidate_paths(paths)
+            else:
+                self.clear()
+
+    def invalidate_paths(self, paths: Iterable[str]) -> None:
+        """Drop cached results that may depend on the given files.
+
+        Entries for the files themselves (matched by path or by note
+        name, since many commands accept either) and all vault-wide
+        listings are removed.
+
+        Args:
+            paths: Vault-relative paths of changed files or folders.
+        """
+        names: set[str] = set()
+        prefixes: list[str] = []
+        for path in paths:
+            path = path.strip("/")
+            names.update(_aliases(path))
+            prefixes.append(path + "/")
+        prefix_tuple = tuple(prefixes)
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if entry.scope is None
+            or entry.scope in names
+            or entry.scope.startswith(prefix_tuple)
+        ]
+        self._drop(stale)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._drop(list(self._entries))
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            entries=len(self._entries),
+            size=self._size,
+        )
+
+    def _drop(self, keys: list[CacheKey]) -> None:
+        self._generation += 1
+        for key in keys:
+            self._remove(key)
+        self._invalidations += len(keys)
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+
+def _scope(key: CacheKey) -> str | None:
+    params = dict(key[1])
+    target = params.get("path") or params.get("file")
+    return target.strip("/") if target else None
+
+
+def _aliases(path: str) -> set[str]:
+    """Names by which a command may refer to the file at `path`."""
+    stem = posixpath.splitext(path)[0]
+    return {path, stem, posixpath.basename(path), posixpath.basename(stem)}
+
+
+def written_paths(command: str, params: dict[str, str]) -> list[str]:
+    path = params.get("path") or params.get("file")
+    paths = [path] if path else []
+    if command == "move" and "to" in params:
+        paths.append(params["to"])
+    elif command == "rename" and path and "new-name" in params:
+        folder = posixpath.dirname(path)
+        renamed = posixpath.join(folder, params["new-name"])
+        paths.append(renamed)
+        paths.append(renamed + posixpath.splitext(path)[1])
+    return paths
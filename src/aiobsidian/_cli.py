@@ -2,14 +2,41 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import shutil
+import time
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from contextlib import aclosing, contextmanager
 from functools import cached_property
-from typing import TYPE_CHECKING
-
-from ._constants import DEFAULT_CLI_TIMEOUT
-from ._exceptions import BinaryNotFoundError, CLITimeoutError, CommandError
+from typing import TYPE_CHECKING, Any
+
+from ._batch import CLICall, iter_calls
+from ._cache import CacheKey, CLICache
+from ._constants import (
+    CLI_STREAM_CHUNK_SIZE,
+    DEFAULT_CLI_MAX_CONCURRENCY,
+    DEFAULT_CLI_TIMEOUT,
+)
+from ._exceptions import BinaryNotFoundError, CLIError, CLITimeoutError, CommandError
+from ._hooks import CommandEvent, CommandHooks, HookDispatcher
+from ._json import JSONBackend, get_loads
+from ._jsonstream import JSONArrayParser
+from ._scheduler import CLIScheduler
+from ._singleflight import SingleFlight
+from ._types import Priority
+from ._vaultfs import ReadBackend, VaultFS
 
 if TYPE_CHECKING:
+    from ._metrics import MetricsRegistry, MetricsSnapshot
+    from ._tracing import TracingHooks
+    from ._watch import VaultEvent, VaultWatcher
     from .cli.aliases import CLIAliasesResource
     from .cli.bases import CLIBasesResource
     from .cli.bookmarks import CLIBookmarksResource
@@ -24,6 +51,7 @@ if TYPE_CHECKING:
     from .cli.properties import CLIPropertiesResource
     from .cli.publish import CLIPublishResource
     from .cli.random_note import CLIRandomResource
+    from .cli.script import CLIScriptBatch
     from .cli.search import CLISearchResource
     from .cli.snippets import CLISnippetsResource
     from .cli.sync import CLISyncResource
@@ -36,6 +64,17 @@ if TYPE_CHECKING:
     from .cli.vault import CLIVaultResource
     from .cli.web import CLIWebResource
     from .cli.workspaces import CLIWorkspacesResource
+    from .index import (
+        BM25Index,
+        LinkGraph,
+        PropertyIndex,
+        QuickSwitcher,
+        SearchIndex,
+        TagIndex,
+        TaskIndex,
+        VaultIndex,
+    )
+    from .models.records import NoteRecord
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +100,70 @@ class ObsidianCLI:
         binary: Path to the Obsidian CLI binary. Use `"auto"` to
             find it automatically via `shutil.which`.
         timeout: Default command timeout in seconds.
+        max_concurrency: Maximum number of `obsidian` processes running
+            at once. Extra commands wait in their `Priority` lane.
+            `None` disables the limit.
+        json_backend: JSON decoder for command output: `"orjson"`,
+            `"msgspec"`, `"json"`, or `"auto"` to use the fastest one
+            installed.
+        cache: Optional `CLICache` for results of read commands.
+            Mutating commands issued through this instance invalidate
+            it automatically.
+        hooks: `CommandHooks` notified when each `obsidian` process
+            starts, finishes or fails.
+        metrics: `True` to collect call counts, errors and latency
+            percentiles in a new `MetricsRegistry`, or an existing
+            registry to share with other clients. Read them with
+            `metrics()`.
+        tracing: `True` to emit an OpenTelemetry span for every call
+            (requires `opentelemetry-api`), or a configured
+            `TracingHooks`.
+        read_backend: `"filesystem"` to serve `vault.read`,
+            `vault.read_many`, `vault.list`, `vault.iter_list`,
+            `vault.folders`, `vault.file_info`, `vault.wordcount` and
+            `random.read` straight from the vault directory instead of
+            spawning `obsidian`. Results have the same shapes; all other
+            commands, including every write, still go through the CLI.
+        search_index: `True` to answer `search.query`,
+            `search.iter_query` and `search.context` from an in-process
+            `SearchIndex` of the vault directory, or an existing index.
+            It is built on the first search and follows the writes made
+            through this instance.
+        ranked_index: `True` to enable BM25-ranked `search.ranked()`
+            over an in-process `BM25Index` (requires `numpy`), or an
+            existing index, e.g. one with field boosts. Maintained like
+            `search_index`.
+        quick_switcher: `True` to enable fuzzy note lookup by path and
+            alias with `vault.quick_switch()` over an in-process
+            `QuickSwitcher`, or an existing one. Maintained like
+            `search_index`.
+        property_index: `True` to enable frontmatter queries with
+            `properties.where()` over an in-process `PropertyIndex`, or
+            an existing one (e.g. with `max_age=` to also pick up edits
+            made in Obsidian). Maintained like `search_index`, including
+            after `properties.set()` and `properties.remove()`.
+        link_graph: `True` to answer the `links` queries (`outgoing`,
+            `incoming`, `unresolved`, `orphans`, `deadends`) from an
+            in-process `LinkGraph`, or an existing one. Results have the
+            same shapes. Maintained like `search_index`.
+        tag_index: `True` to answer `tags.get`, `tags.list` and
+            `tags.iter_list` from an in-process `TagIndex` of inline and
+            frontmatter tags, or an existing one. Results have the same
+            shapes. Maintained like `search_index`.
+        task_index: `True` to answer `tasks.list` and `tasks.iter` (except
+            with `daily=True`) from an in-process `TaskIndex`, and to
+            enable `tasks.query()`, or an existing one. Maintained like
+            `search_index`, including after `tasks.toggle()`.
+        watcher: `True` to watch the vault directory with a
+            `VaultWatcher` (inotify on Linux, polling elsewhere), or an
+            existing one. Changes made outside this instance (in
+            Obsidian, by sync, by other tools) then invalidate `cache`
+            and update the indexes as they happen, instead of waiting
+            for `max_age`. Writes made through this instance are
+            reported to it. Runs inside `async with`.
+        vault_path: Vault directory for `read_backend="filesystem"`
+            and the indexes. By default it is looked up once in
+            `system.vaults()`.
     """
 
     def __init__(
@@ -69,10 +172,126 @@ class ObsidianCLI:
         *,
         binary: str = "auto",
         timeout: float = DEFAULT_CLI_TIMEOUT,
+        max_concurrency: int | None = DEFAULT_CLI_MAX_CONCURRENCY,
+        json_backend: JSONBackend = "auto",
+        cache: CLICache | None = None,
+        hooks: Iterable[CommandHooks] = (),
+        metrics: MetricsRegistry | bool = False,
+        tracing: TracingHooks | bool = False,
+        read_backend: ReadBackend = "cli",
+        search_index: SearchIndex | bool = False,
+        ranked_index: BM25Index | bool = False,
+        quick_switcher: QuickSwitcher | bool = False,
+        property_index: PropertyIndex | bool = False,
+        link_graph: LinkGraph | bool = False,
+        tag_index: TagIndex | bool = False,
+        task_index: TaskIndex | bool = False,
+        watcher: VaultWatcher | bool = False,
+        vault_path: str | os.PathLike[str] | None = None,
     ) -> None:
         self._vault = vault
         self._timeout = timeout
         self._binary = self._resolve_binary(binary)
+        self._scheduler = CLIScheduler(max_concurrency)
+        self._loads = get_loads(json_backend)
+        self._cache = cache
+        self._inflight: SingleFlight[tuple[int, CacheKey], bytes] = SingleFlight()
+        self._epoch = 0
+        self._hooks = HookDispatcher(hooks)
+        # Imported on demand to keep them off the import path of short scripts.
+        self._metrics: MetricsRegistry | None = None
+        if metrics:
+            if metrics is True:
+                from ._metrics import MetricsRegistry
+
+                metrics = MetricsRegistry()
+            self._metrics = metrics
+            self._hooks.add(metrics)
+        self._tracing: TracingHooks | None = None
+        if tracing:
+            if tracing is True:
+                from ._tracing import TracingHooks
+
+                tracing = TracingHooks()
+            self._tracing = tracing
+            self._hooks.add(tracing)
+        if read_backend not in ("cli", "filesystem"):
+            raise ValueError(f"Unknown read backend: {read_backend!r}")
+        self._root = os.path.abspath(vault_path) if vault_path is not None else None
+        self._fs: VaultFS | None = None
+        if read_backend == "filesystem":
+            self._fs = VaultFS(self._root or self._vault_root)
+        self._search_index: SearchIndex | None = None
+        if search_index:
+            if search_index is True:
+                from .index import SearchIndex
+
+                search_index = SearchIndex(self._root)
+            self._search_index = search_index
+        self._ranked_index: BM25Index | None = None
+        if ranked_index:
+            if ranked_index is True:
+                from .index import BM25Index
+
+                ranked_index = BM25Index(self._root)
+            self._ranked_index = ranked_index
+        self._quick_switcher: QuickSwitcher | None = None
+        if quick_switcher:
+            if quick_switcher is True:
+                from .index import QuickSwitcher
+
+                quick_switcher = QuickSwitcher(self._root)
+            self._quick_switcher = quick_switcher
+        self._property_index: PropertyIndex | None = None
+        if property_index:
+            if property_index is True:
+                from .index import PropertyIndex
+
+                property_index = PropertyIndex(self._root)
+            self._property_index = property_index
+        self._link_graph: LinkGraph | None = None
+        if link_graph:
+            if link_graph is True:
+                from .index import LinkGraph
+
+                link_graph = LinkGraph(self._root)
+            self._link_graph = link_graph
+        self._tag_index: TagIndex | None = None
+        if tag_index:
+            if tag_index is True:
+                from .index import TagIndex
+
+                tag_index = TagIndex(self._root)
+            self._tag_index = tag_index
+        self._task_index: TaskIndex | None = None
+        if task_index:
+            if task_index is True:
+                from .index import TaskIndex
+
+                task_index = TaskIndex(self._root)
+            self._task_index = task_index
+        self._indexes: tuple[VaultIndex, ...] = tuple(
+            index
+            for index in (
+                self._search_index,
+                self._ranked_index,
+                self._quick_switcher,
+                self._property_index,
+                self._link_graph,
+                self._tag_index,
+                self._task_index,
+            )
+            if index is not None
+        )
+        self._index_lock = asyncio.Lock()
+        self._watcher: VaultWatcher | None = None
+        if watcher:
+            if watcher is True:
+                from ._watch import VaultWatcher
+
+                watcher = VaultWatcher(self._root)
+            self._watcher = watcher
+        self._watch_task: asyncio.Task[None] | None = None
 
     def __repr__(self) -> str:
         return f"ObsidianCLI(vault={self._vault!r}, binary={self._binary!r})"
@@ -101,6 +320,135 @@ class ObsidianCLI:
             )
         return resolved
 
+    async def _vault_root(self) -> str:
+        """Return the vault directory, looking it up on first use.
+
+        Raises:
+            CLIError: If the vault is not listed by `obsidian vaults`.
+        """
+        if self._root is None:
+            for entry in await self.system.vaults():
+                if entry.get("name") == self._vault and entry.get("path"):
+                    self._root = os.path.abspath(entry["path"])
+                    return self._root
+            raise CLIError(
+                f"Vault {self._vault!r} is not listed by `obsidian vaults`. "
+                "Pass vault_path= explicitly."
+            )
+        return self._root
+
+    async def _query_index[I: VaultIndex, T](
+        self, index: I, query: Callable[[I], T]
+    ) -> T:
+        """Run `query` once `index` reflects the writes made so far.
+
+        Building and updating run on a worker thread; the query itself
+        runs on the event loop, never concurrently with an update.
+        """
+        async with self._index_lock:
+            if index.root is None:
+                index.root = await self._vault_root()
+            if index.needs_sync:
+                await asyncio.to_thread(index.sync)
+            return query(index)
+
+    @property
+    def scheduler(self) -> CLIScheduler:
+        """Process scheduler exposing queue depth and wait-time counters."""
+        return self._scheduler
+
+    def add_hook(self, hook: CommandHooks) -> None:
+        """Register an instrumentation hook.
+
+        Args:
+            hook: Hook to notify about every subsequent command.
+        """
+        self._hooks.add(hook)
+
+    def remove_hook(self, hook: CommandHooks) -> None:
+        """Unregister a hook added with `add_hook()` or the constructor.
+
+        Raises:
+            ValueError: If the hook is not registered.
+        """
+        self._hooks.remove(hook)
+
+    @property
+    def metrics_registry(self) -> MetricsRegistry | None:
+        """Metrics registry, if metrics were enabled."""
+        return self._metrics
+
+    def metrics(self) -> MetricsSnapshot:
+        """Return a snapshot of the collected metrics.
+
+        Raises:
+            RuntimeError: If the client was created without `metrics=`.
+        """
+        if self._metrics is None:
+            raise RuntimeError("Metrics are disabled. Pass metrics=True to enable.")
+        return self._metrics.snapshot()
+
+    @property
+    def cache(self) -> CLICache | None:
+        """Read-through result cache, if one was configured."""
+        return self._cache
+
+    @property
+    def search_index(self) -> SearchIndex | None:
+        """Full-text index serving `search`, if one was configured."""
+        return self._search_index
+
+    @property
+    def ranked_index(self) -> BM25Index | None:
+        """BM25 index serving `search.ranked()`, if one was configured."""
+        return self._ranked_index
+
+    @property
+    def quick_switcher(self) -> QuickSwitcher | None:
+        """Fuzzy matcher serving `vault.quick_switch()`, if one was configured."""
+        return self._quick_switcher
+
+    @property
+    def property_index(self) -> PropertyIndex | None:
+        """Property index serving `properties.where()`, if one was configured."""
+        return self._property_index
+
+    @property
+    def link_graph(self) -> LinkGraph | None:
+        """Link graph serving the `links` queries, if one was configured."""
+        return self._link_graph
+
+    @property
+    def tag_index(self) -> TagIndex | None:
+        """Tag trie serving the `tags` queries, if one was configured."""
+        return self._tag_index
+
+    @property
+    def task_index(self) -> TaskIndex | None:
+        """Task index serving the `tasks` queries, if one was configured."""
+        return self._task_index
+
+    @property
+    def watcher(self) -> VaultWatcher | None:
+        """Vault change watcher, if one was configured."""
+        return self._watcher
+
+    @contextmanager
+    def lane(self, priority: Priority) -> Iterator[None]:
+        """Issue the enclosed commands in the given scheduling lane.
+
+        ```python
+        with cli.lane(Priority.BACKGROUND):
+            for path in paths:
+                await cli.vault.read(path)
+        ```
+
+        Args:
+            priority: Lane for commands issued inside the block.
+        """
+        with self._scheduler.lane(priority):
+            yield
+
     async def _execute(
         self,
         command: str,
@@ -108,14 +456,20 @@ class ObsidianCLI:
         params: dict[str, str] | None = None,
         flags: list[str] | None = None,
         timeout: float | None = None,
+        priority: Priority | None = None,
     ) -> str:
         """Execute an Obsidian CLI command.
 
+        Identical read-only commands that are already in flight share
+        one process; cancelling one caller does not cancel the others.
+
         Args:
             command: CLI command name (e.g. `"read"`, `"daily:path"`).
             params: Key-value parameters passed as `key=value` arguments.
             flags: Extra CLI flags (e.g. `["--overwrite"]`).
             timeout: Override the default timeout for this command.
+            priority: Scheduling lane. Defaults to the lane selected
+                with `lane()`, or `Priority.INTERACTIVE`.
 
         Returns:
             Standard output from the command as a string.
@@ -124,8 +478,397 @@ class ObsidianCLI:
             CommandError: If the command exits with a non-zero status.
             CLITimeoutError: If the command exceeds the timeout.
         """
+        stdout = await self._run(
+            command, params=params, flags=flags, timeout=timeout, priority=priority
+        )
+        return stdout.decode()
+
+    async def _execute_json(
+        self,
+        command: str,
+        *,
+        params: dict[str, str] | None = None,
+        flags: list[str] | None = None,
+        timeout: float | None = None,
+        priority: Priority | None = None,
+    ) -> Any:
+        """Execute an Obsidian CLI command and decode its JSON output.
+
+        The raw stdout bytes are passed straight to the configured JSON
+        backend without an intermediate `str`.
+
+        Args:
+            command: CLI command name.
+            params: Key-value parameters passed as `key=value` arguments.
+            flags: Extra CLI flags.
+            timeout: Override the default timeout for this command.
+            priority: Scheduling lane.
+
+        Returns:
+            The decoded JSON value.
+
+        Raises:
+            CommandError: If the command exits with a non-zero status.
+            CLITimeoutError: If the command exceeds the timeout.
+        """
+        stdout = await self._run(
+            command, params=params, flags=flags, timeout=timeout, priority=priority
+        )
+        return self._loads(stdout)
+
+    async def _run(
+        self,
+        command: str,
+        *,
+        params: dict[str, str] | None,
+        flags: list[str] | None,
+        timeout: float | None,
+        priority: Priority | None,
+    ) -> bytes:
+        key = CLICache.key(command, params, flags)
+        cache = self._cache
+        if key is None:
+            # Reads issued after this point must not join reads that
+            # started before the (possibly mutating) command.
+            self._epoch += 1
+            try:
+                return await self._spawn(
+                    command,
+                    params=params,
+                    flags=flags,
+                    timeout=timeout,
+                    priority=priority,
+                )
+            finally:
+                self._epoch += 1
+                # A failed or timed-out write may still have been applied.
+                if cache is not None:
+                    cache.invalidate(command, params)
+                for index in self._indexes:
+                    index.invalidate(command, params)
+                if self._watcher is not None:
+                    self._watcher.invalidate(command, params)
+
+        generation = 0
+        if cache is not None:
+            cached = cache.get(key)
+            if isinstance(cached, CommandError):
+                raise cached
+            if cached is not None:
+                return cached
+            generation = cache.generation
+
+        # Identical reads already in flight share one process.
+        return await self._inflight.run(
+            (self._epoch, key),
+            lambda: self._fetch(
+                key,
+                generation,
+                command,
+                params=params,
+                flags=flags,
+                timeout=timeout,
+                priority=priority,
+            ),
+        )
+
+    async def _fetch(
+        self,
+        key: CacheKey,
+        generation: int,
+        command: str,
+        *,
+        params: dict[str, str] | None,
+        flags: list[str] | None,
+        timeout: float | None,
+        priority: Priority | None,
+    ) -> bytes:
+        cache = self._cache
+        if cache is None:
+            return await self._spawn(
+                command, params=params, flags=flags, timeout=timeout, priority=priority
+            )
+        try:
+            stdout = await self._spawn(
+                command, params=params, flags=flags, timeout=timeout, priority=priority
+            )
+        except CommandError as exc:
+            cache.put(key, exc, generation=generation)
+            raise
+        cache.put(key, stdout, generation=generation)
+        return stdout
+
+    async def _spawn(
+        self,
+        command: str,
+        *,
+        params: dict[str, str] | None,
+        flags: list[str] | None,
+        timeout: float | None,
+        priority: Priority | None,
+    ) -> bytes:
+        hooks = self._hooks
+        if not hooks:
+            return await self._spawn_process(
+                command,
+                params=params,
+                flags=flags,
+                timeout=timeout,
+                priority=priority,
+                event=None,
+            )
+
+        event = CommandEvent(
+            "cli", command, tuple(params or ()), time.time(), vault=self._vault
+        )
+        hooks.start(event)
+        start = time.perf_counter()
+        try:
+            stdout = await self._spawn_process(
+                command,
+                params=params,
+                flags=flags,
+                timeout=timeout,
+                priority=priority,
+                event=event,
+            )
+        except BaseException as exc:
+            event.wall_time = time.perf_counter() - start
+            hooks.error(event, exc)
+            raise
+        event.wall_time = time.perf_counter() - start
+        hooks.finish(event)
+        return stdout
+
+    async def _spawn_process(
+        self,
+        command: str,
+        *,
+        params: dict[str, str] | None,
+        flags: list[str] | None,
+        timeout: float | None,
+        priority: Priority | None,
+        event: CommandEvent | None,
+    ) -> bytes:
+        effective_timeout = timeout if timeout is not None else self._timeout
+        args = self._build_args(command, params, flags)
+        queued = time.perf_counter() if event is not None else 0.0
+
+        async with self._scheduler.slot(priority):
+            if event is not None:
+                spawning = time.perf_counter()
+                event.queue_time = spawning - queued
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            output: Awaitable[tuple[bytes, bytes]]
+            if event is not None:
+                spawned = time.perf_counter()
+                event.spawn_latency = spawned - spawning
+                output = _read_output(process, event, spawned)
+            else:
+                output = process.communicate()
+
+            try:
+                stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                    output, timeout=effective_timeout
+                )
+            except BaseException as exc:
+                # Timed out or cancelled: the process must not outlive the
+                # call and keep holding its slot.
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                if isinstance(exc, TimeoutError):
+                    raise CLITimeoutError(command, effective_timeout) from exc
+                raise
+
+        if event is not None:
+            event.stdout_bytes = len(stdout_bytes)
+            event.stderr_bytes = len(stderr_bytes)
+            event.exit_code = process.returncode
+
+        stderr = stderr_bytes.decode()
+
+        if process.returncode != 0:
+            raise CommandError(command, process.returncode or 1, stderr)
+
+        if stderr:
+            logger.warning("CLI stderr for %r: %s", command, stderr)
+
+        return stdout_bytes
+
+    async def _stream(
+        self,
+        command: str,
+        *,
+        params: dict[str, str] | None = None,
+        flags: list[str] | None = None,
+        timeout: float | None = None,
+        priority: Priority | None = None,
+    ) -> AsyncGenerator[bytes]:
+        """Execute an Obsidian CLI command and yield stdout in chunks.
+
+        The process slot is held until the first output arrives, so the
+        consumer may run other commands while iterating. Closing the
+        iterator early kills the process.
+
+        Args:
+            command: CLI command name.
+            params: Key-value parameters passed as `key=value` arguments.
+            flags: Extra CLI flags.
+            timeout: Maximum time in seconds to wait for each chunk.
+                Defaults to the CLI timeout.
+            priority: Scheduling lane.
+
+        Yields:
+            Raw chunks of standard output.
+
+        Raises:
+            CommandError: If the command exits with a non-zero status.
+                Raised after all output has been yielded.
+            CLITimeoutError: If no output arrives within the timeout.
+        """
         effective_timeout = timeout if timeout is not None else self._timeout
+        args = self._build_args(command, params, flags)
+        hooks = self._hooks
+        event: CommandEvent | None = None
+        if hooks:
+            event = CommandEvent(
+                "cli", command, tuple(params or ()), time.time(), vault=self._vault
+            )
+            hooks.start(event)
+            start = time.perf_counter()
+        size = 0
+
+        async def read() -> bytes:
+            try:
+                return await asyncio.wait_for(
+                    stdout.read(CLI_STREAM_CHUNK_SIZE), timeout=effective_timeout
+                )
+            except TimeoutError:
+                raise CLITimeoutError(command, effective_timeout) from None
+
+        try:
+            # The slot covers spawning and the wait for the first output,
+            # not the consumer's loop: a loop body issuing commands of
+            # its own must not wait for the slot this stream holds.
+            async with self._scheduler.slot(priority):
+                if event is not None:
+                    spawning = time.perf_counter()
+                    event.queue_time = spawning - start
+                process = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                if event is not None:
+                    spawned = time.perf_counter()
+                    event.spawn_latency = spawned - spawning
+                assert process.stdout is not None and process.stderr is not None
+                stdout = process.stdout
+                stderr_task = asyncio.ensure_future(process.stderr.read())
+                try:
+                    chunk = await read()
+                except BaseException:
+                    if process.returncode is None:
+                        process.kill()
+                        await process.wait()
+                    stderr_task.cancel()
+                    raise
+            try:
+                while chunk:
+                    if event is not None and not size:
+                        event.ttfb = time.perf_counter() - spawned
+                    size += len(chunk)
+                    yield chunk
+                    chunk = await read()
+                returncode = await process.wait()
+                stderr_bytes = await stderr_task
+            finally:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                stderr_task.cancel()
+
+            if event is not None:
+                event.stderr_bytes = len(stderr_bytes)
+                event.exit_code = returncode
+            stderr = stderr_bytes.decode()
+            if returncode != 0:
+                raise CommandError(command, returncode or 1, stderr)
+        except GeneratorExit:
+            # Closed early by the consumer: the command was cut short,
+            # not failed.
+            if event is not None:
+                event.stdout_bytes = size
+                event.wall_time = time.perf_counter() - start
+                hooks.finish(event)
+            raise
+        except BaseException as exc:
+            if event is not None:
+                event.stdout_bytes = size
+                event.wall_time = time.perf_counter() - start
+                hooks.error(event, exc)
+            raise
+
+        if event is not None:
+            event.stdout_bytes = size
+            event.wall_time = time.perf_counter() - start
+            hooks.finish(event)
+
+        if stderr:
+            logger.warning("CLI stderr for %r: %s", command, stderr)
+
+    async def _iter_json(
+        self,
+        command: str,
+        *,
+        params: dict[str, str] | None = None,
+        flags: list[str] | None = None,
+        timeout: float | None = None,
+        priority: Priority | None = None,
+    ) -> AsyncGenerator[Any]:
+        """Execute a command that prints a JSON array and yield its elements.
+
+        Elements are decoded incrementally as stdout arrives, so the
+        full output is never held in memory. Closing the iterator early
+        kills the process.
+
+        Args:
+            command: CLI command name.
+            params: Key-value parameters passed as `key=value` arguments.
+            flags: Extra CLI flags.
+            timeout: Maximum time in seconds to wait for each chunk.
+            priority: Scheduling lane.
 
+        Yields:
+            Decoded array elements in order.
+
+        Raises:
+            CommandError: If the command exits with a non-zero status.
+            CLITimeoutError: If no output arrives within the timeout.
+            ValueError: If the output is not a JSON array.
+        """
+        parser = JSONArrayParser()
+        chunks = self._stream(
+            command, params=params, flags=flags, timeout=timeout, priority=priority
+        )
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                for item in parser.feed(chunk):
+                    yield item
+        for item in parser.close():
+            yield item
+
+    def _build_args(
+        self,
+        command: str,
+        params: dict[str, str] | None,
+        flags: list[str] | None,
+    ) -> list[str]:
         args: list[str] = [
             self._binary,
             command,
@@ -136,32 +879,159 @@ class ObsidianCLI:
             args.extend(f"{k}={v}" for k, v in params.items())
         if flags:
             args.extend(flags)
+        return args
+
+    # -- batches -----------------------------------------------------------
 
-        process = await asyncio.create_subprocess_exec(
-            *args,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+    async def run_many(
+        self,
+        calls: Iterable[CLICall],
+        *,
+        concurrency: int | None = None,
+        priority: Priority = Priority.BACKGROUND,
+    ) -> list[str | CLIError]:
+        """Run many CLI commands with bounded concurrency.
+
+        ```python
+        results = await cli.run_many(
+            CLICall("read", params={"path": path}) for path in paths
         )
+        ```
 
-        try:
-            stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                process.communicate(), timeout=effective_timeout
+        Args:
+            calls: Command descriptors to run.
+            concurrency: Maximum number of commands of this batch in
+                flight at once. Defaults to the scheduler limit.
+            priority: Scheduling lane for the batch.
+
+        Returns:
+            Command outputs in the order of `calls`. A command that
+            failed with `CommandError` or `CLITimeoutError` has the
+            exception in its place instead of aborting the batch.
+        """
+        results: dict[int, str | CLIError] = {}
+        async for index, result in self.iter_many(
+            calls, concurrency=concurrency, priority=priority
+        ):
+            results[index] = result
+        return [results[index] for index in range(len(results))]
+
+    async def iter_many(
+        self,
+        calls: Iterable[CLICall],
+        *,
+        concurrency: int | None = None,
+        priority: Priority = Priority.BACKGROUND,
+    ) -> AsyncIterator[tuple[int, str | CLIError]]:
+        """Run many CLI commands, yielding results as they complete.
+
+        Args:
+            calls: Command descriptors to run.
+            concurrency: Maximum number of commands of this batch in
+                flight at once. Defaults to the scheduler limit.
+            priority: Scheduling lane for the batch.
+
+        Yields:
+            `(index, result)` pairs in completion order, where `index`
+            is the position in `calls` and `result` is the command
+            output or the `CLIError` it raised. Closing the iterator
+            early (e.g. with `contextlib.aclosing`) cancels the
+            remaining commands.
+        """
+        if concurrency is None:
+            concurrency = self._scheduler.max_concurrency or DEFAULT_CLI_MAX_CONCURRENCY
+
+        async def execute(call: CLICall, lane: Priority) -> str:
+            return await self._execute(
+                call.command,
+                params=call.params,
+                flags=call.flags,
+                timeout=call.timeout,
+                priority=lane,
             )
-        except TimeoutError:
-            process.kill()
-            await process.wait()
-            raise CLITimeoutError(command, effective_timeout)
 
-        stdout = stdout_bytes.decode()
-        stderr = stderr_bytes.decode()
+        tracing = self._tracing
+        if tracing is None:
+            batch = iter_calls(
+                execute, calls, concurrency=concurrency, priority=priority
+            )
+            async with aclosing(batch):
+                async for item in batch:
+                    yield item
+            return
+
+        span = tracing.start_batch(
+            "obsidian batch",
+            {
+                "obsidian.vault": self._vault,
+                "obsidian.batch.concurrency": concurrency,
+                "obsidian.batch.priority": str(priority),
+            },
+        )
 
-        if process.returncode != 0:
-            raise CommandError(command, process.returncode or 1, stderr)
+        async def traced(call: CLICall, lane: Priority) -> str:
+            with tracing.activate(span):
+                return await execute(call, lane)
 
-        if stderr:
-            logger.warning("CLI stderr for %r: %s", command, stderr)
+        count = errors = 0
+        error: BaseException | None = None
+        batch = iter_calls(traced, calls, concurrency=concurrency, priority=priority)
+        try:
+            async with aclosing(batch):
+                async for item in batch:
+                    count += 1
+                    errors += isinstance(item[1], CLIError)
+                    yield item
+        except GeneratorExit:
+            raise
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            span.set_attribute("obsidian.batch.calls", count)
+            span.set_attribute("obsidian.batch.errors", errors)
+            tracing.end_batch(span, error)
+
+    def script(self) -> CLIScriptBatch:
+        """Start a script batch of read-only operations.
+
+        The batch packs file reads, frontmatter, outgoing links and
+        heading lookups for many notes into a single `eval` invocation,
+        turning N process spawns into one.
 
-        return stdout
+        Returns:
+            An empty `CLIScriptBatch` bound to this CLI.
+        """
+        from .cli.script import CLIScriptBatch
+
+        return CLIScriptBatch(self)
+
+    async def snapshot(
+        self, prefix: str = "", *, timeout: float | None = None
+    ) -> AsyncIterator[NoteRecord]:
+        """Dump the metadata of the whole vault in a single round trip.
+
+        Reads Obsidian's metadata cache (file stats, frontmatter, tags
+        and links) for every file with one `eval` invocation instead of
+        thousands of per-file commands.
+
+        ```python
+        async for record in cli.snapshot("projects/"):
+            print(record.path, record.tags)
+        ```
+
+        Args:
+            prefix: Only include files whose path starts with this prefix.
+            timeout: Maximum time in seconds to wait for each chunk of
+                output. Defaults to the CLI timeout.
+
+        Yields:
+            One `NoteRecord` per file, as soon as it has been received.
+        """
+        from .cli.snapshot import iter_snapshot
+
+        async for record in iter_snapshot(self, prefix, timeout=timeout):
+            yield record
 
     # -- resources ---------------------------------------------------------
 
@@ -350,7 +1220,56 @@ class ObsidianCLI:
     # -- lifecycle ---------------------------------------------------------
 
     async def __aenter__(self) -> ObsidianCLI:
+        watcher = self._watcher
+        if watcher is not None and self._watch_task is None:
+            if watcher.root is None:
+                watcher.root = await self._vault_root()
+            events = watcher.events()
+            await watcher.start()
+            self._watch_task = asyncio.create_task(self._follow(events))
         return self
 
     async def __aexit__(self, *exc: object) -> None:
-        pass
+        if self._fs is not None:
+            self._fs.close()
+        if self._watcher is not None and self._watch_task is not None:
+            await self._watcher.close()
+            await self._watch_task
+            self._watch_task = None
+
+    async def _follow(self, events: AsyncIterator[VaultEvent]) -> None:
+        """Apply changes seen by the watcher to the cache and the indexes."""
+        async for event in events:
+            # Writes made through this instance were applied in `_run()`.
+            if event.source == "client":
+                continue
+            if self._cache is not None:
+                if event.path:
+                    self._cache.invalidate_paths(event.paths)
+                else:
+                    self._cache.clear()
+            # Indexes only hold notes; other files do not concern them.
+            notes = [
+                path for path in event.paths if event.is_dir or path.endswith(".md")
+            ]
+            for index in self._indexes:
+                index.mark_changed(notes)
+
+
+async def _read_output(
+    process: asyncio.subprocess.Process, event: CommandEvent, spawned: float
+) -> tuple[bytes, bytes]:
+    """Like `Process.communicate()`, recording time to the first stdout byte."""
+    assert process.stdout is not None and process.stderr is not None
+    stderr_task = asyncio.ensure_future(process.stderr.read())
+    try:
+        chunks: list[bytes] = []
+        while chunk := await process.stdout.read(CLI_STREAM_CHUNK_SIZE):
+            if not chunks:
+                event.ttfb = time.perf_counter() - spawned
+            chunks.append(chunk)
+        stderr = await stderr_task
+    finally:
+        stderr_task.cancel()
+    await process.wait()
+    return b"".join(chunks), stderr
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Iterable
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from ._constants import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_SCHEME, DEFAULT_TIMEOUT
 from ._exceptions import APIError, AuthenticationError, NotFoundError
+from ._hooks import CommandEvent, CommandHooks, HookDispatcher, route_template
+from ._json import JSONBackend, get_loads
+from ._singleflight import SingleFlight
 
 if TYPE_CHECKING:
     import httpx
 
+    from ._metrics import MetricsRegistry, MetricsSnapshot
+    from ._tracing import TracingHooks
     from .rest.active import ActiveFileResource
     from .rest.commands import CommandsResource
     from .rest.open import OpenResource
@@ -17,6 +24,8 @@ if TYPE_CHECKING:
     from .rest.system import SystemResource
     from .rest.vault import VaultResource
 
+_RequestKey = tuple[int, str, tuple[tuple[str, str], ...], tuple[tuple[str, str], ...]]
+
 
 class ObsidianClient:
     """Async client for the Obsidian Local REST API.
@@ -41,6 +50,18 @@ class ObsidianClient:
             `False` because the plugin uses self-signed certificates.
         http_client: Optional pre-configured `httpx.AsyncClient`. When
             provided, the client will **not** be closed on `aclose()`.
+        json_backend: JSON decoder for response bodies: `"orjson"`,
+            `"msgspec"`, `"json"`, or `"auto"` to use the fastest one
+            installed.
+        hooks: `CommandHooks` notified when each HTTP request starts,
+            finishes or fails.
+        metrics: `True` to collect call counts, errors and latency
+            percentiles in a new `MetricsRegistry`, or an existing
+            registry to share with other clients. Read them with
+            `metrics()`.
+        tracing: `True` to emit an OpenTelemetry span for every call
+            (requires `opentelemetry-api`), or a configured
+            `TracingHooks`.
     """
 
     def __init__(
@@ -53,6 +74,10 @@ class ObsidianClient:
         timeout: float = DEFAULT_TIMEOUT,
         verify_ssl: bool = False,
         http_client: httpx.AsyncClient | None = None,
+        json_backend: JSONBackend = "auto",
+        hooks: Iterable[CommandHooks] = (),
+        metrics: MetricsRegistry | bool = False,
+        tracing: TracingHooks | bool = False,
     ) -> None:
         self._host = host
         self._port = port
@@ -61,6 +86,27 @@ class ObsidianClient:
         self._api_key = api_key
         self._timeout = timeout
         self._verify_ssl = verify_ssl
+        self._loads = get_loads(json_backend)
+        self._inflight: SingleFlight[_RequestKey, httpx.Response] = SingleFlight()
+        self._epoch = 0
+        self._hooks = HookDispatcher(hooks)
+        # Imported on demand to keep them off the import path of short scripts.
+        self._metrics: MetricsRegistry | None = None
+        if metrics:
+            if metrics is True:
+                from ._metrics import MetricsRegistry
+
+                metrics = MetricsRegistry()
+            self._metrics = metrics
+            self._hooks.add(metrics)
+        self._tracing: TracingHooks | None = None
+        if tracing:
+            if tracing is True:
+                from ._tracing import TracingHooks
+
+                tracing = TracingHooks()
+            self._tracing = tracing
+            self._hooks.add(tracing)
         self._external_client = http_client is not None
         self._http = http_client or self._build_http_client()
 
@@ -75,6 +121,37 @@ class ObsidianClient:
             ) from None
         return httpx
 
+    def add_hook(self, hook: CommandHooks) -> None:
+        """Register an instrumentation hook.
+
+        Args:
+            hook: Hook to notify about every subsequent request.
+        """
+        self._hooks.add(hook)
+
+    def remove_hook(self, hook: CommandHooks) -> None:
+        """Unregister a hook added with `add_hook()` or the constructor.
+
+        Raises:
+            ValueError: If the hook is not registered.
+        """
+        self._hooks.remove(hook)
+
+    @property
+    def metrics_registry(self) -> MetricsRegistry | None:
+        """Metrics registry, if metrics were enabled."""
+        return self._metrics
+
+    def metrics(self) -> MetricsSnapshot:
+        """Return a snapshot of the collected metrics.
+
+        Raises:
+            RuntimeError: If the client was created without `metrics=`.
+        """
+        if self._metrics is None:
+            raise RuntimeError("Metrics are disabled. Pass metrics=True to enable.")
+        return self._metrics.snapshot()
+
     def __repr__(self) -> str:
         return (
             f"ObsidianClient(host={self._host!r}, port={self._port!r}, "
@@ -106,6 +183,9 @@ class ObsidianClient:
         Prefer using the resource methods (e.g. `client.vault.get()`)
         for typical operations.
 
+        Identical `GET` requests that are already in flight share one
+        HTTP round trip and receive the same response.
+
         Args:
             method: HTTP method (GET, POST, PUT, PATCH, DELETE).
             path: API endpoint path (e.g. `"/vault/note.md"`).
@@ -122,16 +202,80 @@ class ObsidianClient:
             NotFoundError: If the resource is not found (HTTP 404).
             APIError: For any other HTTP error (status >= 400).
         """
-        response = await self._http.request(
-            method,
-            path,
-            content=content,
-            json=json,
-            headers=headers,
-            params=params,
+        if method.upper() == "GET" and content is None and json is None:
+            # Identical GETs already in flight share one HTTP round trip.
+            key = (self._epoch, path, _freeze(headers), _freeze(params))
+            return await self._inflight.run(
+                key, lambda: self._send(method, path, headers=headers, params=params)
+            )
+        # GETs issued after this point must not join ones sent before it.
+        self._epoch += 1
+        try:
+            return await self._send(
+                method, path, content=content, json=json, headers=headers, params=params
+            )
+        finally:
+            self._epoch += 1
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        content: str | bytes | None = None,
+        json: Any = None,
+        headers: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        hooks = self._hooks
+        if not hooks:
+            response = await self._http.request(
+                method,
+                path,
+                content=content,
+                json=json,
+                headers=headers,
+                params=params,
+            )
+            if response.status_code >= 400:
+                self._raise_for_status(response)
+            return response
+
+        event = CommandEvent(
+            "rest",
+            method.upper(),
+            tuple(params or ()),
+            time.time(),
+            path=path,
+            route=route_template(path),
         )
-        if response.status_code >= 400:
-            self._raise_for_status(response)
+        hooks.start(event)
+        start = time.perf_counter()
+        try:
+            request = self._http.build_request(
+                method,
+                path,
+                content=content,
+                json=json,
+                headers=headers,
+                params=params,
+            )
+            response = await self._http.send(request, stream=True)
+            event.ttfb = time.perf_counter() - start
+            event.status_code = response.status_code
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            event.response_size = len(response.content)
+            if response.status_code >= 400:
+                self._raise_for_status(response)
+        except BaseException as exc:
+            event.wall_time = time.perf_counter() - start
+            hooks.error(event, exc)
+            raise
+        event.wall_time = time.perf_counter() - start
+        hooks.finish(event)
         return response
 
     @staticmethod
@@ -220,3 +364,9 @@ class ObsidianClient:
         """
         if not self._external_client:
             await self._http.aclose()
+
+
+def _freeze(mapping: dict[str, Any] | None) -> tuple[tuple[str, str], ...]:
+    if not mapping:
+        return ()
+    return tuple(sorted((key, str(value)) for key, value in mapping.items()))
@@ -5,3 +5,11 @@ DEFAULT_PORT = 27124
 DEFAULT_SCHEME = "https"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_CLI_TIMEOUT = 30.0
+DEFAULT_CLI_MAX_CONCURRENCY = 8
+CLI_STREAM_CHUNK_SIZE = 64 * 1024
+DEFAULT_CLI_CACHE_TTL = 60.0
+DEFAULT_CLI_CACHE_NEGATIVE_TTL = 5.0
+DEFAULT_CLI_CACHE_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_WATCH_DEBOUNCE = 0.05
+DEFAULT_WATCH_MAX_DELAY = 1.0
+DEFAULT_WATCH_INTERVAL = 1.0
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Literal
+
+from ._exceptions import APIError, CommandError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, eq=False)
+class CommandEvent:
+    """Timing and size data for one CLI command or REST request.
+
+    The same object is passed to `on_start`, `on_finish` and
+    `on_error`; fields are filled in as the call progresses, so most
+    of them are `None` in `on_start`. Durations are in seconds.
+
+    Attributes:
+        transport: `"cli"` for `ObsidianCLI`, `"rest"` for
+            `ObsidianClient`.
+        command: CLI command name (e.g. `"read"`) or HTTP method.
+        param_keys: Names of the CLI parameters or URL query parameters.
+            Values are not recorded.
+        started_at: Unix timestamp of the start of the call.
+        vault: Name of the vault (CLI only).
+        path: Request path (REST only).
+        route: Route template of `path` with file names and other
+            variable parts replaced by placeholders, e.g.
+            `"/vault/{path}"` (REST only). Safe to use as a metric label.
+        queue_time: Time spent waiting for a scheduler slot (CLI only).
+        spawn_latency: Time to start the `obsidian` process (CLI only).
+        ttfb: Time to the first byte of output, measured from process
+            start (CLI) or from sending the request (REST, response
+            headers).
+        wall_time: Total time of the call, including `queue_time`.
+        stdout_bytes: Size of standard output (CLI only).
+        stderr_bytes: Size of standard error (CLI only).
+        exit_code: Process exit code (CLI only).
+        status_code: HTTP status code (REST only).
+        response_size: Size of the response body (REST only).
+    """
+
+    transport: Literal["cli", "rest"]
+    command: str
+    param_keys: tuple[str, ...]
+    started_at: float
+    vault: str | None = None
+    path: str | None = None
+    route: str | None = None
+    queue_time: float | None = None
+    spawn_latency: float | None = None
+    ttfb: float | None = None
+    wall_time: float | None = None
+    stdout_bytes: int | None = None
+    stderr_bytes: int | None = None
+    exit_code: int | None = None
+    status_code: int | None = None
+    response_size: int | None = None
+
+
+def route_template(path: str) -> str:
+    """Return the Local REST API route template for a request path.
+
+    ```python
+    route_template("/vault/Daily/2024-01-01.md")  # "/vault/{path}"
+    route_template("/commands/editor:save-file/")  # "/commands/{commandId}/"
+    ```
+
+    Paths that do not belong to a known route are returned unchanged.
+    """
+    head, _, rest = path.lstrip("/").partition("/")
+    if not rest:
+        return path
+    if head == "vault" or head == "open":
+        placeholder = "{path}" if head == "vault" else "{filename}"
+        return f"/{head}/{placeholder}{'/' if rest.endswith('/') else ''}"
+    if head == "commands":
+        return "/commands/{commandId}/"
+    if head == "periodic":
+        parts = rest.rstrip("/").split("/")
+        if len(parts) == 1:
+            return "/periodic/{period}/"
+        if len(parts) == 4:
+            return "/periodic/{period}/{year}/{month}/{day}/"
+    return path
+
+
+def error_label(error: BaseException) -> str:
+    """Return a low-cardinality label for a failed call.
+
+    The exit code for `CommandError`, the HTTP status for `APIError`,
+    `"cancelled"` for cancellation, and the exception name otherwise.
+    """
+    if isinstance(error, CommandError):
+        return str(error.exit_code)
+    if isinstance(error, APIError):
+        return str(error.status_code)
+    if isinstance(error, asyncio.CancelledError):
+        return "cancelled"
+    return type(error).__name__
+
+
+class CommandHooks:
+    """Base class for instrumentation hooks.
+
+    Subclass and override the callbacks you need, then pass instances
+    to `ObsidianCLI(hooks=...)` or `ObsidianClient(hooks=...)`:
+
+    ```python
+    class SlowCommands(CommandHooks):
+        def on_finish(self, event: CommandEvent) -> None:
+            if event.wall_time and event.wall_time > 1.0:
+                print(event.command, event.wall_time)
+    ```
+
+    Callbacks run synchronously on the event loop, so they should be
+    cheap. Exceptions raised by a hook are logged and otherwise ignored.
+    """
+
+    def on_start(self, event: CommandEvent) -> None:
+        """Called before the command is queued or the request is sent."""
+
+    def on_finish(self, event: CommandEvent) -> None:
+        """Called after a successful command or request."""
+
+    def on_error(self, event: CommandEvent, error: BaseException) -> None:
+        """Called when the command or request fails or is cancelled.
+
+        Args:
+            event: The event, with the fields known at failure time.
+            error: The exception that is about to propagate.
+        """
+
+
+class HookDispatcher:
+    """Fans events out to registered `CommandHooks`.
+
+    Evaluates to `False` when no hooks are registered, so callers can
+    skip all instrumentation with a single check.
+    """
+
+    __slots__ = ("_hooks",)
+
+    def __init__(self, hooks: Iterable[CommandHooks] = ()) -> None:
+        self._hooks: tuple[CommandHooks, ...] = tuple(hooks)
+
+    def __bool__(self) -> bool:
+        return bool(self._hooks)
+
+    def __iter__(self) -> Iterator[CommandHooks]:
+        return iter(self._hooks)
+
+    def add(self, hook: CommandHooks) -> None:
+        self._hooks = (*self._hooks, hook)
+
+    def remove(self, hook: CommandHooks) -> None:
+        hooks = list(self._hooks)
+        hooks.remove(hook)
+        self._hooks = tuple(hooks)
+
+    def start(self, event: CommandEvent) -> None:
+        for hook in self._hooks:
+            try:
+                hook.on_start(event)
+            except Exception:
+                logger.exception("Hook %r failed in on_start", hook)
+
+    def finish(self, event: CommandEvent) -> None:
+        for hook in self._hooks:
+            try:
+                hook.on_finish(event)
+            except Exception:
+                logger.exception("Hook %r failed in on_finish", hook)
+
+    def error(self, event: CommandEvent, error: BaseException) -> None:
+        for hook in self._hooks:
+            try:
+                hook.on_error(event, error)
+            except Exception:
+                logger.exception("Hook %r failed in on_error", hook)
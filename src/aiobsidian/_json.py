@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any, Literal
+
+JSONBackend = Literal["auto", "orjson", "msgspec", "json"]
+"""Name of a JSON decoder: `"auto"` picks the fastest installed one."""
+
+JSONLoads = Callable[[bytes | str], Any]
+
+_AUTO_ORDER: tuple[JSONBackend, ...] = ("orjson", "msgspec", "json")
+
+
+def get_loads(backend: JSONBackend = "auto") -> JSONLoads:
+    """Return a decode function for the given JSON backend.
+
+    All decoders accept raw `bytes` (UTF-8) as well as `str`, so
+    process output and HTTP bodies can be parsed without decoding them
+    first.
+
+    Args:
+        backend: `"orjson"`, `"msgspec"`, `"json"` (standard library),
+            or `"auto"` to use the first of these that is installed.
+
+    Returns:
+        A callable that decodes a JSON document.
+
+    Raises:
+        ImportError: If the requested backend is not installed.
+        ValueError: If the backend name is unknown.
+    """
+    if backend == "auto":
+        for name in _AUTO_ORDER:
+            try:
+                return get_loads(name)
+            except ImportError:
+                continue
+    if backend == "orjson":
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(
+                "orjson is required for json_backend='orjson'. "
+                "Install with: pip install aiobsidian[speedups]"
+            ) from None
+        loads: JSONLoads = orjson.loads
+        return loads
+    if backend == "msgspec":
+        try:
+            import msgspec
+        except ImportError:
+            raise ImportError(
+                "msgspec is required for json_backend='msgspec'. "
+                "Install with: pip install msgspec"
+            ) from None
+        decode: JSONLoads = msgspec.json.decode
+        return decode
+    if backend == "json":
+        return json.loads
+    raise ValueError(f"Unknown JSON backend: {backend!r}")
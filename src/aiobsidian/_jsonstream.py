@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+_COMPACT_AT = 1 << 16
+
+
+class JSONArrayParser:
+    """Incremental parser for a top-level JSON array.
+
+    Bytes are fed in arbitrary chunks (UTF-8 sequences may be split
+    across chunks); every array element that is complete so far is
+    returned as soon as it can be decoded, so memory use is bounded by
+    the largest single element rather than the whole document.
+
+    ```python
+    parser = JSONArrayParser()
+    for chunk in chunks:
+        for item in parser.feed(chunk):
+            ...
+    parser.close()
+    ```
+    """
+
+    __slots__ = ("_text", "_buffer", "_pos", "_state", "_decoder")
+
+    def __init__(self) -> None:
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add a chunk of input and return the newly completed elements.
+
+        Raises:
+            ValueError: If the input is not a JSON array.
+        """
+        self._buffer += self._text.decode(chunk)
+        return self._parse(final=False)
+
+    def feed_text(self, text: str) -> list[Any]:
+        """Like `feed()`, for input that is already decoded."""
+        self._buffer += text
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        """Signal end of input and return any remaining elements.
+
+        Raises:
+            ValueError: If the input ended before the array was closed.
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._parse(final=True)
+        if self._state != "end":
+            raise ValueError("Unexpected end of JSON array")
+        return items
+
+    def _parse(self, *, final: bool) -> list[Any]:
+        items: list[Any] = []
+        buffer = self._buffer
+        pos = self._pos
+        size = len(buffer)
+        while True:
+            while pos < size and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos >= size:
+                break
+            char = buffer[pos]
+            if self._state == "start":
+                if char != "[":
+                    raise ValueError(f"Expected '[' at position {pos}, got {char!r}")
+                self._state = "first"
+                pos += 1
+            elif self._state in ("first", "item"):
+                if char == "]" and self._state == "first":
+                    self._state = "end"
+                    pos += 1
+                    continue
+                try:
+                    value, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                if (
+                    not final
+                    and isinstance(value, int | float)
+                    and not buffer[end:].strip(_NUMBER_CHARS)
+                ):
+                    # A number at the end of the buffer may still be incomplete.
+                    break
+                items.append(value)
+                self._state = "separator"
+                pos = end
+            elif self._state == "separator":
+                if char == ",":
+                    self._state = "item"
+                elif char == "]":
+                    self._state = "end"
+                else:
+                    raise ValueError(f"Expected ',' or ']' at position {pos}")
+                pos += 1
+            else:
+                raise ValueError(f"Unexpected data after JSON array at position {pos}")
+
+        if pos >= _COMPACT_AT:
+            self._buffer = buffer[pos:]
+            self._pos = 0
+        else:
+            self._buffer = buffer
+            self._pos = pos
+        return items
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ._exceptions import CLITimeoutError
+from ._hooks import CommandEvent, CommandHooks, error_label
+
+_SUB_BITS = 7
+_SUB_COUNT = 1 << _SUB_BITS
+_HALF = _SUB_COUNT >> 1
+_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class LatencyHistogram:
+    """Log-linear (HDR-style) histogram of durations.
+
+    Values are recorded with microsecond resolution into buckets whose
+    width grows with magnitude, keeping the relative error of any
+    reported percentile under 2% at constant memory per order of
+    magnitude.
+    """
+
+    __slots__ = ("_counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one duration in seconds."""
+        index = _bucket(max(0, int(seconds * 1_000_000)))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        if not self.count or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, q: float) -> float:
+        """Return the `q`-quantile (0 < q <= 1) in seconds, or 0 if empty."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(q * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                value = _bucket_midpoint(index) / 1_000_000
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self) -> LatencySummary:
+        """Return count, sum, extremes and p50/p95/p99."""
+        p50, p95, p99 = (self.percentile(q) for q in _QUANTILES)
+        return LatencySummary(
+            count=self.count,
+            sum=self.total,
+            min=self.min,
+            max=self.max,
+            p50=p50,
+            p95=p95,
+            p99=p99,
+        )
+
+
+def _bucket(value: int) -> int:
+    if value < _SUB_COUNT:
+        return value
+    shift = value.bit_length() - _SUB_BITS
+    return _SUB_COUNT + (shift - 1) * _HALF + ((value >> shift) - _HALF)
+
+
+def _bucket_midpoint(index: int) -> float:
+    if index < _SUB_COUNT:
+        return float(index)
+    shift, offset = divmod(index - _SUB_COUNT, _HALF)
+    shift += 1
+    low = (offset + _HALF) << shift
+    return low + ((1 << shift) - 1) / 2
+
+
+@dataclass(frozen=True, slots=True)
+class LatencySummary:
+    """Latency distribution of one command or endpoint, in seconds.
+
+    Attributes:
+        count: Number of recorded calls.
+        sum: Total time of all calls.
+        min: Fastest call.
+        max: Slowest call.
+        p50: Median.
+        p95: 95th percentile.
+        p99: 99th percentile.
+    """
+
+    count: int
+    sum: float
+    min: float
+    max: float
+    p50: float
+    p95: float
+    p99: float
+
+
+@dataclass(frozen=True, slots=True)
+class CommandMetrics:
+    """Counters for one CLI command or REST endpoint.
+
+    Attributes:
+        transport: `"cli"` or `"rest"`.
+        name: CLI command name, or HTTP method and route template
+            (e.g. `"GET /vault/{path}"`).
+        calls: Completed calls, successful or not.
+        timeouts: Calls that timed out.
+        errors: Failed calls by exit code, HTTP status, or exception
+            name for other failures (e.g. `"CLITimeoutError"`).
+        output_bytes: Total stdout (CLI) or response body (REST) size.
+        latency: Wall-time distribution of all completed calls.
+    """
+
+    transport: str
+    name: str
+    calls: int
+    timeouts: int
+    errors: dict[str, int]
+    output_bytes: int
+    latency: LatencySummary
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSnapshot:
+    """Point-in-time copy of a `MetricsRegistry`.
+
+    Attributes:
+        in_flight: Calls currently running, by transport.
+        commands: Per-command and per-endpoint counters.
+    """
+
+    in_flight: dict[str, int]
+    commands: list[CommandMetrics]
+
+    def get(self, name: str, transport: str = "cli") -> CommandMetrics | None:
+        """Return the metrics of one command or endpoint, if recorded."""
+        for metrics in self.commands:
+            if metrics.name == name and metrics.transport == transport:
+                return metrics
+        return None
+
+
+class _Series:
+    __slots__ = ("calls", "timeouts", "errors", "output_bytes", "latency")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.timeouts = 0
+        self.errors: dict[str, int] = {}
+        self.output_bytes = 0
+        self.latency = LatencyHistogram()
+
+
+class MetricsRegistry(CommandHooks):
+    """In-process metrics collected from `CommandHooks` events.
+
+    Enable it with `ObsidianCLI(metrics=True)` /
+    `ObsidianClient(metrics=True)`, or share one registry between
+    clients by passing the same instance to both:
+
+    ```python
+    registry = MetricsRegistry()
+    cli = ObsidianCLI("MyVault", metrics=registry)
+    client = ObsidianClient(api_key, metrics=registry)
+    print(registry.render_prometheus())
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._in_flight: dict[str, int] = {"cli": 0, "rest": 0}
+
+    def __repr__(self) -> str:
+        return f"MetricsRegistry(series={len(self._series)!r})"
+
+    def on_start(self, event: CommandEvent) -> None:
+        self._in_flight[event.transport] += 1
+
+    def on_finish(self, event: CommandEvent) -> None:
+        series = self._finish(event)
+        series.output_bytes += _output_size(event)
+
+    def on_error(self, event: CommandEvent, error: BaseException) -> None:
+        series = self._finish(event)
+        series.output_bytes += _output_size(event)
+        if isinstance(error, CLITimeoutError) or _is_http_timeout(error):
+            series.timeouts += 1
+        code = error_label(error)
+        series.errors[code] = series.errors.get(code, 0) + 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return a copy of all counters and latency summaries."""
+        return MetricsSnapshot(
+            in_flight=dict(self._in_flight),
+            commands=[
+                CommandMetrics(
+                    transport=transport,
+                    name=name,
+                    calls=series.calls,
+                    timeouts=series.timeouts,
+                    errors=dict(series.errors),
+                    output_bytes=series.output_bytes,
+                    latency=series.latency.summary(),
+                )
+                for (transport, name), series in sorted(self._series.items())
+            ],
+        )
+
+    def reset(self) -> None:
+        """Drop all recorded series. The in-flight gauge is kept."""
+        self._series.clear()
+
+    def render_prometheus(self, *, prefix: str = "aiobsidian") -> str:
+        """Render the registry in the Prometheus text exposition format."""
+        return render_prometheus(self.snapshot(), prefix=prefix)
+
+    def _finish(self, event: CommandEvent) -> _Series:
+        self._in_flight[event.transport] -= 1
+        name = event.command
+        if event.transport == "rest":
+            name = f"{event.command} {event.route or event.path}"
+        key = (event.transport, name)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series()
+        series.calls += 1
+        if event.wall_time is not None:
+            series.latency.record(event.wall_time)
+        return series
+
+
+def _output_size(event: CommandEvent) -> int:
+    if event.transport == "cli":
+        return event.stdout_bytes or 0
+    return event.response_size or 0
+
+
+def _is_http_timeout(error: BaseException) -> bool:
+    # httpx is optional, so match its timeout family by name.
+    return any(cls.__name__ == "TimeoutException" for cls in type(error).__mro__)
+
+
+def render_prometheus(snapshot: MetricsSnapshot, *, prefix: str = "aiobsidian") -> str:
+    """Render a metrics snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot: Snapshot from `MetricsRegistry.snapshot()`.
+        prefix: Prefix for every metric name.
+
+    Returns:
+        The exposition text, ending with a newline.
+    """
+    lines: list[str] = []
+
+    def family(name: str, kind: str, help_text: str) -> str:
+        metric = f"{prefix}_{name}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        return metric
+
+    metric = family("in_flight", "gauge", "Commands and requests currently running.")
+    for transport, running in sorted(snapshot.in_flight.items()):
+        lines.append(f"{metric}{_labels(transport=transport)} {running}")
+
+    metric = family("calls_total", "counter", "Completed commands and requests.")
+    for m in snapshot.commands:
+        lines.append(
+            f"{metric}{_labels(transport=m.transport, command=m.name)} {m.calls}"
+        )
+
+    metric = family("errors_total", "counter", "Failed calls by exit code or status.")
+    for m in snapshot.commands:
+        for code, count in sorted(m.errors.items()):
+            labels = _labels(transport=m.transport, command=m.name, code=code)
+            lines.append(f"{metric}{labels} {count}")
+
+    metric = family("timeouts_total", "counter", "Calls that timed out.")
+    for m in snapshot.commands:
+        if m.timeouts:
+            labels = _labels(transport=m.transport, command=m.name)
+            lines.append(f"{metric}{labels} {m.timeouts}")
+
+    metric = family(
+        "output_bytes_total", "counter", "Bytes of stdout or response body."
+    )
+    for m in snapshot.commands:
+        labels = _labels(transport=m.transport, command=m.name)
+        lines.append(f"{metric}{labels} {m.output_bytes}")
+
+    metric = family("duration_seconds", "summary", "Wall time of calls.")
+    for m in snapshot.commands:
+        latency = m.latency
+        for q, value in zip(_QUANTILES, (latency.p50, latency.p95, latency.p99)):
+            labels = _labels(transport=m.transport, command=m.name, quantile=str(q))
+            lines.append(f"{metric}{labels} {value!r}")
+        labels = _labels(transport=m.transport, command=m.name)
+        lines.append(f"{metric}_sum{labels} {latency.sum!r}")
+        lines.append(f"{metric}_count{labels} {latency.count}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    body = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + body + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from ._types import Priority
+
+_current_priority: ContextVar[Priority] = ContextVar(
+    "aiobsidian_priority", default=Priority.INTERACTIVE
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LaneStats:
+    """Counters for a single scheduling lane.
+
+    Attributes:
+        queued: Number of commands currently waiting for a slot.
+        started: Total number of commands that obtained a slot.
+        waited: Number of commands that had to queue before starting.
+        wait_time_total: Sum of queueing time in seconds.
+        wait_time_max: Longest queueing time in seconds.
+    """
+
+    queued: int
+    started: int
+    waited: int
+    wait_time_total: float
+    wait_time_max: float
+
+
+@dataclass(frozen=True, slots=True)
+class SchedulerStats:
+    """Point-in-time snapshot of a `CLIScheduler`.
+
+    Attributes:
+        max_concurrency: Maximum number of processes allowed to run at
+            once, or `None` when unbounded.
+        in_flight: Number of processes currently running.
+        lanes: Per-lane counters keyed by `Priority`.
+    """
+
+    max_concurrency: int | None
+    in_flight: int
+    lanes: dict[Priority, LaneStats]
+
+    @property
+    def queued(self) -> int:
+        """Total number of commands waiting across all lanes."""
+        return sum(lane.queued for lane in self.lanes.values())
+
+
+class CLIScheduler:
+    """Bounded-concurrency scheduler for CLI processes.
+
+    Commands acquire a slot before spawning the `obsidian` binary.
+    When every slot is busy, they wait in the lane for their
+    `Priority`; a released slot is handed to the oldest waiter of the
+    highest-priority non-empty lane, so interactive commands never
+    queue behind background ones.
+
+    Args:
+        max_concurrency: Maximum number of processes allowed to run at
+            once. `None` disables the limit but keeps the counters.
+
+    Raises:
+        ValueError: If `max_concurrency` is less than 1.
+    """
+
+    def __init__(self, max_concurrency: int | None) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._max_concurrency = max_concurrency
+        self._in_flight = 0
+        self._waiters: dict[Priority, deque[asyncio.Future[None]]] = {
+            lane: deque() for lane in Priority
+        }
+        self._started = dict.fromkeys(Priority, 0)
+        self._waited = dict.fromkeys(Priority, 0)
+        self._wait_total = dict.fromkeys(Priority, 0.0)
+        self._wait_max = dict.fromkeys(Priority, 0.0)
+
+    def __repr__(self) -> str:
+        return (
+            f"CLIScheduler(max_concurrency={self._max_concurrency!r}, "
+            f"in_flight={self._in_flight!r})"
+        )
+
+    @property
+    def max_concurrency(self) -> int | None:
+        """Maximum number of processes allowed to run at once."""
+        return self._max_concurrency
+
+    @staticmethod
+    def current_priority() -> Priority:
+        """Return the lane selected for the current context."""
+        return _current_priority.get()
+
+    @staticmethod
+    @contextmanager
+    def lane(priority: Priority) -> Iterator[None]:
+        """Run the enclosed commands in the given lane.
+
+        The selection is stored in a context variable, so it applies
+        to every command issued from the current task and from tasks
+        it spawns.
+
+        Args:
+            priority: Lane to use for commands issued inside the block.
+        """
+        token = _current_priority.set(priority)
+        try:
+            yield
+        finally:
+            _current_priority.reset(token)
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        """Hold a process slot for the duration of the block.
+
+        Args:
+            priority: Lane to queue in. Defaults to the lane selected
+                for the current context.
+        """
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """Wait for a free process slot.
+
+        Args:
+            priority: Lane to queue in. Defaults to the lane selected
+                for the current context.
+        """
+        lane = priority if priority is not None else _current_priority.get()
+        if self._has_capacity():
+            self._in_flight += 1
+            self._started[lane] += 1
+            return
+
+        start = time.perf_counter()
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue = self._waiters[lane]
+        queue.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before cancellation.
+                self.release()
+            else:
+                try:
+                    queue.remove(future)
+                except ValueError:
+                    pass
+            raise
+
+        waited = time.perf_counter() - start
+        self._started[lane] += 1
+        self._waited[lane] += 1
+        self._wait_total[lane] += waited
+        if waited > self._wait_max[lane]:
+            self._wait_max[lane] = waited
+
+    def release(self) -> None:
+        """Release a slot, handing it to the next queued command if any."""
+        for lane in Priority:
+            queue = self._waiters[lane]
+            while queue:
+                future = queue.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    return
+        self._in_flight -= 1
+
+    def stats(self) -> SchedulerStats:
+        """Return a snapshot of queue depth, in-flight and wait counters."""
+        return SchedulerStats(
+            max_concurrency=self._max_concurrency,
+            in_flight=self._in_flight,
+            lanes={
+                lane: LaneStats(
+                    queued=sum(1 for f in self._waiters[lane] if not f.done()),
+                    started=self._started[lane],
+                    waited=self._waited[lane],
+                    wait_time_total=self._wait_total[lane],
+                    wait_time_max=self._wait_max[lane],
+                )
+                for lane in Priority
+            },
+        )
+
+    def _has_capacity(self) -> bool:
+        if any(self._waiters[lane] for lane in Priority):
+            return False
+        return self._max_concurrency is None or self._in_flight < self._max_concurrency
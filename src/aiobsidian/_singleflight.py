@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class _Call[V]:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[V]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight[K: Hashable, V]:
+    """Coalesces concurrent calls that share a key into one operation.
+
+    The first caller for a key starts the operation in its own task;
+    callers that arrive while it is running await the same result.
+    Cancelling one waiter does not affect the others. The operation is
+    cancelled only when every waiter has gone away.
+
+    ```python
+    flight: SingleFlight[str, bytes] = SingleFlight()
+    data = await flight.run("Index.md", lambda: fetch("Index.md"))
+    ```
+    """
+
+    __slots__ = ("_calls", "_coalesced")
+
+    def __init__(self) -> None:
+        self._calls: dict[K, _Call[V]] = {}
+        self._coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that joined an operation already in flight."""
+        return self._coalesced
+
+    async def run(self, key: K, operation: Callable[[], Awaitable[V]]) -> V:
+        """Run `operation`, or join the in-flight call with the same key.
+
+        Args:
+            key: Identity of the call. Equal keys share one operation.
+            operation: Factory for the awaitable to run on a miss.
+
+        Returns:
+            The result of the shared operation. Its exception, if any,
+            is raised in every waiter.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(operation()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+        else:
+            self._coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.task.done():
+                # The last waiter was cancelled: nobody needs the result.
+                self._forget(key, call)
+                call.task.cancel()
+
+    def _forget(self, key: K, call: _Call[V]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from ._hooks import CommandEvent, CommandHooks, error_label
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Span, TracerProvider
+
+
+def _import_trace() -> Any:
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        raise ImportError(
+            "opentelemetry-api is required for tracing. "
+            "Install with: pip install aiobsidian[tracing]"
+        ) from None
+    return trace
+
+
+class TracingHooks(CommandHooks):
+    """Emits an OpenTelemetry span for every CLI command and REST request.
+
+    Enable it with `ObsidianCLI(tracing=True)` /
+    `ObsidianClient(tracing=True)`. Spans are children of the span that
+    is current when the call is made, so Obsidian calls show up inside
+    your own request traces.
+
+    CLI spans are named `obsidian <command>` and carry the command and
+    vault name; REST spans are named `<METHOD> <route>` and carry the
+    HTTP method, route template and status code. Timing fields of
+    `CommandEvent` are added as `obsidian.*` attributes. Parameter
+    values and file paths are never recorded.
+
+    Args:
+        tracer_provider: Provider to get the tracer from. Defaults to
+            the globally configured one.
+
+    Raises:
+        ImportError: If `opentelemetry-api` is not installed.
+    """
+
+    def __init__(self, tracer_provider: TracerProvider | None = None) -> None:
+        self._trace = _import_trace()
+        self._tracer = self._trace.get_tracer(
+            "aiobsidian", tracer_provider=tracer_provider
+        )
+        self._spans: dict[CommandEvent, Span] = {}
+
+    def __repr__(self) -> str:
+        return f"TracingHooks(active={len(self._spans)!r})"
+
+    def on_start(self, event: CommandEvent) -> None:
+        kind = self._trace.SpanKind.CLIENT
+        if event.transport == "cli":
+            name = f"obsidian {event.command}"
+            attributes: dict[str, Any] = {"obsidian.command": event.command}
+            if event.vault is not None:
+                attributes["obsidian.vault"] = event.vault
+        else:
+            route = event.route or event.path or ""
+            name = f"{event.command} {route}"
+            attributes = {"http.request.method": event.command, "http.route": route}
+        if event.param_keys:
+            attributes["obsidian.param_keys"] = list(event.param_keys)
+        self._spans[event] = self._tracer.start_span(
+            name, kind=kind, attributes=attributes
+        )
+
+    def on_finish(self, event: CommandEvent) -> None:
+        span = self._spans.pop(event, None)
+        if span is None:
+            return
+        span.set_attributes(_result_attributes(event))
+        span.end()
+
+    def on_error(self, event: CommandEvent, error: BaseException) -> None:
+        span = self._spans.pop(event, None)
+        if span is None:
+            return
+        span.set_attributes(_result_attributes(event))
+        span.set_attribute("error.type", error_label(error))
+        if isinstance(error, Exception):
+            span.record_exception(error)
+        span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(error)))
+        span.end()
+
+    def start_batch(self, name: str, attributes: Mapping[str, Any]) -> Span:
+        """Start a parent span for a batch of calls.
+
+        The span is not made current; wrap the work of each call in
+        `activate()` so its spans become children of the batch.
+        """
+        span: Span = self._tracer.start_span(name, attributes=dict(attributes))
+        return span
+
+    @contextmanager
+    def activate(self, span: Span) -> Iterator[None]:
+        """Make `span` the current span without ending it on exit."""
+        # Failures of single calls are recorded on their own spans.
+        with self._trace.use_span(
+            span,
+            end_on_exit=False,
+            record_exception=False,
+            set_status_on_exception=False,
+        ):
+            yield
+
+    def end_batch(self, span: Span, error: BaseException | None = None) -> None:
+        """End a span started with `start_batch()`."""
+        if error is not None:
+            span.set_attribute("error.type", error_label(error))
+            span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, str(error))
+            )
+        span.end()
+
+
+def _result_attributes(event: CommandEvent) -> dict[str, Any]:
+    values = {
+        "obsidian.queue_time": event.queue_time,
+        "obsidian.spawn_latency": event.spawn_latency,
+        "obsidian.ttfb": event.ttfb,
+        "obsidian.stdout_bytes": event.stdout_bytes,
+        "obsidian.stderr_bytes": event.stderr_bytes,
+        "obsidian.exit_code": event.exit_code,
+        "http.response.status_code": event.status_code,
+        "http.response.body.size": event.response_size,
+    }
+    return {key: value for key, value in values.items() if value is not None}
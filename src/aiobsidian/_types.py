@@ -64,3 +64,17 @@ class ContentType(StrEnum):
     """Dataview Query Language query string."""
     JSONLOGIC = "application/vnd.olrapi.jsonlogic+json"
     """JsonLogic query object."""
+
+
+class Priority(StrEnum):
+    """Scheduling lane for CLI commands.
+
+    `ObsidianCLI` limits how many `obsidian` processes run at once.
+    When all slots are busy, queued interactive commands are always
+    started before queued background commands.
+    """
+
+    INTERACTIVE = "interactive"
+    """Latency-sensitive commands (the default)."""
+    BACKGROUND = "background"
+    """Bulk jobs that may wait behind interactive commands."""
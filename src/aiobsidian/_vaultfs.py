@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import posixpath
+import random
+import stat
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Literal
+
+from ._exceptions import CLIError, CommandError
+
+ReadBackend = Literal["cli", "filesystem"]
+
+VaultLocator = Callable[[], Awaitable[str]]
+
+
+class VaultFS:
+    """Serves read-only vault queries straight from the vault directory.
+
+    Used by `ObsidianCLI(read_backend="filesystem")`. Results have the
+    same shapes as the corresponding `obsidian` commands; blocking file
+    system calls run on a private thread pool. Like Obsidian, entries
+    whose name starts with a dot (`.obsidian`, `.trash`, ...) are
+    skipped.
+
+    Args:
+        root: Vault directory, or a coroutine function that returns it.
+            The function is awaited once, on first use.
+        max_workers: Size of the thread pool. `None` uses the
+            `ThreadPoolExecutor` default.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | VaultLocator,
+        *,
+        max_workers: int | None = None,
+    ) -> None:
+        if callable(root):
+            self._root: str | None = None
+            self._locate: VaultLocator | None = root
+        else:
+            self._root = os.path.abspath(root)
+            self._locate = None
+        self._lock = asyncio.Lock()
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __repr__(self) -> str:
+        return f"VaultFS(root={self._root!r})"
+
+    async def root(self) -> str:
+        """Return the vault directory, locating it on first use."""
+        if self._root is None:
+            async with self._lock:
+                if self._root is None:
+                    assert self._locate is not None
+                    self._root = os.path.abspath(await self._locate())
+        return self._root
+
+    def close(self) -> None:
+        """Shut the thread pool down without waiting for running reads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run[T](self, func: Callable[..., T], *args: Any) -> T:
+        root = await self.root()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self._max_workers, thread_name_prefix="aiobsidian-fs"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, root, *args))
+
+    # -- queries -------------------------------------------------------------
+
+    async def read(self, path: str) -> str:
+        """Content of a file (`obsidian read`)."""
+        return await self._run(_read, "read", path)
+
+    async def read_many(self, paths: Iterable[str]) -> list[str | CLIError]:
+        """Contents of many files; failures keep their `CLIError` in place."""
+        results = await asyncio.gather(
+            *(self.read(path) for path in paths), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, CLIError):
+                raise result
+        return results  # type: ignore[return-value]
+
+    async def files(
+        self, path: str = "", *, ext: str | None = None, folder: str | None = None
+    ) -> list[str]:
+        """File paths (`obsidian files`)."""
+        return await self._run(_list, path, ext, folder)
+
+    async def folders(self, path: str = "") -> list[str]:
+        """Folder paths (`obsidian folders`)."""
+        return await self._run(_folders, path)
+
+    async def file_info(self, path: str) -> dict[str, Any]:
+        """File metadata (`obsidian file`).
+
+        `ctime` is the creation time where the file system records it
+        (macOS, Windows, BSD). On Linux, `os.stat` has no creation time,
+        so it is the last inode change instead.
+        """
+        return await self._run(_file_info, path)
+
+    async def wordcount(self, file: str) -> dict[str, Any]:
+        """Word and character count of a note body (`obsidian wordcount`)."""
+        return await self._run(_wordcount, file)
+
+    async def random_read(self) -> str:
+        """Content of a random note (`obsidian random:read`)."""
+        return await self._run(_random_read)
+
+
+# -- blocking helpers, run on the thread pool ---------------------------------
+
+
+def _not_found(command: str, path: str) -> CommandError:
+    return CommandError(command, 1, f'Error: File "{path}" not found.')
+
+
+def _abspath(root: str, command: str, path: str) -> str:
+    full = os.path.normpath(os.path.join(root, path.strip("/")))
+    if not (full + os.sep).startswith(root.rstrip(os.sep) + os.sep):
+        raise CommandError(command, 1, f'Error: Path "{path}" is outside the vault.')
+    return full
+
+
+def _read(root: str, command: str, path: str) -> str:
+    # `newline=""` keeps CRLF line endings, as the CLI returns them.
+    try:
+        with open(_abspath(root, command, path), encoding="utf-8", newline="") as fh:
+            return fh.read()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        raise _not_found(command, path) from None
+    except UnicodeDecodeError:
+        raise CommandError(
+            command, 1, f'Error: File "{path}" is not a UTF-8 text file.'
+        ) from None
+
+
+def walk(root: str, prefix: str = "") -> tuple[list[str], list[str]]:
+    """All files and folders below `root`, in `obsidian files` order."""
+    files: list[str] = []
+    folders: list[str] = []
+    stack = [(root, prefix)]
+    while stack:
+        directory, rel = stack.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                subdirs.append((entry.path, rel + entry.name + "/"))
+            else:
+                files.append(rel + entry.name)
+        # Depth-first, pre-order: a folder's files, then its subfolders.
+        stack.extend(reversed(subdirs))
+        folders.extend(sub.rstrip("/") for _, sub in subdirs)
+    return files, folders
+
+
+def _list(root: str, path: str, ext: str | None, folder: str | None) -> list[str]:
+    # `path` and `folder` both restrict the listing to a subtree.
+    prefixes = sorted(p.strip("/") for p in (path, folder or "") if p.strip("/"))
+    start = max(prefixes, key=len, default="")
+    if any(not (start + "/").startswith(prefix + "/") for prefix in prefixes):
+        return []
+    files, _ = walk(_abspath(root, "files", start), start + "/" if start else "")
+    if ext:
+        suffix = "." + ext.lstrip(".")
+        files = [name for name in files if name.endswith(suffix)]
+    return files
+
+
+def _folders(root: str, path: str) -> list[str]:
+    start = path.strip("/")
+    _, folders = walk(_abspath(root, "folders", start), start + "/" if start else "")
+    folders.sort(key=lambda name: name.split("/"))
+    return folders
+
+
+def _file_info(root: str, path: str) -> dict[str, Any]:
+    path = path.strip("/")
+    try:
+        info = os.stat(_abspath(root, "file", path))
+    except (FileNotFoundError, NotADirectoryError):
+        raise _not_found("file", path) from None
+    if stat.S_ISDIR(info.st_mode):
+        raise _not_found("file", path)
+    name = posixpath.basename(path)
+    stem, extension = posixpath.splitext(name)
+    return {
+        "path": path,
+        "name": stem,
+        "extension": extension.lstrip("."),
+        "size": info.st_size,
+        "ctime": int(getattr(info, "st_birthtime", info.st_ctime) * 1000),
+        "mtime": int(info.st_mtime * 1000),
+    }
+
+
+def _resolve(root: str, command: str, file: str) -> str:
+    """Find a file by path or by note name, like the CLI's `file=`."""
+    target = file.strip().strip("/")
+    for candidate in (target, target + ".md"):
+        if os.path.isfile(_abspath(root, command, candidate)):
+            return candidate
+    files, _ = walk(root)
+    for candidate in files:
+        base = posixpath.basename(candidate)
+        if target in (base, posixpath.splitext(base)[0]):
+            return candidate
+    raise _not_found(command, file)
+
+
+def _body(text: str) -> str:
+    # Notes are read with their own line endings, which may be CRLF.
+    if text.startswith(("---\n", "---\r\n")):
+        end = text.find("\n---", 3)
+        if end >= 0:
+            body = text[end + 4 :]
+            return body[2:] if body.startswith("\r\n") else body.removeprefix("\n")
+    return text
+
+
+def _wordcount(root: str, file: str) -> dict[str, Any]:
+    body = _body(_read(root, "wordcount", _resolve(root, "wordcount", file)))
+    return {"words": len(body.split()), "characters": len(body)}
+
+
+def _random_read(root: str) -> str:
+    notes = [name for name in walk(root)[0] if name.endswith(".md")]
+    if not notes:
+        raise CommandError("random:read", 1, "Error: The vault has no notes.")
+    return _read(root, "random:read", random.choice(notes))
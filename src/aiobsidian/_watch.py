@@ -0,0 +1,734 @@
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import posixpath
+import struct
+import sys
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from ._cache import FILE_WRITES
+from ._constants import (
+    DEFAULT_WATCH_DEBOUNCE,
+    DEFAULT_WATCH_INTERVAL,
+    DEFAULT_WATCH_MAX_DELAY,
+)
+
+logger = logging.getLogger(__name__)
+
+EventKind = Literal["created", "modified", "deleted", "moved"]
+
+EventSource = Literal["filesystem", "client"]
+
+WatchBackend = Literal["auto", "inotify", "polling"]
+
+# Seconds during which a change reported by the client hides the same
+# change showing up on disk.
+_ECHO_WINDOW = 2.0
+
+# Seconds the `IN_MOVED_TO` half of a rename may arrive after the
+# `IN_MOVED_FROM` half before the latter counts as a deletion.
+_MOVE_GRACE = 0.05
+
+# (inode, mtime_ns, size) of a path, `None` if it does not exist.
+_Stat = tuple[int, int, int] | None
+
+
+@dataclass(frozen=True, slots=True)
+class VaultEvent:
+    """A change to a file or folder of the vault.
+
+    Attributes:
+        kind: What happened.
+        path: Vault-relative path; the old path for `moved`. An empty
+            path (with `is_dir`) means anything may have changed, e.g.
+            after the kernel dropped events.
+        dest: New path of a `moved` file or folder, `None` otherwise.
+        is_dir: Whether the path is a folder.
+        source: `"filesystem"` for changes seen on disk, `"client"` for
+            writes reported by `ObsidianCLI` or `VaultWatcher.report()`.
+    """
+
+    kind: EventKind
+    path: str
+    dest: str | None = None
+    is_dir: bool = False
+    source: EventSource = "filesystem"
+
+    @property
+    def paths(self) -> tuple[str, ...]:
+        """Affected paths: `path`, and `dest` for moves."""
+        return (self.path,) if self.dest is None else (self.path, self.dest)
+
+
+class VaultWatcher:
+    """Change feed for the files of a vault directory.
+
+    On Linux the kernel reports changes through inotify (called with
+    `ctypes`, no extra dependency); elsewhere, or if inotify is not
+    available, the vault is re-scanned every `interval` seconds and
+    files are compared by modification time, size and inode. As in
+    `obsidian files`, entries whose name starts with a dot (`.obsidian`,
+    `.trash`, ...) are ignored.
+
+    Raw changes are debounced: they are merged per path until none
+    arrived for `debounce` seconds (or `max_delay` passed), so an editor
+    saving a file in several writes yields one `modified` event, a file
+    created and deleted in between yields nothing, and the two halves
+    of a rename (inotify's `IN_MOVED_FROM`/`IN_MOVED_TO`, or a deleted
+    and a created path with the same inode when polling) become one
+    `moved` event.
+
+    Every `events()` iterator receives every event:
+
+    ```python
+    async with VaultWatcher(vault_dir) as watcher:
+        async for event in watcher:
+            print(event.kind, event.paths)
+    ```
+
+    Writes made through `ObsidianCLI(watcher=...)` are reported with
+    `report()` as soon as the command returns; the same change arriving
+    from disk shortly afterwards is then not delivered again, unless
+    the file changed once more in between.
+
+    Args:
+        root: Vault directory. Can be set later through `root` or
+            `start()`; `ObsidianCLI` fills it in.
+        backend: `"inotify"`, `"polling"`, or `"auto"` for inotify where
+            available.
+        debounce: Quiet period, in seconds, before pending changes are
+            delivered.
+        max_delay: Longest time, in seconds, a change is held back while
+            more keep arriving.
+        interval: Seconds between scans of the polling backend.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | None = None,
+        *,
+        backend: WatchBackend = "auto",
+        debounce: float = DEFAULT_WATCH_DEBOUNCE,
+        max_delay: float = DEFAULT_WATCH_MAX_DELAY,
+        interval: float = DEFAULT_WATCH_INTERVAL,
+    ) -> None:
+        if backend not in ("auto", "inotify", "polling"):
+            raise ValueError(f"Unknown watch backend: {backend!r}")
+        self._root = os.path.abspath(root) if root is not None else None
+        self._requested = backend
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.interval = interval
+        self._backend: _Inotify | _Polling | None = None
+        self._batch = _Batch()
+        self._timer: asyncio.TimerHandle | None = None
+        self._first = 0.0
+        self._queues: set[asyncio.Queue[VaultEvent | None]] = set()
+        # Path of a reported change -> (deadline, state it was left in).
+        self._echo: dict[str, tuple[float, _Stat]] = {}
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return f"VaultWatcher(root={self._root!r}, backend={self.backend!r})"
+
+    @property
+    def root(self) -> str | None:
+        """Vault directory, or `None` if not set yet."""
+        return self._root
+
+    @root.setter
+    def root(self, root: str | os.PathLike[str]) -> None:
+        if self._backend is not None:
+            raise RuntimeError("Cannot change the root of a running watcher.")
+        self._root = os.path.abspath(root)
+
+    @property
+    def backend(self) -> str | None:
+        """`"inotify"` or `"polling"` while running, `None` otherwise."""
+        if self._backend is None:
+            return None
+        return "inotify" if isinstance(self._backend, _Inotify) else "polling"
+
+    @property
+    def running(self) -> bool:
+        """Whether `start()` has been called and `close()` has not."""
+        return self._backend is not None
+
+    # -- lifecycle -----------------------------------------------------------
+
+    async def start(self, root: str | os.PathLike[str] | None = None) -> None:
+        """Start watching. Does nothing if already running.
+
+        Args:
+            root: Vault directory, if not given to the constructor.
+
+        Raises:
+            OSError: If `backend="inotify"` and inotify cannot be used.
+        """
+        if self._backend is not None:
+            return
+        self._closed = False
+        if root is not None:
+            self.root = root
+        if self._root is None:
+            raise RuntimeError("Watcher has no vault directory. Pass root= first.")
+        loop = asyncio.get_running_loop()
+        if self._requested != "polling" and sys.platform.startswith("linux"):
+            try:
+                inotify = _Inotify(self._root, self._emit)
+                inotify.start(loop)
+            except OSError as exc:
+                if self._requested == "inotify":
+                    raise
+                logger.warning("inotify unavailable (%s), polling the vault", exc)
+            else:
+                self._backend = inotify
+                return
+        elif self._requested == "inotify":
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        polling = _Polling(self._root, self._emit, self.interval)
+        await polling.start()
+        self._backend = polling
+
+    async def close(self) -> None:
+        """Stop watching, deliver pending changes and end every `events()`."""
+        backend, self._backend = self._backend, None
+        self._closed = True
+        if backend is not None:
+            await backend.close()
+        self._flush()
+        for queue in self._queues:
+            queue.put_nowait(None)
+
+    async def __aenter__(self) -> VaultWatcher:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    # -- events --------------------------------------------------------------
+
+    def events(self) -> AsyncIterator[VaultEvent]:
+        """Iterate over changes from now on, until the watcher is closed.
+
+        Each call returns an independent iterator; events are buffered
+        until it consumes them.
+        """
+        queue: asyncio.Queue[VaultEvent | None] = asyncio.Queue()
+        self._queues.add(queue)
+        if self._closed:
+            queue.put_nowait(None)
+        return self._drain(queue)
+
+    def __aiter__(self) -> AsyncIterator[VaultEvent]:
+        return self.events()
+
+    def report(
+        self,
+        kind: EventKind,
+        path: str,
+        dest: str | None = None,
+        *,
+        is_dir: bool = False,
+    ) -> None:
+        """Deliver a change made by this process right away.
+
+        The change seen on disk within a few seconds is dropped, as long
+        as the files still have the inode, modification time and size
+        they had when reported; later edits are delivered as usual.
+
+        Args:
+            kind: What happened.
+            path: Vault-relative path; the old path for `moved`.
+            dest: New path, for `moved`.
+            is_dir: Whether the path is a folder.
+        """
+        event = VaultEvent(
+            kind,
+            path.strip("/"),
+            dest.strip("/") if dest is not None else None,
+            is_dir,
+            "client",
+        )
+        deadline = _now() + _ECHO_WINDOW
+        self._expire()
+        for changed in event.paths:
+            self._echo[changed] = (deadline, self._stat(changed))
+        self._publish([event])
+
+    def invalidate(self, command: str, params: dict[str, str] | None) -> None:
+        """Report the change made by a CLI command, if it names its file.
+
+        Called by `ObsidianCLI` after every mutating command. Commands
+        that name their note only by `file=` or touch unknown files are
+        left to the file system.
+
+        Args:
+            command: CLI command name that was executed.
+            params: Parameters the command was executed with.
+        """
+        event = _written(command, params or {})
+        if event is not None:
+            self.report(event.kind, event.path, event.dest)
+
+    async def _drain(
+        self, queue: asyncio.Queue[VaultEvent | None]
+    ) -> AsyncIterator[VaultEvent]:
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+        finally:
+            self._queues.discard(queue)
+
+    def _emit(
+        self, kind: EventKind, path: str, dest: str | None = None, is_dir: bool = False
+    ) -> None:
+        """Queue a raw change from the backend and (re)arm the debounce timer."""
+        self._batch.add(kind, path, dest, is_dir)
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if self._timer is None:
+            self._first = now
+        else:
+            self._timer.cancel()
+        delay = min(self.debounce, self._first + self.max_delay - now)
+        self._timer = loop.call_later(max(delay, 0.0), self._flush)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        events = self._batch.drain()
+        if not events:
+            return
+        self._expire()
+        echo = self._echo
+        delivered = []
+        for event in events:
+            paths = event.paths
+            if echo and all(
+                path in echo and echo[path][1] == self._stat(path) for path in paths
+            ):
+                # The files are as the reported change left them.
+                continue
+            for path in paths:
+                echo.pop(path, None)
+            delivered.append(event)
+        self._publish(delivered)
+
+    def _publish(self, events: list[VaultEvent]) -> None:
+        for event in events:
+            for queue in self._queues:
+                queue.put_nowait(event)
+
+    def _expire(self) -> None:
+        now = _now()
+        for path in [path for path, (end, _) in self._echo.items() if end < now]:
+            del self._echo[path]
+
+    def _stat(self, path: str) -> _Stat:
+        if self._root is None or not path:
+            return None
+        try:
+            info = os.stat(os.path.join(self._root, path))
+        except OSError:
+            return None
+        return info.st_ino, info.st_mtime_ns, info.st_size
+
+
+class _Batch:
+    """Changes of one debounce window, merged per path."""
+
+    def __init__(self) -> None:
+        # Current path -> (kind, original path of a move, is_dir).
+        self._changes: dict[str, tuple[EventKind, str | None, bool]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._changes)
+
+    def add(
+        self, kind: EventKind, path: str, dest: str | None = None, is_dir: bool = False
+    ) -> None:
+        changes = self._changes
+        if kind == "moved":
+            assert dest is not None
+            previous = changes.pop(path, None)
+            if previous is not None and previous[0] == "created":
+                self.add("created", dest, is_dir=is_dir)
+                return
+            origin = path
+            if previous is not None and previous[0] == "moved":
+                origin = previous[1] or path
+            changes.pop(dest, None)
+            if origin == dest:
+                changes[dest] = ("modified", None, is_dir)
+            else:
+                changes[dest] = ("moved", origin, is_dir)
+            return
+        previous = changes.get(path)
+        if previous is None:
+            changes[path] = (kind, None, is_dir)
+        elif kind == "deleted":
+            del changes[path]
+            if previous[0] == "moved":
+                assert previous[1] is not None
+                changes[previous[1]] = ("deleted", None, is_dir)
+            elif previous[0] != "created":
+                changes[path] = ("deleted", None, is_dir)
+        elif previous[0] == "deleted":
+            # Deleted and written again: the file was replaced.
+            changes[path] = ("modified", None, is_dir)
+
+    def drain(self) -> list[VaultEvent]:
+        changes, self._changes = self._changes, {}
+        return [
+            VaultEvent("moved", origin, path, is_dir)
+            if kind == "moved" and origin is not None
+            else VaultEvent(kind, path, None, is_dir)
+            for path, (kind, origin, is_dir) in changes.items()
+        ]
+
+
+def _written(command: str, params: dict[str, str]) -> VaultEvent | None:
+    """The change made by a CLI write, if its parameters tell."""
+    path = params.get("path", "").strip("/")
+    if command not in FILE_WRITES or not path:
+        return None
+    if command == "create":
+        return VaultEvent("created", path)
+    if command == "delete":
+        return VaultEvent("deleted", path)
+    if command == "rename" and "new-name" in params:
+        new = params["new-name"]
+        if not posixpath.splitext(new)[1]:
+            new += posixpath.splitext(path)[1]
+        return VaultEvent("moved", path, posixpath.join(posixpath.dirname(path), new))
+    if command == "move" and "to" in params:
+        to = params["to"].strip("/")
+        if not posixpath.splitext(to)[1]:
+            to = posixpath.join(to, posixpath.basename(path))
+        return VaultEvent("moved", path, to)
+    return VaultEvent("modified", path)
+
+
+def _now() -> float:
+    return asyncio.get_running_loop().time()
+
+
+# -- inotify -------------------------------------------------------------------
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_DONT_FOLLOW = 0x02000000
+_IN_EXCL_UNLINK = 0x04000000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_ONLYDIR
+    | _IN_DONT_FOLLOW
+    | _IN_EXCL_UNLINK
+)
+
+# struct inotify_event: wd, mask, cookie, len, then `len` bytes of name.
+_HEADER = struct.Struct("iIII")
+
+_Emit = Callable[..., None]
+
+_libc: Any = None
+
+
+def _load_libc() -> Any:
+    global _libc
+    if _libc is None:
+        name = ctypes.util.find_library("c") or "libc.so.6"
+        libc = ctypes.CDLL(name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "libc has no inotify")
+        _libc = libc
+    return _libc
+
+
+class _Inotify:
+    """inotify watches on every folder of the vault."""
+
+    def __init__(self, root: str, emit: _Emit) -> None:
+        self._root = root
+        self._emit = emit
+        self._libc = _load_libc()
+        self._fd: int = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            _raise_errno()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Watch descriptor <-> vault-relative folder ("" for the root).
+        self._folders: dict[int, str] = {}
+        self._watches: dict[str, int] = {}
+        # Cookie -> (path, is_dir, deadline) of renames awaiting their
+        # `IN_MOVED_TO`, which may come with a later read.
+        self._moved_from: dict[int, tuple[str, bool, float]] = {}
+        self._expiry: asyncio.TimerHandle | None = None
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            self._watch_tree("", report=False)
+        except OSError:
+            os.close(self._fd)
+            raise
+        loop.add_reader(self._fd, self._read)
+        self._loop = loop
+
+    async def close(self) -> None:
+        if self._loop is not None:
+            self._loop.remove_reader(self._fd)
+            self._loop = None
+        if self._expiry is not None:
+            self._expiry.cancel()
+            self._expiry = None
+        self._expire_moves(everything=True)
+        os.close(self._fd)
+
+    def _watch_tree(self, top: str, *, report: bool) -> None:
+        """Watch `top` and the folders below it, reporting their contents."""
+        stack = [top]
+        while stack:
+            folder = stack.pop()
+            full = os.path.join(self._root, folder) if folder else self._root
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(full), _WATCH_MASK)
+            if wd < 0:
+                if ctypes.get_errno() in (errno.ENOENT, errno.ENOTDIR):
+                    continue
+                _raise_errno()
+            self._folders[wd] = folder
+            self._watches[folder] = wd
+            try:
+                entries = list(os.scandir(full))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                path = f"{folder}/{entry.name}" if folder else entry.name
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if is_dir:
+                    stack.append(path)
+                if report:
+                    # Created before the watch was in place.
+                    self._emit("created", path, None, is_dir)
+
+    def _subtree(self, top: str) -> list[str]:
+        return [f for f in self._watches if f == top or f.startswith(top + "/")]
+
+    def _forget_tree(self, top: str) -> None:
+        """Stop watching a folder that left the vault, and those below it."""
+        for folder in self._subtree(top):
+            wd = self._watches.pop(folder)
+            del self._folders[wd]
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _move_tree(self, old: str, new: str) -> None:
+        """Follow a moved folder: its watches stay, their paths change."""
+        for folder in self._subtree(old):
+            wd = self._watches.pop(folder)
+            moved = new + folder[len(old) :]
+            self._watches[moved] = wd
+            self._folders[wd] = moved
+
+    def _read(self) -> None:
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            except OSError:
+                logger.exception("Reading inotify events failed")
+                break
+            if not data:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = _HEADER.unpack_from(data, offset)
+                raw = data[offset + _HEADER.size : offset + _HEADER.size + length]
+                offset += _HEADER.size + length
+                self._handle(wd, mask, cookie, raw.split(b"\0", 1)[0])
+
+    def _expire_moves(self, *, everything: bool = False) -> None:
+        """Report renames whose other half never came as deletions.
+
+        The file or folder was moved out of the watched folders.
+        """
+        self._expiry = None
+        now = asyncio.get_running_loop().time()
+        for cookie, (path, is_dir, deadline) in list(self._moved_from.items()):
+            if everything or deadline <= now:
+                del self._moved_from[cookie]
+                if is_dir:
+                    self._forget_tree(path)
+                self._emit("deleted", path, None, is_dir)
+        if self._moved_from:
+            self._expiry = asyncio.get_running_loop().call_later(
+                _MOVE_GRACE, self._expire_moves
+            )
+
+    def _handle(self, wd: int, mask: int, cookie: int, raw: bytes) -> None:
+        if mask & _IN_Q_OVERFLOW:
+            self._emit("modified", "", None, True)
+            return
+        if mask & _IN_IGNORED:
+            folder = self._folders.pop(wd, None)
+            if folder is not None and self._watches.get(folder) == wd:
+                del self._watches[folder]
+            return
+        folder = self._folders.get(wd)
+        name = os.fsdecode(raw)
+        if folder is None or not name or name.startswith("."):
+            return
+        path = f"{folder}/{name}" if folder else name
+        is_dir = bool(mask & _IN_ISDIR)
+        if mask & _IN_CREATE:
+            self._emit("created", path, None, is_dir)
+            if is_dir:
+                self._watch_folder(path)
+        elif mask & (_IN_MODIFY | _IN_ATTRIB):
+            if not is_dir:
+                self._emit("modified", path, None, False)
+        elif mask & _IN_DELETE:
+            self._emit("deleted", path, None, is_dir)
+        elif mask & _IN_MOVED_FROM:
+            loop = asyncio.get_running_loop()
+            self._moved_from[cookie] = (path, is_dir, loop.time() + _MOVE_GRACE)
+            if self._expiry is None:
+                self._expiry = loop.call_later(_MOVE_GRACE, self._expire_moves)
+        elif mask & _IN_MOVED_TO:
+            source = self._moved_from.pop(cookie, None)
+            if source is None:
+                self._emit("created", path, None, is_dir)
+                if is_dir:
+                    self._watch_folder(path)
+                return
+            if is_dir:
+                self._move_tree(source[0], path)
+            self._emit("moved", source[0], path, is_dir)
+
+    def _watch_folder(self, path: str) -> None:
+        try:
+            self._watch_tree(path, report=True)
+        except OSError as exc:
+            # Out of watches: tell consumers to look at everything.
+            logger.warning("Cannot watch %s: %s", path, exc)
+            self._emit("modified", "", None, True)
+
+
+def _raise_errno() -> None:
+    code = ctypes.get_errno()
+    raise OSError(code, os.strerror(code))
+
+
+# -- polling -------------------------------------------------------------------
+
+# Vault-relative file path -> (inode, mtime_ns, size).
+_Snapshot = dict[str, tuple[int, int, int]]
+
+
+class _Polling:
+    """Compares scans of the vault taken every `interval` seconds."""
+
+    def __init__(self, root: str, emit: _Emit, interval: float) -> None:
+        self._root = root
+        self._emit = emit
+        self._interval = interval
+        self._snapshot: _Snapshot = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        self._snapshot = await asyncio.to_thread(_scan, self._root)
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                snapshot = await asyncio.to_thread(_scan, self._root)
+            except OSError:
+                logger.exception("Scanning %s failed", self._root)
+                continue
+            self._compare(snapshot)
+
+    def _compare(self, snapshot: _Snapshot) -> None:
+        old, self._snapshot = self._snapshot, snapshot
+        deleted = sorted(old.keys() - snapshot.keys())
+        # A path that disappeared and one that appeared with the same
+        # inode and size are a rename.
+        by_inode = {old[path][0]: path for path in deleted if old[path][0]}
+        moved: set[str] = set()
+        for path in sorted(snapshot.keys() - old.keys()):
+            inode, _, size = snapshot[path]
+            source = by_inode.pop(inode, None) if inode else None
+            if source is not None and old[source][2] == size:
+                moved.add(source)
+                self._emit("moved", source, path, False)
+            else:
+                self._emit("created", path, None, False)
+        for path in deleted:
+            if path not in moved:
+                self._emit("deleted", path, None, False)
+        for path, stat in snapshot.items():
+            before = old.get(path)
+            if before is not None and before != stat:
+                self._emit("modified", path, None, False)
+
+
+def _scan(root: str) -> _Snapshot:
+    """Inode, modification time and size of every file below `root`."""
+    snapshot: _Snapshot = {}
+    stack = [(root, "")]
+    while stack:
+        directory, rel = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel + entry.name + "/"))
+                    continue
+                info = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            snapshot[rel + entry.name] = (
+                entry.inode(),
+                info.st_mtime_ns,
+                info.st_size,
+            )
+    return snapshot
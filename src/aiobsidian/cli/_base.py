@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING
 
+from .._batch import CLICall
+from .._exceptions import CLIError
+
 if TYPE_CHECKING:
     from .._cli import ObsidianCLI
 
@@ -13,3 +17,17 @@ class BaseCLIResource:
 
     def __init__(self, cli: ObsidianCLI) -> None:
         self._cli = cli
+
+    async def _run_many[T](
+        self,
+        calls: Iterable[CLICall],
+        parse: Callable[[str], T],
+        *,
+        concurrency: int | None = None,
+    ) -> list[T | CLIError]:
+        """Run a batch through `ObsidianCLI.run_many` and parse each output.
+
+        Failed commands keep their `CLIError` in place of a result.
+        """
+        results = await self._cli.run_many(calls, concurrency=concurrency)
+        return [r if isinstance(r, CLIError) else parse(r) for r in results]
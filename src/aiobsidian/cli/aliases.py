@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import json
-
 from ._base import BaseCLIResource
 
 
@@ -21,6 +19,7 @@ class CLIAliasesResource(BaseCLIResource):
         Returns:
             List of alias strings for the file.
         """
-        output = await self._cli._execute("aliases", params={"file": path})
-        result: list[str] = json.loads(output)
+        result: list[str] = await self._cli._execute_json(
+            "aliases", params={"file": path}
+        )
         return result
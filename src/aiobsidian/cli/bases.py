@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -22,8 +21,9 @@ class CLIBasesResource(BaseCLIResource):
         Returns:
             List of view objects.
         """
-        output = await self._cli._execute("base:views", params={"file": path})
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json(
+            "base:views", params={"file": path}
+        )
         return result
 
     async def create(self, path: str, **fields: str) -> None:
@@ -52,8 +52,9 @@ class CLIBasesResource(BaseCLIResource):
         params: dict[str, str] = {"file": path}
         if view:
             params["view"] = view
-        output = await self._cli._execute("base:query", params=params)
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json(
+            "base:query", params=params
+        )
         return result
 
     async def list(self) -> list[dict[str, Any]]:
@@ -62,6 +63,5 @@ class CLIBasesResource(BaseCLIResource):
         Returns:
             List of database file objects.
         """
-        output = await self._cli._execute("bases")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("bases")
         return result
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+from typing import Any, Literal, overload
 
+from ..models.records import BookmarkRecord
 from ._base import BaseCLIResource
 
+_Bookmarks = list[BookmarkRecord]
+_RawBookmarks = list[dict[str, Any]]
+
 
 class CLIBookmarksResource(BaseCLIResource):
     """CLI resource for bookmark operations.
@@ -51,12 +54,21 @@ class CLIBookmarksResource(BaseCLIResource):
             params["subpath"] = subpath
         await self._cli._execute("bookmark", params=params or None)
 
-    async def list(self) -> list[dict[str, Any]]:
+    @overload
+    async def list(self, *, raw: Literal[False] = ...) -> _Bookmarks: ...
+
+    @overload
+    async def list(self, *, raw: Literal[True]) -> _RawBookmarks: ...
+
+    async def list(self, *, raw: bool = False) -> _Bookmarks | _RawBookmarks:
         """List all bookmarks.
 
+        Args:
+            raw: If ``True``, return dicts instead of `BookmarkRecord`
+                objects.
+
         Returns:
-            List of bookmark objects.
+            List of bookmarks.
         """
-        output = await self._cli._execute("bookmarks")
-        result: list[dict[str, Any]] = json.loads(output)
-        return result
+        result: _RawBookmarks = await self._cli._execute_json("bookmarks")
+        return result if raw else BookmarkRecord.from_list(result)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -32,6 +31,7 @@ class CLICommandsResource(BaseCLIResource):
             List of command objects.
         """
         params = {"filter": filter} if filter else None
-        output = await self._cli._execute("commands", params=params)
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json(
+            "commands", params=params
+        )
         return result
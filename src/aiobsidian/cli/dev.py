@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import json
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -40,18 +41,37 @@ class CLIDevResource(BaseCLIResource):
         params: dict[str, str] = {}
         if limit is not None:
             params["limit"] = str(limit)
-        output = await self._cli._execute("dev:console", params=params or None)
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json(
+            "dev:console", params=params or None
+        )
         return result
 
+    async def iter_console(
+        self, *, limit: int | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream console messages without buffering the full list.
+
+        Closing the iterator early terminates the ``obsidian`` process.
+
+        Args:
+            limit: Maximum number of messages to return.
+
+        Yields:
+            Console message objects, one at a time.
+        """
+        params = {"limit": str(limit)} if limit is not None else None
+        items = self._cli._iter_json("dev:console", params=params)
+        async with aclosing(items):
+            async for item in items:
+                yield item
+
     async def errors(self) -> list[dict[str, Any]]:
         """Show JavaScript errors.
 
         Returns:
             List of error objects.
         """
-        output = await self._cli._execute("dev:errors")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("dev:errors")
         return result
 
     async def screenshot(self, path: str) -> str:
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+from typing import Any, Literal, overload
 
+from ..models.records import VersionRecord
 from ._base import BaseCLIResource
 
 
@@ -13,18 +13,33 @@ class CLIHistoryResource(BaseCLIResource):
         _cli: Reference to the parent ``ObsidianCLI`` instance.
     """
 
-    async def versions(self, path: str) -> list[dict[str, Any]]:
+    @overload
+    async def versions(
+        self, path: str, *, raw: Literal[False] = ...
+    ) -> list[VersionRecord]: ...
+
+    @overload
+    async def versions(
+        self, path: str, *, raw: Literal[True]
+    ) -> list[dict[str, Any]]: ...
+
+    async def versions(
+        self, path: str, *, raw: bool = False
+    ) -> list[VersionRecord] | list[dict[str, Any]]:
         """List versions of a specific file in local history.
 
         Args:
             path: Path to the file relative to the vault root.
+            raw: If ``True``, return dicts instead of `VersionRecord`
+                objects.
 
         Returns:
-            List of version objects for the file.
+            List of versions of the file.
         """
-        output = await self._cli._execute("history", params={"path": path})
-        result: list[dict[str, Any]] = json.loads(output)
-        return result
+        result: list[dict[str, Any]] = await self._cli._execute_json(
+            "history", params={"path": path}
+        )
+        return result if raw else VersionRecord.from_list(result)
 
     async def open(self, path: str) -> None:
         """Open the File Recovery UI for a file.
@@ -94,6 +109,5 @@ class CLIHistoryResource(BaseCLIResource):
         Returns:
             List of file objects with local history.
         """
-        output = await self._cli._execute("history:list")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("history:list")
         return result
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -24,10 +23,9 @@ class CLIHotkeysResource(BaseCLIResource):
             Hotkey binding details.
         """
         flags = ["--verbose"] if verbose else None
-        output = await self._cli._execute(
+        result: dict[str, Any] = await self._cli._execute_json(
             "hotkey", params={"id": command_id}, flags=flags
         )
-        result: dict[str, Any] = json.loads(output)
         return result
 
     async def list(self) -> list[dict[str, Any]]:
@@ -36,6 +34,5 @@ class CLIHotkeysResource(BaseCLIResource):
         Returns:
             List of hotkey binding objects.
         """
-        output = await self._cli._execute("hotkeys")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("hotkeys")
         return result
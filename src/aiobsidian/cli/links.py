@@ -1,76 +1,281 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, Literal, overload
 
+from .._batch import CLICall
+from .._exceptions import CLIError, CommandError
+from ..models.records import FileRecord, LinkRecord, UnresolvedLinkRecord
 from ._base import BaseCLIResource
 
+if TYPE_CHECKING:
+    from ..index import GraphAnalytics, LinkGraph
+
 
 class CLILinksResource(BaseCLIResource):
     """CLI resource for link and backlink operations.
 
+    Every query returns typed records by default; pass ``raw=True`` to
+    get the decoded JSON dicts instead. With ``link_graph=`` set on the
+    client, the queries are answered by the in-process `LinkGraph`.
+
     Attributes:
         _cli: Reference to the parent ``ObsidianCLI`` instance.
     """
 
-    async def outgoing(self, path: str) -> list[dict[str, Any]]:
+    @overload
+    async def outgoing(
+        self, path: str, *, raw: Literal[False] = ...
+    ) -> list[LinkRecord]: ...
+
+    @overload
+    async def outgoing(
+        self, path: str, *, raw: Literal[True]
+    ) -> list[dict[str, Any]]: ...
+
+    async def outgoing(
+        self, path: str, *, raw: bool = False
+    ) -> list[LinkRecord] | list[dict[str, Any]]:
         """Get outgoing links from a note.
 
         Args:
             path: Path or name of the note.
+            raw: If ``True``, return dicts instead of `LinkRecord` objects.
+
+        Returns:
+            List of outgoing links.
+        """
+        result: list[dict[str, Any]]
+        if self._cli._link_graph is not None:
+            result = await self._query_graph(
+                lambda graph: _lookup(graph.outgoing, "links", path)
+            )
+        else:
+            result = await self._cli._execute_json("links", params={"file": path})
+        return result if raw else LinkRecord.from_list(result)
+
+    @overload
+    async def outgoing_many(
+        self,
+        paths: Iterable[str],
+        *,
+        concurrency: int | None = ...,
+        raw: Literal[False] = ...,
+    ) -> list[list[LinkRecord] | CLIError]: ...
+
+    @overload
+    async def outgoing_many(
+        self,
+        paths: Iterable[str],
+        *,
+        concurrency: int | None = ...,
+        raw: Literal[True],
+    ) -> list[list[dict[str, Any]] | CLIError]: ...
+
+    async def outgoing_many(
+        self,
+        paths: Iterable[str],
+        *,
+        concurrency: int | None = None,
+        raw: bool = False,
+    ) -> list[list[LinkRecord] | CLIError] | list[list[dict[str, Any]] | CLIError]:
+        """Get outgoing links of many notes with bounded concurrency.
+
+        Args:
+            paths: Paths or names of the notes.
+            concurrency: Maximum number of commands in flight at once.
+            raw: If ``True``, return dicts instead of `LinkRecord` objects.
 
         Returns:
-            List of outgoing link objects.
+            Outgoing link lists in the order of `paths`. A note that
+            could not be read has the `CLIError` in its place.
         """
-        output = await self._cli._execute("links", params={"file": path})
-        result: list[dict[str, Any]] = json.loads(output)
-        return result
+        if self._cli._link_graph is not None:
+            paths = list(paths)
+            results = await self._query_graph(
+                lambda graph: [_try(graph.outgoing, "links", path) for path in paths]
+            )
+            if raw:
+                return results
+            return [
+                item if isinstance(item, CLIError) else LinkRecord.from_list(item)
+                for item in results
+            ]
+        calls = (CLICall("links", params={"file": path}) for path in paths)
+        loads = self._cli._loads
+        if raw:
+            return await self._run_many(calls, loads, concurrency=concurrency)
+        return await self._run_many(
+            calls,
+            lambda output: LinkRecord.from_list(loads(output)),
+            concurrency=concurrency,
+        )
+
+    @overload
+    async def incoming(
+        self, path: str, *, counts: bool = ..., raw: Literal[False] = ...
+    ) -> list[LinkRecord]: ...
+
+    @overload
+    async def incoming(
+        self, path: str, *, counts: bool = ..., raw: Literal[True]
+    ) -> list[dict[str, Any]]: ...
 
     async def incoming(
-        self, path: str, *, counts: bool = False
-    ) -> list[dict[str, Any]]:
+        self, path: str, *, counts: bool = False, raw: bool = False
+    ) -> list[LinkRecord] | list[dict[str, Any]]:
         """Get backlinks (incoming links) to a note.
 
         Args:
             path: Path or name of the note.
             counts: If ``True``, include reference counts.
+            raw: If ``True``, return dicts instead of `LinkRecord` objects.
 
         Returns:
-            List of backlink objects.
+            List of backlinks.
         """
-        flags = ["--counts"] if counts else None
-        output = await self._cli._execute(
-            "backlinks", params={"file": path}, flags=flags
-        )
-        result: list[dict[str, Any]] = json.loads(output)
-        return result
+        result: list[dict[str, Any]]
+        if self._cli._link_graph is not None:
+            result = await self._query_graph(
+                lambda graph: _lookup(
+                    lambda path: graph.backlinks(path, counts=counts),
+                    "backlinks",
+                    path,
+                )
+            )
+        else:
+            flags = ["--counts"] if counts else None
+            result = await self._cli._execute_json(
+                "backlinks", params={"file": path}, flags=flags
+            )
+        return result if raw else LinkRecord.from_list(result)
+
+    @overload
+    async def unresolved(
+        self, *, raw: Literal[False] = ...
+    ) -> list[UnresolvedLinkRecord]: ...
+
+    @overload
+    async def unresolved(self, *, raw: Literal[True]) -> list[dict[str, Any]]: ...
 
-    async def unresolved(self) -> list[dict[str, Any]]:
+    async def unresolved(
+        self, *, raw: bool = False
+    ) -> list[UnresolvedLinkRecord] | list[dict[str, Any]]:
         """Get all unresolved (broken) links in the vault.
 
+        Args:
+            raw: If ``True``, return dicts instead of
+                `UnresolvedLinkRecord` objects.
+
         Returns:
-            List of unresolved link objects.
+            List of unresolved links.
         """
-        output = await self._cli._execute("unresolved")
-        result: list[dict[str, Any]] = json.loads(output)
-        return result
+        result: list[dict[str, Any]]
+        if self._cli._link_graph is not None:
+            result = await self._query_graph(lambda graph: graph.unresolved())
+        else:
+            result = await self._cli._execute_json("unresolved")
+        return result if raw else UnresolvedLinkRecord.from_list(result)
 
-    async def orphans(self) -> list[dict[str, Any]]:
+    @overload
+    async def orphans(self, *, raw: Literal[False] = ...) -> list[FileRecord]: ...
+
+    @overload
+    async def orphans(self, *, raw: Literal[True]) -> list[dict[str, Any]]: ...
+
+    async def orphans(
+        self, *, raw: bool = False
+    ) -> list[FileRecord] | list[dict[str, Any]]:
         """Get orphan notes (notes with no incoming or outgoing links).
 
+        Args:
+            raw: If ``True``, return dicts instead of `FileRecord` objects.
+
         Returns:
-            List of orphan note objects.
+            List of orphan notes.
         """
-        output = await self._cli._execute("orphans")
-        result: list[dict[str, Any]] = json.loads(output)
-        return result
+        result: list[dict[str, Any]]
+        if self._cli._link_graph is not None:
+            result = await self._query_graph(lambda graph: graph.orphans())
+        else:
+            result = await self._cli._execute_json("orphans")
+        return result if raw else FileRecord.from_list(result)
+
+    @overload
+    async def deadends(self, *, raw: Literal[False] = ...) -> list[FileRecord]: ...
+
+    @overload
+    async def deadends(self, *, raw: Literal[True]) -> list[dict[str, Any]]: ...
 
-    async def deadends(self) -> list[dict[str, Any]]:
+    async def deadends(
+        self, *, raw: bool = False
+    ) -> list[FileRecord] | list[dict[str, Any]]:
         """Get notes with no outgoing links (dead ends).
 
+        Args:
+            raw: If ``True``, return dicts instead of `FileRecord` objects.
+
+        Returns:
+            List of dead-end notes.
+        """
+        result: list[dict[str, Any]]
+        if self._cli._link_graph is not None:
+            result = await self._query_graph(lambda graph: graph.deadends())
+        else:
+            result = await self._cli._execute_json("deadends")
+        return result if raw else FileRecord.from_list(result)
+
+    async def analytics(self, *, concurrency: int | None = None) -> GraphAnalytics:
+        """Snapshot the links between notes for graph algorithms.
+
+        With ``link_graph=`` set the snapshot is taken from the graph;
+        otherwise the notes are listed and their outgoing links fetched
+        with one ``links`` command each. Requires ``numpy``.
+
+        Args:
+            concurrency: Maximum number of commands in flight at once
+                when fetching links through the CLI.
+
         Returns:
-            List of dead-end note objects.
+            `GraphAnalytics` over every note, without links to missing
+            notes or attachments. Notes whose links could not be read
+            have none.
         """
-        output = await self._cli._execute("deadends")
-        result: list[dict[str, Any]] = json.loads(output)
-        return result
+        from ..index import GraphAnalytics
+
+        if self._cli._link_graph is not None:
+            return await self._query_graph(GraphAnalytics.from_link_graph)
+        paths = [path for path in await self._cli.vault.list() if path.endswith(".md")]
+        results = await self.outgoing_many(paths, concurrency=concurrency, raw=True)
+        return GraphAnalytics.from_links(
+            {
+                path: []
+                if isinstance(found, CLIError)
+                else [link["path"] for link in found]
+                for path, found in zip(paths, results, strict=True)
+            }
+        )
+
+    async def _query_graph[T](self, query: Callable[[LinkGraph], T]) -> T:
+        graph = self._cli._link_graph
+        assert graph is not None
+        return await self._cli._query_index(graph, query)
+
+
+def _lookup(
+    query: Callable[[str], list[dict[str, Any]]], command: str, path: str
+) -> list[dict[str, Any]]:
+    """Run a per-note graph query, failing like the CLI on missing notes."""
+    try:
+        return query(path)
+    except KeyError:
+        raise CommandError(command, 1, f'Error: File "{path}" not found.') from None
+
+
+def _try(
+    query: Callable[[str], list[dict[str, Any]]], command: str, path: str
+) -> list[dict[str, Any]] | CLIError:
+    try:
+        return _lookup(query, command, path)
+    except CLIError as exc:
+        return exc
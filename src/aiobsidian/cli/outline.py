@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import json
+from collections.abc import Iterable
 from typing import Any
 
+from .._batch import CLICall
+from .._exceptions import CLIError
 from ._base import BaseCLIResource
 
 
@@ -22,6 +24,23 @@ class CLIOutlineResource(BaseCLIResource):
         Returns:
             List of heading objects forming the document outline.
         """
-        output = await self._cli._execute("outline", params={"file": path})
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json(
+            "outline", params={"file": path}
+        )
         return result
+
+    async def get_many(
+        self, paths: Iterable[str], *, concurrency: int | None = None
+    ) -> list[list[dict[str, Any]] | CLIError]:
+        """Get the heading outlines of many files with bounded concurrency.
+
+        Args:
+            paths: Paths to the files relative to the vault root.
+            concurrency: Maximum number of commands in flight at once.
+
+        Returns:
+            Outlines in the order of `paths`. A file that could not be
+            read has the `CLIError` in its place.
+        """
+        calls = (CLICall("outline", params={"file": path}) for path in paths)
+        return await self._run_many(calls, self._cli._loads, concurrency=concurrency)
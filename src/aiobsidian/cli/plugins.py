@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -22,8 +21,9 @@ class CLIPluginsResource(BaseCLIResource):
         Returns:
             Plugin details.
         """
-        output = await self._cli._execute("plugin", params={"id": plugin_id})
-        result: dict[str, Any] = json.loads(output)
+        result: dict[str, Any] = await self._cli._execute_json(
+            "plugin", params={"id": plugin_id}
+        )
         return result
 
     async def restrict(self, *, on: bool) -> None:
@@ -42,8 +42,7 @@ class CLIPluginsResource(BaseCLIResource):
         Returns:
             List of enabled plugin objects.
         """
-        output = await self._cli._execute("plugins:enabled")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("plugins:enabled")
         return result
 
     async def enable(self, plugin_id: str) -> None:
@@ -96,6 +95,7 @@ class CLIPluginsResource(BaseCLIResource):
             List of plugin objects.
         """
         flags = ["--versions"] if versions else None
-        output = await self._cli._execute("plugins", flags=flags)
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json(
+            "plugins", flags=flags
+        )
         return result
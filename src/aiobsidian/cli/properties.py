@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
+from .._batch import CLICall
+from .._exceptions import CLIError
 from ._base import BaseCLIResource
 
+if TYPE_CHECKING:
+    from ..index import Condition
+
 
 class CLIPropertiesResource(BaseCLIResource):
     """CLI resource for note property operations.
@@ -13,6 +18,57 @@ class CLIPropertiesResource(BaseCLIResource):
         _cli: Reference to the parent ``ObsidianCLI`` instance.
     """
 
+    async def list_many(
+        self, paths: Iterable[str], *, concurrency: int | None = None
+    ) -> list[dict[str, Any] | CLIError]:
+        """List the properties of many notes with bounded concurrency.
+
+        Args:
+            paths: Paths to the notes relative to the vault root.
+            concurrency: Maximum number of commands in flight at once.
+
+        Returns:
+            Property dictionaries in the order of `paths`. A note that
+            could not be read has the `CLIError` in its place.
+        """
+        calls = (CLICall("properties", params={"path": path}) for path in paths)
+        return await self._run_many(calls, self._cli._loads, concurrency=concurrency)
+
+    async def where(self, *conditions: Condition, path: str | None = None) -> list[str]:
+        """Find notes by property values.
+
+        Served by the client's `PropertyIndex` without spawning
+        ``obsidian``:
+
+        ```python
+        paths = await cli.properties.where(
+            ("status", "==", "active"), ("priority", ">", 2)
+        )
+        ```
+
+        Args:
+            *conditions: `(name, operator, value)` triples, all of which
+                must hold. Operators are `==`, `!=`, `<`, `<=`, `>`,
+                `>=`, `in` and `exists`.
+            path: Restrict the search to notes under this folder.
+
+        Returns:
+            Paths of the matching notes.
+
+        Raises:
+            RuntimeError: If the client was created without
+                `property_index=`.
+            ValueError: If a condition is malformed.
+        """
+        index = self._cli._property_index
+        if index is None:
+            raise RuntimeError(
+                "Property queries are disabled. Pass property_index=True to enable."
+            )
+        return await self._cli._query_index(
+            index, lambda index: index.where(*conditions, path=path)
+        )
+
     async def list(self, path: str) -> dict[str, Any]:
         """List all properties of a note.
 
@@ -22,8 +78,9 @@ class CLIPropertiesResource(BaseCLIResource):
         Returns:
             Dictionary of property names to their values.
         """
-        output = await self._cli._execute("properties", params={"path": path})
-        result: dict[str, Any] = json.loads(output)
+        result: dict[str, Any] = await self._cli._execute_json(
+            "properties", params={"path": path}
+        )
         return result
 
     async def read(self, path: str, property_name: str) -> Any:
@@ -36,11 +93,10 @@ class CLIPropertiesResource(BaseCLIResource):
         Returns:
             The property value.
         """
-        output = await self._cli._execute(
+        return await self._cli._execute_json(
             "property:read",
             params={"path": path, "property": property_name},
         )
-        return json.loads(output)
 
     async def set(self, path: str, property_name: str, value: str) -> None:
         """Set a property on a note.
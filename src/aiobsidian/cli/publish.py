@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -29,8 +28,7 @@ class CLIPublishResource(BaseCLIResource):
         Returns:
             Site configuration details.
         """
-        output = await self._cli._execute("publish:site")
-        result: dict[str, Any] = json.loads(output)
+        result: dict[str, Any] = await self._cli._execute_json("publish:site")
         return result
 
     async def status(self, path: str | None = None) -> dict[str, Any]:
@@ -43,8 +41,9 @@ class CLIPublishResource(BaseCLIResource):
             Publication status details.
         """
         params = {"path": path} if path is not None else None
-        output = await self._cli._execute("publish:status", params=params)
-        result: dict[str, Any] = json.loads(output)
+        result: dict[str, Any] = await self._cli._execute_json(
+            "publish:status", params=params
+        )
         return result
 
     async def add(self, path: str | None = None) -> None:
@@ -71,6 +70,5 @@ class CLIPublishResource(BaseCLIResource):
         Returns:
             List of published file objects.
         """
-        output = await self._cli._execute("publish:list")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("publish:list")
         return result
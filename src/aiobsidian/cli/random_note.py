@@ -20,4 +20,6 @@ class CLIRandomResource(BaseCLIResource):
         Returns:
             Content of a randomly selected note.
         """
+        if self._cli._fs is not None:
+            return await self._cli._fs.random_read()
         return await self._cli._execute("random:read")
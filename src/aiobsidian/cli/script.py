@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from .._batch import CLICall
+from .._exceptions import CLIError, CommandError
+from .._json import JSONLoads
+
+if TYPE_CHECKING:
+    from .._cli import ObsidianCLI
+
+MAX_SCRIPT_LENGTH = 100_000
+"""Upper bound for a single `eval` payload.
+
+Linux limits one command-line argument to 128 KiB, so larger batches
+are split into several `eval` invocations.
+"""
+
+_SCRIPT = """(async () => {
+  const ops = __OPS__;
+  const out = [];
+  for (const [kind, path] of ops) {
+    try {
+      const file = app.vault.getAbstractFileByPath(path)
+        ?? app.metadataCache.getFirstLinkpathDest(path, "");
+      if (!file || !("extension" in file)) throw new Error(`File not found: ${path}`);
+      const cache = app.metadataCache.getFileCache(file) ?? {};
+      if (kind === "read") {
+        out.push({ok: await app.vault.cachedRead(file)});
+      } else if (kind === "properties") {
+        out.push({ok: cache.frontmatter ?? {}});
+      } else if (kind === "links") {
+        out.push({ok: [...(cache.links ?? []), ...(cache.embeds ?? [])].map((l) => ({
+          path: app.metadataCache.getFirstLinkpathDest(l.link, file.path)?.path
+            ?? l.link,
+          display: l.displayText ?? l.link,
+        }))});
+      } else if (kind === "outline") {
+        out.push({ok: (cache.headings ?? []).map((h) => ({
+          level: h.level, text: h.heading, position: h.position.start.offset,
+        }))});
+      }
+    } catch (e) {
+      out.push({error: String(e?.message ?? e)});
+    }
+  }
+  return JSON.stringify(out);
+})()"""
+
+
+def loads_eval_output(output: str, loads: JSONLoads = json.loads) -> Any:
+    """Decode the JSON value printed by the `eval` command.
+
+    Strips the `=> ` prefix the CLI prints before results and unwraps
+    values that were serialized with `JSON.stringify` inside the script.
+
+    Args:
+        output: Standard output of `obsidian eval`.
+        loads: JSON decoder; `ObsidianCLI` passes its `json_backend`.
+    """
+    text = output.strip()
+    if text.startswith("=>"):
+        text = text[2:].lstrip()
+    value = loads(text)
+    if isinstance(value, str):
+        value = loads(value)
+    return value
+
+
+class ScriptOp[T]:
+    """Handle to the result of a single operation in a `CLIScriptBatch`.
+
+    Attributes:
+        kind: Operation kind (`"read"`, `"properties"`, `"links"`,
+            or `"outline"`).
+        path: Path of the file the operation applies to.
+    """
+
+    __slots__ = ("kind", "path", "_done", "_value", "_error")
+
+    def __init__(self, kind: str, path: str) -> None:
+        self.kind = kind
+        self.path = path
+        self._done = False
+        self._value: T | None = None
+        self._error: CLIError | None = None
+
+    def __repr__(self) -> str:
+        return f"ScriptOp(kind={self.kind!r}, path={self.path!r})"
+
+    def done(self) -> bool:
+        """Return `True` once the batch containing this operation has run."""
+        return self._done
+
+    def result(self) -> T:
+        """Return the operation result.
+
+        Returns:
+            The value, shaped like the equivalent resource method.
+
+        Raises:
+            RuntimeError: If the batch has not been run yet.
+            CommandError: If the operation failed inside Obsidian.
+            CLIError: If the `eval` invocation itself failed.
+        """
+        if not self._done:
+            raise RuntimeError("Script batch has not been run yet")
+        if self._error is not None:
+            raise self._error
+        return self._value  # type: ignore[return-value]
+
+    def _set(self, value: Any, error: CLIError | None) -> None:
+        self._done = True
+        self._value = value
+        self._error = error
+
+
+class CLIScriptBatch:
+    """Packs many read-only operations into a single `eval` invocation.
+
+    Each method queues one operation and returns a `ScriptOp` handle.
+    `run()` compiles the queue into a JavaScript payload, executes it
+    with one `obsidian eval` process (split only when the payload would
+    exceed `MAX_SCRIPT_LENGTH`), and distributes the results:
+
+    ```python
+    batch = cli.script()
+    content = batch.read("note.md")
+    links = batch.links("note.md")
+    await batch.run()
+    print(content.result(), links.result())
+    ```
+
+    Args:
+        cli: Parent `ObsidianCLI` instance.
+    """
+
+    def __init__(self, cli: ObsidianCLI) -> None:
+        self._cli = cli
+        self._ops: list[ScriptOp[Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def __repr__(self) -> str:
+        return f"CLIScriptBatch(ops={len(self._ops)!r})"
+
+    def read(self, path: str) -> ScriptOp[str]:
+        """Queue a file read, like `cli.vault.read`.
+
+        Args:
+            path: Path to the file relative to the vault root.
+        """
+        return self._add("read", path)
+
+    def properties(self, path: str) -> ScriptOp[dict[str, Any]]:
+        """Queue a frontmatter lookup, like `cli.properties.list`.
+
+        Args:
+            path: Path to the note relative to the vault root.
+        """
+        return self._add("properties", path)
+
+    def links(self, path: str) -> ScriptOp[list[dict[str, Any]]]:
+        """Queue an outgoing-links lookup, like `cli.links.outgoing(raw=True)`.
+
+        Args:
+            path: Path or name of the note.
+        """
+        return self._add("links", path)
+
+    def outline(self, path: str) -> ScriptOp[list[dict[str, Any]]]:
+        """Queue a heading outline lookup, like `cli.outline.get`.
+
+        Args:
+            path: Path to the file relative to the vault root.
+        """
+        return self._add("outline", path)
+
+    def compile(self) -> list[str]:
+        """Compile the queued operations into JavaScript payloads.
+
+        Returns:
+            One script per `eval` invocation.
+        """
+        return [self._script(group) for group in self._groups()]
+
+    async def run(self, *, timeout: float | None = None) -> list[Any]:
+        """Execute the queued operations and resolve their handles.
+
+        Args:
+            timeout: Override the default timeout for each `eval`
+                invocation.
+
+        Returns:
+            Results in queue order. An operation that failed inside
+            Obsidian has a `CommandError` in its place; if an `eval`
+            invocation fails, its `CLIError` is used for every
+            operation of that invocation.
+        """
+        if not self._ops:
+            return []
+        groups = self._groups()
+        outputs: list[str | CLIError]
+        if len(groups) == 1:
+            try:
+                output = await self._cli._execute(
+                    "eval", params={"code": self._script(groups[0])}, timeout=timeout
+                )
+            except CLIError as exc:
+                outputs = [exc]
+            else:
+                outputs = [output]
+        else:
+            outputs = await self._cli.run_many(
+                CLICall("eval", params={"code": self._script(group)}, timeout=timeout)
+                for group in groups
+            )
+
+        for group, result in zip(groups, outputs, strict=True):
+            if isinstance(result, CLIError):
+                for op in group:
+                    op._set(None, result)
+                continue
+            for op, item in zip(
+                group, loads_eval_output(result, self._cli._loads), strict=True
+            ):
+                if "error" in item:
+                    op._set(None, CommandError(op.kind, 1, item["error"]))
+                else:
+                    op._set(item["ok"], None)
+
+        return [op._error if op._error is not None else op._value for op in self._ops]
+
+    def _add(self, kind: str, path: str) -> ScriptOp[Any]:
+        op: ScriptOp[Any] = ScriptOp(kind, path)
+        self._ops.append(op)
+        return op
+
+    def _groups(self) -> list[list[ScriptOp[Any]]]:
+        budget = MAX_SCRIPT_LENGTH - len(_SCRIPT)
+        groups: list[list[ScriptOp[Any]]] = [[]]
+        length = 0
+        for op in self._ops:
+            size = len(json.dumps([op.kind, op.path])) + 1
+            if groups[-1] and length + size > budget:
+                groups.append([])
+                length = 0
+            groups[-1].append(op)
+            length += size
+        return groups
+
+    @staticmethod
+    def _script(group: list[ScriptOp[Any]]) -> str:
+        ops = json.dumps([[op.kind, op.path] for op in group])
+        return _SCRIPT.replace("__OPS__", ops)
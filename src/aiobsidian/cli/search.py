@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any, Literal, overload
 
+from ..models.records import SearchHitRecord
 from ._base import BaseCLIResource
 
+if TYPE_CHECKING:
+    from ..models.search import SearchResult
+
 
 class CLISearchResource(BaseCLIResource):
     """CLI resource for vault search operations.
@@ -21,6 +26,30 @@ class CLISearchResource(BaseCLIResource):
         """
         await self._cli._execute("search:open", params={"query": query})
 
+    @overload
+    async def query(
+        self,
+        query: str,
+        *,
+        path: str | None = ...,
+        limit: int | None = ...,
+        case: bool = ...,
+        matches: bool = ...,
+        raw: Literal[False] = ...,
+    ) -> list[SearchHitRecord]: ...
+
+    @overload
+    async def query(
+        self,
+        query: str,
+        *,
+        path: str | None = ...,
+        limit: int | None = ...,
+        case: bool = ...,
+        matches: bool = ...,
+        raw: Literal[True],
+    ) -> list[dict[str, Any]]: ...
+
     async def query(
         self,
         query: str,
@@ -29,7 +58,8 @@ class CLISearchResource(BaseCLIResource):
         limit: int | None = None,
         case: bool = False,
         matches: bool = False,
-    ) -> list[dict[str, Any]]:
+        raw: bool = False,
+    ) -> list[SearchHitRecord] | list[dict[str, Any]]:
         """Search the vault.
 
         Args:
@@ -38,23 +68,103 @@ class CLISearchResource(BaseCLIResource):
             limit: Maximum number of results to return.
             case: If ``True``, perform case-sensitive search.
             matches: If ``True``, include match details in results.
+            raw: If ``True``, return dicts instead of `SearchHitRecord`
+                objects.
 
         Returns:
-            List of search result dictionaries.
+            List of search results.
         """
-        params: dict[str, str] = {"query": query}
-        if path is not None:
-            params["path"] = path
-        if limit is not None:
-            params["limit"] = str(limit)
-        flags: list[str] = []
-        if case:
-            flags.append("--case")
-        if matches:
-            flags.append("--matches")
-        output = await self._cli._execute("search", params=params, flags=flags or None)
-        result: list[dict[str, Any]] = json.loads(output)
-        return result
+        index = self._cli._search_index
+        if index is not None:
+            result = await self._cli._query_index(
+                index,
+                lambda index: index.search(
+                    query, path=path, limit=limit, case=case, matches=matches
+                ),
+            )
+            return result if raw else SearchHitRecord.from_list(result)
+        params, flags = _query_args(query, path, limit, case, matches)
+        result = await self._cli._execute_json("search", params=params, flags=flags)
+        return result if raw else SearchHitRecord.from_list(result)
+
+    @overload
+    def iter_query(
+        self,
+        query: str,
+        *,
+        path: str | None = ...,
+        limit: int | None = ...,
+        case: bool = ...,
+        matches: bool = ...,
+        raw: Literal[False] = ...,
+    ) -> AsyncIterator[SearchHitRecord]: ...
+
+    @overload
+    def iter_query(
+        self,
+        query: str,
+        *,
+        path: str | None = ...,
+        limit: int | None = ...,
+        case: bool = ...,
+        matches: bool = ...,
+        raw: Literal[True],
+    ) -> AsyncIterator[dict[str, Any]]: ...
+
+    async def iter_query(
+        self,
+        query: str,
+        *,
+        path: str | None = None,
+        limit: int | None = None,
+        case: bool = False,
+        matches: bool = False,
+        raw: bool = False,
+    ) -> AsyncIterator[SearchHitRecord | dict[str, Any]]:
+        """Stream search results without buffering the full list.
+
+        Accepts the same arguments as `query()`. Closing the iterator
+        early terminates the ``obsidian`` process.
+
+        Yields:
+            `SearchHitRecord` objects (dicts when ``raw=True``), one at
+            a time.
+        """
+        if self._cli._search_index is not None:
+            for hit in await self.query(
+                query, path=path, limit=limit, case=case, matches=matches, raw=True
+            ):
+                yield hit if raw else SearchHitRecord.from_dict(hit)
+            return
+        params, flags = _query_args(query, path, limit, case, matches)
+        items = self._cli._iter_json("search", params=params, flags=flags)
+        async with aclosing(items):
+            async for item in items:
+                yield item if raw else SearchHitRecord.from_dict(item)
+
+    @overload
+    async def context(
+        self,
+        query: str,
+        *,
+        lines: int | None = ...,
+        path: str | None = ...,
+        limit: int | None = ...,
+        case: bool = ...,
+        raw: Literal[False] = ...,
+    ) -> list[SearchHitRecord]: ...
+
+    @overload
+    async def context(
+        self,
+        query: str,
+        *,
+        lines: int | None = ...,
+        path: str | None = ...,
+        limit: int | None = ...,
+        case: bool = ...,
+        raw: Literal[True],
+    ) -> list[dict[str, Any]]: ...
 
     async def context(
         self,
@@ -64,7 +174,8 @@ class CLISearchResource(BaseCLIResource):
         path: str | None = None,
         limit: int | None = None,
         case: bool = False,
-    ) -> list[dict[str, Any]]:
+        raw: bool = False,
+    ) -> list[SearchHitRecord] | list[dict[str, Any]]:
         """Search the vault with surrounding context lines.
 
         Args:
@@ -73,10 +184,21 @@ class CLISearchResource(BaseCLIResource):
             path: Restrict search to files under this path.
             limit: Maximum number of results to return.
             case: If ``True``, perform case-sensitive search.
+            raw: If ``True``, return dicts instead of `SearchHitRecord`
+                objects.
 
         Returns:
-            List of search result dictionaries with context.
+            List of search results with context.
         """
+        index = self._cli._search_index
+        if index is not None:
+            result = await self._cli._query_index(
+                index,
+                lambda index: index.context(
+                    query, lines=lines, path=path, limit=limit, case=case
+                ),
+            )
+            return result if raw else SearchHitRecord.from_list(result)
         params: dict[str, str] = {"query": query}
         if lines is not None:
             params["lines"] = str(lines)
@@ -85,6 +207,63 @@ class CLISearchResource(BaseCLIResource):
         if limit is not None:
             params["limit"] = str(limit)
         flags = ["--case"] if case else None
-        output = await self._cli._execute("search:context", params=params, flags=flags)
-        result: list[dict[str, Any]] = json.loads(output)
-        return result
+        result = await self._cli._execute_json(
+            "search:context", params=params, flags=flags
+        )
+        return result if raw else SearchHitRecord.from_list(result)
+
+    async def ranked(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        path: str | None = None,
+        context_length: int | None = None,
+    ) -> list[SearchResult]:
+        """Search the vault with BM25 relevance ranking.
+
+        Served by the client's `BM25Index` without spawning
+        ``obsidian``. Results have the shape of the REST
+        `client.search.simple()` results, best score first.
+
+        Args:
+            query: Words to look for; a note matches any of them.
+            limit: Maximum number of results to return.
+            path: Restrict search to files under this path.
+            context_length: Characters of context around each match.
+                `None` returns results without `matches`.
+
+        Returns:
+            List of `SearchResult` objects with `score` set.
+
+        Raises:
+            RuntimeError: If the client was created without
+                `ranked_index=`.
+        """
+        index = self._cli._ranked_index
+        if index is None:
+            raise RuntimeError(
+                "Ranked search is disabled. Pass ranked_index=True to enable."
+            )
+        return await self._cli._query_index(
+            index,
+            lambda index: index.search(
+                query, limit=limit, path=path, context_length=context_length
+            ),
+        )
+
+
+def _query_args(
+    query: str, path: str | None, limit: int | None, case: bool, matches: bool
+) -> tuple[dict[str, str], list[str] | None]:
+    params: dict[str, str] = {"query": query}
+    if path is not None:
+        params["path"] = path
+    if limit is not None:
+        params["limit"] = str(limit)
+    flags: list[str] = []
+    if case:
+        flags.append("--case")
+    if matches:
+        flags.append("--matches")
+    return params, flags or None
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any
+
+from .._json import JSONLoads
+from .._jsonstream import JSONArrayParser
+from ..models.records import NoteRecord
+
+if TYPE_CHECKING:
+    from .._cli import ObsidianCLI
+
+_SCRIPT = """(() => {
+  const prefix = __PREFIX__;
+  const mc = app.metadataCache;
+  const rows = [];
+  for (const file of app.vault.getFiles()) {
+    if (!file.path.startsWith(prefix)) continue;
+    const cache = mc.getFileCache(file) ?? {};
+    const fm = cache.frontmatter ?? null;
+    const tags = new Set((cache.tags ?? []).map((t) => t.tag.replace(/^#/, "")));
+    for (const t of [fm?.tags ?? []].flat()) {
+      if (typeof t !== "string") continue;
+      for (const x of t.split(/[\\s,]+/).filter(Boolean)) tags.add(x.replace(/^#/, ""));
+    }
+    const links = [
+      ...Object.keys(mc.resolvedLinks[file.path] ?? {}),
+      ...Object.keys(mc.unresolvedLinks[file.path] ?? {}),
+    ];
+    rows.push([
+      file.path, file.stat.ctime, file.stat.mtime, file.stat.size, fm, [...tags], links,
+    ]);
+  }
+  return JSON.stringify(rows);
+})()"""
+
+
+def build_script(prefix: str = "") -> str:
+    """Build the JavaScript payload that dumps the metadata cache.
+
+    Args:
+        prefix: Only include files whose path starts with this prefix.
+    """
+    return _SCRIPT.replace("__PREFIX__", json.dumps(prefix))
+
+
+async def iter_snapshot(
+    cli: ObsidianCLI, prefix: str = "", *, timeout: float | None = None
+) -> AsyncIterator[NoteRecord]:
+    """Yield a `NoteRecord` for every file in the vault.
+
+    Rows are decoded as the `eval` output arrives, so records are
+    yielded before the whole snapshot has been printed and the output
+    is never held in memory at once.
+
+    Args:
+        cli: CLI used to run the `eval` command.
+        prefix: Only include files whose path starts with this prefix.
+        timeout: Maximum time in seconds to wait for each chunk of
+            output. Defaults to the CLI timeout.
+    """
+    parser = _EvalArrayParser(cli._loads)
+    chunks = cli._stream("eval", params={"code": build_script(prefix)}, timeout=timeout)
+    async with aclosing(chunks):
+        async for chunk in chunks:
+            for row in parser.feed(chunk):
+                yield NoteRecord.from_row(row)
+    for row in parser.close():
+        yield NoteRecord.from_row(row)
+
+
+# Longest run of complete units of a JSON string body: plain characters,
+# simple escapes, `\uXXXX` escapes and surrogate pairs. A high surrogate
+# is only complete once the next escape shows it is not a pair.
+_STRING_BODY = re.compile(
+    r"""(?:
+        [^"\\]+
+      | \\[^u]
+      | \\u[dD][89abAB][0-9a-fA-F]{2}\\u[dD][c-fC-F][0-9a-fA-F]{2}
+      | \\u[dD][89abAB][0-9a-fA-F]{2}(?=[^\\]|\\[^u]|\\u[0-9a-fA-F]{4})
+      | \\u(?![dD][89abAB])[0-9a-fA-F]{4}
+    )*""",
+    re.VERBOSE,
+)
+
+
+class _EvalArrayParser:
+    """Incremental parser for the JSON array printed by `obsidian eval`.
+
+    Like `loads_eval_output`, strips the `=> ` prefix and accepts the
+    array either as is or quoted in a JSON string (the result of
+    `JSON.stringify`); a quoted array is unescaped as it arrives and
+    handed to a `JSONArrayParser`.
+
+    Args:
+        loads: JSON decoder used to unescape the quoted array.
+    """
+
+    def __init__(self, loads: JSONLoads = json.loads) -> None:
+        self._loads = loads
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._head = ""
+        # `None` until the first character of the value is seen.
+        self._quoted: bool | None = None
+        self._pending = ""
+        self._closed = False
+        self._array = JSONArrayParser()
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add a chunk of output and return the newly completed elements.
+
+        Raises:
+            ValueError: If the output is not a JSON array.
+        """
+        return self._feed(self._text.decode(chunk))
+
+    def close(self) -> list[Any]:
+        """Signal end of output and return any remaining elements.
+
+        Raises:
+            ValueError: If the output ended before the array was complete.
+        """
+        items = self._feed(self._text.decode(b"", final=True))
+        if self._quoted and not self._closed:
+            raise ValueError("Unterminated JSON string in eval output")
+        return items + self._array.close()
+
+    def _feed(self, text: str) -> list[Any]:
+        if self._quoted is None:
+            head = (self._head + text).lstrip()
+            body = head[2:].lstrip() if head.startswith("=>") else head
+            if not body or head == "=":
+                self._head = head
+                return []
+            self._head = ""
+            self._quoted = body[0] == '"'
+            text = body[1:] if self._quoted else body
+        if not self._quoted:
+            return self._array.feed_text(text)
+        if self._closed:
+            if text.strip():
+                raise ValueError("Unexpected data after eval output")
+            return []
+        text = self._pending + text
+        match = _STRING_BODY.match(text)
+        assert match is not None  # the pattern also matches ""
+        end = match.end()
+        if end < len(text) and text[end] == '"':
+            self._closed = True
+            if text[end + 1 :].strip():
+                raise ValueError("Unexpected data after eval output")
+            self._pending = ""
+        else:
+            self._pending = text[end:]
+        if not end:
+            return []
+        return self._array.feed_text(self._loads('"' + text[:end] + '"'))
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -19,8 +18,7 @@ class CLISnippetsResource(BaseCLIResource):
         Returns:
             List of enabled snippet objects.
         """
-        output = await self._cli._execute("snippets:enabled")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("snippets:enabled")
         return result
 
     async def enable(self, name: str) -> None:
@@ -45,6 +43,5 @@ class CLISnippetsResource(BaseCLIResource):
         Returns:
             List of snippet objects.
         """
-        output = await self._cli._execute("snippets")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("snippets")
         return result
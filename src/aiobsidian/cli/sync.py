@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -31,8 +30,7 @@ class CLISyncResource(BaseCLIResource):
         Returns:
             Sync status details.
         """
-        output = await self._cli._execute("sync:status")
-        result: dict[str, Any] = json.loads(output)
+        result: dict[str, Any] = await self._cli._execute_json("sync:status")
         return result
 
     async def history(self, path: str) -> list[dict[str, Any]]:
@@ -44,8 +42,9 @@ class CLISyncResource(BaseCLIResource):
         Returns:
             List of version objects.
         """
-        output = await self._cli._execute("sync:history", params={"path": path})
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json(
+            "sync:history", params={"path": path}
+        )
         return result
 
     async def read(self, path: str, *, version: str) -> str:
@@ -79,6 +78,5 @@ class CLISyncResource(BaseCLIResource):
         Returns:
             List of deleted file objects.
         """
-        output = await self._cli._execute("sync:deleted")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("sync:deleted")
         return result
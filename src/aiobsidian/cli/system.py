@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -27,8 +26,7 @@ class CLISystemResource(BaseCLIResource):
         Returns:
             List of command descriptions.
         """
-        output = await self._cli._execute("help")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("help")
         return result
 
     async def reload(self) -> None:
@@ -45,6 +43,5 @@ class CLISystemResource(BaseCLIResource):
         Returns:
             List of vault objects.
         """
-        output = await self._cli._execute("vaults")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("vaults")
         return result
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -33,8 +32,7 @@ class CLITabsResource(BaseCLIResource):
         Returns:
             List of recently opened file objects.
         """
-        output = await self._cli._execute("recents")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("recents")
         return result
 
     async def list(self) -> list[dict[str, Any]]:
@@ -43,6 +41,5 @@ class CLITabsResource(BaseCLIResource):
         Returns:
             List of open tab objects.
         """
-        output = await self._cli._execute("tabs")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("tabs")
         return result
@@ -1,30 +1,53 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from typing import Any, Literal, overload
 
+from ..models.records import FileRecord, TagRecord
 from ._base import BaseCLIResource
 
+_Tags = list[TagRecord]
+_RawTags = list[dict[str, Any]]
+
 
 class CLITagsResource(BaseCLIResource):
     """CLI resource for tag operations.
 
+    With ``tag_index=`` set on the client, `get()`, `list()` and
+    `iter_list()` are answered by the in-process `TagIndex`.
+
     Attributes:
         _cli: Reference to the parent ``ObsidianCLI`` instance.
     """
 
-    async def get(self, name: str) -> list[dict[str, Any]]:
+    @overload
+    async def get(
+        self, name: str, *, raw: Literal[False] = ...
+    ) -> list[FileRecord]: ...
+
+    @overload
+    async def get(self, name: str, *, raw: Literal[True]) -> list[dict[str, Any]]: ...
+
+    async def get(
+        self, name: str, *, raw: bool = False
+    ) -> list[FileRecord] | list[dict[str, Any]]:
         """Get notes that contain a specific tag.
 
         Args:
             name: Tag name (without ``#`` prefix).
+            raw: If ``True``, return dicts instead of `FileRecord` objects.
 
         Returns:
-            List of matching note objects.
+            List of matching notes.
         """
-        output = await self._cli._execute("tag", params={"tagname": name})
-        result: list[dict[str, Any]] = json.loads(output)
-        return result
+        result: list[dict[str, Any]]
+        index = self._cli._tag_index
+        if index is not None:
+            result = await self._cli._query_index(index, lambda index: index.get(name))
+        else:
+            result = await self._cli._execute_json("tag", params={"tagname": name})
+        return result if raw else FileRecord.from_list(result)
 
     async def rename(self, old: str, new: str) -> None:
         """Rename a tag across the entire vault.
@@ -35,29 +58,109 @@ class CLITagsResource(BaseCLIResource):
         """
         await self._cli._execute("tags:rename", params={"old": old, "new": new})
 
+    @overload
+    async def list(
+        self,
+        *,
+        sort: str | None = ...,
+        path: str | None = ...,
+        counts: bool = ...,
+        raw: Literal[False] = ...,
+    ) -> _Tags: ...
+
+    @overload
+    async def list(
+        self,
+        *,
+        sort: str | None = ...,
+        path: str | None = ...,
+        counts: bool = ...,
+        raw: Literal[True],
+    ) -> _RawTags: ...
+
     async def list(
         self,
         *,
         sort: str | None = None,
         path: str | None = None,
         counts: bool = False,
-    ) -> list[dict[str, Any]]:
+        raw: bool = False,
+    ) -> _Tags | _RawTags:
         """List all tags in the vault.
 
         Args:
             sort: Sort order (e.g. ``"count"`` to sort by frequency).
             path: Restrict to tags found under this path.
             counts: If ``True``, include usage counts per tag.
+            raw: If ``True``, return dicts instead of `TagRecord` objects.
 
         Returns:
-            List of tag objects.
+            List of `TagRecord` objects, or dicts when ``raw=True``.
         """
-        params: dict[str, str] = {}
-        if sort:
-            params["sort"] = sort
-        if path is not None:
-            params["path"] = path
-        flags = ["--counts"] if counts else None
-        output = await self._cli._execute("tags", params=params or None, flags=flags)
-        result: list[dict[str, Any]] = json.loads(output)
-        return result
+        result: _RawTags
+        index = self._cli._tag_index
+        if index is not None:
+            result = await self._cli._query_index(
+                index, lambda index: index.tags(sort=sort, path=path, counts=counts)
+            )
+        else:
+            params, flags = _list_args(sort, path, counts)
+            result = await self._cli._execute_json("tags", params=params, flags=flags)
+        return result if raw else TagRecord.from_list(result)
+
+    @overload
+    def iter_list(
+        self,
+        *,
+        sort: str | None = ...,
+        path: str | None = ...,
+        counts: bool = ...,
+        raw: Literal[False] = ...,
+    ) -> AsyncIterator[TagRecord]: ...
+
+    @overload
+    def iter_list(
+        self,
+        *,
+        sort: str | None = ...,
+        path: str | None = ...,
+        counts: bool = ...,
+        raw: Literal[True],
+    ) -> AsyncIterator[dict[str, Any]]: ...
+
+    async def iter_list(
+        self,
+        *,
+        sort: str | None = None,
+        path: str | None = None,
+        counts: bool = False,
+        raw: bool = False,
+    ) -> AsyncIterator[TagRecord | dict[str, Any]]:
+        """Stream tags without buffering the full list.
+
+        Accepts the same arguments as `list()`. Closing the iterator
+        early terminates the ``obsidian`` process.
+
+        Yields:
+            `TagRecord` objects (dicts when ``raw=True``), one at a time.
+        """
+        if self._cli._tag_index is not None:
+            for item in await self.list(sort=sort, path=path, counts=counts, raw=True):
+                yield item if raw else TagRecord.from_dict(item)
+            return
+        params, flags = _list_args(sort, path, counts)
+        items = self._cli._iter_json("tags", params=params, flags=flags)
+        async with aclosing(items):
+            async for item in items:
+                yield item if raw else TagRecord.from_dict(item)
+
+
+def _list_args(
+    sort: str | None, path: str | None, counts: bool
+) -> tuple[dict[str, str] | None, list[str] | None]:
+    params: dict[str, str] = {}
+    if sort:
+        params["sort"] = sort
+    if path is not None:
+        params["path"] = path
+    return params or None, ["--counts"] if counts else None
@@ -1,44 +1,216 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+import datetime
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any, Literal, overload
 
+from ..models.records import TaskRecord
 from ._base import BaseCLIResource
 
+if TYPE_CHECKING:
+    from ..index import TaskSort
+
+_Tasks = list[TaskRecord]
+_RawTasks = list[dict[str, Any]]
+
 
 class CLITasksResource(BaseCLIResource):
     """CLI resource for task operations.
 
+    With ``task_index=`` set on the client, `list()` and `iter()` are
+    answered by the in-process `TaskIndex` (except for the daily note),
+    and `query()` is available.
+
     Attributes:
         _cli: Reference to the parent ``ObsidianCLI`` instance.
     """
 
+    @overload
+    async def query(
+        self,
+        *,
+        completed: bool | None = ...,
+        tag: str | None = ...,
+        path: str | None = ...,
+        due_from: datetime.date | str | None = ...,
+        due_to: datetime.date | str | None = ...,
+        sort: TaskSort = ...,
+        limit: int | None = ...,
+        raw: Literal[False] = ...,
+    ) -> _Tasks: ...
+
+    @overload
+    async def query(
+        self,
+        *,
+        completed: bool | None = ...,
+        tag: str | None = ...,
+        path: str | None = ...,
+        due_from: datetime.date | str | None = ...,
+        due_to: datetime.date | str | None = ...,
+        sort: TaskSort = ...,
+        limit: int | None = ...,
+        raw: Literal[True],
+    ) -> _RawTasks: ...
+
+    async def query(
+        self,
+        *,
+        completed: bool | None = None,
+        tag: str | None = None,
+        path: str | None = None,
+        due_from: datetime.date | str | None = None,
+        due_to: datetime.date | str | None = None,
+        sort: TaskSort = "path",
+        limit: int | None = None,
+        raw: bool = False,
+    ) -> _Tasks | _RawTasks:
+        """Filter and sort tasks with the task index.
+
+        Requires ``task_index=`` on the client; no ``obsidian`` command
+        is run. See `TaskIndex.query()` for the filters.
+
+        ```python
+        overdue = await cli.tasks.query(
+            completed=False, tag="work", due_to=datetime.date.today(), sort="due"
+        )
+        ```
+
+        Args:
+            completed: Only completed (``True``) or open (``False``) tasks.
+            tag: Only tasks with this tag or one nested under it.
+            path: Restrict to tasks in files under this path.
+            due_from: Only tasks due on or after this date.
+            due_to: Only tasks due on or before this date.
+            sort: ``"path"`` for vault order, ``"due"`` for the earliest
+                due date first.
+            limit: Maximum number of tasks to return.
+            raw: If ``True``, return dicts instead of `TaskRecord` objects
+                (whose ``extra`` then holds ``tags`` and ``due``).
+
+        Returns:
+            List of `TaskRecord` objects, or dicts when ``raw=True``.
+
+        Raises:
+            RuntimeError: If the client was created without
+                `task_index=`.
+        """
+        index = self._cli._task_index
+        if index is None:
+            raise RuntimeError(
+                "Task queries are disabled. Pass task_index=True to enable."
+            )
+        result: _RawTasks = await self._cli._query_index(
+            index,
+            lambda index: index.query(
+                completed=completed,
+                tag=tag,
+                path=path,
+                due_from=due_from,
+                due_to=due_to,
+                sort=sort,
+                limit=limit,
+            ),
+        )
+        return result if raw else TaskRecord.from_list(result)
+
+    @overload
+    async def list(
+        self,
+        *,
+        path: str | None = ...,
+        daily: bool = ...,
+        done: bool = ...,
+        raw: Literal[False] = ...,
+    ) -> _Tasks: ...
+
+    @overload
+    async def list(
+        self,
+        *,
+        path: str | None = ...,
+        daily: bool = ...,
+        done: bool = ...,
+        raw: Literal[True],
+    ) -> _RawTasks: ...
+
     async def list(
         self,
         *,
         path: str | None = None,
         daily: bool = False,
         done: bool = False,
-    ) -> list[dict[str, Any]]:
+        raw: bool = False,
+    ) -> _Tasks | _RawTasks:
         """List tasks across the vault.
 
         Args:
             path: Restrict to tasks in files under this path.
             daily: If ``True``, only list tasks from the daily note.
             done: If ``True``, include completed tasks.
+            raw: If ``True``, return the decoded JSON dicts instead of
+                `TaskRecord` objects.
 
         Returns:
-            List of task objects.
+            List of `TaskRecord` objects, or dicts when ``raw=True``.
+        """
+        result: _RawTasks
+        index = self._cli._task_index
+        if index is not None and not daily:
+            result = await self._cli._query_index(
+                index, lambda index: index.tasks(path=path, done=done)
+            )
+        else:
+            params, flags = _list_args(path, daily, done)
+            result = await self._cli._execute_json("tasks", params=params, flags=flags)
+        return result if raw else TaskRecord.from_list(result)
+
+    @overload
+    def iter(
+        self,
+        *,
+        path: str | None = ...,
+        daily: bool = ...,
+        done: bool = ...,
+        raw: Literal[False] = ...,
+    ) -> AsyncIterator[TaskRecord]: ...
+
+    @overload
+    def iter(
+        self,
+        *,
+        path: str | None = ...,
+        daily: bool = ...,
+        done: bool = ...,
+        raw: Literal[True],
+    ) -> AsyncIterator[dict[str, Any]]: ...
+
+    async def iter(
+        self,
+        *,
+        path: str | None = None,
+        daily: bool = False,
+        done: bool = False,
+        raw: bool = False,
+    ) -> AsyncIterator[TaskRecord | dict[str, Any]]:
+        """Stream tasks without buffering the full list.
+
+        Accepts the same arguments as `list()`. Closing the iterator
+        early terminates the ``obsidian`` process.
+
+        Yields:
+            `TaskRecord` objects (dicts when ``raw=True``), one at a time.
         """
-        params = {"path": path} if path is not None else None
-        flags: list[str] = []
-        if daily:
-            flags.append("--daily")
-        if done:
-            flags.append("--done")
-        output = await self._cli._execute("tasks", params=params, flags=flags or None)
-        result: list[dict[str, Any]] = json.loads(output)
-        return result
+        if self._cli._task_index is not None and not daily:
+            for item in await self.list(path=path, done=done, raw=True):
+                yield item if raw else TaskRecord.from_dict(item)
+            return
+        params, flags = _list_args(path, daily, done)
+        items = self._cli._iter_json("tasks", params=params, flags=flags)
+        async with aclosing(items):
+            async for item in items:
+                yield item if raw else TaskRecord.from_dict(item)
 
     async def toggle(self, path: str, line: int) -> None:
         """Toggle a task's completion status.
@@ -70,3 +242,15 @@ class CLITasksResource(BaseCLIResource):
             task_id: Identifier of the task to complete.
         """
         await self._cli._execute("task:complete", params={"task": task_id})
+
+
+def _list_args(
+    path: str | None, daily: bool, done: bool
+) -> tuple[dict[str, str] | None, list[str] | None]:
+    params = {"path": path} if path is not None else None
+    flags: list[str] = []
+    if daily:
+        flags.append("--daily")
+    if done:
+        flags.append("--done")
+    return params, flags or None
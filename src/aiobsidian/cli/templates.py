@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -50,6 +49,5 @@ class CLITemplatesResource(BaseCLIResource):
         Returns:
             List of template objects.
         """
-        output = await self._cli._execute("templates")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("templates")
         return result
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -19,8 +18,7 @@ class CLIThemesResource(BaseCLIResource):
         Returns:
             Current theme details.
         """
-        output = await self._cli._execute("theme")
-        result: dict[str, Any] = json.loads(output)
+        result: dict[str, Any] = await self._cli._execute_json("theme")
         return result
 
     async def set(self, name: str) -> None:
@@ -59,6 +57,7 @@ class CLIThemesResource(BaseCLIResource):
             List of theme objects.
         """
         flags = ["--versions"] if versions else None
-        output = await self._cli._execute("themes", flags=flags)
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json(
+            "themes", flags=flags
+        )
         return result
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+from collections.abc import AsyncIterator, Iterable
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any
 
+from .._batch import CLICall
+from .._exceptions import CLIError
 from ._base import BaseCLIResource
 
+if TYPE_CHECKING:
+    from ..index import SwitcherMatch
+
 
 class CLIVaultResource(BaseCLIResource):
     """CLI resource for vault file operations.
@@ -30,8 +36,28 @@ class CLIVaultResource(BaseCLIResource):
         Returns:
             File content as a string.
         """
+        if self._cli._fs is not None:
+            return await self._cli._fs.read(path)
         return await self._cli._execute("read", params={"path": path})
 
+    async def read_many(
+        self, paths: Iterable[str], *, concurrency: int | None = None
+    ) -> list[str | CLIError]:
+        """Read many vault files with bounded concurrency.
+
+        Args:
+            paths: Paths to the files relative to the vault root.
+            concurrency: Maximum number of reads in flight at once.
+
+        Returns:
+            File contents in the order of `paths`. A file that could
+            not be read has the `CLIError` in its place.
+        """
+        if self._cli._fs is not None:
+            return await self._cli._fs.read_many(paths)
+        calls = (CLICall("read", params={"path": path}) for path in paths)
+        return await self._run_many(calls, str, concurrency=concurrency)
+
     async def create(
         self,
         path: str,
@@ -121,8 +147,7 @@ class CLIVaultResource(BaseCLIResource):
         Returns:
             Vault details including name and configuration.
         """
-        output = await self._cli._execute("vault")
-        result: dict[str, Any] = json.loads(output)
+        result: dict[str, Any] = await self._cli._execute_json("vault")
         return result
 
     async def file_info(self, path: str) -> dict[str, Any]:
@@ -134,8 +159,11 @@ class CLIVaultResource(BaseCLIResource):
         Returns:
             File metadata.
         """
-        output = await self._cli._execute("file", params={"path": path})
-        result: dict[str, Any] = json.loads(output)
+        if self._cli._fs is not None:
+            return await self._cli._fs.file_info(path)
+        result: dict[str, Any] = await self._cli._execute_json(
+            "file", params={"path": path}
+        )
         return result
 
     async def folder_info(self, path: str) -> dict[str, Any]:
@@ -147,8 +175,9 @@ class CLIVaultResource(BaseCLIResource):
         Returns:
             Folder metadata.
         """
-        output = await self._cli._execute("folder", params={"path": path})
-        result: dict[str, Any] = json.loads(output)
+        result: dict[str, Any] = await self._cli._execute_json(
+            "folder", params={"path": path}
+        )
         return result
 
     async def folders(self, path: str = "") -> list[str]:
@@ -161,9 +190,10 @@ class CLIVaultResource(BaseCLIResource):
         Returns:
             List of folder paths.
         """
+        if self._cli._fs is not None:
+            return await self._cli._fs.folders(path)
         params = {"path": path} if path else None
-        output = await self._cli._execute("folders", params=params)
-        result: list[str] = json.loads(output)
+        result: list[str] = await self._cli._execute_json("folders", params=params)
         return result
 
     async def wordcount(self, path: str) -> dict[str, Any]:
@@ -175,10 +205,41 @@ class CLIVaultResource(BaseCLIResource):
         Returns:
             Word count statistics.
         """
-        output = await self._cli._execute("wordcount", params={"file": path})
-        result: dict[str, Any] = json.loads(output)
+        if self._cli._fs is not None:
+            return await self._cli._fs.wordcount(path)
+        result: dict[str, Any] = await self._cli._execute_json(
+            "wordcount", params={"file": path}
+        )
         return result
 
+    async def quick_switch(self, query: str, *, limit: int = 10) -> list[SwitcherMatch]:
+        """Find notes by fuzzy-matching their path or aliases.
+
+        Served by the client's `QuickSwitcher` without spawning
+        ``obsidian``, like Obsidian's quick switcher: the characters of
+        `query` must occur in order in the note path (without `.md`) or
+        in one of its aliases.
+
+        Args:
+            query: Characters to look for.
+            limit: Maximum number of notes to return.
+
+        Returns:
+            List of `SwitcherMatch` objects, best first.
+
+        Raises:
+            RuntimeError: If the client was created without
+                `quick_switcher=`.
+        """
+        switcher = self._cli._quick_switcher
+        if switcher is None:
+            raise RuntimeError(
+                "Quick switcher is disabled. Pass quick_switcher=True to enable."
+            )
+        return await self._cli._query_index(
+            switcher, lambda switcher: switcher.match(query, limit=limit)
+        )
+
     async def list(
         self,
         path: str = "",
@@ -197,13 +258,46 @@ class CLIVaultResource(BaseCLIResource):
         Returns:
             List of file paths.
         """
-        params: dict[str, str] = {}
-        if path:
-            params["path"] = path
-        if ext is not None:
-            params["ext"] = ext
-        if folder is not None:
-            params["folder"] = folder
-        output = await self._cli._execute("files", params=params or None)
-        result: list[str] = json.loads(output)
+        if self._cli._fs is not None:
+            return await self._cli._fs.files(path, ext=ext, folder=folder)
+        params = _list_params(path, ext, folder)
+        result: list[str] = await self._cli._execute_json("files", params=params)
         return result
+
+    async def iter_list(
+        self,
+        path: str = "",
+        *,
+        ext: str | None = None,
+        folder: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream file paths in the vault without buffering the full list.
+
+        Accepts the same arguments as `list()`. Closing the iterator
+        early terminates the ``obsidian`` process.
+
+        Yields:
+            File paths, in the order the CLI prints them.
+        """
+        if self._cli._fs is not None:
+            for item in await self._cli._fs.files(path, ext=ext, folder=folder):
+                yield item
+            return
+        params = _list_params(path, ext, folder)
+        items = self._cli._iter_json("files", params=params)
+        async with aclosing(items):
+            async for item in items:
+                yield item
+
+
+def _list_params(
+    path: str, ext: str | None, folder: str | None
+) -> dict[str, str] | None:
+    params: dict[str, str] = {}
+    if path:
+        params["path"] = path
+    if ext is not None:
+        params["ext"] = ext
+    if folder is not None:
+        params["folder"] = folder
+    return params or None
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from ._base import BaseCLIResource
@@ -19,8 +18,7 @@ class CLIWorkspacesResource(BaseCLIResource):
         Returns:
             Current workspace tree structure.
         """
-        output = await self._cli._execute("workspace")
-        result: dict[str, Any] = json.loads(output)
+        result: dict[str, Any] = await self._cli._execute_json("workspace")
         return result
 
     async def save(self, name: str) -> None:
@@ -53,6 +51,5 @@ class CLIWorkspacesResource(BaseCLIResource):
         Returns:
             List of workspace objects.
         """
-        output = await self._cli._execute("workspaces")
-        result: list[dict[str, Any]] = json.loads(output)
+        result: list[dict[str, Any]] = await self._cli._execute_json("workspaces")
         return result
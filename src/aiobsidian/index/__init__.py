@@ -0,0 +1,62 @@
+"""In-process indexes over the notes of a vault.
+
+Indexes read the Markdown files straight from the vault directory and
+answer queries without spawning `obsidian`. They are updated per file,
+either explicitly (`update()`, `remove()`, `refresh()`) or, when
+attached to an `ObsidianCLI`, after every write made through it:
+
+```python
+from aiobsidian import ObsidianCLI
+
+async with ObsidianCLI("MyVault", search_index=True) as cli:
+    hits = await cli.search.query("latency", limit=20)
+```
+
+`BM25Index` and `GraphAnalytics` need `numpy` (`pip install aiobsidian[index]`).
+"""
+
+from __future__ import annotations
+
+from ._base import VaultIndex
+from ._bm25 import FIELDS, BM25Index, BM25IndexStats, Field
+from ._fulltext import SearchIndex, SearchIndexStats, TextMatch
+from ._graph import Direction, GraphAnalytics
+from ._links import LinkGraph, LinkGraphStats
+from ._properties import (
+    OPERATORS,
+    Condition,
+    Operator,
+    PropertyIndex,
+    PropertyIndexStats,
+)
+from ._switcher import QuickSwitcher, QuickSwitcherStats, SwitcherMatch
+from ._tags import TagIndex, TagIndexStats
+from ._tasks import TaskIndex, TaskIndexStats, TaskSort
+
+__all__ = [
+    "BM25Index",
+    "BM25IndexStats",
+    "Condition",
+    "Direction",
+    "FIELDS",
+    "Field",
+    "GraphAnalytics",
+    "LinkGraph",
+    "LinkGraphStats",
+    "OPERATORS",
+    "Operator",
+    "PropertyIndex",
+    "PropertyIndexStats",
+    "QuickSwitcher",
+    "QuickSwitcherStats",
+    "SearchIndex",
+    "SearchIndexStats",
+    "SwitcherMatch",
+    "TagIndex",
+    "TagIndexStats",
+    "TaskIndex",
+    "TaskIndexStats",
+    "TaskSort",
+    "TextMatch",
+    "VaultIndex",
+]
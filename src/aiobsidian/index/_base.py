@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+from .._cache import FILE_WRITES, VAULT_WRITES, written_paths
+from .._vaultfs import walk
+
+
+class VaultIndex(ABC):
+    """Base class for in-process indexes over the notes of a vault.
+
+    Keeps the modification time and size of every indexed Markdown file
+    so the index can be brought up to date incrementally. Subclasses
+    implement `_add`, `_remove` and `_clear`; everything else (full
+    builds, per-file updates, stat-based refreshes and tracking of
+    writes made through `ObsidianCLI`) is shared.
+
+    Indexes are not thread-safe: run queries and updates from one
+    thread at a time. Only `invalidate()` and `mark_changed()` may be
+    called concurrently with the other methods.
+
+    Args:
+        root: Vault directory. Can be set later through `root` or
+            `build()`; `ObsidianCLI` fills it in on first use.
+        max_age: Seconds after which `sync()` also runs `refresh()`, to
+            pick up edits made outside this process. `None` only
+            refreshes on request.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | None = None,
+        *,
+        max_age: float | None = None,
+    ) -> None:
+        self._root = os.path.abspath(root) if root is not None else None
+        self.max_age = max_age
+        self._files: dict[str, tuple[int, int]] = {}
+        self._built = False
+        self._build_time = 0.0
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self._pending: set[str] = set()
+        self._stale = False
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._files
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(root={self._root!r}, files={len(self)})"
+
+    @property
+    def root(self) -> str | None:
+        """Vault directory, or `None` if not set yet."""
+        return self._root
+
+    @root.setter
+    def root(self, root: str | os.PathLike[str]) -> None:
+        if self._built:
+            raise RuntimeError("Cannot change the root of a built index.")
+        self._root = os.path.abspath(root)
+
+    @property
+    def built(self) -> bool:
+        """Whether `build()` has run."""
+        return self._built
+
+    @property
+    def needs_sync(self) -> bool:
+        """Whether `sync()` has anything to do."""
+        return not self._built or self._stale or bool(self._pending) or self._expired()
+
+    # -- maintenance ---------------------------------------------------------
+
+    def build(self, root: str | os.PathLike[str] | None = None) -> None:
+        """Index every Markdown file of the vault from scratch.
+
+        Args:
+            root: Vault directory, if not given to the constructor.
+        """
+        if root is not None:
+            self._built = False
+            self.root = root
+        directory = self._require_root()
+        start = time.perf_counter()
+        self._checked = time.monotonic()
+        with self._lock:
+            self._pending.clear()
+            self._stale = False
+        self._files.clear()
+        self._clear()
+        for path in walk(directory)[0]:
+            if path.endswith(".md"):
+                self._load(directory, path)
+        self._built = True
+        self._build_time = time.perf_counter() - start
+
+    def refresh(self) -> int:
+        """Re-index files whose modification time or size changed.
+
+        Picks up edits made outside this process. New files are added
+        and deleted ones dropped.
+
+        Returns:
+            Number of files added, updated or removed.
+        """
+        if not self._built:
+            self.build()
+            return len(self._files)
+        directory = self._require_root()
+        self._checked = time.monotonic()
+        seen: set[str] = set()
+        changed = 0
+        for path in walk(directory)[0]:
+            if not path.endswith(".md"):
+                continue
+            seen.add(path)
+            try:
+                info = os.stat(os.path.join(directory, path))
+            except OSError:
+                continue
+            if self._files.get(path) != (info.st_mtime_ns, info.st_size):
+                self._drop(path)
+                self._load(directory, path)
+                changed += 1
+        for path in self._files.keys() - seen:
+            self._drop(path)
+            changed += 1
+        return changed
+
+    def update(self, path: str) -> None:
+        """Re-read one file, or drop it from the index if it is gone.
+
+        Args:
+            path: Vault-relative path of the file.
+        """
+        path = path.strip("/")
+        self._drop(path)
+        if path.endswith(".md"):
+            self._load(self._require_root(), path)
+
+    def remove(self, path: str) -> None:
+        """Drop one file from the index.
+
+        Args:
+            path: Vault-relative path of the file.
+        """
+        self._drop(path.strip("/"))
+
+    def invalidate(self, command: str, params: dict[str, str] | None) -> None:
+        """Record a mutating command to apply on the next `sync()`.
+
+        Uses the same rules as `CLICache.invalidate()`: file writes mark
+        their files for re-reading, vault-wide writes schedule a
+        `refresh()`. Read-only and unknown commands are ignored.
+
+        Args:
+            command: CLI command name that was executed.
+            params: Parameters the command was executed with.
+        """
+        if command in VAULT_WRITES:
+            with self._lock:
+                self._stale = True
+        elif command in FILE_WRITES:
+            paths = written_paths(command, params or {})
+            with self._lock:
+                if paths:
+                    self._pending.update(paths)
+                else:
+                    self._stale = True
+
+    def mark_changed(self, paths: Iterable[str]) -> None:
+        """Record files changed outside `ObsidianCLI`, for the next `sync()`.
+
+        Used with a `VaultWatcher`. Like `invalidate()`, may be called
+        concurrently with the other methods.
+
+        Args:
+            paths: Vault-relative paths of changed files or folders. An
+                empty path schedules a `refresh()`.
+        """
+        with self._lock:
+            for path in paths:
+                if path.strip("/"):
+                    self._pending.add(path)
+                else:
+                    self._stale = True
+
+    def sync(self) -> None:
+        """Apply the writes recorded by `invalidate()`.
+
+        Builds the index on first use. Files named by path or by note
+        name are re-read one by one; anything else (folders, unknown
+        names, vault-wide writes) falls back to `refresh()`, as does an
+        index last checked more than `max_age` seconds ago.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, set()
+            stale, self._stale = self._stale, False
+        stale = stale or self._expired()
+        if not self._built:
+            self.build()
+            return
+        directory = self._require_root()
+        targets: list[str] = []
+        for path in pending:
+            path = path.strip("/")
+            target = next(
+                (
+                    candidate
+                    for candidate in (path, path + ".md")
+                    if candidate in self._files
+                    or os.path.isfile(os.path.join(directory, candidate))
+                ),
+                None,
+            )
+            if target is None:
+                stale = True
+                break
+            targets.append(target)
+        if stale:
+            self.refresh()
+        else:
+            for target in targets:
+                self.update(target)
+
+    # -- subclass interface --------------------------------------------------
+
+    @abstractmethod
+    def _add(self, path: str, text: str) -> None:
+        """Index the content of a file that is not in the index."""
+
+    @abstractmethod
+    def _remove(self, path: str) -> None:
+        """Forget a file previously passed to `_add`."""
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Forget every file."""
+
+    # -- helpers -------------------------------------------------------------
+
+    def _expired(self) -> bool:
+        return (
+            self._built
+            and self.max_age is not None
+            and time.monotonic() - self._checked > self.max_age
+        )
+
+    def _require_root(self) -> str:
+        if self._root is None:
+            raise RuntimeError("Index has no vault directory. Pass root= first.")
+        return self._root
+
+    def _load(self, directory: str, path: str) -> None:
+        full = os.path.join(directory, path)
+        try:
+            # Stat first: an edit made while reading shows up as a change.
+            info = os.stat(full)
+            with open(full, encoding="utf-8", errors="replace") as fh:
+                text = fh.read()
+        except OSError:
+            return
+        self._files[path] = (info.st_mtime_ns, info.st_size)
+        self._add(path, text)
+
+    def _drop(self, path: str) -> None:
+        if self._files.pop(path, None) is not None:
+            self._remove(path)
+
+
+def walk_key(path: str) -> tuple[tuple[int, str], ...]:
+    """Sort key that orders paths like `obsidian files` does.
+
+    Within a folder, files come first (by name), then the contents of
+    each subfolder.
+    """
+    *folders, name = path.split("/")
+    return (*((1, folder) for folder in folders), (0, name))
+
+
+def under(path: str, folder: str | None) -> bool:
+    """Whether `path` is `folder` or lies below it (`None` matches all)."""
+    folder = (folder or "").strip("/")
+    if not folder:
+        return True
+    return path == folder or path.startswith(folder + "/")
+
+
+def fold(text: str) -> str:
+    """Lower-case `text` without changing its length."""
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    # A few characters (such as "İ") lower-case to two; keep offsets aligned.
+    return "".join(lower if len(lower := char.lower()) == 1 else char for char in text)
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import math
+import os
+import posixpath
+import re
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from ._base import VaultIndex, fold, under
+
+if TYPE_CHECKING:
+    from ..models.search import SearchResult
+
+Field = Literal["title", "headings", "frontmatter", "body"]
+
+FIELDS: tuple[Field, ...] = ("title", "headings", "frontmatter", "body")
+
+_TOKEN = re.compile(r"\w+")
+_HEADING = re.compile(r"#{1,6}\s+(.*)")
+
+# Compact the postings once removed notes outnumber live ones (and at
+# least this many notes were removed).
+_COMPACT_MIN = 256
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "numpy is required for BM25Index. "
+            "Install with: pip install aiobsidian[index]"
+        ) from None
+    return numpy
+
+
+@dataclass(frozen=True, slots=True)
+class BM25IndexStats:
+    """Size of a `BM25Index`.
+
+    Attributes:
+        files: Indexed notes.
+        terms: Distinct terms.
+        postings: Stored (term, note) pairs, including those of removed
+            notes that were not compacted away yet.
+        average_length: Mean weighted note length, in tokens.
+        memory: Approximate memory held by the postings and per-note
+            arrays, in bytes.
+        build_time: Duration of the last full `build()`, in seconds.
+    """
+
+    files: int
+    terms: int
+    postings: int
+    average_length: float
+    memory: int
+    build_time: float
+
+
+class _Postings:
+    """Notes containing one term and the term's weighted frequency in each."""
+
+    __slots__ = ("docs", "freqs")
+
+    def __init__(self) -> None:
+        self.docs = array("I")
+        self.freqs = array("f")
+
+
+class BM25Index(VaultIndex):
+    """Ranked full-text search over the notes of a vault.
+
+    Notes are tokenized into lower-cased words and scored with Okapi
+    BM25. Each term keeps its postings in two flat arrays (note ids and
+    term frequencies) that are scored as NumPy views, so a query costs
+    a few vector operations per term regardless of the vault size.
+    Requires `numpy` (`pip install aiobsidian[index]`).
+
+    Field boosts weight a term by where it occurs (BM25F): the note
+    name (`title`), Markdown headings, the frontmatter block, or the
+    rest of the note (`body`). Boosts are applied when notes are
+    indexed; fields left out default to `1.0`.
+
+    ```python
+    index = BM25Index(vault_dir, boosts={"title": 3.0, "headings": 2.0})
+    index.build()
+    for result in index.search("async parser", limit=5):
+        print(result.filename, result.score)
+    ```
+
+    Args:
+        root: Vault directory.
+        boosts: Weight of each field.
+        k1: Term frequency saturation.
+        b: Strength of the note length normalisation, from 0 to 1.
+        max_age: Seconds after which `sync()` also runs `refresh()`.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+        ValueError: If `boosts` names an unknown field.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | None = None,
+        *,
+        boosts: Mapping[Field, float] | None = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        max_age: float | None = None,
+    ) -> None:
+        super().__init__(root, max_age=max_age)
+        self._np = _import_numpy()
+        unknown = set(boosts or ()) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown fields in boosts: {sorted(unknown)}")
+        self._boosts = {field: 1.0 for field in FIELDS} | dict(boosts or {})
+        self._k1 = k1
+        self._b = b
+        self._postings: dict[str, _Postings] = {}
+        self._ids: dict[str, int] = {}
+        self._paths: list[str | None] = []
+        self._lengths = array("f")
+        self._alive = array("B")
+        self._total_length = 0.0
+        self._removed = 0
+        self._masks: dict[str, Any] = {}
+
+    @property
+    def boosts(self) -> dict[Field, float]:
+        """Weight of each field."""
+        return dict(self._boosts)
+
+    # -- queries -------------------------------------------------------------
+
+    def top(
+        self, query: str, *, limit: int = 10, path: str | None = None
+    ) -> list[tuple[str, float]]:
+        """Best-scoring notes for `query`.
+
+        A note matches if it contains any of the query's words; notes
+        containing more (and rarer) words score higher.
+
+        Args:
+            query: Words to look for.
+            limit: Maximum number of notes to return.
+            path: Restrict the search to notes under this folder.
+
+        Returns:
+            `(path, score)` pairs, best first; equal scores by path.
+        """
+        np = self._np
+        terms = set(_TOKEN.findall(fold(query)))
+        live = len(self._ids)
+        if not terms or not live or limit <= 0:
+            return []
+        alive = np.frombuffer(self._alive, dtype=np.bool_)
+        lengths = np.frombuffer(self._lengths, dtype=np.float32)
+        k1, b = self._k1, self._b
+        average = self._total_length / live or 1.0
+        scores = np.zeros(len(self._paths), dtype=np.float32)
+        for term in terms:
+            entry = self._postings.get(term)
+            if entry is None:
+                continue
+            docs = np.frombuffer(entry.docs, dtype=np.uint32)
+            freqs = np.frombuffer(entry.freqs, dtype=np.float32)
+            if self._removed:
+                keep = alive[docs]
+                docs, freqs = docs[keep], freqs[keep]
+            if not len(docs):
+                continue
+            df = len(docs)
+            idf = math.log(1.0 + (live - df + 0.5) / (df + 0.5))
+            norm = k1 * (1.0 - b + b * lengths[docs] / average)
+            # Each note occurs once per term, so plain fancy-index adds are safe.
+            scores[docs] += idf * freqs * (k1 + 1.0) / (freqs + norm)
+
+        if path:
+            scores *= self._folder_mask(path)
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > limit:
+            # Partial selection instead of a heap: `np.partition` finds the
+            # `limit`-th best score in linear time, and only notes scoring
+            # at least that much get sorted. Notes tied with it are all
+            # kept, so ties are broken by path, not by partition order.
+            ranked = scores[candidates]
+            cutoff = -np.partition(-ranked, limit - 1)[limit - 1]
+            candidates = candidates[ranked >= cutoff]
+        hits = [(self._paths[doc] or "", float(scores[doc])) for doc in candidates]
+        hits.sort(key=lambda hit: (-hit[1], hit[0]))
+        return hits[:limit]
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        path: str | None = None,
+        context_length: int | None = None,
+    ) -> list[SearchResult]:
+        """Best-scoring notes for `query` as `SearchResult` objects.
+
+        Results have the shape of `client.search.simple()`: `filename`
+        and `score`, plus `matches` with the offsets of every query
+        word and the surrounding text when `context_length` is given.
+        Matches are read from the files on disk.
+
+        Args:
+            query: Words to look for.
+            limit: Maximum number of notes to return.
+            path: Restrict the search to notes under this folder.
+            context_length: Characters of context around each match.
+                `None` skips reading the matching notes.
+        """
+        from ..models.search import MatchSpan, SearchMatch, SearchResult
+
+        hits = self.top(query, limit=limit, path=path)
+        if context_length is None:
+            return [SearchResult(filename=file, score=score) for file, score in hits]
+        terms = set(_TOKEN.findall(fold(query)))
+        directory = self._require_root()
+        results = []
+        for file, score in hits:
+            try:
+                with open(
+                    os.path.join(directory, file), encoding="utf-8", errors="replace"
+                ) as fh:
+                    text = fh.read()
+            except OSError:
+                text = ""
+            matches = [
+                SearchMatch(
+                    match=MatchSpan(start=token.start(), end=token.end()),
+                    context=text[
+                        max(0, token.start() - context_length) : token.end()
+                        + context_length
+                    ],
+                )
+                for token in _TOKEN.finditer(fold(text))
+                if token.group() in terms
+            ]
+            results.append(SearchResult(filename=file, score=score, matches=matches))
+        return results
+
+    def _folder_mask(self, folder: str) -> Any:
+        """0/1 weights of the notes under `folder`, cached until the next change."""
+        mask = self._masks.get(folder)
+        if mask is None:
+            np = self._np
+            mask = np.fromiter(
+                (path is not None and under(path, folder) for path in self._paths),
+                dtype=np.float32,
+                count=len(self._paths),
+            )
+            self._masks[folder] = mask
+        return mask
+
+    def stats(self) -> BM25IndexStats:
+        """Return the size of the index."""
+        postings = 0
+        memory = sys.getsizeof(self._lengths) + sys.getsizeof(self._alive)
+        for term, entry in self._postings.items():
+            postings += len(entry.docs)
+            memory += (
+                sys.getsizeof(term)
+                + sys.getsizeof(entry)
+                + sys.getsizeof(entry.docs)
+                + sys.getsizeof(entry.freqs)
+            )
+        live = len(self._ids)
+        return BM25IndexStats(
+            files=live,
+            terms=len(self._postings),
+            postings=postings,
+            average_length=self._total_length / live if live else 0.0,
+            memory=memory,
+            build_time=self._build_time,
+        )
+
+    # -- VaultIndex ----------------------------------------------------------
+
+    def _add(self, path: str, text: str) -> None:
+        self._masks.clear()
+        doc = len(self._paths)
+        self._ids[path] = doc
+        self._paths.append(path)
+        freqs: dict[str, float] = {}
+        length = 0.0
+        for field, content in _fields(path, text):
+            boost = self._boosts[field]
+            if not boost:
+                continue
+            tokens = _TOKEN.findall(fold(content))
+            for term, count in Counter(tokens).items():
+                freqs[term] = freqs.get(term, 0.0) + count * boost
+            length += len(tokens) * boost
+        self._lengths.append(length)
+        self._alive.append(1)
+        self._total_length += length
+        postings = self._postings
+        for term, freq in freqs.items():
+            entry = postings.get(term)
+            if entry is None:
+                entry = postings[term] = _Postings()
+            entry.docs.append(doc)
+            entry.freqs.append(freq)
+
+    def _remove(self, path: str) -> None:
+        self._masks.clear()
+        doc = self._ids.pop(path)
+        self._paths[doc] = None
+        self._alive[doc] = 0
+        self._total_length -= self._lengths[doc]
+        self._removed += 1
+        if self._removed > max(_COMPACT_MIN, len(self._ids)):
+            self._compact()
+
+    def _clear(self) -> None:
+        self._postings = {}
+        self._ids = {}
+        self._paths = []
+        self._lengths = array("f")
+        self._alive = array("B")
+        self._total_length = 0.0
+        self._removed = 0
+        self._masks.clear()
+
+    def _compact(self) -> None:
+        """Drop removed notes from the postings and renumber the rest."""
+        np = self._np
+        alive = np.frombuffer(self._alive, dtype=np.bool_)
+        remap = np.cumsum(alive, dtype=np.uint32) - 1
+        postings: dict[str, _Postings] = {}
+        for term, entry in self._postings.items():
+            docs = np.frombuffer(entry.docs, dtype=np.uint32)
+            keep = alive[docs]
+            if not keep.any():
+                continue
+            compacted = postings[term] = _Postings()
+            compacted.docs.frombytes(remap[docs[keep]].astype(np.uint32).tobytes())
+            compacted.freqs.frombytes(
+                np.frombuffer(entry.freqs, dtype=np.float32)[keep].tobytes()
+            )
+        lengths = np.frombuffer(self._lengths, dtype=np.float32)[alive]
+        self._postings = postings
+        paths = [path for path in self._paths if path is not None]
+        self._paths = list[str | None](paths)
+        self._ids = {path: doc for doc, path in enumerate(paths)}
+        self._lengths = array("f", lengths.tobytes())
+        self._alive = array("B", bytes([1]) * len(self._paths))
+        self._removed = 0
+
+
+def _fields(path: str, text: str) -> list[tuple[Field, str]]:
+    """Split a note into the text of each field."""
+    frontmatter = ""
+    body = text
+    if text.startswith("---\n"):
+        end = text.find("\n---", 3)
+        if end >= 0:
+            frontmatter = text[4:end]
+            body = text[end + 4 :]
+    headings = []
+    lines = []
+    for line in body.splitlines():
+        match = _HEADING.match(line)
+        if match:
+            headings.append(match.group(1))
+        else:
+            lines.append(line)
+    title = posixpath.splitext(posixpath.basename(path))[0]
+    return [
+        ("title", title),
+        ("headings", "\n".join(headings)),
+        ("frontmatter", frontmatter),
+        ("body", "\n".join(lines)),
+    ]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+# YAML 1.2 core schema numbers; unlike `int()`/`float()` no `1_000`,
+# `nan` or `Infinity`.
+_INT = re.compile(r"[-+]?[0-9]+")
+_FLOAT = re.compile(r"[-+]?(?:\.[0-9]+|[0-9]+(?:\.[0-9]*)?)(?:[eE][-+]?[0-9]+)?")
+_ESCAPE = re.compile(r"\\(x[0-9A-Fa-f]{2}|u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|.)", re.S)
+_ESCAPES = {
+    "0": "\0",
+    "a": "\a",
+    "b": "\b",
+    "t": "\t",
+    "\t": "\t",
+    "n": "\n",
+    "v": "\v",
+    "f": "\f",
+    "r": "\r",
+    "e": "\x1b",
+    " ": " ",
+    '"': '"',
+    "/": "/",
+    "\\": "\\",
+    "N": "\x85",
+    "_": "\xa0",
+    "L": "\u2028",
+    "P": "\u2029",
+}
+
+
+def parse_frontmatter(text: str) -> tuple[dict[str, Any], int]:
+    """Parse the YAML frontmatter block at the start of a note.
+
+    Understands the subset Obsidian writes for properties: `key: value`
+    scalars (strings, numbers, booleans, null, quoted strings with YAML
+    escapes), inline lists (`[a, b]`) and block lists (`- item` lines).
+    A key without a value is `None`, as in YAML.
+
+    Returns:
+        The properties, and the offset where the note body starts
+        (`0` if the note has no frontmatter).
+    """
+    if not text.startswith("---\n"):
+        return {}, 0
+    end = text.find("\n---", 3)
+    if end < 0:
+        return {}, 0
+    data: dict[str, Any] = {}
+    key = None
+    for line in text[4:end].splitlines():
+        stripped = line.strip()
+        if key is not None and stripped.startswith("- "):
+            if data[key] is None:
+                data[key] = []
+            data[key].append(_scalar(stripped[2:]))
+            continue
+        name, sep, value = line.partition(":")
+        if not sep or line.startswith((" ", "\t")):
+            continue
+        key = name.strip()
+        if value.strip():
+            data[key] = _scalar(value)
+            key = None
+        else:
+            data[key] = None
+    body = end + 4
+    if text.startswith("\n", body):
+        body += 1
+    return data, body
+
+
+def aliases(properties: dict[str, Any]) -> list[str]:
+    """Aliases listed in `aliases` (or `alias`), like `obsidian aliases`."""
+    value = properties.get("aliases") or properties.get("alias")
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        value = [value]
+    return [str(alias) for alias in value]
+
+
+def _scalar(text: str) -> Any:
+    text = text.strip()
+    if not text or text in ("null", "Null", "NULL", "~"):
+        return None
+    if text[0] in "\"'" and text[-1] == text[0] and len(text) > 1:
+        if text[0] == "'":
+            return text[1:-1].replace("''", "'")
+        return _ESCAPE.sub(_unescape, text[1:-1])
+    if text in ("true", "True", "TRUE"):
+        return True
+    if text in ("false", "False", "FALSE"):
+        return False
+    if text.startswith("[") and text.endswith("]"):
+        inner = text[1:-1].strip()
+        return [_scalar(part) for part in inner.split(",")] if inner else []
+    if _INT.fullmatch(text):
+        return int(text)
+    if _FLOAT.fullmatch(text):
+        return float(text)
+    return text
+
+
+def _unescape(match: re.Match[str]) -> str:
+    """Replace one escape of a YAML double-quoted string.
+
+    Unknown escapes and code points are kept as written instead of
+    failing the whole note.
+    """
+    escape = match.group(1)
+    if len(escape) > 1:
+        code = int(escape[1:], 16)
+        return chr(code) if code <= 0x10FFFF else match.group()
+    return _ESCAPES.get(escape, match.group())
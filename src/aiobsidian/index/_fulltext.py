@@ -0,0 +1,430 @@
+from __future__ import annotations
+
+import os
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from ._base import VaultIndex, fold, under, walk_key
+
+_GRAM = 3
+
+# Compact the postings once removed files outnumber live ones (and at
+# least this many files were removed).
+_COMPACT_MIN = 256
+
+
+@dataclass(frozen=True, slots=True)
+class TextMatch:
+    """One occurrence of a query in a note, as returned by `SearchIndex.find()`.
+
+    Attributes:
+        file: Vault-relative path of the note.
+        line: Line number of the match (1-based).
+        column: Offset of the match within its line.
+        start: Offset of the first matched character in the file content.
+        end: Offset just past the last matched character.
+        text: The line containing the match.
+    """
+
+    file: str
+    line: int
+    column: int
+    start: int
+    end: int
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class SearchIndexStats:
+    """Size of a `SearchIndex`.
+
+    Attributes:
+        files: Indexed notes.
+        grams: Distinct trigrams.
+        postings: Stored trigram positions, including those of removed
+            notes that were not compacted away yet.
+        characters: Total length of the indexed notes.
+        memory: Approximate memory held by postings and note contents,
+            in bytes.
+        build_time: Duration of the last full `build()`, in seconds.
+    """
+
+    files: int
+    grams: int
+    postings: int
+    characters: int
+    memory: int
+    build_time: float
+
+
+class _Postings:
+    """Positions of one trigram: per note, a run in `positions`."""
+
+    __slots__ = ("docs", "starts", "positions")
+
+    def __init__(self) -> None:
+        self.docs = array("I")
+        self.starts = array("I")
+        self.positions = array("I")
+
+    def find(self, doc: int) -> int:
+        index = bisect_left(self.docs, doc)
+        if index < len(self.docs) and self.docs[index] == doc:
+            return index
+        return -1
+
+    def at(self, index: int) -> array[int]:
+        end = (
+            self.starts[index + 1]
+            if index + 1 < len(self.starts)
+            else len(self.positions)
+        )
+        return self.positions[self.starts[index] : end]
+
+
+class SearchIndex(VaultIndex):
+    """In-process full-text index answering `cli.search` queries.
+
+    Every note is split into overlapping three-character grams of its
+    lower-cased content, each stored with the offsets where it occurs
+    (positional postings). A query is answered by intersecting the
+    offsets of the grams that cover it, so matching never scans note
+    contents; case-sensitive queries additionally compare the candidate
+    matches with the original text. Queries shorter than three
+    characters fall back to scanning.
+
+    Matching follows `obsidian search`: the query is a literal string
+    matched within single lines, case-insensitive unless `case=True`.
+    `search()` and `context()` return the same dicts as
+    `cli.search.query(raw=True)` and `cli.search.context(raw=True)`.
+
+    ```python
+    index = SearchIndex("/path/to/vault")
+    index.build()
+    index.search("latency", path="Projects", limit=10)
+    index.update("Projects/plan.md")
+    ```
+
+    Pass `ObsidianCLI(search_index=True)` to have `cli.search` served
+    from an index that follows the writes made through the client.
+
+    Args:
+        root: Vault directory.
+        max_age: Seconds after which `sync()` also runs `refresh()`.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | None = None,
+        *,
+        max_age: float | None = None,
+    ) -> None:
+        super().__init__(root, max_age=max_age)
+        self._postings: dict[str, _Postings] = {}
+        self._ids: dict[str, int] = {}
+        self._paths: list[str | None] = []
+        self._texts: list[str | None] = []
+        self._lines: list[array[int] | None] = []
+        self._removed = 0
+
+    # -- queries -------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        *,
+        path: str | None = None,
+        limit: int | None = None,
+        case: bool = False,
+        matches: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Notes containing `query`, like `obsidian search`.
+
+        Args:
+            query: Literal text to look for.
+            path: Restrict the search to notes under this folder.
+            limit: Maximum number of notes to return.
+            case: If `True`, match case-sensitively.
+            matches: If `True`, list the matching lines of each note.
+
+        Returns:
+            Dicts with `file` and `score` (the number of occurrences),
+            plus `matches` (`line` and `text`) when requested, best
+            score first.
+        """
+        hits: list[dict[str, Any]] = []
+        for doc, found in self._occurrences(query, path, case):
+            hit: dict[str, Any] = {"file": self._paths[doc], "score": len(found)}
+            if matches:
+                hit["matches"] = [
+                    {"line": line + 1, "text": self._line(doc, line)}
+                    for line in self._line_numbers(doc, found)
+                ]
+            hits.append(hit)
+        hits.sort(key=lambda hit: (-hit["score"], hit["file"]))
+        return hits if limit is None else hits[:limit]
+
+    def context(
+        self,
+        query: str,
+        *,
+        lines: int | None = None,
+        path: str | None = None,
+        limit: int | None = None,
+        case: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Matching lines with their surroundings, like `obsidian search:context`.
+
+        Args:
+            query: Literal text to look for.
+            lines: Context lines before and after each match (default 1).
+            path: Restrict the search to notes under this folder.
+            limit: Maximum number of matching lines to return.
+            case: If `True`, match case-sensitively.
+
+        Returns:
+            Dicts with `file`, `line` and `context` (the surrounding
+            lines), in vault order.
+        """
+        around = 1 if lines is None else lines
+        results: list[dict[str, Any]] = []
+        for doc, found in self._sorted_occurrences(query, path, case):
+            text = self._texts[doc]
+            assert text is not None
+            all_lines = text.splitlines()
+            for line in self._line_numbers(doc, found):
+                if limit is not None and len(results) >= limit:
+                    return results
+                results.append(
+                    {
+                        "file": self._paths[doc],
+                        "line": line + 1,
+                        "context": all_lines[max(0, line - around) : line + around + 1],
+                    }
+                )
+        return results
+
+    def find(
+        self,
+        query: str,
+        *,
+        path: str | None = None,
+        limit: int | None = None,
+        case: bool = False,
+    ) -> list[TextMatch]:
+        """Every occurrence of `query` with its position, in vault order.
+
+        Overlapping occurrences are not reported, like `str.count`.
+
+        Args:
+            query: Literal text to look for.
+            path: Restrict the search to notes under this folder.
+            limit: Maximum number of matches to return.
+            case: If `True`, match case-sensitively.
+        """
+        results: list[TextMatch] = []
+        for doc, found in self._sorted_occurrences(query, path, case):
+            file = self._paths[doc]
+            starts = self._lines[doc]
+            assert file is not None and starts is not None
+            for offset in found:
+                if limit is not None and len(results) >= limit:
+                    return results
+                line = bisect_right(starts, offset) - 1
+                results.append(
+                    TextMatch(
+                        file=file,
+                        line=line + 1,
+                        column=offset - starts[line],
+                        start=offset,
+                        end=offset + len(query),
+                        text=self._line(doc, line),
+                    )
+                )
+        return results
+
+    def stats(self) -> SearchIndexStats:
+        """Return the size of the index."""
+        memory = sum(sys.getsizeof(text) for text in self._texts if text is not None)
+        postings = 0
+        for entry in self._postings.values():
+            postings += len(entry.positions)
+            memory += (
+                sys.getsizeof(entry)
+                + sys.getsizeof(entry.docs)
+                + sys.getsizeof(entry.starts)
+                + sys.getsizeof(entry.positions)
+            )
+        return SearchIndexStats(
+            files=len(self._ids),
+            grams=len(self._postings),
+            postings=postings,
+            characters=sum(len(text) for text in self._texts if text is not None),
+            memory=memory,
+            build_time=self._build_time,
+        )
+
+    # -- matching ------------------------------------------------------------
+
+    def _sorted_occurrences(
+        self, query: str, path: str | None, case: bool
+    ) -> list[tuple[int, list[int]]]:
+        return sorted(
+            self._occurrences(query, path, case),
+            key=lambda item: walk_key(self._paths[item[0]] or ""),
+        )
+
+    def _occurrences(
+        self, query: str, path: str | None, case: bool
+    ) -> Iterator[tuple[int, list[int]]]:
+        """Yield `(doc, offsets)` for every note containing `query`.
+
+        Offsets are sorted and non-overlapping.
+        """
+        # Matches never span lines, so neither may the query.
+        if query.splitlines() != [query]:
+            return
+        folded = fold(query)
+        size = len(query)
+        if size < _GRAM:
+            needle = query if case else folded
+            for doc, text in enumerate(self._texts):
+                file = self._paths[doc]
+                if text is None or file is None or not under(file, path):
+                    continue
+                haystack = text if case else fold(text)
+                found = []
+                offset = haystack.find(needle)
+                while offset >= 0:
+                    found.append(offset)
+                    offset = haystack.find(needle, offset + size)
+                if found:
+                    yield doc, found
+            return
+
+        # Grams at offsets 0, 3, 6, ... and one ending the query cover
+        # every character, so their intersection is an exact match.
+        offsets = list(range(0, size - _GRAM + 1, _GRAM))
+        if offsets[-1] != size - _GRAM:
+            offsets.append(size - _GRAM)
+        plan: list[tuple[_Postings, int]] = []
+        for offset in offsets:
+            entry = self._postings.get(folded[offset : offset + _GRAM])
+            if entry is None:
+                return
+            plan.append((entry, offset))
+        plan.sort(key=lambda item: len(item[0].docs))
+        (rarest, rarest_offset), rest = plan[0], plan[1:]
+
+        for index, doc in enumerate(rarest.docs):
+            file = self._paths[doc]
+            if file is None or not under(file, path):
+                continue
+            starts = {position - rarest_offset for position in rarest.at(index)}
+            for entry, offset in rest:
+                other = entry.find(doc)
+                if other < 0:
+                    starts.clear()
+                    break
+                starts.intersection_update(
+                    [position - offset for position in entry.at(other)]
+                )
+                if not starts:
+                    break
+            if not starts:
+                continue
+            candidates = sorted(starts)
+            if case:
+                text = self._texts[doc]
+                assert text is not None
+                candidates = [s for s in candidates if text.startswith(query, s)]
+            found = []
+            end = -1
+            for start in candidates:
+                if start >= end:
+                    found.append(start)
+                    end = start + size
+            if found:
+                yield doc, found
+
+    def _line_numbers(self, doc: int, offsets: list[int]) -> list[int]:
+        """Distinct 0-based line numbers of `offsets` in note `doc`."""
+        starts = self._lines[doc]
+        assert starts is not None
+        numbers: list[int] = []
+        for offset in offsets:
+            line = bisect_right(starts, offset) - 1
+            if not numbers or numbers[-1] != line:
+                numbers.append(line)
+        return numbers
+
+    def _line(self, doc: int, line: int) -> str:
+        text = self._texts[doc]
+        starts = self._lines[doc]
+        assert text is not None and starts is not None
+        end = starts[line + 1] if line + 1 < len(starts) else len(text)
+        segment = text[starts[line] : end]
+        return segment.splitlines()[0] if segment else ""
+
+    # -- VaultIndex ----------------------------------------------------------
+
+    def _add(self, path: str, text: str) -> None:
+        doc = len(self._paths)
+        self._ids[path] = doc
+        self._paths.append(path)
+        self._texts.append(text)
+        folded = fold(text)
+        grams: defaultdict[str, list[int]] = defaultdict(list)
+        starts = array("I")
+        offset = 0
+        for line in text.splitlines(keepends=True):
+            starts.append(offset)
+            # Only grams within the line: separators are never matched.
+            chunk = folded[offset : offset + len(line.splitlines()[0])]
+            grams_of_line = map("".join, zip(chunk, chunk[1:], chunk[2:]))
+            for position, gram in enumerate(grams_of_line, offset):
+                grams[gram].append(position)
+            offset += len(line)
+        self._lines.append(starts)
+        postings = self._postings
+        for gram, positions in grams.items():
+            entry = postings.get(gram)
+            if entry is None:
+                entry = postings[gram] = _Postings()
+            # Inlined `_Postings.add`: this loop dominates build time.
+            entry.docs.append(doc)
+            entry.starts.append(len(entry.positions))
+            entry.positions.extend(positions)
+
+    def _remove(self, path: str) -> None:
+        doc = self._ids.pop(path)
+        self._paths[doc] = None
+        self._texts[doc] = None
+        self._lines[doc] = None
+        self._removed += 1
+        if self._removed > max(_COMPACT_MIN, len(self._ids)):
+            self._compact()
+
+    def _clear(self) -> None:
+        self._postings = {}
+        self._ids = {}
+        self._paths = []
+        self._texts = []
+        self._lines = []
+        self._removed = 0
+
+    def _compact(self) -> None:
+        """Rebuild the postings without the entries of removed notes."""
+        live = [
+            (path, text)
+            for path, text in zip(self._paths, self._texts, strict=True)
+            if path is not None and text is not None
+        ]
+        self._clear()
+        for path, text in live:
+            self._add(path, text)
@@ -0,0 +1,418 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from ._links import LinkGraph
+
+Direction = Literal["out", "in", "both"]
+"""Links to follow: outgoing, incoming (backlinks), or either."""
+
+_REVERSED: dict[Direction, Direction] = {"out": "in", "in": "out", "both": "both"}
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "numpy is required for GraphAnalytics. "
+            "Install with: pip install aiobsidian[index]"
+        ) from None
+    return numpy
+
+
+class GraphAnalytics:
+    """Whole-graph algorithms over the links between notes.
+
+    A frozen snapshot of the resolved links as a directed graph in
+    compressed sparse row (CSR) form: `offsets[n]:offsets[n + 1]`
+    slices `targets` to the notes note `n` links to, each once.
+    PageRank runs as repeated sparse matrix-vector products in NumPy;
+    components, neighbourhoods and shortest paths are linear-time
+    traversals of the same arrays.
+
+    Build one from a `LinkGraph`, with `cli.links.analytics()`, or from
+    any mapping of note to linked notes:
+
+    ```python
+    analytics = await cli.links.analytics()
+    top = list(analytics.pagerank())[:10]
+    path = analytics.shortest_path("Home.md", "Projects/Plan.md")
+    ```
+
+    Args:
+        paths: Note paths, indexed by node id.
+        offsets: `len(paths) + 1` CSR offsets into `targets`.
+        targets: Node ids of the linked notes.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+        ValueError: If the arrays do not describe a graph over `paths`.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[str],
+        offsets: Sequence[int] | Any,
+        targets: Sequence[int] | Any,
+    ) -> None:
+        np = self._np = _import_numpy()
+        self._paths = list(paths)
+        self._ids = {path: node for node, path in enumerate(self._paths)}
+        self._offsets = np.asarray(offsets, dtype=np.int64)
+        self._targets = np.asarray(targets, dtype=np.int64)
+        count = len(self._paths)
+        if (
+            self._offsets.shape != (count + 1,)
+            or self._offsets[0] != 0
+            or self._offsets[-1] != len(self._targets)
+            or (np.diff(self._offsets) < 0).any()
+            or (len(self._targets) and self._targets.min() < 0)
+            or (len(self._targets) and self._targets.max() >= count)
+        ):
+            raise ValueError("offsets and targets do not form a CSR graph over paths")
+        # Built on first use: the reverse arrays and plain lists for
+        # traversals, which index Python lists much faster than arrays.
+        self._reverse: tuple[Any, Any] | None = None
+        self._lists: dict[str, tuple[list[int], list[int]]] = {}
+
+    @classmethod
+    def from_links(cls, links: Mapping[str, Iterable[str]]) -> GraphAnalytics:
+        """Build from a mapping of note path to the paths it links to.
+
+        Every key is a node. Link targets that are not keys (unresolved
+        links, attachments) are dropped, as are repeated links.
+        """
+        paths = list(links)
+        ids = {path: node for node, path in enumerate(paths)}
+        offsets = [0]
+        targets: list[int] = []
+        for path in paths:
+            targets.extend(
+                dict.fromkeys(ids[target] for target in links[path] if target in ids)
+            )
+            offsets.append(len(targets))
+        return cls(paths, offsets, targets)
+
+    @classmethod
+    def from_link_graph(cls, graph: LinkGraph) -> GraphAnalytics:
+        """Snapshot a `LinkGraph`, renumbering its notes compactly."""
+        np = _import_numpy()
+        offsets, targets = graph.adjacency()
+        offsets = np.frombuffer(offsets, dtype=np.uint32).astype(np.int64)
+        targets = np.frombuffer(targets, dtype=np.uint32).astype(np.int64)
+        live = [node for node, path in enumerate(graph._paths) if path is not None]
+        renumber = np.full(graph.size, -1, dtype=np.int64)
+        renumber[live] = np.arange(len(live))
+        degrees = np.diff(offsets)[live]
+        starts = offsets[live]
+        # Concatenate the target slices of the live notes, in order.
+        gather = np.repeat(starts - np.cumsum(degrees) + degrees, degrees)
+        gather += np.arange(len(gather))
+        return cls(
+            [graph._paths[node] or "" for node in live],
+            np.concatenate(([0], np.cumsum(degrees))),
+            renumber[targets[gather]],
+        )
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __repr__(self) -> str:
+        return f"GraphAnalytics(notes={len(self)}, edges={self.edges})"
+
+    @property
+    def paths(self) -> list[str]:
+        """Note paths, indexed by node id."""
+        return list(self._paths)
+
+    @property
+    def edges(self) -> int:
+        """Number of distinct links between notes."""
+        return len(self._targets)
+
+    def csr(self, *, reverse: bool = False) -> tuple[Any, Any]:
+        """`(offsets, targets)` NumPy arrays of the links, or of the backlinks."""
+        if not reverse:
+            return self._offsets, self._targets
+        if self._reverse is None:
+            np = self._np
+            sources = np.repeat(np.arange(len(self)), np.diff(self._offsets))
+            order = np.argsort(self._targets, kind="stable")
+            counts = np.bincount(self._targets, minlength=len(self))
+            self._reverse = (
+                np.concatenate(([0], np.cumsum(counts))),
+                sources[order],
+            )
+        return self._reverse
+
+    # -- ranking -------------------------------------------------------------
+
+    def pagerank(
+        self,
+        *,
+        damping: float = 0.85,
+        personalization: Mapping[str, float] | None = None,
+        tol: float = 1e-8,
+        max_iter: int = 100,
+    ) -> dict[str, float]:
+        """Rank notes by PageRank over their links.
+
+        Notes without links spread their rank like the random jump, so
+        the scores sum to 1.
+
+        Args:
+            damping: Probability of following a link rather than jumping.
+            personalization: Jump probabilities per note path (normalised;
+                missing notes get 0), to rank relative to some notes.
+                Uniform by default.
+            tol: Stop once the total change per note is below `tol`.
+            max_iter: Maximum number of iterations.
+
+        Returns:
+            Score per note path, highest first.
+
+        Raises:
+            KeyError: If `personalization` names an unknown note.
+            ValueError: If `personalization` has no positive weight.
+        """
+        np = self._np
+        count = len(self)
+        if not count:
+            return {}
+        if personalization is None:
+            jump = np.full(count, 1.0 / count)
+        else:
+            jump = np.zeros(count)
+            for path, weight in personalization.items():
+                jump[self._node(path)] = weight
+            if jump.sum() <= 0:
+                raise ValueError("personalization needs a positive weight")
+            jump /= jump.sum()
+        degrees = np.diff(self._offsets)
+        dangling = degrees == 0
+        sources = np.repeat(np.arange(count), degrees)
+        inverse = np.divide(1.0, degrees, out=np.zeros(count), where=~dangling)
+        rank = jump.copy()
+        for _ in range(max_iter):
+            # One product with the column-stochastic link matrix.
+            spread = np.bincount(
+                self._targets, weights=(rank * inverse)[sources], minlength=count
+            )
+            updated = damping * (spread + rank[dangling].sum() * jump)
+            updated += (1.0 - damping) * jump
+            change = np.abs(updated - rank).sum()
+            rank = updated
+            if change < count * tol:
+                break
+        order = np.argsort(-rank, kind="stable")
+        return {self._paths[node]: float(rank[node]) for node in order.tolist()}
+
+    # -- traversal -----------------------------------------------------------
+
+    def components(self) -> list[list[str]]:
+        """Groups of notes connected by links in either direction.
+
+        Returns:
+            Weakly connected components, largest first (then by first
+            note), with each note (unlinked notes included) in exactly
+            one. Notes keep their node order within a component.
+        """
+        seen = [False] * len(self)
+        result = []
+        for node in range(len(self)):
+            if not seen[node]:
+                found = self._bfs(node, "both", seen=seen)
+                result.append(sorted(found))
+        return self._named(result)
+
+    def strongly_connected(self) -> list[list[str]]:
+        """Groups of notes that can all reach each other along links.
+
+        Returns:
+            Strongly connected components, ordered like `components()`.
+        """
+        offsets, targets = self._adjacency("out")
+        count = len(self)
+        index = [-1] * count
+        low = [0] * count
+        stacked = [False] * count
+        stack: list[int] = []
+        result = []
+        counter = 0
+        # Tarjan's algorithm with an explicit stack of (node, next link).
+        for root in range(count):
+            if index[root] >= 0:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            stacked[root] = True
+            work = [(root, offsets[root])]
+            while work:
+                node, position = work[-1]
+                if position < offsets[node + 1]:
+                    work[-1] = (node, position + 1)
+                    target = targets[position]
+                    if index[target] < 0:
+                        index[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        stacked[target] = True
+                        work.append((target, offsets[target]))
+                    elif stacked[target] and index[target] < low[node]:
+                        low[node] = index[target]
+                    continue
+                work.pop()
+                if work and low[node] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        stacked[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    result.append(sorted(component))
+        return self._named(result)
+
+    def neighbourhood(
+        self, path: str, hops: int = 1, *, direction: Direction = "out"
+    ) -> dict[str, int]:
+        """Notes within `hops` links of a note.
+
+        Args:
+            path: Note path.
+            hops: Maximum number of links to follow.
+            direction: Follow links, backlinks, or both.
+
+        Returns:
+            Distance in links per note, nearest first; the note itself
+            is not included.
+
+        Raises:
+            KeyError: If the note is unknown.
+        """
+        start = self._node(path)
+        distances = self._bfs(start, direction, hops=hops)
+        del distances[start]
+        return {self._paths[node]: hops for node, hops in distances.items()}
+
+    def shortest_path(
+        self, source: str, target: str, *, direction: Direction = "out"
+    ) -> list[str] | None:
+        """Fewest-links path between two notes.
+
+        Searches breadth-first from both ends at once, always growing
+        the smaller frontier, so only a small part of a well-connected
+        vault is visited.
+
+        Args:
+            source: Note path to start from.
+            target: Note path to reach.
+            direction: Follow links, backlinks, or both.
+
+        Returns:
+            The notes along the path, both ends included, or `None` if
+            `target` cannot be reached.
+
+        Raises:
+            KeyError: If either note is unknown.
+        """
+        start, goal = self._node(source), self._node(target)
+        backward = _REVERSED[direction]
+        # Per side: adjacency, parent and distance of each reached node,
+        # and the current frontier.
+        sides = [
+            (self._following(direction), {start: start}, {start: 0}, [start]),
+            (self._following(backward), {goal: goal}, {goal: 0}, [goal]),
+        ]
+        meet = start if start == goal else -1
+        while meet < 0 and sides[0][3] and sides[1][3]:
+            side = 0 if len(sides[0][3]) <= len(sides[1][3]) else 1
+            adjacency, parents, depths, frontier = sides[side]
+            other = sides[1 - side][2]
+            following = []
+            best = -1
+            for node in frontier:
+                depth = depths[node] + 1
+                for offsets, targets in adjacency:
+                    for target_node in targets[offsets[node] : offsets[node + 1]]:
+                        if target_node in parents:
+                            continue
+                        parents[target_node] = node
+                        depths[target_node] = depth
+                        following.append(target_node)
+                        if target_node in other and (
+                            best < 0 or other[target_node] < other[best]
+                        ):
+                            best = target_node
+            sides[side] = (adjacency, parents, depths, following)
+            meet = best
+        if meet < 0:
+            return None
+        path = [meet]
+        while path[-1] != start:
+            path.append(sides[0][1][path[-1]])
+        path.reverse()
+        while path[-1] != goal:
+            path.append(sides[1][1][path[-1]])
+        return [self._paths[node] for node in path]
+
+    def _bfs(
+        self,
+        start: int,
+        direction: Direction,
+        *,
+        hops: int | None = None,
+        seen: list[bool] | None = None,
+    ) -> dict[int, int]:
+        """Nodes reached from `start`, mapped to their distance."""
+        adjacency = self._following(direction)
+        found = {start: 0}
+        if seen is not None:
+            seen[start] = True
+        frontier = [start]
+        depth = 0
+        while frontier and (hops is None or depth < hops):
+            depth += 1
+            following = []
+            for node in frontier:
+                for offsets, targets in adjacency:
+                    for target in targets[offsets[node] : offsets[node + 1]]:
+                        if target not in found:
+                            found[target] = depth
+                            following.append(target)
+                            if seen is not None:
+                                seen[target] = True
+            frontier = following
+        return found
+
+    def _following(self, direction: Direction) -> list[tuple[list[int], list[int]]]:
+        if direction == "both":
+            return [self._adjacency("out"), self._adjacency("in")]
+        return [self._adjacency(direction)]
+
+    def _adjacency(
+        self, direction: Literal["out", "in"]
+    ) -> tuple[list[int], list[int]]:
+        lists = self._lists.get(direction)
+        if lists is None:
+            offsets, targets = self.csr(reverse=direction == "in")
+            lists = self._lists[direction] = (offsets.tolist(), targets.tolist())
+        return lists
+
+    def _named(self, groups: list[list[int]]) -> list[list[str]]:
+        groups.sort(key=lambda group: (-len(group), group[0]))
+        return [[self._paths[node] for node in group] for group in groups]
+
+    def _node(self, path: str) -> int:
+        node = self._ids.get(path)
+        if node is None:
+            node = self._ids.get(path + ".md")
+        if node is None:
+            raise KeyError(path)
+        return node
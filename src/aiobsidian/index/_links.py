@@ -0,0 +1,472 @@
+from __future__ import annotations
+
+import os
+import posixpath
+import re
+import sys
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import unquote
+
+from ._base import VaultIndex, fold, walk_key
+from ._frontmatter import parse_frontmatter
+
+# [[target#heading|display]] and [display](target "title"), in one pass
+# so links keep their order in the note.
+_LINK = re.compile(
+    r"\[\[([^\[\]|#]*)(?:#[^\[\]|]*)?(?:\|([^\[\]]*))?\]\]"
+    r'|\[([^\[\]]*)\]\(\s*(?:<([^<>\n]+)>|([^()\s]+))(?:\s+"[^"\n]*")?\s*\)'
+)
+
+# Targets with a file extension other than `.md` are attachments.
+_ATTACHMENT = re.compile(r"\.(?!md$)[A-Za-z][A-Za-z0-9]{0,4}$")
+
+_EXTERNAL = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*:")
+
+
+@dataclass(frozen=True, slots=True)
+class LinkGraphStats:
+    """Size of a `LinkGraph`.
+
+    Attributes:
+        files: Indexed notes.
+        links: Links as written, attachments included.
+        edges: Distinct (source, target) pairs of resolved links.
+        unresolved: Links whose target note does not exist.
+        memory: Approximate memory held by the graph, in bytes.
+        build_time: Duration of the last full `build()`, in seconds.
+    """
+
+    files: int
+    links: int
+    edges: int
+    unresolved: int
+    memory: int
+    build_time: float
+
+
+class LinkGraph(VaultIndex):
+    """Links between the notes of a vault, in both directions.
+
+    Wikilinks (`[[target#heading|display]]`, embeds included) and
+    Markdown links to local files (`[display](path/to/note.md)`) are
+    read from each note's body and resolved the way Obsidian does: by
+    path, then relative to the linking note, then by note name. Only
+    notes are nodes: links to attachments (targets with an extension
+    other than `.md`) are listed by `outgoing()` as written but are
+    neither edges nor unresolved links, and external URLs are skipped.
+
+    Every note gets a small integer id; ids of removed notes are reused.
+    Each note keeps its outgoing links in order and a count of linking
+    notes, so `outgoing()` and `backlinks()` cost O(degree), while
+    orphans, dead ends and unresolved links are maintained as the graph
+    changes. `adjacency()` exports compressed sparse row (CSR) arrays of
+    either direction for graph algorithms.
+
+    Changing one note re-resolves only the notes whose links name it, so
+    per-file updates stay cheap.
+
+    ```python
+    graph = LinkGraph(vault_dir)
+    graph.build()
+    graph.backlinks("Projects/Plan.md")
+    graph.orphans()
+    ```
+
+    Args:
+        root: Vault directory.
+        max_age: Seconds after which `sync()` also runs `refresh()`.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | None = None,
+        *,
+        max_age: float | None = None,
+    ) -> None:
+        super().__init__(root, max_age=max_age)
+        self._ids: dict[str, int] = {}
+        self._paths: list[str | None] = []
+        self._free: list[int] = []
+        self._by_name: dict[str, set[int]] = {}
+        # Per note: links as written, the resolved note of each (-1 if
+        # unresolved, -2 for attachments), and the notes linking to it.
+        self._links: list[list[tuple[str, str]]] = []
+        self._targets: list[array[int]] = []
+        self._incoming: list[dict[int, int]] = []
+        # Notes whose links name a given note name, for re-resolution.
+        self._referrers: dict[str, set[int]] = {}
+        self._orphans: set[int] = set()
+        self._deadends: set[int] = set()
+        self._unresolved: set[int] = set()
+        self._cache: dict[str, Any] = {}
+        self._deferred = False
+
+    def build(self, root: str | os.PathLike[str] | None = None) -> None:
+        """Index every Markdown file of the vault from scratch.
+
+        Args:
+            root: Vault directory, if not given to the constructor.
+        """
+        # Links are resolved once every note is known, instead of
+        # re-resolving the referrers of each note as it is added.
+        self._deferred = True
+        try:
+            super().build(root)
+        finally:
+            self._deferred = False
+            start = time.perf_counter()
+            for node, path in enumerate(self._paths):
+                if path is not None:
+                    self._resolve_links(node)
+            self._build_time += time.perf_counter() - start
+
+    # -- queries -------------------------------------------------------------
+
+    def node(self, path: str) -> int:
+        """Id of a note, by path or by name.
+
+        Raises:
+            KeyError: If no indexed note matches.
+        """
+        node = self._resolve(path, "")
+        if node < 0:
+            raise KeyError(path)
+        return node
+
+    def path(self, node: int) -> str:
+        """Path of the note with id `node`.
+
+        Raises:
+            KeyError: If no note has this id.
+        """
+        path = self._paths[node] if 0 <= node < len(self._paths) else None
+        if path is None:
+            raise KeyError(node)
+        return path
+
+    @property
+    def size(self) -> int:
+        """Upper bound of the note ids: every id is below it."""
+        return len(self._paths)
+
+    def outgoing(self, path: str) -> list[dict[str, Any]]:
+        """Links of a note, as `obsidian links` lists them.
+
+        Args:
+            path: Path or name of the note.
+
+        Returns:
+            `{"path", "display"}` dicts in the order the links appear;
+            `path` is the resolved note, or the target as written if it
+            does not exist.
+
+        Raises:
+            KeyError: If the note is not indexed.
+        """
+        node = self.node(path)
+        paths = self._paths
+        return [
+            {"path": paths[target] if target >= 0 else written, "display": display}
+            for (written, display), target in zip(
+                self._links[node], self._targets[node], strict=True
+            )
+        ]
+
+    def backlinks(self, path: str, *, counts: bool = False) -> list[dict[str, Any]]:
+        """Notes linking to a note, as `obsidian backlinks` lists them.
+
+        Args:
+            path: Path or name of the note.
+            counts: Include the number of links from each note.
+
+        Returns:
+            `{"path", "display"}` dicts (plus `count`), in vault order.
+
+        Raises:
+            KeyError: If the note is not indexed.
+        """
+        incoming = self._incoming[self.node(path)]
+        result = []
+        for source in sorted(incoming, key=self._order):
+            file = self._paths[source] or ""
+            item: dict[str, Any] = {"path": file, "display": _name(file)}
+            if counts:
+                item["count"] = incoming[source]
+            result.append(item)
+        return result
+
+    def orphans(self) -> list[dict[str, str]]:
+        """Notes no note links to, as `obsidian orphans` lists them."""
+        return self._listed("orphans", self._orphans)
+
+    def deadends(self) -> list[dict[str, str]]:
+        """Notes without resolved links, as `obsidian deadends` lists them."""
+        return self._listed("deadends", self._deadends)
+
+    def unresolved(self) -> list[dict[str, str]]:
+        """Links to missing notes, as `obsidian unresolved` lists them.
+
+        Returns:
+            `{"source", "target"}` dicts, by source in vault order.
+        """
+        cached = self._cache.get("unresolved")
+        if cached is None:
+            cached = self._cache["unresolved"] = [
+                {"source": self._paths[source] or "", "target": written}
+                for source in sorted(self._unresolved, key=self._order)
+                for (written, _), target in zip(
+                    self._links[source], self._targets[source], strict=True
+                )
+                if target == -1
+            ]
+        return [dict(item) for item in cached]
+
+    def adjacency(self, *, reverse: bool = False) -> tuple[array[int], array[int]]:
+        """Resolved links as compressed sparse row (CSR) arrays.
+
+        The notes note `n` links to (or, with `reverse`, that link to
+        it) are `targets[offsets[n]:offsets[n + 1]]`, each once. Ids of
+        removed notes have no links.
+
+        Returns:
+            `offsets` (`size + 1` entries) and `targets`, as unsigned
+            32-bit arrays. Do not modify them: they are cached until the
+            graph changes.
+        """
+        key = "reverse" if reverse else "forward"
+        cached = self._cache.get(key)
+        if cached is None:
+            offsets = array("I", [0])
+            targets = array("I")
+            for node in range(len(self._paths)):
+                if reverse:
+                    targets.extend(self._incoming[node])
+                else:
+                    targets.extend(
+                        dict.fromkeys(t for t in self._targets[node] if t >= 0)
+                    )
+                offsets.append(len(targets))
+            cached = self._cache[key] = (offsets, targets)
+        return cached
+
+    def stats(self) -> LinkGraphStats:
+        """Return the size of the graph."""
+        links = sum(len(targets) for targets in self._targets)
+        unresolved = sum(
+            1 for source in self._unresolved for t in self._targets[source] if t == -1
+        )
+        edges = sum(len(incoming) for incoming in self._incoming)
+        memory = sum(
+            sys.getsizeof(part)
+            for part in (self._ids, self._paths, self._links, self._targets)
+        )
+        for node in range(len(self._paths)):
+            memory += sys.getsizeof(self._links[node]) + sys.getsizeof(
+                self._targets[node]
+            )
+            memory += sys.getsizeof(self._incoming[node])
+            memory += sum(
+                sys.getsizeof(written) + sys.getsizeof(display) + 56
+                for written, display in self._links[node]
+            )
+        return LinkGraphStats(
+            files=len(self._ids),
+            links=links,
+            edges=edges,
+            unresolved=unresolved,
+            memory=memory,
+            build_time=self._build_time,
+        )
+
+    def _listed(self, key: str, nodes: set[int]) -> list[dict[str, str]]:
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._cache[key] = [
+                (self._paths[node] or "") for node in sorted(nodes, key=self._order)
+            ]
+        return [{"path": path, "name": _name(path)} for path in cached]
+
+    def _order(self, node: int) -> tuple[tuple[int, str], ...]:
+        return walk_key(self._paths[node] or "")
+
+    # -- VaultIndex ----------------------------------------------------------
+
+    def _add(self, path: str, text: str) -> None:
+        _, body = parse_frontmatter(text)
+        if self._free:
+            node = self._free.pop()
+            self._paths[node] = path
+            self._links[node] = _parse_links(text[body:])
+        else:
+            node = len(self._paths)
+            self._paths.append(path)
+            self._links.append(_parse_links(text[body:]))
+            self._targets.append(array("i"))
+            self._incoming.append({})
+        self._ids[path] = node
+        self._by_name.setdefault(_name_key(path), set()).add(node)
+        for written, _ in self._links[node]:
+            self._referrers.setdefault(_target_key(written), set()).add(node)
+        self._orphans.add(node)
+        if not self._deferred:
+            self._resolve_links(node)
+            self._reresolve(path, skip=node)
+
+    def _remove(self, path: str) -> None:
+        node = self._ids.pop(path)
+        self._unlink(node)
+        for written, _ in self._links[node]:
+            referrers = self._referrers.get(_target_key(written))
+            if referrers is not None:
+                referrers.discard(node)
+                if not referrers:
+                    del self._referrers[_target_key(written)]
+        named = self._by_name[_name_key(path)]
+        named.discard(node)
+        if not named:
+            del self._by_name[_name_key(path)]
+        self._paths[node] = None
+        self._links[node] = []
+        self._orphans.discard(node)
+        self._deadends.discard(node)
+        self._unresolved.discard(node)
+        self._reresolve(path, skip=node)
+        self._incoming[node].clear()
+        self._free.append(node)
+
+    def _clear(self) -> None:
+        self._ids = {}
+        self._paths = []
+        self._free = []
+        self._by_name = {}
+        self._links = []
+        self._targets = []
+        self._incoming = []
+        self._referrers = {}
+        self._orphans = set()
+        self._deadends = set()
+        self._unresolved = set()
+        self._cache = {}
+
+    # -- resolution ----------------------------------------------------------
+
+    def _reresolve(self, path: str, skip: int) -> None:
+        """Re-resolve the links of notes whose links may name `path`."""
+        for source in list(self._referrers.get(_name_key(path), ())):
+            if source != skip:
+                self._unlink(source)
+                self._resolve_links(source)
+
+    def _resolve_links(self, source: int) -> None:
+        """Resolve the links of `source` and add its edges."""
+        self._cache.clear()
+        file = self._paths[source] or ""
+        targets = self._targets[source]
+        del targets[:]
+        resolved = unresolved = False
+        for written, _ in self._links[source]:
+            target = self._resolve(written, file)
+            if target == -1 and _ATTACHMENT.search(written):
+                target = -2
+            targets.append(target)
+            if target >= 0:
+                resolved = True
+                incoming = self._incoming[target]
+                incoming[source] = incoming.get(source, 0) + 1
+                self._orphans.discard(target)
+            elif target == -1:
+                unresolved = True
+        if resolved:
+            self._deadends.discard(source)
+        else:
+            self._deadends.add(source)
+        if unresolved:
+            self._unresolved.add(source)
+        else:
+            self._unresolved.discard(source)
+
+    def _unlink(self, source: int) -> None:
+        """Remove the edges of `source`."""
+        self._cache.clear()
+        for target in self._targets[source]:
+            if target < 0:
+                continue
+            incoming = self._incoming[target]
+            count = incoming.get(source)
+            if count is None:
+                continue
+            if count > 1:
+                incoming[source] = count - 1
+            else:
+                del incoming[source]
+                if not incoming and self._paths[target] is not None:
+                    self._orphans.add(target)
+        del self._targets[source][:]
+
+    def _resolve(self, target: str, source: str) -> int:
+        """Note a link target or note name resolves to, or -1."""
+        target = target.strip().strip("/")
+        if not target:
+            return -1
+        ids = self._ids
+        for candidate in (target, target + ".md"):
+            if candidate in ids:
+                return ids[candidate]
+        relative = posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+        for candidate in (relative, relative + ".md"):
+            if candidate in ids:
+                return ids[candidate]
+        # A note whose path ends with the target; like Obsidian, letter
+        # case only matters to prefer an exact match.
+        names = (target, target + ".md", "/" + target, "/" + target + ".md")
+        folded = tuple(fold(name) for name in names)
+        best = -1
+        best_rank: tuple[bool, tuple[tuple[int, str], ...]] | None = None
+        for node in self._by_name.get(_target_key(target), ()):
+            path = self._paths[node] or ""
+            lowered = fold(path)
+            if lowered not in folded[:2] and not lowered.endswith(folded[2:]):
+                continue
+            exact = path in names[:2] or path.endswith(names[2:])
+            rank = (not exact, walk_key(path))
+            if best_rank is None or rank < best_rank:
+                best, best_rank = node, rank
+        return best
+
+
+def _name(path: str) -> str:
+    """Note name: the file name without `.md`."""
+    name = posixpath.basename(path)
+    return name[:-3] if name.endswith(".md") else name
+
+
+def _name_key(path: str) -> str:
+    """Case-folded note name, to look notes up by."""
+    return fold(_name(path))
+
+
+def _target_key(target: str) -> str:
+    """Case-folded note name a link target refers to."""
+    return _name_key(target.strip().strip("/"))
+
+
+def _parse_links(body: str) -> list[tuple[str, str]]:
+    """`(target, display)` of every wikilink and local Markdown link."""
+    links = []
+    for match in _LINK.finditer(body):
+        wiki, alias, text, bracketed, href = match.groups()
+        if text is None:
+            target = wiki.strip()
+            if target:
+                links.append((target, (alias or wiki).strip()))
+            continue
+        href = bracketed or href
+        if _EXTERNAL.match(href):
+            continue
+        target = unquote(href.partition("#")[0]).strip()
+        if target:
+            links.append((target, text.strip() or target))
+    return links
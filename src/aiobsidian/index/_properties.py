@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import math
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from operator import ge, gt, le, lt
+from typing import Any, Literal
+
+from ._base import VaultIndex, under, walk_key
+from ._frontmatter import parse_frontmatter
+
+Operator = Literal["==", "!=", "<", "<=", ">", ">=", "in", "exists"]
+
+OPERATORS: tuple[Operator, ...] = ("==", "!=", "<", "<=", ">", ">=", "in", "exists")
+
+Condition = tuple[str, Operator, Any]
+
+# Compact the range arrays once removed notes outnumber live ones (and
+# at least this many notes were removed).
+_COMPACT_MIN = 256
+
+_COMPARE: dict[str, Callable[[Any, Any], bool]] = {
+    "<": lt,
+    "<=": le,
+    ">": gt,
+    ">=": ge,
+}
+
+# Testing one note's values costs about this many set insertions, so a
+# condition is looked up in the index unless it matches far more notes
+# than are left.
+_TEST_COST = 16
+
+# Unsorted additions up to this many are inserted one by one before a
+# range query; more are merged with a full sort.
+_INSERT_MAX = 64
+
+
+@dataclass(frozen=True, slots=True)
+class PropertyIndexStats:
+    """Size of a `PropertyIndex`.
+
+    Attributes:
+        files: Indexed notes.
+        keys: Distinct property names.
+        values: Distinct (name, value) pairs in the hash indexes.
+        sorted: Entries in the range arrays, including those of removed
+            notes that were not compacted away yet.
+        memory: Approximate memory held by the indexes, in bytes.
+        build_time: Duration of the last full `build()`, in seconds.
+    """
+
+    files: int
+    keys: int
+    values: int
+    sorted: int
+    memory: int
+    build_time: float
+
+
+class _Sorted:
+    """Values of one type in ascending order, with the note of each."""
+
+    __slots__ = ("docs", "keys", "tail")
+
+    def __init__(self) -> None:
+        self.keys: list[Any] = []
+        self.docs: list[int] = []
+        self.tail: list[tuple[Any, int]] = []
+
+    def settle(self) -> None:
+        """Merge the values added since the last range query."""
+        tail, self.tail = self.tail, []
+        if len(tail) <= _INSERT_MAX:
+            for key, doc in tail:
+                index = bisect_right(self.keys, key)
+                self.keys.insert(index, key)
+                self.docs.insert(index, doc)
+            return
+        merged = sorted([*zip(self.keys, self.docs), *tail])
+        self.keys = [key for key, _ in merged]
+        self.docs = [doc for _, doc in merged]
+
+    def bounds(self, operator: str, value: Any) -> tuple[int, int]:
+        """Slice of `keys` (and `docs`) satisfying `key <operator> value`."""
+        if self.tail:
+            self.settle()
+        keys = self.keys
+        low, high = 0, len(keys)
+        if operator == ">":
+            low = bisect_right(keys, value)
+        elif operator == ">=":
+            low = bisect_left(keys, value)
+        elif operator == "<":
+            high = bisect_left(keys, value)
+        else:
+            high = bisect_right(keys, value)
+        return low, high
+
+
+class _Column:
+    """Secondary indexes of one property name."""
+
+    __slots__ = ("docs", "equal", "numbers", "strings")
+
+    def __init__(self) -> None:
+        self.docs: set[int] = set()
+        self.equal: dict[tuple[str, Any], set[int]] = {}
+        self.numbers = _Sorted()
+        self.strings = _Sorted()
+
+
+class PropertyIndex(VaultIndex):
+    """Frontmatter properties of every note, queryable by value.
+
+    Each note's frontmatter is parsed into typed values (text, numbers,
+    booleans, null and lists), as `obsidian properties` returns them.
+    Every property name gets a hash index from value to notes, for
+    equality, and sorted arrays of its numeric and text values, for
+    ranges. A list property matches if any of its items does.
+
+    ```python
+    index = PropertyIndex(vault_dir)
+    index.build()
+    index.where(("status", "==", "active"), ("priority", ">", 2))
+    index.where(("due", "<", date(2025, 1, 1)), path="Projects")
+    ```
+
+    Conditions are `(name, operator, value)` triples, combined with AND:
+
+    - `==` / `!=`: equal / not equal. `!=` only matches notes that
+      have the property.
+    - `<`, `<=`, `>`, `>=`: numbers compare with numbers, text with
+      text (ISO dates sort correctly). `date` and `datetime` values
+      are compared as ISO strings.
+    - `in`: equal to any item of the value.
+    - `exists`: the note has the property (value `True`) or lacks it
+      (value `False`).
+
+    Args:
+        root: Vault directory.
+        max_age: Seconds after which `sync()` also runs `refresh()`.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | None = None,
+        *,
+        max_age: float | None = None,
+    ) -> None:
+        super().__init__(root, max_age=max_age)
+        self._columns: dict[str, _Column] = {}
+        self._ids: dict[str, int] = {}
+        self._paths: list[str | None] = []
+        self._values: list[dict[str, Any] | None] = []
+        self._order: list[tuple[tuple[int, str], ...]] = []
+        self._removed = 0
+
+    # -- queries -------------------------------------------------------------
+
+    def where(self, *conditions: Condition, path: str | None = None) -> list[str]:
+        """Notes whose properties satisfy every condition.
+
+        Args:
+            *conditions: `(name, operator, value)` triples.
+            path: Restrict the result to notes under this folder.
+
+        Returns:
+            Matching note paths, in the order `obsidian files` lists
+            them.
+
+        Raises:
+            ValueError: If an operator is unknown, or a range operator
+                is given a value that is neither a number nor text.
+        """
+        plan = sorted(
+            (self._estimate(*checked), index, checked)
+            for index, checked in enumerate(map(_check, conditions))
+        )
+        docs: set[int] | None = None
+        for estimate, _, (name, operator, value) in plan:
+            if docs is not None and len(docs) * _TEST_COST <= estimate:
+                # Far fewer candidates than index hits: test their values.
+                docs = {doc for doc in docs if self._test(doc, name, operator, value)}
+            else:
+                matched = self._match(name, operator, value)
+                docs = matched if docs is None else docs & matched
+            if not docs:
+                return []
+        if docs is None:
+            docs = set(self._ids.values())
+        paths = self._paths
+        if path:
+            docs = {doc for doc in docs if under(paths[doc] or "", path)}
+        return [paths[doc] or "" for doc in sorted(docs, key=self._order.__getitem__)]
+
+    def get(self, path: str) -> dict[str, Any]:
+        """Properties of one note, as `cli.properties.list()` returns them.
+
+        Raises:
+            KeyError: If the note is not indexed.
+        """
+        return dict(self._values[self._ids[path.strip("/")]] or {})
+
+    def keys(self) -> dict[str, int]:
+        """Number of notes using each property name."""
+        return {
+            name: len(column.docs)
+            for name, column in sorted(self._columns.items())
+            if column.docs
+        }
+
+    def stats(self) -> PropertyIndexStats:
+        """Return the size of the index."""
+        values = 0
+        entries = 0
+        memory = sys.getsizeof(self._columns)
+        for name, column in self._columns.items():
+            values += len(column.equal)
+            memory += sys.getsizeof(name) + sys.getsizeof(column.equal)
+            memory += sys.getsizeof(column.docs)
+            for docs in column.equal.values():
+                memory += sys.getsizeof(docs)
+            for ordered in (column.numbers, column.strings):
+                entries += len(ordered.keys) + len(ordered.tail)
+                memory += sys.getsizeof(ordered.keys) + sys.getsizeof(ordered.docs)
+        return PropertyIndexStats(
+            files=len(self._ids),
+            keys=len(self.keys()),
+            values=values,
+            sorted=entries,
+            memory=memory,
+            build_time=self._build_time,
+        )
+
+    def _estimate(self, name: str, operator: Operator, value: Any) -> int:
+        """Number of notes the index would return for one condition."""
+        column = self._columns.get(name)
+        if operator in ("!=", "exists"):
+            return len(self._ids)
+        if column is None:
+            return 0
+        if operator == "==":
+            return len(column.equal.get(_hash_key(value), ()))
+        if operator == "in":
+            return sum(len(column.equal.get(_hash_key(item), ())) for item in value)
+        ordered = column.strings if isinstance(value, str) else column.numbers
+        low, high = ordered.bounds(operator, value)
+        return high - low
+
+    def _match(self, name: str, operator: Operator, value: Any) -> set[int]:
+        """Notes satisfying one condition, looked up in the indexes."""
+        column = self._columns.get(name)
+        having = column.docs if column is not None else set()
+        if operator == "exists":
+            return set(having) if value else set(self._ids.values()) - having
+        if column is None:
+            return set()
+        if operator == "==":
+            return set(column.equal.get(_hash_key(value), ()))
+        if operator == "in":
+            return set().union(
+                *(column.equal.get(_hash_key(item), ()) for item in value)
+            )
+        if operator == "!=":
+            return having - column.equal.get(_hash_key(value), set())
+        ordered = column.strings if isinstance(value, str) else column.numbers
+        low, high = ordered.bounds(operator, value)
+        paths = self._paths
+        return {doc for doc in ordered.docs[low:high] if paths[doc] is not None}
+
+    def _test(self, doc: int, name: str, operator: Operator, value: Any) -> bool:
+        """Whether one note satisfies one condition, from its values."""
+        properties = self._values[doc]
+        if properties is None:
+            return False
+        if operator == "exists":
+            return (name in properties) == bool(value)
+        if name not in properties:
+            return False
+        found = properties[name]
+        items = found if isinstance(found, list) else [found]
+        if operator in ("==", "!="):
+            key = _hash_key(value)
+            equal = any(_hash_key(item) == key for item in items)
+            return equal if operator == "==" else not equal
+        if operator == "in":
+            keys = {_hash_key(candidate) for candidate in value}
+            return any(_hash_key(item) in keys for item in items)
+        compare = _COMPARE[operator]
+        if isinstance(value, str):
+            return any(isinstance(item, str) and compare(item, value) for item in items)
+        return any(_is_number(item) and compare(item, value) for item in items)
+
+    # -- VaultIndex ----------------------------------------------------------
+
+    def _add(self, path: str, text: str) -> None:
+        properties, _ = parse_frontmatter(text)
+        self._index(path, properties)
+
+    def _index(self, path: str, properties: dict[str, Any]) -> None:
+        doc = len(self._paths)
+        self._ids[path] = doc
+        self._paths.append(path)
+        self._values.append(properties)
+        self._order.append(walk_key(path))
+        columns = self._columns
+        for name, value in properties.items():
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = _Column()
+            column.docs.add(doc)
+            for item in value if isinstance(value, list) else [value]:
+                key = _hash_key(item)
+                docs = column.equal.get(key)
+                if docs is None:
+                    docs = column.equal[key] = set()
+                docs.add(doc)
+                if isinstance(item, str):
+                    column.strings.tail.append((item, doc))
+                elif _is_number(item):
+                    column.numbers.tail.append((item, doc))
+
+    def _remove(self, path: str) -> None:
+        doc = self._ids.pop(path)
+        self._paths[doc] = None
+        properties = self._values[doc] or {}
+        self._values[doc] = None
+        for name, value in properties.items():
+            column = self._columns[name]
+            column.docs.discard(doc)
+            for item in value if isinstance(value, list) else [value]:
+                key = _hash_key(item)
+                docs = column.equal.get(key)
+                if docs is not None:
+                    docs.discard(doc)
+                    if not docs:
+                        del column.equal[key]
+        # The range arrays keep the note until compaction; queries skip it.
+        self._removed += 1
+        if self._removed > max(_COMPACT_MIN, len(self._ids)):
+            self._compact()
+
+    def _clear(self) -> None:
+        self._columns = {}
+        self._ids = {}
+        self._paths = []
+        self._values = []
+        self._order = []
+        self._removed = 0
+
+    def _compact(self) -> None:
+        """Rebuild the indexes without removed notes."""
+        live = [
+            (path, properties)
+            for path, properties in zip(self._paths, self._values, strict=True)
+            if path is not None and properties is not None
+        ]
+        self._clear()
+        for path, properties in live:
+            self._index(path, properties)
+
+
+def _check(condition: Condition) -> Condition:
+    """Validate a condition and normalise its value."""
+    name, operator, value = condition
+    if operator not in OPERATORS:
+        raise ValueError(f"Unknown operator: {operator!r}")
+    if operator == "in":
+        return name, operator, [_comparable(item) for item in value]
+    value = _comparable(value)
+    if operator in _COMPARE and not (isinstance(value, str) or _is_number(value)):
+        raise ValueError(
+            f"Cannot compare {name!r} with {value!r}: use a number or text."
+        )
+    return name, operator, value
+
+
+def _is_number(value: Any) -> bool:
+    return (
+        isinstance(value, int | float)
+        and not isinstance(value, bool)
+        and not math.isnan(value)
+    )
+
+
+def _comparable(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _hash_key(value: Any) -> tuple[str, Any]:
+    """Hash index key that keeps `True` and `1` (and `"1"`) apart."""
+    value = _comparable(value)
+    if isinstance(value, bool):
+        return ("bool", value)
+    if isinstance(value, int | float):
+        return ("number", value)
+    if isinstance(value, list | dict):
+        return ("text", str(value))
+    return (type(value).__name__, value)
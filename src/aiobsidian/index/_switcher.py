@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import os
+import re
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from itertools import accumulate
+
+from ._base import VaultIndex, fold
+from ._frontmatter import aliases as note_aliases
+from ._frontmatter import parse_frontmatter
+
+_GRAM = 3
+
+# Characters after which a match counts as the start of a word.
+_SEPARATORS = frozenset(" /-_.")
+
+# Compact the grams once removed entries outnumber live ones (and at
+# least this many entries were removed).
+_COMPACT_MIN = 256
+
+
+@dataclass(frozen=True, slots=True)
+class SwitcherMatch:
+    """One result of `QuickSwitcher.match()`.
+
+    Attributes:
+        path: Vault-relative path of the note.
+        text: String the query matched: the note path without `.md`,
+            or one of the note's aliases.
+        alias: Whether `text` is an alias.
+        score: Match quality; higher is better.
+        positions: Offsets in `text` of the matched query characters,
+            e.g. for highlighting.
+    """
+
+    path: str
+    text: str
+    alias: bool
+    score: float
+    positions: tuple[int, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class QuickSwitcherStats:
+    """Size of a `QuickSwitcher`.
+
+    Attributes:
+        files: Indexed notes.
+        entries: Matchable strings (note paths and aliases), including
+            removed ones that were not compacted away yet.
+        grams: Distinct trigrams.
+        memory: Approximate memory held by the entries and trigrams, in
+            bytes.
+        build_time: Duration of the last full `build()`, in seconds.
+    """
+
+    files: int
+    entries: int
+    grams: int
+    memory: int
+    build_time: float
+
+
+class QuickSwitcher(VaultIndex):
+    """Fuzzy note lookup by path and alias, like Obsidian's quick switcher.
+
+    Every note is matchable by its path without the `.md` extension and
+    by each alias listed in its frontmatter (the values `obsidian
+    aliases` returns). A query matches a string if its characters occur
+    in it in order, case-insensitively; whitespace separates query
+    words. Matches score higher when characters are consecutive, whole
+    words or word starts, and fall in the note name rather than its
+    folder; shorter strings win ties.
+
+    A trigram index over the lower-cased strings narrows the candidates
+    to those containing every query word of 3+ characters verbatim, so
+    typical lookups take microseconds. Queries without such words, and
+    those no string contains verbatim (initials, typos with the right
+    letters), scan every string for scattered matches instead: one
+    regular expression over the joined strings, then scoring of each
+    hit, which costs milliseconds in vaults of tens of thousands of
+    notes.
+
+    ```python
+    switcher = QuickSwitcher(vault_dir)
+    switcher.build()
+    for match in switcher.match("proj plan", limit=5):
+        print(match.path, match.score)
+    ```
+
+    Args:
+        root: Vault directory.
+        max_age: Seconds after which `sync()` also runs `refresh()`.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | None = None,
+        *,
+        max_age: float | None = None,
+    ) -> None:
+        super().__init__(root, max_age=max_age)
+        self._entries: dict[str, list[int]] = {}
+        self._owners: list[str | None] = []
+        self._texts: list[str] = []
+        self._folded: list[str] = []
+        self._alias = array("B")
+        self._grams: dict[str, array[int]] = {}
+        self._removed = 0
+        # Live entries joined by newlines for the scan, built on demand.
+        self._joined: tuple[str, list[int], list[int]] | None = None
+
+    # -- queries -------------------------------------------------------------
+
+    def match(self, query: str, *, limit: int = 10) -> list[SwitcherMatch]:
+        """Notes whose path or an alias fuzzy-matches `query`.
+
+        Args:
+            query: Characters to look for, in order.
+            limit: Maximum number of notes to return.
+
+        Returns:
+            At most one match per note (its best string), best first.
+        """
+        words = fold(query).split()
+        if not words or limit <= 0:
+            return []
+        best: dict[str, tuple[float, int, tuple[int, ...]]] = {}
+        scored: set[int] = set()
+
+        def consider(entry: int) -> None:
+            scored.add(entry)
+            owner = self._owners[entry]
+            if owner is None:
+                return
+            alias = bool(self._alias[entry])
+            result = _score(words, self._texts[entry], self._folded[entry], alias)
+            if result is not None:
+                current = best.get(owner)
+                if current is None or result[0] > current[0]:
+                    best[owner] = (result[0], entry, result[1])
+
+        grams = {
+            word[i : i + _GRAM] for word in words for i in range(len(word) - _GRAM + 1)
+        }
+        if grams:
+            rarest = min((self._grams.get(gram, array("I")) for gram in grams), key=len)
+            folded = self._folded
+            for entry in rarest:
+                if all(gram in folded[entry] for gram in grams):
+                    consider(entry)
+        if not best:
+            for entry in self._scan("".join(words)):
+                if entry not in scored:
+                    consider(entry)
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], item[0]))
+        return [
+            SwitcherMatch(
+                path=path,
+                text=self._texts[entry],
+                alias=bool(self._alias[entry]),
+                score=score,
+                positions=positions,
+            )
+            for path, (score, entry, positions) in ranked[:limit]
+        ]
+
+    def aliases(self, path: str) -> list[str]:
+        """Aliases of an indexed note, as `cli.aliases.get()` returns them.
+
+        Raises:
+            KeyError: If the note is not indexed.
+        """
+        return [
+            self._texts[entry]
+            for entry in self._entries[path.strip("/")]
+            if self._alias[entry]
+        ]
+
+    def stats(self) -> QuickSwitcherStats:
+        """Return the size of the index."""
+        memory = sum(
+            sys.getsizeof(part)
+            for part in (self._owners, self._texts, self._folded, self._alias)
+        )
+        memory += sum(sys.getsizeof(text) for text in self._texts)
+        memory += sum(sys.getsizeof(text) for text in self._folded)
+        for gram, entries in self._grams.items():
+            memory += sys.getsizeof(gram) + sys.getsizeof(entries)
+        return QuickSwitcherStats(
+            files=len(self._entries),
+            entries=len(self._texts),
+            grams=len(self._grams),
+            memory=memory,
+            build_time=self._build_time,
+        )
+
+    def _scan(self, needle: str) -> Iterator[int]:
+        """Live entries that contain the characters of `needle` in order."""
+        if self._joined is None:
+            live = [
+                entry for entry, owner in enumerate(self._owners) if owner is not None
+            ]
+            texts = [self._folded[entry] for entry in live]
+            starts = [0, *accumulate(len(text) + 1 for text in texts)]
+            self._joined = ("\n".join(texts), live, starts)
+        joined, live, starts = self._joined
+        # "a[^b\n]*+b[^c\n]*+c": possessive runs take the first occurrence
+        # of each character, so matching never backtracks.
+        pattern = re.escape(needle[0]) + "".join(
+            f"[^{re.escape(char)}\\n]*+{re.escape(char)}" for char in needle[1:]
+        )
+        last = -1
+        for found in re.finditer(pattern, joined):
+            line = bisect_right(starts, found.start()) - 1
+            if line != last:
+                last = line
+                yield live[line]
+
+    # -- VaultIndex ----------------------------------------------------------
+
+    def _add(self, path: str, text: str) -> None:
+        properties, _ = parse_frontmatter(text)
+        self._add_note(path, note_aliases(properties))
+
+    def _add_note(self, path: str, names: list[str]) -> None:
+        self._joined = None
+        entries = self._entries[path] = [self._add_entry(path, path[:-3], False)]
+        for name in dict.fromkeys(names):
+            if name.strip() and "\n" not in name:
+                entries.append(self._add_entry(path, name, True))
+
+    def _add_entry(self, owner: str, text: str, alias: bool) -> int:
+        entry = len(self._texts)
+        folded = fold(text)
+        self._owners.append(owner)
+        self._texts.append(text)
+        self._folded.append(folded)
+        self._alias.append(alias)
+        grams = self._grams
+        for gram in {folded[i : i + _GRAM] for i in range(len(folded) - _GRAM + 1)}:
+            entries = grams.get(gram)
+            if entries is None:
+                entries = grams[gram] = array("I")
+            entries.append(entry)
+        return entry
+
+    def _remove(self, path: str) -> None:
+        self._joined = None
+        entries = self._entries.pop(path)
+        for entry in entries:
+            self._owners[entry] = None
+        self._removed += len(entries)
+        if self._removed > max(_COMPACT_MIN, len(self._texts) - self._removed):
+            self._compact()
+
+    def _clear(self) -> None:
+        self._entries = {}
+        self._owners = []
+        self._texts = []
+        self._folded = []
+        self._alias = array("B")
+        self._grams = {}
+        self._removed = 0
+        self._joined = None
+
+    def _compact(self) -> None:
+        """Rebuild the entries and trigrams without removed notes."""
+        live = [(path, self.aliases(path)) for path in self._entries]
+        self._clear()
+        for path, names in live:
+            self._add_note(path, names)
+
+
+def _score(
+    words: list[str], text: str, folded: str, alias: bool
+) -> tuple[float, tuple[int, ...]] | None:
+    """Score the query `words` against `text`, or `None` if they do not match."""
+    boundary = _boundary(text, folded)
+    positions = _align(words, folded, boundary)
+    if positions is None:
+        return None
+    name = 0 if alias else text.rfind("/") + 1
+    score = 0.0
+    previous = -1
+    for index, position in enumerate(positions):
+        score += 1.0
+        if previous >= 0 and position == previous + 1:
+            score += 3.0
+        elif previous >= 0:
+            score -= min(position - previous - 1, 10) * 0.1
+        if boundary(position):
+            score += 3.0 if position == name else 2.0
+        if position >= name:
+            score += 1.0
+        following = position + 1
+        if index + 1 == len(positions) or positions[index + 1] != following:
+            if following == len(text) or folded[following] in _SEPARATORS:
+                score += 2.0  # the run ends a word
+        previous = position
+    if folded[name:] == " ".join(words):
+        score += 5.0
+    score -= 0.01 * len(text)
+    return score, tuple(positions)
+
+
+def _align(
+    words: list[str], folded: str, boundary: Callable[[int], bool]
+) -> list[int] | None:
+    """Offsets in `folded` matching the characters of `words`, in order.
+
+    Each word is placed verbatim when possible, preferring a word
+    start; otherwise its characters are matched one by one, preferring
+    word starts. Every choice leaves room for the rest of the query.
+    """
+    needle = "".join(words)
+    positions: list[int] = []
+    offset = 0
+    for word in words:
+        done = len(positions)
+        rest = needle[done + len(word) :]
+        start = folded.find(word, offset)
+        first = -1
+        while start >= 0:
+            if _fits(rest, folded, start + len(word)):
+                if first < 0 or boundary(start):
+                    first = start
+                if boundary(start):
+                    break
+            start = folded.find(word, start + 1)
+        if first >= 0:
+            positions.extend(range(first, first + len(word)))
+            offset = first + len(word)
+            continue
+        for index, char in enumerate(word):
+            position = folded.find(char, offset)
+            if position < 0:
+                return None
+            if position != offset or not positions:
+                # Prefer a later occurrence that starts a word.
+                later = position
+                while later >= 0 and not boundary(later):
+                    later = folded.find(char, later + 1)
+                if later >= 0 and _fits(needle[done + index + 1 :], folded, later + 1):
+                    position = later
+            positions.append(position)
+            offset = position + 1
+    return positions
+
+
+def _boundary(text: str, folded: str) -> Callable[[int], bool]:
+    """Predicate telling whether an offset of `text` starts a word."""
+
+    def boundary(position: int) -> bool:
+        if position == 0 or folded[position - 1] in _SEPARATORS:
+            return True
+        before, char = text[position - 1], text[position]
+        return (before.islower() and char.isupper()) or (
+            char.isdigit() and not before.isdigit()
+        )
+
+    return boundary
+
+
+def _fits(needle: str, folded: str, offset: int) -> bool:
+    """Whether `needle` is a subsequence of `folded[offset:]`."""
+    for char in needle:
+        offset = folded.find(char, offset) + 1
+        if not offset:
+            return False
+    return True
@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import os
+import re
+import sys
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Any
+
+from ._base import VaultIndex, walk_key
+from ._frontmatter import parse_frontmatter
+
+# `#tag` in the body, not inside a word, URL fragment or heading marker;
+# a tag needs something besides digits (`#2024` is not one).
+_TAG = re.compile(r"(?<![\w&/#])#(?=[\w/-]*[^\W\d])([\w-][\w/-]*)")
+
+
+@dataclass(frozen=True, slots=True)
+class TagIndexStats:
+    """Size of a `TagIndex`.
+
+    Attributes:
+        files: Indexed notes.
+        tags: Distinct tags.
+        occurrences: Tags in all notes, repeats included.
+        nodes: Nodes of the tag trie, parents of nested tags included.
+        memory: Approximate memory held by the trie, in bytes.
+        build_time: Duration of the last full `build()`, in seconds.
+    """
+
+    files: int
+    tags: int
+    occurrences: int
+    nodes: int
+    memory: int
+    build_time: float
+
+
+class _Node:
+    """One level of the tag hierarchy, e.g. `project/alpha`."""
+
+    __slots__ = ("children", "count", "files", "ordered", "total")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        # Occurrences of exactly this tag, and of it and its nested tags,
+        # in total and per note.
+        self.count = 0
+        self.total = 0
+        self.files: dict[str, int] = {}
+        # `files` in vault order, kept up to date once first queried.
+        self.ordered: list[str] | None = None
+
+
+class TagIndex(VaultIndex):
+    """Tags of the notes of a vault as a trie of nested tags.
+
+    Tags come from the frontmatter `tags:` property and from `#tags` in
+    the body, as `obsidian tags` reads them; every occurrence counts.
+    Each level of a nested tag (`project`, `project/alpha`, ...) is a
+    trie node holding the notes tagged with it or anything below it, so
+    "every note under `#project/`" is one lookup and `get()` costs
+    O(notes returned). The sorted tag list behind `tags()` is kept
+    until a note changes.
+
+    ```python
+    tags = TagIndex(vault_dir)
+    tags.build()
+    tags.files("project")  # notes tagged #project or #project/...
+    tags.tags(sort="count", counts=True)
+    ```
+
+    Args:
+        root: Vault directory.
+        max_age: Seconds after which `sync()` also runs `refresh()`.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | None = None,
+        *,
+        max_age: float | None = None,
+    ) -> None:
+        super().__init__(root, max_age=max_age)
+        self._root_node = _Node()
+        self._notes: dict[str, list[str]] = {}
+        self._names: list[tuple[str, int]] | None = None
+        # Note paths in string order for folder filters, built on demand.
+        self._paths: list[str] | None = None
+
+    # -- queries -------------------------------------------------------------
+
+    def files(self, tag: str) -> list[str]:
+        """Notes tagged with `tag` or a tag nested under it, in vault order.
+
+        Args:
+            tag: Tag name, with or without `#` and a trailing `/`.
+        """
+        node = self._find(tag)
+        if node is None:
+            return []
+        if node.ordered is None:
+            node.ordered = sorted(node.files, key=walk_key)
+        return list(node.ordered)
+
+    def get(self, tag: str) -> list[dict[str, str]]:
+        """Notes with a tag, as `obsidian tag` lists them.
+
+        Returns:
+            `{"path", "name"}` dicts in vault order.
+        """
+        return [{"path": path, "name": _name(path)} for path in self.files(tag)]
+
+    def count(self, tag: str, *, nested: bool = True) -> int:
+        """Occurrences of a tag, including tags nested under it unless not `nested`."""
+        node = self._find(tag)
+        if node is None:
+            return 0
+        return node.total if nested else node.count
+
+    def children(self, tag: str = "") -> list[str]:
+        """Tags one level below `tag` (top-level tags by default), sorted.
+
+        A child is listed if it or a tag nested under it is in use.
+        """
+        node = self._find(tag) if tag.strip("#/") else self._root_node
+        if node is None:
+            return []
+        prefix = _clean(tag) + "/" if tag.strip("#/") else ""
+        return sorted(prefix + segment for segment in node.children)
+
+    def tags(
+        self,
+        *,
+        sort: str | None = None,
+        path: str | None = None,
+        prefix: str | None = None,
+        counts: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Tags in use, as `obsidian tags` lists them.
+
+        Args:
+            sort: `"count"` for the most used first; by name otherwise.
+            path: Only count notes in this folder (or this note).
+            prefix: Only list this tag and the tags nested under it.
+            counts: Include the number of occurrences of each tag.
+
+        Returns:
+            `{"name"}` dicts, with `count` when requested.
+        """
+        found: dict[str, int]
+        if not (path or "").strip("/"):
+            node = self._find(prefix) if prefix else self._root_node
+            if node is None:
+                return []
+            found = dict(self._sorted() if prefix is None else _names(node, prefix))
+        else:
+            start = _clean(prefix or "")
+            found = {}
+            for file in self._under(path or ""):
+                for name in self._notes[file]:
+                    if _nested(name, start):
+                        found[name] = found.get(name, 0) + 1
+        order = sorted(found)
+        if sort == "count":
+            order.sort(key=lambda name: -found[name])
+        if counts:
+            return [{"name": name, "count": found[name]} for name in order]
+        return [{"name": name} for name in order]
+
+    def stats(self) -> TagIndexStats:
+        """Return the size of the index."""
+        nodes = 0
+        memory = sys.getsizeof(self._notes)
+        stack = [self._root_node]
+        while stack:
+            node = stack.pop()
+            nodes += 1
+            memory += sys.getsizeof(node) + sys.getsizeof(node.children)
+            memory += sys.getsizeof(node.files)
+            stack.extend(node.children.values())
+        for tags in self._notes.values():
+            memory += sys.getsizeof(tags) + sum(sys.getsizeof(tag) for tag in tags)
+        return TagIndexStats(
+            files=len(self._notes),
+            tags=len(self._sorted()),
+            occurrences=self._root_node.total,
+            nodes=nodes - 1,
+            memory=memory,
+            build_time=self._build_time,
+        )
+
+    def _find(self, tag: str) -> _Node | None:
+        node: _Node | None = self._root_node
+        for segment in _clean(tag).split("/"):
+            node = node.children.get(segment) if node is not None else None
+        return node
+
+    def _under(self, folder: str) -> list[str]:
+        """Notes in `folder` (or the note `folder` itself)."""
+        if self._paths is None:
+            self._paths = sorted(self._notes)
+        folder = folder.strip("/")
+        paths = self._paths
+        # Paths below `folder/` sort between it and `folder0` ("0" follows "/").
+        start = bisect_left(paths, folder + "/")
+        found = paths[start : bisect_left(paths, folder + "0", start)]
+        return [folder, *found] if folder in self._notes else found
+
+    def _sorted(self) -> list[tuple[str, int]]:
+        if self._names is None:
+            self._names = _names(self._root_node, "")
+        return self._names
+
+    # -- VaultIndex ----------------------------------------------------------
+
+    def _add(self, path: str, text: str) -> None:
+        properties, body = parse_frontmatter(text)
+        tags = self._notes[path] = _tags(properties, text[body:])
+        if self._paths is not None:
+            insort(self._paths, path)
+        if tags:
+            self._names = None
+        for tag in tags:
+            node = self._root_node
+            _enter(node, path)
+            for segment in tag.split("/"):
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _Node()
+                node = child
+                _enter(node, path)
+            node.count += 1
+
+    def _remove(self, path: str) -> None:
+        tags = self._notes.pop(path)
+        if self._paths is not None:
+            del self._paths[bisect_left(self._paths, path)]
+        if tags:
+            self._names = None
+        for tag in tags:
+            node = self._root_node
+            _leave(node, path)
+            trail = []
+            for segment in tag.split("/"):
+                trail.append((node, segment))
+                node = node.children[segment]
+                _leave(node, path)
+            node.count -= 1
+            for parent, segment in reversed(trail):
+                if parent.children[segment].total:
+                    break
+                del parent.children[segment]
+
+    def _clear(self) -> None:
+        self._root_node = _Node()
+        self._notes = {}
+        self._names = None
+        self._paths = None
+
+
+def _enter(node: _Node, path: str) -> None:
+    node.total += 1
+    seen = node.files.get(path, 0)
+    node.files[path] = seen + 1
+    if not seen and node.ordered is not None:
+        insort(node.ordered, path, key=walk_key)
+
+
+def _leave(node: _Node, path: str) -> None:
+    node.total -= 1
+    left = node.files[path] - 1
+    if left:
+        node.files[path] = left
+        return
+    del node.files[path]
+    if node.ordered is not None:
+        del node.ordered[bisect_left(node.ordered, walk_key(path), key=walk_key)]
+
+
+def _names(node: _Node, prefix: str) -> list[tuple[str, int]]:
+    """Tags in use at or below `node` with their counts, sorted by name."""
+    names = []
+    stack = [(node, _clean(prefix))]
+    while stack:
+        node, name = stack.pop()
+        if node.count:
+            names.append((name, node.count))
+        for segment, child in node.children.items():
+            stack.append((child, f"{name}/{segment}" if name else segment))
+    names.sort()
+    return names
+
+
+def _tags(properties: dict[str, Any], body: str) -> list[str]:
+    """Tags of a note in order of appearance, repeats included."""
+    found: list[str] = []
+    values = properties.get("tags")
+    for value in values if isinstance(values, list) else [values]:
+        if isinstance(value, str):
+            found.extend(tag.lstrip("#") for tag in value.replace(",", " ").split())
+    found.extend(match.group(1) for match in _TAG.finditer(body))
+    tags = (_tag_name(tag) for tag in found)
+    return [tag for tag in tags if tag]
+
+
+def _tag_name(tag: str) -> str:
+    """`tag` without empty levels: `a/b/` and `a//b` nest like `a/b`."""
+    return "/".join(filter(None, tag.split("/")))
+
+
+def _clean(tag: str) -> str:
+    return tag.strip().lstrip("#").rstrip("/")
+
+
+def _nested(tag: str, prefix: str) -> bool:
+    return not prefix or tag == prefix or tag.startswith(prefix + "/")
+
+
+def _name(path: str) -> str:
+    """Note name: the file name without `.md` (every indexed path has it)."""
+    return path[path.rfind("/") + 1 : -3]
@@ -0,0 +1,474 @@
+from __future__ import annotations
+
+import datetime
+import os
+import re
+import sys
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Any, Literal
+
+from ._base import VaultIndex, under, walk_key
+from ._frontmatter import parse_frontmatter
+from ._tags import _TAG, _tag_name
+
+# `- [ ] text` / `- [x] text`; like Obsidian, any other character in the
+# box (`[-]`, `[/]`, `[>]`, ...) is a task status too, and counts as done.
+_TASK = re.compile(r"^[ \t]*[-*+] \[([^\]\n\r])\] (.*)$", re.MULTILINE)
+
+# Due dates of the Tasks plugin (`📅 2024-05-01`) and Dataview
+# (`[due:: 2024-05-01]`, `(due:: 2024-05-01)`).
+_DUE = re.compile(r"(?:\U0001f4c5\ufe0f?\s*|[\[(]due::\s*)(\d{4}-\d{2}-\d{2})")
+
+# Compact the columns once removed tasks outnumber live ones (and at
+# least this many tasks were removed).
+_COMPACT_MIN = 256
+
+_UNDATED = 2**32 - 1
+
+TaskSort = Literal["path", "due"]
+"""Order of `TaskIndex.query()` results: vault order, or due date first."""
+
+
+@dataclass(frozen=True, slots=True)
+class TaskIndexStats:
+    """Size of a `TaskIndex`.
+
+    Attributes:
+        files: Indexed notes.
+        tasks: Tasks in those notes.
+        open: Tasks not checked off.
+        rows: Rows in the columns, including removed tasks that were
+            not compacted away yet.
+        memory: Approximate memory held by the columns, in bytes.
+        build_time: Duration of the last full `build()`, in seconds.
+    """
+
+    files: int
+    tasks: int
+    open: int
+    rows: int
+    memory: int
+    build_time: float
+
+
+class TaskIndex(VaultIndex):
+    """Checkbox tasks of the notes of a vault, in columns.
+
+    Every `- [ ]` / `- [x]` line (also with `*` or `+` bullets, and
+    custom statuses such as `- [-]`) becomes a row: the note, line
+    number, status character, text, `#tags` and due date
+    (`📅 2024-05-01` or `[due:: 2024-05-01]`). The fixed-size fields
+    live in `array` columns; rows of a changed note are dropped and
+    re-appended, and the columns are compacted once removed rows
+    outnumber live ones. `refresh()` re-parses only notes whose
+    modification time or size changed.
+
+    `tasks()` returns what `obsidian tasks` lists; `query()` adds
+    filters by completion, tag (nested tags included), folder and due
+    range, sorted in vault order or by due date. Tags are looked up in
+    per-tag row lists and due ranges in the dated rows kept sorted by
+    due date, so neither scans every task:
+
+    ```python
+    tasks = TaskIndex(vault_dir)
+    tasks.build()
+    overdue = tasks.query(completed=False, due_to=datetime.date.today())
+    ```
+
+    Args:
+        root: Vault directory.
+        max_age: Seconds after which `sync()` also runs `refresh()`.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | None = None,
+        *,
+        max_age: float | None = None,
+    ) -> None:
+        super().__init__(root, max_age=max_age)
+        # Per note: its id and its rows, `range(start, stop)`.
+        self._spans: dict[str, tuple[int, int, int]] = {}
+        # Per note id: path (`None` once removed) and `walk_key()`.
+        self._paths: list[str | None] = []
+        self._keys: list[tuple[tuple[int, str], ...]] = []
+        # Columns, one entry per row.
+        self._note = array("I")
+        self._line = array("I")
+        self._done = array("B")
+        self._status = array("I")
+        self._due = array("I")
+        self._content: list[str] = []
+        self._tags: list[tuple[str, ...]] = []
+        self._by_tag: dict[str, array[int]] = {}
+        self._removed = 0
+        # Built on first use, then kept up to date: live note ids in
+        # vault order, and live dated rows by due date, then vault order.
+        self._order: list[int] | None = None
+        self._dated: list[int] | None = None
+        self._rank: dict[int, int] | None = None
+
+    # -- queries -------------------------------------------------------------
+
+    def tasks(
+        self, *, path: str | None = None, done: bool = False
+    ) -> list[dict[str, Any]]:
+        """Tasks as `obsidian tasks` lists them.
+
+        Args:
+            path: Only tasks in notes under this folder.
+            done: Include completed tasks.
+
+        Returns:
+            `{"id", "content", "completed", "path", "line"}` dicts, in
+            vault order.
+        """
+        result = []
+        spans, completed, lines, contents = (
+            self._spans,
+            self._done,
+            self._line,
+            self._content,
+        )
+        for note in self._vault_order():
+            file = self._paths[note] or ""
+            if not under(file, path):
+                continue
+            _, start, stop = spans[file]
+            for row in range(start, stop):
+                if done or not completed[row]:
+                    line = lines[row]
+                    result.append(
+                        {
+                            "id": f"{file}:{line}",
+                            "content": contents[row],
+                            "completed": bool(completed[row]),
+                            "path": file,
+                            "line": line,
+                        }
+                    )
+        return result
+
+    def query(
+        self,
+        *,
+        completed: bool | None = None,
+        tag: str | None = None,
+        path: str | None = None,
+        due_from: datetime.date | str | None = None,
+        due_to: datetime.date | str | None = None,
+        sort: TaskSort = "path",
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Tasks matching all of the given filters.
+
+        Args:
+            completed: Only checked-off (`True`) or open (`False`) tasks.
+            tag: Only tasks with this tag or one nested under it, with
+                or without `#`.
+            path: Only tasks in notes under this folder.
+            due_from: Only tasks due on or after this date.
+            due_to: Only tasks due on or before this date.
+            sort: `"path"` for vault order and line, `"due"` for the
+                earliest due date first (undated tasks last).
+            limit: Maximum number of tasks to return.
+
+        Returns:
+            Dicts shaped like `tasks()` results, plus `status` (the
+            character in the box), `tags` (list) and `due` (ISO date,
+            or `None`).
+
+        Raises:
+            ValueError: If a due bound is not a date or `YYYY-MM-DD`, or
+                `sort` is unknown.
+        """
+        if sort not in ("path", "due"):
+            raise ValueError(f"Unknown sort: {sort!r}")
+        low = _ordinal(due_from) if due_from is not None else None
+        high = _ordinal(due_to) if due_to is not None else None
+        rows = self._select(completed, tag, path, low, high, sort)
+        result = []
+        for row in islice(rows, limit):
+            task = self._task(row)
+            due = self._due[row]
+            task["status"] = chr(self._status[row])
+            task["tags"] = list(self._tags[row])
+            task["due"] = (
+                None if due == _UNDATED else datetime.date.fromordinal(due).isoformat()
+            )
+            result.append(task)
+        return result
+
+    def stats(self) -> TaskIndexStats:
+        """Return the size of the index."""
+        live = [row for row in range(len(self._note)) if self._live(row)]
+        memory = sum(
+            sys.getsizeof(column)
+            for column in (
+                self._note,
+                self._line,
+                self._done,
+                self._status,
+                self._due,
+            )
+        )
+        memory += sys.getsizeof(self._content) + sys.getsizeof(self._tags)
+        memory += sum(sys.getsizeof(text) for text in self._content)
+        memory += sum(sys.getsizeof(rows) for rows in self._by_tag.values())
+        return TaskIndexStats(
+            files=len(self._spans),
+            tasks=len(live),
+            open=sum(1 for row in live if not self._done[row]),
+            rows=len(self._note),
+            memory=memory,
+            build_time=self._build_time,
+        )
+
+    def _select(
+        self,
+        completed: bool | None,
+        tag: str | None,
+        folder: str | None,
+        low: int | None,
+        high: int | None,
+        sort: TaskSort,
+    ) -> Iterator[int]:
+        """Rows matching the filters, in the requested order."""
+        notes, paths = self._note, self._paths
+        order = self._vault_order()
+        allowed: set[int] | None = None
+        if (folder or "").strip("/"):
+            order = [note for note in order if under(paths[note] or "", folder)]
+            allowed = set(order)
+        rows: Iterator[int] | list[int]
+        if tag is not None:
+            tag = tag.strip().lstrip("#").rstrip("/")
+            found: set[int] = set()
+            for name, postings in self._by_tag.items():
+                if name == tag or name.startswith(tag + "/"):
+                    found.update(postings)
+            rank = self._ranks()
+            rows = sorted(
+                (
+                    row
+                    for row in found
+                    if paths[notes[row]] is not None
+                    and (allowed is None or notes[row] in allowed)
+                ),
+                key=lambda row: (rank[notes[row]], row),
+            )
+            if sort == "due":
+                rows.sort(key=self._due.__getitem__)
+        elif sort == "due" or low is not None or high is not None:
+            dated = self._by_due()
+            key = self._due_key
+            start = 0 if low is None else bisect_left(dated, (low,), key=key)
+            stop = len(dated)
+            if high is not None:
+                stop = bisect_left(dated, (high + 1,), key=key, lo=start)
+            rows = dated[start:stop]
+            if allowed is not None:
+                rows = [row for row in rows if notes[row] in allowed]
+            if sort == "path":
+                rank = self._ranks()
+                rows.sort(key=lambda row: (rank[notes[row]], row))
+            elif low is None and high is None:
+                due = self._due
+                undated = (row for row in self._spanned(order) if due[row] == _UNDATED)
+                rows = chain(rows, undated)
+        else:
+            rows = self._spanned(order)
+        done, due = self._done, self._due
+        return (
+            row
+            for row in rows
+            if (completed is None or done[row] == completed)
+            and (low is None or low <= due[row] != _UNDATED)
+            and (high is None or due[row] <= high)
+        )
+
+    def _spanned(self, order: list[int]) -> Iterator[int]:
+        """Rows of the given notes, note by note."""
+        spans, paths = self._spans, self._paths
+        for note in order:
+            _, start, stop = spans[paths[note] or ""]
+            yield from range(start, stop)
+
+    def _vault_order(self) -> list[int]:
+        if self._order is None:
+            self._order = sorted(
+                (note for note, _, _ in self._spans.values()),
+                key=self._keys.__getitem__,
+            )
+        return self._order
+
+    def _ranks(self) -> dict[int, int]:
+        """Position of every live note in vault order."""
+        if self._rank is None:
+            self._rank = {note: i for i, note in enumerate(self._vault_order())}
+        return self._rank
+
+    def _by_due(self) -> list[int]:
+        if self._dated is None:
+            due = self._due
+            self._dated = sorted(
+                (
+                    row
+                    for row in self._spanned(self._vault_order())
+                    if due[row] != _UNDATED
+                ),
+                key=self._due_key,
+            )
+        return self._dated
+
+    def _due_key(self, row: int) -> tuple[Any, ...]:
+        return (self._due[row], self._keys[self._note[row]], self._line[row])
+
+    def _task(self, row: int) -> dict[str, Any]:
+        path = self._paths[self._note[row]] or ""
+        line = self._line[row]
+        return {
+            "id": f"{path}:{line}",
+            "content": self._content[row],
+            "completed": bool(self._done[row]),
+            "path": path,
+            "line": line,
+        }
+
+    def _live(self, row: int) -> bool:
+        return self._paths[self._note[row]] is not None
+
+    # -- VaultIndex ----------------------------------------------------------
+
+    def _add(self, path: str, text: str) -> None:
+        _, offset = parse_frontmatter(text)
+        # Lines before the body; a closing `---` directly followed by text
+        # still counts as a line of its own.
+        before = text.count("\n", 0, offset)
+        if offset and text[offset - 1] != "\n":
+            before += 1
+        self._add_rows(path, _parse(text[offset:], before + 1))
+
+    def _add_rows(
+        self, path: str, rows: list[tuple[int, str, int, str, tuple[str, ...]]]
+    ) -> None:
+        note = len(self._paths)
+        self._paths.append(path)
+        self._keys.append(walk_key(path))
+        self._rank = None
+        if self._order is not None:
+            insort(self._order, note, key=self._keys.__getitem__)
+        start = len(self._note)
+        for line, status, due, content, tags in rows:
+            row = len(self._note)
+            self._note.append(note)
+            self._line.append(line)
+            self._done.append(status != " ")
+            self._status.append(ord(status))
+            self._due.append(due)
+            self._content.append(content)
+            self._tags.append(tags)
+            for tag in dict.fromkeys(tags):
+                postings = self._by_tag.get(tag)
+                if postings is None:
+                    postings = self._by_tag[tag] = array("I")
+                postings.append(row)
+            if self._dated is not None and due != _UNDATED:
+                insort(self._dated, row, key=self._due_key)
+        self._spans[path] = (note, start, len(self._note))
+
+    def _remove(self, path: str) -> None:
+        note, start, stop = self._spans.pop(path)
+        self._rank = None
+        if self._order is not None:
+            key = self._keys[note]
+            del self._order[bisect_left(self._order, key, key=self._keys.__getitem__)]
+        if self._dated is not None:
+            for row in range(start, stop):
+                if self._due[row] != _UNDATED:
+                    key = self._due_key(row)
+                    del self._dated[bisect_left(self._dated, key, key=self._due_key)]
+        self._paths[note] = None
+        self._removed += stop - start
+        if self._removed > max(_COMPACT_MIN, len(self._note) - self._removed):
+            self._compact()
+
+    def _clear(self) -> None:
+        self._spans = {}
+        self._paths = []
+        self._keys = []
+        self._note = array("I")
+        self._line = array("I")
+        self._done = array("B")
+        self._status = array("I")
+        self._due = array("I")
+        self._content = []
+        self._tags = []
+        self._by_tag = {}
+        self._removed = 0
+        self._order = None
+        self._dated = None
+        self._rank = None
+
+    def _compact(self) -> None:
+        """Rebuild the columns without removed rows."""
+        live = [
+            (
+                path,
+                [
+                    (
+                        self._line[row],
+                        chr(self._status[row]),
+                        self._due[row],
+                        self._content[row],
+                        self._tags[row],
+                    )
+                    for row in range(start, stop)
+                ],
+            )
+            for path, (_, start, stop) in self._spans.items()
+        ]
+        self._clear()
+        for path, rows in live:
+            self._add_rows(path, rows)
+
+
+def _parse(body: str, first: int) -> list[tuple[int, str, int, str, tuple[str, ...]]]:
+    """Tasks of a note body whose first line has number `first`."""
+    rows = []
+    line, position = first, 0
+    for match in _TASK.finditer(body):
+        line += body.count("\n", position, match.start())
+        position = match.start()
+        content = match.group(2).rstrip("\r")
+        due = _DUE.search(content)
+        rows.append(
+            (
+                line,
+                match.group(1),
+                _ordinal(due.group(1), strict=False) if due else _UNDATED,
+                content,
+                tuple(
+                    name
+                    for tag in _TAG.finditer(content)
+                    if (name := _tag_name(tag.group(1)))
+                ),
+            )
+        )
+    return rows
+
+
+def _ordinal(value: datetime.date | str, *, strict: bool = True) -> int:
+    """Day number of a date, for the `due` column."""
+    try:
+        if isinstance(value, str):
+            value = datetime.date.fromisoformat(value)
+        return value.toordinal()
+    except (TypeError, ValueError, AttributeError):
+        if strict:
+            raise ValueError(f"Not a date: {value!r}") from None
+        return _UNDATED
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Any, ClassVar, Self
+
+
+@dataclass(frozen=True, slots=True)
+class NoteRecord:
+    """Compact metadata record for a single vault file.
+
+    Produced by `ObsidianCLI.snapshot()` from Obsidian's metadata cache.
+
+    Attributes:
+        path: Path to the file relative to the vault root.
+        ctime: Creation time as a Unix timestamp in milliseconds.
+        mtime: Last modification time as a Unix timestamp in milliseconds.
+        size: File size in bytes.
+        frontmatter: Parsed YAML frontmatter, or `None` if the file has
+            none.
+        tags: Tags found in the file (inline and frontmatter), without
+            the `#` prefix.
+        links: Link targets of the file. Resolved links are vault paths;
+            unresolved links are kept as written.
+    """
+
+    path: str
+    ctime: int
+    mtime: int
+    size: int
+    frontmatter: dict[str, Any] | None
+    tags: tuple[str, ...]
+    links: tuple[str, ...]
+
+    @classmethod
+    def from_row(cls, row: list[Any]) -> NoteRecord:
+        """Build a record from the positional row emitted by the snapshot script."""
+        path, ctime, mtime, size, frontmatter, tags, links = row
+        return cls(
+            path, ctime, mtime, size, frontmatter or None, tuple(tags), tuple(links)
+        )
+
+
+class _DictRecord:
+    """Conversion between CLI JSON objects and slotted record classes.
+
+    Keys that match a declared field are stored in a slot; any other
+    keys are kept untouched in `extra`, so rarely used data costs
+    nothing until it is read and nothing is lost. Declared fields that
+    were `null` in the source are remembered, so `to_dict()` gives back
+    the decoded object.
+    """
+
+    __slots__ = ()
+
+    _INTERNED: ClassVar[frozenset[str]] = frozenset()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Build a record from a decoded CLI JSON object."""
+        names = _field_names(cls)
+        values: dict[str, Any] = {}
+        extra: dict[str, Any] | None = None
+        nulls: list[str] | None = None
+        for key, value in data.items():
+            if key not in names:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+            elif value is None:
+                if nulls is None:
+                    nulls = []
+                nulls.append(key)
+            elif key in cls._INTERNED and type(value) is str:
+                # Paths repeat across records (e.g. many tasks per file).
+                values[key] = sys.intern(value)
+            else:
+                values[key] = value
+        values["extra"] = extra
+        if nulls is not None:
+            values["_nulls"] = frozenset(nulls)
+        return cls(**values)
+
+    @classmethod
+    def from_list(cls, items: list[dict[str, Any]]) -> list[Self]:
+        """Build records from a decoded CLI JSON array."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the record as a plain dict, like `raw=True` output.
+
+        Fields that are `None` are omitted, unless they were `null` in
+        the dict passed to `from_dict()`, so `from_dict(data).to_dict()
+        == data`.
+        """
+        nulls: frozenset[str] = getattr(self, "_nulls")
+        data = {
+            name: value
+            for name in _field_names(type(self))
+            if (value := getattr(self, name)) is not None or name in nulls
+        }
+        extra: dict[str, Any] | None = getattr(self, "extra")
+        if extra:
+            data.update(extra)
+        return data
+
+
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _field_names(cls: type) -> tuple[str, ...]:
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = tuple(f.name for f in fields(cls) if f.name not in ("extra", "_nulls"))
+        _FIELD_NAMES[cls] = names
+    return names
+
+
+@dataclass(frozen=True, slots=True)
+class TaskRecord(_DictRecord):
+    """A task returned by `cli.tasks.list()`.
+
+    Attributes:
+        id: Task identifier.
+        content: Task text.
+        completed: Whether the task is checked off.
+        path: Path of the file containing the task.
+        line: Line number of the task in the file.
+        extra: Any other keys reported by the CLI.
+    """
+
+    id: str | None = None
+    content: str | None = None
+    completed: bool | None = None
+    path: str | None = None
+    line: int | None = None
+    extra: dict[str, Any] | None = field(default=None, repr=False)
+    _nulls: frozenset[str] = field(default=frozenset(), repr=False, compare=False)
+
+    _INTERNED: ClassVar[frozenset[str]] = frozenset({"path"})
+
+
+@dataclass(frozen=True, slots=True)
+class LinkRecord(_DictRecord):
+    """An outgoing link or backlink returned by `cli.links`.
+
+    Attributes:
+        path: Path of the linked (or linking) note.
+        display: Display text of the link.
+        extra: Any other keys reported by the CLI (e.g. counts).
+    """
+
+    path: str | None = None
+    display: str | None = None
+    extra: dict[str, Any] | None = field(default=None, repr=False)
+    _nulls: frozenset[str] = field(default=frozenset(), repr=False, compare=False)
+
+    _INTERNED: ClassVar[frozenset[str]] = frozenset({"path"})
+
+
+@dataclass(frozen=True, slots=True)
+class UnresolvedLinkRecord(_DictRecord):
+    """A link whose target does not exist, from `cli.links.unresolved()`.
+
+    Attributes:
+        source: Path of the note containing the link.
+        target: Link target as written.
+        extra: Any other keys reported by the CLI.
+    """
+
+    source: str | None = None
+    target: str | None = None
+    extra: dict[str, Any] | None = field(default=None, repr=False)
+    _nulls: frozenset[str] = field(default=frozenset(), repr=False, compare=False)
+
+    _INTERNED: ClassVar[frozenset[str]] = frozenset({"source"})
+
+
+@dataclass(frozen=True, slots=True)
+class FileRecord(_DictRecord):
+    """A note reference, from `cli.links.orphans()` or `cli.tags.get()`.
+
+    Attributes:
+        path: Path to the file relative to the vault root.
+        name: File name without extension.
+        extra: Any other keys reported by the CLI.
+    """
+
+    path: str | None = None
+    name: str | None = None
+    extra: dict[str, Any] | None = field(default=None, repr=False)
+    _nulls: frozenset[str] = field(default=frozenset(), repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class TagRecord(_DictRecord):
+    """A tag returned by `cli.tags.list()`.
+
+    Attributes:
+        name: Tag name.
+        count: Number of occurrences, when requested with `counts=True`.
+        extra: Any other keys reported by the CLI.
+    """
+
+    name: str | None = None
+    count: int | None = None
+    extra: dict[str, Any] | None = field(default=None, repr=False)
+    _nulls: frozenset[str] = field(default=frozenset(), repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHitRecord(_DictRecord):
+    """A search result returned by `cli.search.query()` or `context()`.
+
+    `matches` and `context` are kept exactly as decoded from the CLI.
+
+    Attributes:
+        file: Path of the matching file.
+        score: Relevance score.
+        line: Line number of the match (`context()` only).
+        matches: Match details, when requested with `matches=True`.
+        context: Lines surrounding the match (`context()` only).
+        extra: Any other keys reported by the CLI.
+    """
+
+    file: str | None = None
+    score: float | None = None
+    line: int | None = None
+    matches: list[Any] | None = None
+    context: list[str] | None = None
+    extra: dict[str, Any] | None = field(default=None, repr=False)
+    _nulls: frozenset[str] = field(default=frozenset(), repr=False, compare=False)
+
+    _INTERNED: ClassVar[frozenset[str]] = frozenset({"file"})
+
+
+@dataclass(frozen=True, slots=True)
+class BookmarkRecord(_DictRecord):
+    """A bookmark returned by `cli.bookmarks.list()`.
+
+    Attributes:
+        type: Bookmark type (e.g. `"file"`, `"folder"`, `"url"`).
+        path: Bookmarked file or folder path.
+        title: Display title.
+        url: Bookmarked URL.
+        extra: Any other keys reported by the CLI.
+    """
+
+    type: str | None = None
+    path: str | None = None
+    title: str | None = None
+    url: str | None = None
+    extra: dict[str, Any] | None = field(default=None, repr=False)
+    _nulls: frozenset[str] = field(default=frozenset(), repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class VersionRecord(_DictRecord):
+    """A local history version returned by `cli.history.versions()`.
+
+    Attributes:
+        version: Version identifier.
+        date: Timestamp of the version as reported by the CLI.
+        extra: Any other keys reported by the CLI.
+    """
+
+    version: str | None = None
+    date: str | None = None
+    extra: dict[str, Any] | None = field(default=None, repr=False)
+    _nulls: frozenset[str] = field(default=frozenset(), repr=False, compare=False)
@@ -58,9 +58,9 @@ class ContentResource(BaseResource):
             headers={"Accept": content_type.value},
         )
         if content_type == ContentType.NOTE_JSON:
-            return NoteJson.model_validate(response.json())
+            return NoteJson.model_validate(self._client._loads(response.content))
         if content_type == ContentType.DOCUMENT_MAP:
-            return DocumentMap.model_validate(response.json())
+            return DocumentMap.model_validate(self._client._loads(response.content))
         return response.text
 
     async def _append_content(self, url: str, content: str) -> None:
@@ -16,7 +16,7 @@ class CommandsResource(BaseResource):
             A list of `Command` objects with `id` and `name` fields.
         """
         response = await self._client.request("GET", f"{self._BASE_URL}/")
-        data = response.json()
+        data = self._client._loads(response.content)
         return [Command.model_validate(c) for c in data["commands"]]
 
     async def execute(self, command_id: str) -> None:
@@ -34,7 +34,10 @@ class SearchResource(BaseResource):
             f"{self._BASE_URL}/simple/",
             params={"query": query, "contextLength": context_length},
         )
-        return [SearchResult.model_validate(r) for r in response.json()]
+        return [
+            SearchResult.model_validate(r)
+            for r in self._client._loads(response.content)
+        ]
 
     async def dataview(self, dql: str) -> list[SearchResult]:
         """Search using a Dataview Query Language (DQL) expression.
@@ -53,7 +56,10 @@ class SearchResource(BaseResource):
             content=dql,
             headers={"Content-Type": ContentType.DATAVIEW_DQL},
         )
-        return [SearchResult.model_validate(r) for r in response.json()]
+        return [
+            SearchResult.model_validate(r)
+            for r in self._client._loads(response.content)
+        ]
 
     async def jsonlogic(self, query: dict[str, Any]) -> list[SearchResult]:
         """Search using a JsonLogic query object.
@@ -71,4 +77,7 @@ class SearchResource(BaseResource):
             json=query,
             headers={"Content-Type": ContentType.JSONLOGIC},
         )
-        return [SearchResult.model_validate(r) for r in response.json()]
+        return [
+            SearchResult.model_validate(r)
+            for r in self._client._loads(response.content)
+        ]
@@ -15,7 +15,7 @@ class SystemResource(BaseResource):
             version information.
         """
         response = await self._client.request("GET", "/")
-        return ServerStatus.model_validate(response.json())
+        return ServerStatus.model_validate(self._client._loads(response.content))
 
     async def openapi(self) -> str:
         """Get the OpenAPI specification of the REST API.
@@ -146,4 +146,4 @@ class VaultResource(ContentResource):
         path = path.strip("/")
         trailing = f"{path}/" if path else ""
         response = await self._client.request("GET", f"{self._BASE_URL}/{trailing}")
-        return VaultDirectory.model_validate(response.json())
+        return VaultDirectory.model_validate(self._client._loads(response.content))
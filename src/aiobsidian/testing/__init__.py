@@ -0,0 +1,76 @@
+"""Offline stand-ins for exercising aiobsidian without Obsidian.
+
+`generate_vault()` writes a synthetic vault of Markdown notes and
+`write_fake_binary()` installs an `obsidian` executable that serves it
+over the same argv protocol as the real CLI. `FakeRESTServer` serves a
+vault over the Local REST API routes for `ObsidianClient`:
+
+```python
+from aiobsidian import ObsidianCLI
+from aiobsidian.testing import generate_vault, write_fake_binary
+
+generate_vault(tmp / "vaults" / "Bench", notes=5000)
+binary = write_fake_binary(tmp / "bin", tmp / "vaults")
+cli = ObsidianCLI("Bench", binary=binary)
+```
+"""
+
+from __future__ import annotations
+
+import os
+import shlex
+import stat
+import sys
+from pathlib import Path
+
+from ._rest import FakeRESTServer, ServerStats
+from ._vault import generate_vault
+
+FAKE_OBSIDIAN = Path(__file__).with_name("fake_obsidian.py")
+"""Path of the stand-in CLI script."""
+
+
+def write_fake_binary(
+    directory: str | os.PathLike[str],
+    vaults: str | os.PathLike[str],
+    *,
+    latency: float = 0.0,
+    python: str = sys.executable,
+) -> str:
+    """Install an executable `obsidian` stand-in.
+
+    The executable is a shell wrapper that runs `fake_obsidian.py`
+    with `python -S`, serving every vault directory under `vaults`
+    (`vault=Name` selects `vaults/Name`). Requires a POSIX shell.
+
+    Args:
+        directory: Directory to create the `obsidian` executable in.
+        vaults: Directory containing one subdirectory per vault.
+        latency: Extra delay in seconds added to every command, to
+            model a slower host.
+        python: Interpreter that runs the script.
+
+    Returns:
+        Path of the executable, for `ObsidianCLI(binary=...)`.
+    """
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    binary = target / "obsidian"
+    binary.write_text(
+        "#!/bin/sh\n"
+        f"AIOBSIDIAN_FAKE_VAULTS={shlex.quote(str(Path(vaults).resolve()))} "
+        f"AIOBSIDIAN_FAKE_LATENCY={latency!r} "
+        f"exec {shlex.quote(python)} -S {shlex.quote(str(FAKE_OBSIDIAN))} "
+        '"$@"\n'
+    )
+    binary.chmod(binary.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return str(binary)
+
+
+__all__ = [
+    "FAKE_OBSIDIAN",
+    "FakeRESTServer",
+    "ServerStats",
+    "generate_vault",
+    "write_fake_binary",
+]
@@ -0,0 +1,821 @@
+"""Stand-in for the Obsidian Local REST API plugin, backed by a directory.
+
+Serves the routes used by `aiobsidian.rest` over real sockets, so
+`ObsidianClient` can be exercised with connection pooling, TLS and
+serialization in the loop:
+
+```python
+from aiobsidian.testing import FakeRESTServer
+
+with FakeRESTServer("path/to/vault", latency=0.002) as server:
+    async with server.client() as client:
+        await client.vault.update("note.md", "# Hello")
+    print(server.stats())
+```
+
+Run `python -m aiobsidian.testing.fake_rest` to serve a vault from a
+shell.
+
+`/vault/`, `/active/` and `/periodic/` read and write the files on disk
+(including heading, block and frontmatter patches), `/search/simple/`
+scans note contents and `/search/` evaluates JsonLogic queries.
+Dataview queries, commands and `/open/` only keep the state that the
+REST API reports back.
+"""
+
+from __future__ import annotations
+
+import datetime
+import fnmatch
+import ipaddress
+import json
+import os
+import re
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .._constants import DEFAULT_HOST
+from .._hooks import route_template
+from .fake_obsidian import VERSION, Note, join_frontmatter, split_frontmatter
+
+if TYPE_CHECKING:
+    from email.message import Message
+
+    from .._client import ObsidianClient
+
+_JSON = "application/json"
+_MARKDOWN = "text/markdown; charset=utf-8"
+_NOTE_JSON = "application/vnd.olrapi.note+json"
+_DOCUMENT_MAP = "application/vnd.olrapi.document-map+json"
+_DQL = "application/vnd.olrapi.dataview.dql+txt"
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_BLOCK = re.compile(r"\s\^([\w-]+)\s*$")
+
+_COMMANDS = [
+    {"id": "editor:save-file", "name": "Save current file"},
+    {"id": "editor:toggle-bold", "name": "Toggle bold"},
+    {"id": "app:reload", "name": "Reload app without saving"},
+]
+
+_OPENAPI = """\
+openapi: 3.0.2
+info:
+  title: Local REST API for Obsidian (stand-in)
+  version: 3.0.0
+paths: {}
+"""
+
+_Response = tuple[int, str, bytes]
+
+
+@dataclass(frozen=True, slots=True)
+class ServerStats:
+    """Traffic counters of a `FakeRESTServer`.
+
+    Attributes:
+        connections: TCP connections accepted.
+        requests: HTTP requests handled.
+        routes: Requests per `"METHOD route"` series, with routes as
+            templates (e.g. `"GET /vault/{path}"`).
+    """
+
+    connections: int
+    requests: int
+    routes: dict[str, int]
+
+    @property
+    def requests_per_connection(self) -> float:
+        """Average number of requests served per connection."""
+        return self.requests / self.connections if self.connections else 0.0
+
+
+class _Error(Exception):
+    def __init__(self, status: int, message: str, error_code: int | None = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.error_code = error_code or status * 100
+
+
+class FakeRESTServer:
+    """Local REST API stand-in serving a vault directory.
+
+    The server runs in a background thread (one handler thread per
+    connection, HTTP/1.1 keep-alive) between `start()` and `stop()`,
+    or for the duration of a `with` block.
+
+    Args:
+        vault: Vault directory to serve.
+        api_key: Bearer token every route except `/` requires.
+        host: Interface to listen on.
+        port: Port to listen on; `0` picks a free one.
+        tls: Serve HTTPS. Without `certfile`, a throwaway self-signed
+            certificate is generated with the `openssl` command.
+        certfile: PEM certificate chain for TLS.
+        keyfile: PEM private key for `certfile`.
+        latency: Delay in seconds added to every request.
+        route_latency: Per-route delays overriding `latency`, keyed by
+            route template (`"/vault/{path}"`) or by method and route
+            (`"PUT /vault/{path}"`).
+    """
+
+    def __init__(
+        self,
+        vault: str | os.PathLike[str],
+        *,
+        api_key: str = "test-key",
+        host: str = DEFAULT_HOST,
+        port: int = 0,
+        tls: bool = False,
+        certfile: str | os.PathLike[str] | None = None,
+        keyfile: str | os.PathLike[str] | None = None,
+        latency: float = 0.0,
+        route_latency: Mapping[str, float] | None = None,
+    ) -> None:
+        self._root = os.path.abspath(vault)
+        self._api_key = api_key
+        self._host = host
+        self._port = port
+        self._tls = tls
+        self._certfile = certfile
+        self._keyfile = keyfile
+        self._latency = latency
+        self._route_latency = dict(route_latency or {})
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._active: str | None = None
+        self._connections = 0
+        self._requests = 0
+        self._routes: dict[str, int] = {}
+        self._server: _Server | None = None
+        self._thread: threading.Thread | None = None
+        self._tempdir: tempfile.TemporaryDirectory[str] | None = None
+
+    def __repr__(self) -> str:
+        return f"FakeRESTServer(vault={self._root!r}, url={self.base_url!r})"
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> None:
+        """Bind the socket and start serving in a background thread.
+
+        Raises:
+            RuntimeError: If the server is already running, or a
+                certificate must be generated and `openssl` is missing.
+        """
+        if self._server is not None:
+            raise RuntimeError("Server is already running")
+        server = _Server((self._host, self._port), _Handler)
+        server.app = self
+        if self._tls:
+            server.socket = self._ssl_context().wrap_socket(
+                server.socket, server_side=True, do_handshake_on_connect=False
+            )
+        self._server = server
+        self._thread = threading.Thread(
+            target=server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="fake-rest-server",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = self._thread = None
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
+
+    def __enter__(self) -> FakeRESTServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        certfile, keyfile = self._certfile, self._keyfile
+        if certfile is None:
+            self._tempdir = tempfile.TemporaryDirectory(prefix="aiobsidian-tls-")
+            certfile, keyfile = _self_signed(self._tempdir.name, self._host)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile, keyfile)
+        return context
+
+    # -- connection details ------------------------------------------------
+
+    @property
+    def scheme(self) -> str:
+        """`"https"` when serving TLS, `"http"` otherwise."""
+        return "https" if self._tls else "http"
+
+    @property
+    def host(self) -> str:
+        """Host the server listens on."""
+        return self._host
+
+    @property
+    def port(self) -> int:
+        """Bound port (the requested one until the server is started)."""
+        if self._server is None:
+            return self._port
+        return int(self._server.server_address[1])
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the server."""
+        return f"{self.scheme}://{self._host}:{self.port}"
+
+    @property
+    def api_key(self) -> str:
+        """API key the server accepts."""
+        return self._api_key
+
+    def client(self, **kwargs: Any) -> ObsidianClient:
+        """Create an `ObsidianClient` connected to this server.
+
+        Args:
+            **kwargs: Extra `ObsidianClient` arguments.
+        """
+        from .._client import ObsidianClient
+
+        return ObsidianClient(
+            self._api_key,
+            host=self._host,
+            port=self.port,
+            scheme=self.scheme,
+            **kwargs,
+        )
+
+    # -- statistics --------------------------------------------------------
+
+    def stats(self) -> ServerStats:
+        """Return the connection and request counters."""
+        with self._stats_lock:
+            return ServerStats(self._connections, self._requests, dict(self._routes))
+
+    def reset_stats(self) -> None:
+        """Zero the connection and request counters."""
+        with self._stats_lock:
+            self._connections = self._requests = 0
+            self._routes.clear()
+
+    def _count_connection(self) -> None:
+        with self._stats_lock:
+            self._connections += 1
+
+    # -- request handling --------------------------------------------------
+
+    def handle(
+        self, method: str, target: str, headers: Mapping[str, str], body: bytes
+    ) -> _Response:
+        """Answer one request.
+
+        Returns:
+            `(status, content_type, body)`.
+        """
+        url = urlsplit(target)
+        path = unquote(url.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        series = f"{method} {route_template(path)}"
+        with self._stats_lock:
+            self._requests += 1
+            self._routes[series] = self._routes.get(series, 0) + 1
+        delay = self._route_latency.get(
+            series, self._route_latency.get(route_template(path), self._latency)
+        )
+        if delay:
+            time.sleep(delay)
+
+        authenticated = headers.get("Authorization") == f"Bearer {self._api_key}"
+        try:
+            if path == "/":
+                return _json(200, self._status(authenticated))
+            if not authenticated:
+                raise _Error(401, "Authorization required.", 40101)
+            with self._lock:
+                return self._route(method, path, query, headers, body)
+        except _Error as exc:
+            return _json(
+                exc.status, {"message": exc.message, "errorCode": exc.error_code}
+            )
+        except Exception as exc:
+            return _json(500, {"message": repr(exc), "errorCode": 50000})
+
+    def _route(
+        self,
+        method: str,
+        path: str,
+        query: dict[str, str],
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> _Response:
+        if path == "/openapi.yaml":
+            return 200, "text/yaml; charset=utf-8", _OPENAPI.encode()
+        head, _, rest = path.lstrip("/").partition("/")
+        if head == "vault" and path.startswith("/vault/"):
+            if not rest or rest.endswith("/"):
+                _allow(method, "GET")
+                return _json(200, {"files": self._listdir(rest)})
+            return self._file(method, rest, headers, body)
+        if path == "/active/":
+            if self._active is None:
+                raise _Error(404, "No file is currently active.")
+            response = self._file(method, self._active, headers, body)
+            if method == "DELETE":
+                self._active = None
+            return response
+        if head == "periodic":
+            note = _periodic_path(rest)
+            return self._file(method, note, headers, body, create=True)
+        if path == "/search/simple/":
+            _allow(method, "POST")
+            return _json(
+                200,
+                self._simple_search(
+                    query.get("query", ""), int(query.get("contextLength", 100))
+                ),
+            )
+        if path == "/search/":
+            _allow(method, "POST")
+            if headers.get("Content-Type", "").startswith(_DQL):
+                raise _Error(400, "Dataview is not available.", 40070)
+            return _json(200, self._jsonlogic_search(json.loads(body or b"null")))
+        if path == "/commands/":
+            _allow(method, "GET")
+            return _json(200, {"commands": _COMMANDS})
+        if head == "commands" and rest.endswith("/"):
+            _allow(method, "POST")
+            if not any(command["id"] == rest[:-1] for command in _COMMANDS):
+                raise _Error(404, f"Command {rest[:-1]} not found.")
+            return 204, "", b""
+        if head == "open" and rest:
+            _allow(method, "POST")
+            self._active = rest.strip("/")
+            return 200, "", b""
+        raise _Error(404, "Not Found")
+
+    def _status(self, authenticated: bool) -> dict[str, Any]:
+        return {
+            "status": "OK",
+            "service": "Obsidian Local REST API",
+            "authenticated": authenticated,
+            "versions": {"obsidian": VERSION.split()[0], "self": "3.0.0"},
+        }
+
+    # -- files -------------------------------------------------------------
+
+    def _abspath(self, path: str) -> str:
+        full = os.path.normpath(os.path.join(self._root, path.strip("/")))
+        if not (full + os.sep).startswith(self._root.rstrip(os.sep) + os.sep):
+            raise _Error(400, f"Path {path} is outside the vault.")
+        return full
+
+    def _read(self, path: str) -> str:
+        try:
+            with open(self._abspath(path), encoding="utf-8") as fh:
+                return fh.read()
+        except (FileNotFoundError, IsADirectoryError):
+            raise _Error(404, f"File {path} not found.") from None
+
+    def _write(self, path: str, text: str) -> None:
+        full = self._abspath(path)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, "w", encoding="utf-8") as fh:
+            fh.write(text)
+
+    def _listdir(self, folder: str) -> list[str]:
+        try:
+            entries = list(os.scandir(self._abspath(folder)))
+        except (FileNotFoundError, NotADirectoryError):
+            raise _Error(404, f"Folder {folder} not found.") from None
+        return sorted(
+            entry.name + ("/" if entry.is_dir() else "")
+            for entry in entries
+            if not entry.name.startswith(".")
+        )
+
+    def _file(
+        self,
+        method: str,
+        path: str,
+        headers: Mapping[str, str],
+        body: bytes,
+        *,
+        create: bool = False,
+    ) -> _Response:
+        if method == "GET":
+            text = self._read(path)
+            accept = headers.get("Accept", "")
+            if accept.startswith(_NOTE_JSON):
+                return _json(200, self._note_json(path, text), _NOTE_JSON)
+            if accept.startswith(_DOCUMENT_MAP):
+                return _json(200, _document_map(text), _DOCUMENT_MAP)
+            return 200, _MARKDOWN, text.encode()
+        if method == "PUT":
+            self._write(path, body.decode())
+            return 204, "", b""
+        if method == "POST":
+            try:
+                text = self._read(path)
+            except _Error:
+                if not create:
+                    raise
+                text = ""
+            self._write(path, text + body.decode())
+            return 204, "", b""
+        if method == "PATCH":
+            text = _patch(self._read(path), headers, body.decode())
+            self._write(path, text)
+            return 200, "", b""
+        if method == "DELETE":
+            try:
+                os.remove(self._abspath(path))
+            except (FileNotFoundError, IsADirectoryError):
+                raise _Error(404, f"File {path} not found.") from None
+            return 204, "", b""
+        raise _Error(405, f"Method {method} not allowed.")
+
+    def _note_json(self, path: str, text: str) -> dict[str, Any]:
+        note = Note(path, text)
+        stat = os.stat(self._abspath(path))
+        return {
+            "content": text,
+            "frontmatter": note.frontmatter,
+            "tags": list(dict.fromkeys(note.tags())),
+            "path": path,
+            "stat": {
+                "ctime": int(stat.st_ctime * 1000),
+                "mtime": int(stat.st_mtime * 1000),
+                "size": stat.st_size,
+            },
+        }
+
+    def _notes(self) -> list[str]:
+        found: list[str] = []
+        for directory, dirs, names in os.walk(self._root):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            rel = os.path.relpath(directory, self._root)
+            prefix = "" if rel == "." else rel.replace(os.sep, "/") + "/"
+            found.extend(
+                prefix + name for name in sorted(names) if name.endswith(".md")
+            )
+        return found
+
+    # -- search ------------------------------------------------------------
+
+    def _simple_search(self, query: str, context: int) -> list[dict[str, Any]]:
+        terms = query.lower().split()
+        if not terms:
+            return []
+        results: list[dict[str, Any]] = []
+        for path in self._notes():
+            text = self._read(path)
+            lower = text.lower()
+            if not all(term in lower for term in terms):
+                continue
+            matches = []
+            for term in terms:
+                start = lower.find(term)
+                while start >= 0:
+                    end = start + len(term)
+                    matches.append(
+                        {
+                            "match": {"start": start, "end": end},
+                            "context": text[max(0, start - context) : end + context],
+                        }
+                    )
+                    start = lower.find(term, end)
+            results.append(
+                {"filename": path, "score": float(len(matches)), "matches": matches}
+            )
+        results.sort(key=lambda result: -result["score"])
+        return results
+
+    def _jsonlogic_search(self, rule: Any) -> list[dict[str, Any]]:
+        results = []
+        for path in self._notes():
+            value = _logic(rule, self._note_json(path, self._read(path)))
+            if value:
+                # `SearchResult.result` holds objects and arrays only.
+                result: dict[str, Any] = {"filename": path}
+                if isinstance(value, dict | list):
+                    result["result"] = value
+                results.append(result)
+        return results
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    block_on_close = False
+    # The default backlog of 5 drops SYNs when many pooled connections
+    # open at once, adding a one-second retransmit to their first request.
+    request_queue_size = 128
+    app: FakeRESTServer
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self.app._count_connection()
+        super().process_request(request, client_address)
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients dropping pooled connections or failing TLS handshakes.
+        pass
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: _Server
+
+    def setup(self) -> None:
+        if isinstance(self.request, ssl.SSLSocket):
+            self.request.do_handshake()
+        super().setup()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, content_type, payload = self.server.app.handle(
+            self.command, self.path, _Headers(self.headers), body
+        )
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if payload:
+            self.wfile.write(payload)
+
+    do_GET = do_PUT = do_POST = do_PATCH = do_DELETE = _dispatch
+
+
+class _Headers(Mapping[str, str]):
+    """Case-insensitive read-only view of the request headers."""
+
+    def __init__(self, message: Message) -> None:
+        self._message = message
+
+    def __getitem__(self, key: str) -> str:
+        value = self._message.get(key)
+        if value is None:
+            raise KeyError(key)
+        return str(value)
+
+    def __iter__(self) -> Any:
+        return iter(self._message.keys())
+
+    def __len__(self) -> int:
+        return len(self._message)
+
+
+# -- helpers -----------------------------------------------------------------
+
+
+def _json(status: int, data: Any, content_type: str = _JSON) -> _Response:
+    return status, content_type, json.dumps(data, ensure_ascii=False).encode()
+
+
+def _allow(method: str, *allowed: str) -> None:
+    if method not in allowed:
+        raise _Error(405, f"Method {method} not allowed.")
+
+
+def _periodic_path(rest: str) -> str:
+    period, *parts = rest.strip("/").split("/")
+    try:
+        if not parts:
+            date = datetime.date.today()
+        elif len(parts) == 3:
+            date = datetime.date(*(int(part) for part in parts))
+        else:
+            raise ValueError(rest)
+    except ValueError:
+        raise _Error(400, f"Invalid date: {rest}") from None
+    if period == "daily":
+        name = date.isoformat()
+    elif period == "weekly":
+        year, week, _ = date.isocalendar()
+        name = f"{year}-W{week:02d}"
+    elif period == "monthly":
+        name = f"{date:%Y-%m}"
+    elif period == "quarterly":
+        name = f"{date.year}-Q{(date.month - 1) // 3 + 1}"
+    elif period == "yearly":
+        name = str(date.year)
+    else:
+        raise _Error(400, f"Unknown period: {period}")
+    return f"{period.capitalize()}/{name}.md"
+
+
+def _headings(lines: list[str], delimiter: str) -> list[tuple[int, int, str]]:
+    """`(line index, level, "Parent::Child" path)` of every heading."""
+    found = []
+    stack: list[tuple[int, str]] = []
+    fenced = False
+    for index, line in enumerate(lines):
+        if line.startswith("```"):
+            fenced = not fenced
+        elif not fenced and (match := _HEADING.match(line)):
+            level = len(match.group(1))
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, match.group(2)))
+            found.append((index, level, delimiter.join(text for _, text in stack)))
+    return found
+
+
+def _document_map(text: str) -> dict[str, Any]:
+    frontmatter, body, _ = split_frontmatter(text)
+    lines = body.splitlines()
+    return {
+        "headings": [path for _, _, path in _headings(lines, "::")],
+        "blocks": [m.group(1) for line in lines if (m := _BLOCK.search(line))],
+        "frontmatterFields": list(frontmatter),
+    }
+
+
+def _patch(text: str, headers: Mapping[str, str], content: str) -> str:
+    operation = headers.get("Operation", "")
+    target_type = headers.get("Target-Type", "")
+    target = unquote(headers.get("Target", ""))
+    if operation not in ("append", "prepend", "replace"):
+        raise _Error(400, f"Invalid operation: {operation}", 40050)
+
+    if target_type == "frontmatter":
+        data, body, _ = split_frontmatter(text)
+        value = json.loads(content)
+        current = data.get(target)
+        if operation == "replace" or current is None:
+            data[target] = value
+        elif isinstance(current, list):
+            extra = value if isinstance(value, list) else [value]
+            data[target] = current + extra if operation == "append" else extra + current
+        elif isinstance(current, str) and isinstance(value, str):
+            data[target] = current + value if operation == "append" else value + current
+        else:
+            raise _Error(400, f"Cannot {operation} to frontmatter field {target}.")
+        return join_frontmatter(data, body)
+
+    lines = text.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    block = content if content.endswith("\n") else content + "\n"
+    if target_type == "heading":
+        delimiter = headers.get("Target-Delimiter", "::")
+        for index, level, path in _headings(lines, delimiter):
+            if path == target:
+                break
+        else:
+            raise _Error(400, f"Heading {target} not found.", 40080)
+        end = next(
+            (
+                i
+                for i, lvl, _ in _headings(lines, delimiter)
+                if i > index and lvl <= level
+            ),
+            len(lines),
+        )
+        if operation == "prepend":
+            lines[index + 1 : index + 1] = [block]
+        elif operation == "append":
+            while end > index + 1 and not lines[end - 1].strip():
+                end -= 1
+            lines[end:end] = [block]
+        else:
+            lines[index + 1 : end] = [block]
+        return "".join(lines)
+    if target_type == "block":
+        for index, line in enumerate(lines):
+            match = _BLOCK.search(line)
+            if match and match.group(1) == target:
+                break
+        else:
+            raise _Error(400, f"Block {target} not found.", 40080)
+        if operation == "prepend":
+            lines[index:index] = [block]
+        elif operation == "append":
+            lines[index + 1 : index + 1] = [block]
+        else:
+            lines[index] = f"{content.rstrip()} ^{target}\n"
+        return "".join(lines)
+    raise _Error(400, f"Invalid target type: {target_type}", 40050)
+
+
+def _logic(rule: Any, data: Any) -> Any:
+    """Evaluate the JsonLogic subset the Local REST API commonly receives."""
+    if isinstance(rule, list):
+        return [_logic(item, data) for item in rule]
+    if not isinstance(rule, dict) or len(rule) != 1:
+        return rule
+    ((op, args),) = rule.items()
+    if not isinstance(args, list):
+        args = [args]
+    if op == "var":
+        key = _logic(args[0], data) if args else ""
+        default = args[1] if len(args) > 1 else None
+        value = data
+        for part in str(key).split(".") if key not in ("", None) else ():
+            if isinstance(value, dict) and part in value:
+                value = value[part]
+            elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+                value = value[int(part)]
+            else:
+                return default
+        return value
+    if op in ("and", "or"):
+        value = op == "and"
+        for arg in args:
+            value = _logic(arg, data)
+            if bool(value) != (op == "and"):
+                return value
+        return value
+    if op == "if":
+        for condition, then in zip(args[::2], args[1::2], strict=False):
+            if _logic(condition, data):
+                return _logic(then, data)
+        return _logic(args[-1], data) if len(args) % 2 else None
+    values = [_logic(arg, data) for arg in args]
+    try:
+        return _OPERATORS[op](*values)
+    except KeyError:
+        raise _Error(400, f"Unsupported JsonLogic operator: {op}", 40050) from None
+    except TypeError:
+        return False
+
+
+_OPERATORS: dict[str, Any] = {
+    "==": lambda a, b: a == b,
+    "===": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "!==": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "!": lambda a: not a,
+    "!!": lambda a: bool(a),
+    "in": lambda a, b: b is not None and a in b,
+    "glob": lambda pattern, value: fnmatch.fnmatchcase(str(value), pattern),
+    "regexp": lambda pattern, value: re.search(pattern, str(value)) is not None,
+}
+
+
+def _self_signed(directory: str, host: str) -> tuple[str, str]:
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        raise RuntimeError(
+            "Generating a TLS certificate requires the openssl command. "
+            "Pass certfile= and keyfile= instead."
+        )
+    try:
+        ipaddress.ip_address(host)
+        san = f"IP:{host}"
+    except ValueError:
+        san = f"DNS:{host}"
+    certfile = os.path.join(directory, "cert.pem")
+    keyfile = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            openssl,
+            "req",
+            "-x509",
+            "-newkey",
+            "ec",
+            "-pkeyopt",
+            "ec_paramgen_curve:prime256v1",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            f"/CN={host}",
+            "-addext",
+            f"subjectAltName={san}",
+            "-keyout",
+            keyfile,
+            "-out",
+            certfile,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return certfile, keyfile
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import datetime
+import os
+import random
+from pathlib import Path
+
+_WORDS = (
+    "alpha beta gamma delta vector cache index query graph node edge latency "
+    "throughput buffer stream parser token schema module client server vault "
+    "note link tag task daily weekly review project area resource archive idea "
+    "draft summary meeting plan goal habit reading book article paper source "
+    "python async process thread socket request response header payload batch "
+    "metric trace span sample bucket window shard replica leader follower log "
+    "commit branch merge rebase release version feature bug fix test bench "
+    "profile memory disk network kernel syscall file folder path name title"
+).split()
+
+_STATUSES = ("todo", "active", "waiting", "done", "archived")
+
+
+def generate_vault(
+    root: str | os.PathLike[str],
+    *,
+    notes: int = 1000,
+    folders: int = 20,
+    words: int = 150,
+    links: int = 5,
+    tasks: int = 3,
+    seed: int = 0,
+) -> Path:
+    """Write a synthetic vault of Markdown notes to disk.
+
+    Notes are spread over `folders` folders and carry frontmatter
+    (title, tags, aliases, status, priority, created date), headings,
+    inline tags, wikilinks to other notes (about one in ten unresolved)
+    and checkbox tasks (some tagged or with a due date), so every CLI
+    command has something to report.
+    The same arguments always produce the same vault.
+
+    Args:
+        root: Directory of the vault. Created if missing.
+        notes: Number of notes.
+        folders: Number of top-level folders.
+        words: Approximate number of body words per note.
+        links: Wikilinks per note.
+        tasks: Tasks per note.
+        seed: Seed for the random generator.
+
+    Returns:
+        Path of the vault directory.
+    """
+    rng = random.Random(seed)
+    vault = Path(root)
+    (vault / ".obsidian").mkdir(parents=True, exist_ok=True)
+    names = [f"note-{i:05d}" for i in range(notes)]
+    start = datetime.date(2024, 1, 1)
+
+    for i, name in enumerate(names):
+        folder = vault / f"folder-{i % max(folders, 1):02d}"
+        folder.mkdir(exist_ok=True)
+        topic = rng.choice(_WORDS)
+        tags = sorted({f"topic/{topic}", f"status/{rng.choice(_STATUSES)}"})
+        frontmatter = [
+            "---",
+            f"title: Note {i}",
+            f"tags: [{', '.join(tags)}]",
+            f"aliases: [N{i}]",
+            f"status: {rng.choice(_STATUSES)}",
+            f"priority: {rng.randint(1, 5)}",
+            f"created: {start + datetime.timedelta(days=i % 1000)}",
+            f"done: {'true' if rng.random() < 0.3 else 'false'}",
+            "---",
+        ]
+        body = [f"# Note {i}", ""]
+        sections = max(1, words // 50)
+        for section in range(sections):
+            body.append(f"## Section {section + 1}")
+            body.append("")
+            text = [rng.choice(_WORDS) for _ in range(words // sections)]
+            for _ in range(links // sections + (section < links % sections)):
+                if rng.random() < 0.1:
+                    target = f"missing-{rng.randrange(notes * 10):05d}"
+                else:
+                    target = rng.choice(names)
+                text.insert(rng.randrange(len(text) + 1), f"[[{target}]]")
+            text.insert(rng.randrange(len(text) + 1), f"#{rng.choice(_WORDS)}")
+            body.append(" ".join(text))
+            body.append("")
+        for t in range(tasks):
+            box = "x" if rng.random() < 0.4 else " "
+            task = f"- [{box}] {rng.choice(_WORDS)} {rng.choice(_WORDS)} {t}"
+            if t == 0:
+                task += f" #topic/{topic}"
+            elif t == 1:
+                task += f" \U0001f4c5 {start + datetime.timedelta(days=i % 365)}"
+            body.append(task)
+        (folder / f"{name}.md").write_text(
+            "\n".join(frontmatter + body) + "\n", encoding="utf-8"
+        )
+
+    templates = vault / "Templates"
+    templates.mkdir(exist_ok=True)
+    (templates / "Meeting.md").write_text(
+        "# {{title}}\n\nDate: {{date}}\n\n## Notes\n\n## Actions\n- [ ] \n",
+        encoding="utf-8",
+    )
+    return vault
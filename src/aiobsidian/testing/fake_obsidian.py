@@ -0,0 +1,1012 @@
+"""Stand-in for the `obsidian` CLI binary, backed by plain Markdown files.
+
+Speaks the same argv protocol as the real binary::
+
+    fake_obsidian.py <command> vault=<name> format=json [key=value ...] [--flag ...]
+
+Vaults are directories under `$AIOBSIDIAN_FAKE_VAULTS`; `vault=Name`
+selects `$AIOBSIDIAN_FAKE_VAULTS/Name`. File, search, property, tag,
+link, task, outline, daily note and template commands operate on the
+files on disk. Commands that only make sense inside the Obsidian app
+(plugins, themes, sync, publish, workspaces, ...) answer with fixed
+data so every `aiobsidian.cli` resource can be exercised.
+`$AIOBSIDIAN_FAKE_LATENCY` adds a fixed delay in seconds to each call.
+
+The script only uses the standard library and does not import
+`aiobsidian`, so its startup cost stays close to that of a bare
+interpreter.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import posixpath
+import random
+import re
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+_LINK = re.compile(r"\[\[([^\[\]|#]*)(?:#[^\[\]|]*)?(?:\|([^\[\]]*))?\]\]")
+_TAG = re.compile(r"(?<![\w&/#])#([A-Za-z_][\w/-]*)")
+_TASK = re.compile(r"^(\s*[-*+] \[)([^\]])(\] )(.*)$")
+_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_BARE = re.compile(r"[\w./@ -]*")
+
+VERSION = "1.12.0 (fake)"
+
+
+class Failure(Exception):
+    """Error reported on stderr with a non-zero exit code."""
+
+    def __init__(self, message: str, code: int = 1) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+# -- frontmatter -------------------------------------------------------------
+
+
+def _scalar(text: str) -> Any:
+    text = text.strip()
+    if not text or text in ("null", "~"):
+        return None
+    if text[0] in "\"'" and text[-1] == text[0] and len(text) > 1:
+        return json.loads(text) if text[0] == '"' else text[1:-1]
+    if text == "true":
+        return True
+    if text == "false":
+        return False
+    if text.startswith("[") and text.endswith("]"):
+        inner = text[1:-1].strip()
+        return [_scalar(part) for part in inner.split(",")] if inner else []
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def _dump_scalar(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int | float):
+        return repr(value)
+    if isinstance(value, list):
+        return "[" + ", ".join(_dump_scalar(item) for item in value) + "]"
+    text = str(value)
+    if (
+        text
+        and _BARE.fullmatch(text)
+        and _scalar(text) == text
+        and text == text.strip()
+    ):
+        return text
+    return json.dumps(text)
+
+
+def split_frontmatter(text: str) -> tuple[dict[str, Any], str, int]:
+    """Return the frontmatter, the body, and the number of lines before it."""
+    if not text.startswith(("---\n", "---\r\n")):
+        return {}, text, 0
+    end = text.find("\n---", 3)
+    if end < 0:
+        return {}, text, 0
+    block = text[text.index("\n") + 1 : end]
+    rest = text[end + 4 :]
+    rest = rest[2:] if rest.startswith("\r\n") else rest.removeprefix("\n")
+    data: dict[str, Any] = {}
+    key = None
+    for line in block.splitlines():
+        stripped = line.strip()
+        if key is not None and stripped.startswith("- "):
+            data[key].append(_scalar(stripped[2:]))
+            continue
+        name, sep, value = line.partition(":")
+        if not sep or line.startswith((" ", "\t")):
+            continue
+        key = name.strip()
+        if value.strip():
+            data[key] = _scalar(value)
+            key = None
+        else:
+            data[key] = []
+    return data, rest, block.count("\n") + 3
+
+
+def join_frontmatter(data: dict[str, Any], body: str) -> str:
+    if not data:
+        return body
+    lines = [f"{key}: {_dump_scalar(value)}" for key, value in data.items()]
+    return "---\n" + "\n".join(lines) + "\n---\n" + body
+
+
+def _as_list(value: Any) -> list[Any]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+# -- notes -------------------------------------------------------------------
+
+
+class Note:
+    __slots__ = ("path", "text", "frontmatter", "body", "offset")
+
+    def __init__(self, path: str, text: str) -> None:
+        self.path = path
+        self.text = text
+        self.frontmatter, self.body, self.offset = split_frontmatter(text)
+
+    @property
+    def name(self) -> str:
+        return posixpath.splitext(posixpath.basename(self.path))[0]
+
+    def tags(self) -> list[str]:
+        found: list[str] = []
+        for value in _as_list(self.frontmatter.get("tags")):
+            if isinstance(value, str):
+                found.extend(t.lstrip("#") for t in value.replace(",", " ").split())
+        found.extend(match.group(1) for match in _TAG.finditer(self.body))
+        return found
+
+    def links(self) -> list[tuple[str, str]]:
+        return [
+            (match.group(1).strip(), (match.group(2) or match.group(1)).strip())
+            for match in _LINK.finditer(self.body)
+            if match.group(1).strip()
+        ]
+
+    def headings(self) -> list[dict[str, Any]]:
+        headings = []
+        position = len(self.text) - len(self.body)
+        fenced = False
+        for line in self.body.splitlines(keepends=True):
+            if line.startswith("```"):
+                fenced = not fenced
+            elif not fenced and (match := _HEADING.match(line)):
+                headings.append(
+                    {
+                        "level": len(match.group(1)),
+                        "text": match.group(2),
+                        "position": position,
+                    }
+                )
+            position += len(line)
+        return headings
+
+    def tasks(self) -> list[dict[str, Any]]:
+        tasks = []
+        for number, line in enumerate(self.body.splitlines(), self.offset + 1):
+            if match := _TASK.match(line):
+                tasks.append(
+                    {
+                        "id": f"{self.path}:{number}",
+                        "content": match.group(4),
+                        "completed": match.group(2) != " ",
+                        "path": self.path,
+                        "line": number,
+                    }
+                )
+        return tasks
+
+
+class Vault:
+    def __init__(self, name: str, root: str) -> None:
+        self.name = name
+        self.root = root
+        self._notes: dict[str, Note] = {}
+        self._files: list[str] | None = None
+
+    # files
+
+    def files(self) -> list[str]:
+        if self._files is None:
+            found: list[str] = []
+            for directory, dirs, names in os.walk(self.root):
+                dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+                rel = os.path.relpath(directory, self.root)
+                prefix = "" if rel == "." else rel.replace(os.sep, "/") + "/"
+                found.extend(prefix + n for n in sorted(names) if not n.startswith("."))
+            self._files = found
+        return self._files
+
+    def notes(self) -> list[Note]:
+        return [self.note(path) for path in self.files() if path.endswith(".md")]
+
+    def folders(self) -> list[str]:
+        found = []
+        for directory, dirs, _ in os.walk(self.root):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            rel = os.path.relpath(directory, self.root)
+            if rel != ".":
+                found.append(rel.replace(os.sep, "/"))
+        return found
+
+    def abspath(self, path: str) -> str:
+        full = os.path.normpath(os.path.join(self.root, path.strip("/")))
+        if not (full + os.sep).startswith(self.root.rstrip(os.sep) + os.sep):
+            raise Failure(f'Error: Path "{path}" is outside the vault.')
+        return full
+
+    def exists(self, path: str) -> bool:
+        return os.path.isfile(self.abspath(path))
+
+    def note(self, path: str) -> Note:
+        note = self._notes.get(path)
+        if note is None:
+            try:
+                with open(self.abspath(path), encoding="utf-8", newline="") as fh:
+                    text = fh.read()
+            except FileNotFoundError:
+                raise Failure(f'Error: File "{path}" not found.') from None
+            note = self._notes[path] = Note(path, text)
+        return note
+
+    def write(self, path: str, text: str) -> None:
+        full = self.abspath(path)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, "w", encoding="utf-8", newline="") as fh:
+            fh.write(text)
+        self._notes.pop(path, None)
+        self._files = None
+
+    def remove(self, path: str) -> None:
+        os.remove(self.abspath(path))
+        self._notes.pop(path, None)
+        self._files = None
+
+    # name resolution
+
+    def resolve(self, target: str, source: str = "") -> str | None:
+        """Resolve a link target or note name the way Obsidian does."""
+        target = target.strip().strip("/")
+        if not target:
+            return None
+        files = self.files()
+        for candidate in (target, target + ".md"):
+            if candidate in files:
+                return candidate
+        relative = posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+        for candidate in (relative, relative + ".md"):
+            if candidate in files:
+                return candidate
+        wanted = posixpath.basename(target)
+        for path in files:
+            base = posixpath.basename(path)
+            if base == wanted or posixpath.splitext(base)[0] == wanted:
+                if path.endswith(target) or path.endswith(target + ".md"):
+                    return path
+        return None
+
+    def target(self, params: dict[str, str]) -> str:
+        """Path of the file named by the `path` or `file` parameter."""
+        if "path" in params:
+            path = params["path"].strip("/")
+            if not self.exists(path):
+                raise Failure(f'Error: File "{path}" not found.')
+            return path
+        if "file" in params:
+            resolved = self.resolve(params["file"])
+            if resolved is None:
+                raise Failure(f'Error: File "{params["file"]}" not found.')
+            return resolved
+        raise Failure("Error: Missing required parameter: path")
+
+    def link_graph(
+        self,
+    ) -> tuple[dict[str, list[tuple[str, str]]], list[dict[str, str]]]:
+        """Resolved outgoing links per note, and all unresolved links."""
+        resolved: dict[str, list[tuple[str, str]]] = {}
+        unresolved = []
+        for note in self.notes():
+            out = resolved[note.path] = []
+            for target, display in note.links():
+                path = self.resolve(target, note.path)
+                if path is None:
+                    unresolved.append({"source": note.path, "target": target})
+                else:
+                    out.append((path, display))
+        return resolved, unresolved
+
+
+# -- helpers -----------------------------------------------------------------
+
+
+def _under(path: str, folder: str | None) -> bool:
+    if not folder:
+        return True
+    folder = folder.strip("/")
+    return path == folder or path.startswith(folder + "/")
+
+
+def _stat(vault: Vault, path: str) -> dict[str, Any]:
+    info = os.stat(vault.abspath(path))
+    name = posixpath.basename(path)
+    return {
+        "path": path,
+        "name": posixpath.splitext(name)[0],
+        "extension": posixpath.splitext(name)[1].lstrip("."),
+        "size": info.st_size,
+        "ctime": int(getattr(info, "st_birthtime", info.st_ctime) * 1000),
+        "mtime": int(info.st_mtime * 1000),
+    }
+
+
+def _today() -> str:
+    return datetime.date.today().isoformat()
+
+
+def _daily_path(date: str | None = None) -> str:
+    return f"Daily/{date or _today()}.md"
+
+
+def _insert_after_frontmatter(text: str, content: str) -> str:
+    data, body, _ = split_frontmatter(text)
+    head = text[: len(text) - len(body)]
+    return head + content + ("\n" if body and not content.endswith("\n") else "") + body
+
+
+def _append(text: str, content: str, inline: bool = False) -> str:
+    if inline or not text or text.endswith("\n"):
+        return text + content
+    return text + "\n" + content
+
+
+def _load_state(vault: Vault, name: str, default: Any) -> Any:
+    try:
+        with open(os.path.join(vault.root, ".obsidian", name), encoding="utf-8") as fh:
+            return json.load(fh)
+    except (FileNotFoundError, ValueError):
+        return default
+
+
+def _save_state(vault: Vault, name: str, data: Any) -> None:
+    os.makedirs(os.path.join(vault.root, ".obsidian"), exist_ok=True)
+    with open(os.path.join(vault.root, ".obsidian", name), "w", encoding="utf-8") as fh:
+        json.dump(data, fh)
+
+
+# -- commands ----------------------------------------------------------------
+
+Params = dict[str, str]
+Flags = set[str]
+Handler = Callable[[Vault, str, Params, Flags], Any]
+COMMANDS: dict[str, Handler] = {}
+
+
+def command(*names: str) -> Callable[[Handler], Handler]:
+    def register(fn: Handler) -> Handler:
+        for name in names:
+            COMMANDS[name] = fn
+        return fn
+
+    return register
+
+
+@command("read")
+def _read(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    return vault.note(vault.target(params)).text
+
+
+@command("create")
+def _create(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    path = params.get("path") or (params.get("name", "Untitled") + ".md")
+    if not path.endswith(".md") and "." not in posixpath.basename(path):
+        path += ".md"
+    if vault.exists(path) and "--overwrite" not in flags:
+        raise Failure(f'Error: File "{path}" already exists.')
+    content = params.get("content", "")
+    if "template" in params:
+        content = vault.note(f"Templates/{params['template']}.md").text + content
+    vault.write(path, content)
+    return "" if "--silent" in flags else f"Created {path}"
+
+
+@command("append", "prepend")
+def _append_cmd(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    path = vault.target(params)
+    text = vault.note(path).text
+    content = params.get("content", "")
+    if cmd == "append":
+        text = _append(text, content, "--inline" in flags)
+    else:
+        text = _insert_after_frontmatter(text, content)
+    vault.write(path, text)
+    return ""
+
+
+@command("move", "rename")
+def _move(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    path = vault.target(params)
+    if cmd == "rename":
+        new = params["new-name"]
+        if not posixpath.splitext(new)[1]:
+            new += posixpath.splitext(path)[1]
+        dest = posixpath.join(posixpath.dirname(path), new)
+    else:
+        to = params["to"].strip("/")
+        dest = (
+            to
+            if posixpath.splitext(to)[1]
+            else posixpath.join(to, posixpath.basename(path))
+        )
+    if vault.exists(dest):
+        raise Failure(f'Error: File "{dest}" already exists.')
+    os.makedirs(os.path.dirname(vault.abspath(dest)), exist_ok=True)
+    os.replace(vault.abspath(path), vault.abspath(dest))
+    return ""
+
+
+@command("delete")
+def _delete(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    path = vault.target(params)
+    if "--permanent" in flags:
+        vault.remove(path)
+    else:
+        trash = os.path.join(vault.root, ".trash", path)
+        os.makedirs(os.path.dirname(trash), exist_ok=True)
+        os.replace(vault.abspath(path), trash)
+    return ""
+
+
+@command("open", "search:open", "random", "history:open", "sync:open", "publish:open")
+def _ui(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    if "path" in params or "file" in params:
+        vault.target(params)
+    return ""
+
+
+@command("vault")
+def _vault(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    files = vault.files()
+    return {
+        "name": vault.name,
+        "path": vault.root,
+        "files": len(files),
+        "folders": len(vault.folders()),
+        "size": sum(os.path.getsize(vault.abspath(f)) for f in files),
+    }
+
+
+def _list_vaults(base: str) -> list[dict[str, str]]:
+    return [
+        {"name": name, "path": os.path.join(base, name)}
+        for name in sorted(os.listdir(base))
+        if os.path.isdir(os.path.join(base, name))
+    ]
+
+
+@command("version")
+def _version(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    return VERSION
+
+
+@command("file")
+def _file(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    return _stat(vault, vault.target(params))
+
+
+@command("folder")
+def _folder(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    folder = params.get("path", "").strip("/")
+    if folder and not os.path.isdir(vault.abspath(folder)):
+        raise Failure(f'Error: Folder "{folder}" not found.')
+    files = [f for f in vault.files() if _under(f, folder)]
+    return {
+        "path": folder or "/",
+        "files": len(files),
+        "folders": len(
+            [f for f in vault.folders() if _under(f, folder) and f != folder]
+        ),
+        "size": sum(os.path.getsize(vault.abspath(f)) for f in files),
+    }
+
+
+@command("folders")
+def _folders(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    folder = params.get("path")
+    return [f for f in vault.folders() if _under(f, folder) and f != folder]
+
+
+@command("files")
+def _files(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    ext = params.get("ext", "").lstrip(".")
+    return [
+        f
+        for f in vault.files()
+        if _under(f, params.get("folder"))
+        and _under(f, params.get("path"))
+        and (not ext or f.endswith("." + ext))
+    ]
+
+
+@command("wordcount")
+def _wordcount(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    note = vault.note(vault.target(params))
+    return {"words": len(note.body.split()), "characters": len(note.body)}
+
+
+@command("search")
+def _search(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    query = params.get("query", "")
+    case = "--case" in flags
+    needle = query if case else query.lower()
+    hits = []
+    for note in vault.notes():
+        if not _under(note.path, params.get("path")) or not needle:
+            continue
+        matches = []
+        score = 0
+        for number, line in enumerate(note.text.splitlines(), 1):
+            haystack = line if case else line.lower()
+            count = haystack.count(needle)
+            if count:
+                score += count
+                matches.append({"line": number, "text": line})
+        if score:
+            hit: dict[str, Any] = {"file": note.path, "score": score}
+            if "--matches" in flags:
+                hit["matches"] = matches
+            hits.append(hit)
+    hits.sort(key=lambda hit: (-hit["score"], hit["file"]))
+    if "limit" in params:
+        hits = hits[: int(params["limit"])]
+    return hits
+
+
+@command("search:context")
+def _search_context(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    query = params.get("query", "")
+    case = "--case" in flags
+    needle = query if case else query.lower()
+    around = int(params.get("lines", "1"))
+    results = []
+    for note in vault.notes():
+        if not _under(note.path, params.get("path")) or not needle:
+            continue
+        lines = note.text.splitlines()
+        for index, line in enumerate(lines):
+            if needle in (line if case else line.lower()):
+                results.append(
+                    {
+                        "file": note.path,
+                        "line": index + 1,
+                        "context": lines[max(0, index - around) : index + around + 1],
+                    }
+                )
+    if "limit" in params:
+        results = results[: int(params["limit"])]
+    return results
+
+
+@command("properties")
+def _properties(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    return vault.note(vault.target(params)).frontmatter
+
+
+@command("property:read")
+def _property_read(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    data = vault.note(vault.target(params)).frontmatter
+    name = params.get("property", params.get("name", ""))
+    if name not in data:
+        raise Failure(f'Error: Property "{name}" not found.')
+    # Encode here: string values would otherwise be printed as plain text.
+    return json.dumps(data[name], ensure_ascii=False)
+
+
+@command("property:set", "property:remove")
+def _property_write(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    path = vault.target(params)
+    note = vault.note(path)
+    data = dict(note.frontmatter)
+    name = params.get("property", params.get("name", ""))
+    if cmd == "property:set":
+        data[name] = _scalar(params.get("value", ""))
+    elif name in data:
+        del data[name]
+    else:
+        raise Failure(f'Error: Property "{name}" not found.')
+    vault.write(path, join_frontmatter(data, note.body))
+    return ""
+
+
+@command("aliases")
+def _aliases(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    data = vault.note(vault.target(params)).frontmatter
+    return [str(alias) for alias in _as_list(data.get("aliases") or data.get("alias"))]
+
+
+@command("tags")
+def _tags(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    counts: dict[str, int] = {}
+    for note in vault.notes():
+        if _under(note.path, params.get("path")):
+            for tag in note.tags():
+                counts[tag] = counts.get(tag, 0) + 1
+    order = sorted(counts)
+    if params.get("sort") == "count":
+        order.sort(key=lambda tag: -counts[tag])
+    if "--counts" in flags:
+        return [{"name": tag, "count": counts[tag]} for tag in order]
+    return [{"name": tag} for tag in order]
+
+
+@command("tag")
+def _tag(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    name = params.get("tagname", params.get("name", "")).lstrip("#")
+    return [
+        {"path": note.path, "name": note.name}
+        for note in vault.notes()
+        if any(tag == name or tag.startswith(name + "/") for tag in note.tags())
+    ]
+
+
+@command("tags:rename")
+def _tags_rename(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    old, new = params["old"].lstrip("#"), params["new"].lstrip("#")
+    pattern = re.compile(r"(?<![\w&/#])#" + re.escape(old) + r"(?=[/\s]|$)")
+    for note in vault.notes():
+        data = dict(note.frontmatter)
+        tags = _as_list(data.get("tags"))
+        renamed = [
+            new + t[len(old) :] if t == old or str(t).startswith(old + "/") else t
+            for t in tags
+        ]
+        body = pattern.sub("#" + new, note.body)
+        if body != note.body or renamed != tags:
+            if "tags" in data:
+                data["tags"] = renamed
+            vault.write(note.path, join_frontmatter(data, body))
+    return ""
+
+
+@command("links")
+def _links(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    note = vault.note(vault.target(params))
+    return [
+        {"path": vault.resolve(target, note.path) or target, "display": display}
+        for target, display in note.links()
+    ]
+
+
+@command("backlinks")
+def _backlinks(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    path = vault.target(params)
+    resolved, _ = vault.link_graph()
+    counts: dict[str, int] = {}
+    for source, links in resolved.items():
+        for target, _display in links:
+            if target == path:
+                counts[source] = counts.get(source, 0) + 1
+    result = []
+    for source, count in counts.items():
+        item: dict[str, Any] = {"path": source, "display": vault.note(source).name}
+        if "--counts" in flags:
+            item["count"] = count
+        result.append(item)
+    return result
+
+
+@command("unresolved")
+def _unresolved(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    return vault.link_graph()[1]
+
+
+@command("orphans", "deadends")
+def _orphans(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    resolved, _ = vault.link_graph()
+    if cmd == "deadends":
+        selected = [path for path, links in resolved.items() if not links]
+    else:
+        linked = {target for links in resolved.values() for target, _ in links}
+        selected = [path for path in resolved if path not in linked]
+    return [{"path": path, "name": vault.note(path).name} for path in selected]
+
+
+@command("outline")
+def _outline(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    return vault.note(vault.target(params)).headings()
+
+
+@command("tasks")
+def _tasks(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    if "--daily" in flags:
+        notes = [vault.note(_daily_path())] if vault.exists(_daily_path()) else []
+    else:
+        notes = [n for n in vault.notes() if _under(n.path, params.get("path"))]
+    return [
+        task
+        for note in notes
+        for task in note.tasks()
+        if "--done" in flags or not task["completed"]
+    ]
+
+
+def _set_task(vault: Vault, path: str, line: int, state: bool | None) -> None:
+    lines = vault.note(path).text.splitlines(keepends=True)
+    match = _TASK.match(lines[line - 1]) if 0 < line <= len(lines) else None
+    if match is None:
+        raise Failure(f"Error: No task at {path}:{line}.")
+    done = match.group(2) == " " if state is None else state
+    end = "\n" if lines[line - 1].endswith("\n") else ""
+    lines[line - 1] = (
+        match.expand(r"\1") + ("x" if done else " ") + match.expand(r"\3\4") + end
+    )
+    vault.write(path, "".join(lines))
+
+
+@command("task")
+def _task(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    path = vault.target(params)
+    line = int(params["line"])
+    if "--toggle" in flags:
+        _set_task(vault, path, line, None)
+    elif "--done" in flags or "--todo" in flags:
+        _set_task(vault, path, line, "--done" in flags)
+    else:
+        return next(t for t in vault.note(path).tasks() if t["line"] == line)
+    return ""
+
+
+@command("task:create")
+def _task_create(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    path = _daily_path()
+    text = vault.note(path).text if vault.exists(path) else ""
+    content = params.get("content", "")
+    tags = " ".join("#" + t.lstrip("#") for t in params.get("tags", "").split(",") if t)
+    vault.write(path, _append(text, f"- [ ] {content}{' ' + tags if tags else ''}\n"))
+    return ""
+
+
+@command("task:complete")
+def _task_complete(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    path, _, line = params["task"].rpartition(":")
+    if not path or not line.isdigit() or not vault.exists(path):
+        raise Failure(f'Error: Task "{params["task"]}" not found.')
+    _set_task(vault, path, int(line), True)
+    return ""
+
+
+@command("daily", "daily:read", "daily:path", "daily:append", "daily:prepend")
+def _daily(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    path = _daily_path(params.get("date") if cmd == "daily:read" else None)
+    if cmd == "daily:path":
+        return path
+    if not vault.exists(path):
+        if cmd == "daily:read":
+            raise Failure(f'Error: File "{path}" not found.')
+        vault.write(path, "")
+    text = vault.note(path).text
+    if cmd == "daily:read":
+        return text
+    if cmd == "daily:append":
+        vault.write(path, _append(text, params.get("content", "")))
+    elif cmd == "daily:prepend":
+        vault.write(path, _insert_after_frontmatter(text, params.get("content", "")))
+    return ""
+
+
+@command("random:read")
+def _random_read(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    notes = [f for f in vault.files() if f.endswith(".md")]
+    if not notes:
+        raise Failure("Error: The vault has no notes.")
+    return vault.note(random.choice(notes)).text
+
+
+@command("templates")
+def _templates(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    return [
+        {"name": posixpath.splitext(posixpath.basename(f))[0], "path": f}
+        for f in vault.files()
+        if _under(f, "Templates") and f.endswith(".md")
+    ]
+
+
+@command("template:read", "template:insert")
+def _template(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    path = f"Templates/{params.get('name', '')}.md"
+    if not vault.exists(path):
+        raise Failure(f'Error: Template "{params.get("name", "")}" not found.')
+    text = vault.note(path).text
+    if "--resolve" in flags:
+        text = text.replace("{{date}}", _today()).replace(
+            "{{title}}", params.get("title", "")
+        )
+    return text if cmd == "template:read" else ""
+
+
+@command("bookmarks", "bookmark")
+def _bookmarks(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    items = _load_state(vault, "bookmarks.json", {"items": []})["items"]
+    if cmd == "bookmarks":
+        return items
+    if "file" in params:
+        item = {"type": "file", "path": vault.target(params)}
+    elif "url" in params:
+        item = {"type": "url", "url": params["url"]}
+    elif "search" in params:
+        item = {"type": "search", "query": params["search"]}
+    else:
+        item = {"type": "folder", "path": params.get("folder", "")}
+    if "title" in params:
+        item["title"] = params["title"]
+    items.append(item)
+    _save_state(vault, "bookmarks.json", {"items": items})
+    return ""
+
+
+@command("bases")
+def _bases(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    return [{"path": f} for f in vault.files() if f.endswith(".base")]
+
+
+@command("base:create")
+def _base_create(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    path = params.get("path") or params.get("name", "Untitled") + ".md"
+    vault.write(
+        path, join_frontmatter({k: v for k, v in params.items() if k != "path"}, "")
+    )
+    return ""
+
+
+@command("eval")
+def _eval(vault: Vault, cmd: str, params: Params, flags: Flags) -> Any:
+    code = params.get("code", "")
+    if match := re.search(r"const ops = (\[.*?\]);\n", code, re.S):
+        return "=> " + json.dumps(_eval_ops(vault, json.loads(match.group(1))))
+    if match := re.search(r"const prefix = (\".*?\");\n", code):
+        return "=> " + json.dumps(_eval_snapshot(vault, json.loads(match.group(1))))
+    raise Failure("Error: eval is limited to aiobsidian script batches and snapshots.")
+
+
+def _eval_ops(vault: Vault, ops: list[list[str]]) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for kind, target in ops:
+        path = vault.resolve(target)
+        if path is None or not path.endswith(".md"):
+            out.append({"error": f"File not found: {target}"})
+            continue
+        note = vault.note(path)
+        if kind == "read":
+            out.append({"ok": note.text})
+        elif kind == "properties":
+            out.append({"ok": note.frontmatter})
+        elif kind == "links":
+            out.append(
+                {
+                    "ok": [
+                        {"path": vault.resolve(t, path) or t, "display": d}
+                        for t, d in note.links()
+                    ]
+                }
+            )
+        elif kind == "outline":
+            out.append({"ok": note.headings()})
+    return out
+
+
+def _eval_snapshot(vault: Vault, prefix: str) -> list[list[Any]]:
+    rows = []
+    for path in vault.files():
+        if not path.startswith(prefix):
+            continue
+        info = _stat(vault, path)
+        fm: dict[str, Any] | None = None
+        tags: list[str] = []
+        links: list[str] = []
+        if path.endswith(".md"):
+            note = vault.note(path)
+            fm = note.frontmatter or None
+            tags = list(dict.fromkeys(note.tags()))
+            links = [vault.resolve(t, path) or t for t, _ in note.links()]
+        rows.append([path, info["ctime"], info["mtime"], info["size"], fm, tags, links])
+    return rows
+
+
+# Commands served from fixed data: the app state they report does not
+# exist outside Obsidian.
+_STATIC: dict[str, Any] = {
+    "help": [{"command": name} for name in ("read", "create", "search", "tags")],
+    "commands": [
+        {"id": "editor:save-file", "name": "Save current file"},
+        {"id": "app:reload", "name": "Reload app without saving"},
+    ],
+    "hotkeys": [{"id": "editor:save-file", "hotkey": "Mod+S"}],
+    "hotkey": {"id": "editor:save-file", "hotkey": "Mod+S"},
+    "plugins": [{"id": "daily-notes", "name": "Daily notes", "enabled": True}],
+    "plugins:enabled": [{"id": "daily-notes", "name": "Daily notes"}],
+    "plugin": {"id": "daily-notes", "name": "Daily notes", "enabled": True},
+    "themes": [{"name": "Default"}],
+    "theme": {"name": "Default", "mode": "dark"},
+    "snippets": [{"name": "wide"}],
+    "snippets:enabled": [{"name": "wide"}],
+    "workspaces": [{"name": "Default"}],
+    "workspace": {"name": "Default", "tabs": 1},
+    "tabs": [{"file": "Index.md", "view": "markdown"}],
+    "recents": [{"path": "Index.md"}],
+    "sync:status": {"enabled": False, "status": "disconnected"},
+    "sync:history": [],
+    "sync:deleted": [],
+    "publish:site": {"url": "https://publish.example.invalid"},
+    "publish:status": {"new": [], "changed": [], "deleted": []},
+    "publish:list": [],
+    "history": [],
+    "history:list": [],
+    "base:views": [],
+    "base:query": [],
+    "dev:errors": [],
+    "dev:console": [],
+    "dev:dom": [],
+    "dev:css": [],
+}
+
+
+def run(argv: list[str], env: dict[str, str]) -> tuple[str, str, int]:
+    """Execute one command and return `(stdout, stderr, exit_code)`."""
+    if not argv:
+        return "", "Usage: obsidian <command> [key=value ...] [--flag ...]\n", 1
+    cmd = argv[0]
+    params: dict[str, str] = {}
+    flags: set[str] = set()
+    for arg in argv[1:]:
+        if arg.startswith("--"):
+            flags.add(arg)
+        else:
+            key, _, value = arg.partition("=")
+            params[key] = value
+    base = env.get("AIOBSIDIAN_FAKE_VAULTS", "")
+    name = params.pop("vault", "")
+    params.pop("format", None)
+    root = os.path.join(base, name)
+    if cmd == "vaults" and base:
+        # Lists every vault, whichever one is selected.
+        return json.dumps(_list_vaults(os.path.abspath(base))), "", 0
+    if not base or not name or not os.path.isdir(root):
+        return "", f'Error: Vault "{name}" not found.\n', 1
+
+    latency = float(env.get("AIOBSIDIAN_FAKE_LATENCY") or 0)
+    if latency:
+        time.sleep(latency)
+
+    vault = Vault(name, os.path.abspath(root))
+    handler = COMMANDS.get(cmd)
+    try:
+        if handler is not None:
+            result = handler(vault, cmd, params, flags)
+        elif cmd in _STATIC:
+            result = _STATIC[cmd]
+        else:
+            # Remaining app commands (plugin:enable, theme:set, sync:on, ...)
+            # change UI state only and print nothing.
+            result = ""
+    except Failure as exc:
+        return "", f"{exc}\n", exc.code
+    except (KeyError, ValueError) as exc:
+        return "", f"Error: Invalid parameters: {exc}\n", 2
+    if isinstance(result, str):
+        return result, "", 0
+    return json.dumps(result, ensure_ascii=False), "", 0
+
+
+def main() -> None:
+    stdout, stderr, code = run(sys.argv[1:], dict(os.environ))
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    sys.stdout.flush()
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Serve a vault over the Local REST API routes from a shell.
+
+Mirrors the plugin's defaults (HTTPS with a self-signed certificate on
+port 27124):
+
+    python -m aiobsidian.testing.fake_rest path/to/vault --api-key secret
+
+See `aiobsidian.testing.FakeRESTServer` for what the routes implement.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+
+from .._constants import DEFAULT_HOST, DEFAULT_PORT
+from ._rest import FakeRESTServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("vault", help="vault directory to serve")
+    parser.add_argument("--api-key", default="test-key")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--http", action="store_true", help="serve plain HTTP")
+    parser.add_argument("--certfile")
+    parser.add_argument("--keyfile")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument(
+        "--route-latency",
+        action="append",
+        default=[],
+        metavar="ROUTE=SECONDS",
+        help='per-route delay, e.g. "PUT /vault/{path}=0.02"; repeatable',
+    )
+    args = parser.parse_args()
+    route_latency = {}
+    for item in args.route_latency:
+        route, _, seconds = item.rpartition("=")
+        route_latency[route] = float(seconds)
+
+    server = FakeRESTServer(
+        args.vault,
+        api_key=args.api_key,
+        host=args.host,
+        port=args.port,
+        tls=not args.http,
+        certfile=args.certfile,
+        keyfile=args.keyfile,
+        latency=args.latency,
+        route_latency=route_latency,
+    )
+    with server:
+        print(f"Serving {os.path.abspath(args.vault)} at {server.base_url}", flush=True)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
-from unittest.mock import AsyncMock
+import json
+import sys
+import textwrap
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
@@ -6,6 +9,7 @@ import respx
 
 from aiobsidian._cli import ObsidianCLI
 from aiobsidian._client import ObsidianClient
+from aiobsidian.testing import generate_vault, write_fake_binary
 
 
 @pytest.fixture()
@@ -26,9 +30,50 @@ async def client(mock_api):
 
 @pytest.fixture()
 def cli():
-    instance = ObsidianCLI.__new__(ObsidianCLI)
-    instance._vault = "TestVault"
-    instance._binary = "/usr/local/bin/obsidian"
-    instance._timeout = 30.0
+    """CLI for vault `TestVault` whose commands are mocked.
+
+    Set `cli._execute.return_value` to the raw output of a command, or
+    `cli._iter_json.items` to the elements a streaming command yields.
+    """
+    instance = ObsidianCLI(
+        "TestVault", binary="/usr/local/bin/obsidian", json_backend="json"
+    )
     instance._execute = AsyncMock()
+
+    async def execute_json(command, **kwargs):
+        return json.loads(await instance._execute(command, **kwargs))
+
+    instance._execute_json = execute_json
+
+    async def iter_json(*args, **kwargs):
+        for item in instance._iter_json.items:
+            yield item
+
+    instance._iter_json = MagicMock(side_effect=iter_json)
+    instance._iter_json.items = []
     return instance
+
+
+@pytest.fixture()
+def make_binary(tmp_path):
+    """Factory writing a stand-in ``obsidian`` executable from Python source."""
+
+    def factory(source: str) -> str:
+        path = tmp_path / "obsidian"
+        path.write_text(f"#!{sys.executable}\n" + textwrap.dedent(source))
+        path.chmod(0o755)
+        return str(path)
+
+    return factory
+
+
+@pytest.fixture()
+def vault(tmp_path):
+    """Generated 60-note vault `Bench` in `tmp_path / "vaults"`."""
+    return generate_vault(tmp_path / "vaults" / "Bench", notes=60, folders=3)
+
+
+@pytest.fixture()
+def binary(tmp_path, vault):
+    """Fake `obsidian` executable serving the vaults next to `vault`."""
+    return write_fake_binary(tmp_path / "bin", vault.parent)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from aiobsidian._batch import CLICall
+from aiobsidian._exceptions import CLITimeoutError, CommandError
+from aiobsidian._types import Priority
+
+
+async def test_run_many_preserves_order(cli):
+    async def execute(command, **kwargs):
+        path = kwargs["params"]["path"]
+        await asyncio.sleep(0.01 if path == "a.md" else 0)
+        return f"content of {path}"
+
+    cli._execute.side_effect = execute
+    calls = [CLICall("read", params={"path": p}) for p in ("a.md", "b.md", "c.md")]
+    results = await cli.run_many(calls)
+    assert results == ["content of a.md", "content of b.md", "content of c.md"]
+
+
+async def test_run_many_collects_errors(cli):
+    async def execute(command, **kwargs):
+        path = kwargs["params"]["path"]
+        if path == "missing.md":
+            raise CommandError("read", 1, "not found")
+        if path == "slow.md":
+            raise CLITimeoutError("read", 1.0)
+        return path
+
+    cli._execute.side_effect = execute
+    paths = ["a.md", "missing.md", "slow.md", "b.md"]
+    results = await cli.run_many(CLICall("read", params={"path": p}) for p in paths)
+
+    assert results[0] == "a.md"
+    assert isinstance(results[1], CommandError)
+    assert isinstance(results[2], CLITimeoutError)
+    assert results[3] == "b.md"
+
+
+async def test_run_many_propagates_unexpected_errors(cli):
+    cli._execute.side_effect = RuntimeError("boom")
+    with pytest.raises(RuntimeError):
+        await cli.run_many([CLICall("read")])
+
+
+async def test_run_many_passes_call_fields(cli):
+    cli._execute.return_value = ""
+    await cli.run_many(
+        [CLICall("create", params={"path": "n.md"}, flags=["--silent"], timeout=5.0)]
+    )
+    cli._execute.assert_awaited_once_with(
+        "create",
+        params={"path": "n.md"},
+        flags=["--silent"],
+        timeout=5.0,
+        priority=Priority.BACKGROUND,
+    )
+
+
+async def test_run_many_bounded_concurrency(cli):
+    running = 0
+    peak = 0
+
+    async def execute(command, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return ""
+
+    cli._execute.side_effect = execute
+    await cli.run_many((CLICall("read") for _ in range(20)), concurrency=3)
+    assert peak == 3
+
+
+async def test_run_many_empty(cli):
+    assert await cli.run_many([]) == []
+
+
+async def test_iter_many_completion_order(cli):
+    async def execute(command, **kwargs):
+        delay = float(kwargs["params"]["delay"])
+        await asyncio.sleep(delay)
+        return kwargs["params"]["delay"]
+
+    cli._execute.side_effect = execute
+    calls = [CLICall("eval", params={"delay": d}) for d in ("0.02", "0")]
+    items = [item async for item in cli.iter_many(calls)]
+    assert items == [(1, "0"), (0, "0.02")]
+
+
+async def test_iter_many_early_exit_cancels(cli):
+    cancelled = 0
+
+    async def execute(command, **kwargs):
+        nonlocal cancelled
+        if kwargs["params"]["path"] == "fast.md":
+            return "fast"
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return "slow"
+
+    cli._execute.side_effect = execute
+    calls = [CLICall("read", params={"path": p}) for p in ("slow.md", "fast.md")]
+    async with asyncio.timeout(1):
+        iterator = cli.iter_many(calls)
+        async for item in iterator:
+            assert item == (1, "fast")
+            break
+        await iterator.aclose()
+    assert cancelled == 1
+
+
+async def test_iter_many_invalid_concurrency(cli):
+    with pytest.raises(ValueError):
+        async for _ in cli.iter_many([CLICall("read")], concurrency=0):
+            pass
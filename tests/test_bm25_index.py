@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian.models.search import SearchResult
+
+pytest.importorskip("numpy")
+
+from aiobsidian.index import BM25Index  # noqa: E402
+
+
+@pytest.fixture
+def small(tmp_path):
+    root = tmp_path / "Small"
+    (root / "fruit").mkdir(parents=True)
+    (root / "a.md").write_text("apple banana")
+    (root / "b.md").write_text("apple apple cherry")
+    (root / "fruit" / "c.md").write_text("durian")
+    return root
+
+
+def build(root, **kwargs):
+    index = BM25Index(root, **kwargs)
+    index.build()
+    return index
+
+
+def test_okapi_scores(small):
+    index = build(small)
+    # Three notes of 3, 4 and 2 tokens (the note name counts): avgdl 3.
+    idf = math.log(1 + (3 - 1 + 0.5) / (1 + 0.5))
+    [(file, score)] = index.top("banana")
+    assert file == "a.md"
+    assert score == pytest.approx(idf * 2.2 / (1 + 1.2), rel=1e-6)
+
+    ranked = index.top("Apple durian")
+    assert [file for file, _ in ranked] == ["fruit/c.md", "b.md", "a.md"]
+    assert ranked[1][1] > ranked[2][1]
+    assert index.top("apple", path="fruit") == []
+    assert index.top("kiwi") == index.top("") == index.top("apple", limit=0) == []
+
+
+def test_field_boosts(tmp_path):
+    root = tmp_path / "Boosts"
+    root.mkdir()
+    (root / "parser.md").write_text("notes about tokens")
+    (root / "other.md").write_text("---\ntopic: misc\n---\n# Parser\nthe parser")
+    assert build(root).top("parser")[0][0] == "other.md"
+    boosted = build(root, boosts={"title": 5.0})
+    assert boosted.top("parser")[0][0] == "parser.md"
+    assert build(root, boosts={"frontmatter": 0.0}).top("misc") == []
+    with pytest.raises(ValueError, match="Unknown fields"):
+        BM25Index(root, boosts={"tags": 2.0})  # type: ignore[dict-item]
+
+
+def test_top_k_matches_full_sort(vault):
+    index = build(vault)
+    everything = index.top("cache vector latency", limit=1000)
+    assert len(everything) > 20
+    assert index.top("cache vector latency", limit=7) == everything[:7]
+    scores = [score for _, score in everything]
+    assert scores == sorted(scores, reverse=True)
+    under = index.top("cache", path="folder-01", limit=1000)
+    assert under and all(file.startswith("folder-01/") for file, _ in under)
+
+
+def test_ties_at_the_cutoff_are_broken_by_path(tmp_path):
+    # Same length and term frequency: these notes all score the same.
+    names = [f"n{i:03d}.md" for i in range(300)]
+    for name in names:
+        (tmp_path / name).write_text("kiwi")
+    (tmp_path / "best.md").write_text("kiwi kiwi")
+    index = build(tmp_path)
+    # Re-index in reverse, so note ids no longer follow path order.
+    for name in reversed(names):
+        index.update(name)
+    expected = ["best.md", *names]
+    for limit in (1, 2, 7, 50, 299, 301, 400):
+        ranked = index.top("kiwi", limit=limit)
+        assert [file for file, _ in ranked] == expected[:limit]
+    scores = [score for _, score in index.top("kiwi", limit=5)]
+    assert scores[0] > scores[1] == scores[4]
+
+
+def test_search_results(small):
+    index = build(small)
+    [result] = index.search("banana cherry", limit=1, context_length=3)
+    assert isinstance(result, SearchResult)
+    assert result.filename in {"a.md", "b.md"} and result.score
+    plain = index.search("apple")
+    assert [r.filename for r in plain] == ["b.md", "a.md"]
+    assert plain[0].matches is None
+
+    [hit] = index.search("cherry", context_length=4)
+    assert hit.matches is not None
+    [match] = hit.matches
+    assert (match.match.start, match.match.end) == (12, 18)
+    assert match.context == "ple cherry"
+
+
+def test_spans_after_case_folding(tmp_path):
+    # "İ".lower() is two code points; spans must index the original text.
+    (tmp_path / "t.md").write_text("İİ İstanbul Kiwi")
+    index = build(tmp_path)
+    [hit] = index.search("KIWI", context_length=0)
+    assert hit.matches is not None
+    [match] = hit.matches
+    assert (match.match.start, match.match.end) == (12, 16)
+    assert match.context == "Kiwi"
+    # Query and content fold alike, so the term still matches.
+    [(file, _)] = index.top("İSTANBUL")
+    assert file == "t.md"
+
+
+def test_incremental_updates_match_rebuild(vault):
+    index = build(vault)
+    note = vault / "folder-00" / "note-00000.md"
+    note.write_text("# Quokka\nquokka quokka habitat")
+    index.update("folder-00/note-00000.md")
+    assert index.top("quokka")[0][0] == "folder-00/note-00000.md"
+
+    for _ in range(300):  # enough removals to trigger compaction
+        index.update("folder-01/note-00001.md")
+    (vault / "folder-02" / "note-00002.md").unlink()
+    index.refresh()
+    fresh = build(vault)
+    query = "quokka cache vector index"
+    assert index.top(query, limit=100) == pytest.approx(fresh.top(query, limit=100))
+    assert index.stats().files == fresh.stats().files == len(fresh)
+
+
+async def test_cli_ranked(binary, vault):
+    async with ObsidianCLI(
+        "Bench", binary=binary, ranked_index=True, metrics=True
+    ) as cli:
+        results = await cli.search.ranked("cache", limit=5, context_length=10)
+        assert len(results) == 5 and all(r.matches for r in results)
+        assert cli.ranked_index is not None
+        assert [c.name for c in cli.metrics().commands] == ["vaults"]
+
+        await cli.vault.create("Zoo/quokka.md", content="quokka")
+        [result] = await cli.search.ranked("quokka")
+        assert result.filename == "Zoo/quokka.md"
+
+    async with ObsidianCLI("Bench", binary=binary) as plain:
+        with pytest.raises(RuntimeError, match="ranked_index"):
+            await plain.search.ranked("cache")
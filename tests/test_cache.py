@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aiobsidian._cache import CLICache
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian._exceptions import CLITimeoutError, CommandError
+
+
+def put(cache: CLICache, command: str, params: dict[str, str] | None, value=b"x"):
+    key = cache.key(command, params, None)
+    assert key is not None
+    cache.put(key, value, generation=cache.generation)
+    return key
+
+
+def test_only_reads_are_cacheable():
+    assert CLICache.key("read", {"path": "a.md"}, None) is not None
+    assert CLICache.key("files", None, None) is not None
+    assert CLICache.key("create", {"path": "a.md"}, None) is None
+    assert CLICache.key("eval", {"code": "1"}, None) is None
+
+
+def test_key_ignores_param_order():
+    cache = CLICache()
+    first = put(cache, "property:read", {"name": "status", "path": "a.md"})
+    second = CLICache.key("property:read", {"path": "a.md", "name": "status"}, None)
+    assert second == first
+    assert cache.get(second) == b"x"
+    cache.invalidate("property:set", {"path": "a.md", "name": "status"})
+    assert cache.get(first) is None and cache.stats().entries == 0
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        CLICache(ttl=0)
+    with pytest.raises(ValueError):
+        CLICache(max_bytes=0)
+
+
+def test_hit_and_miss():
+    cache = CLICache()
+    key = put(cache, "read", {"path": "a.md"}, b"hello")
+    assert cache.get(key) == b"hello"
+    assert cache.get(CLICache.key("read", {"path": "b.md"}, None)) is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_ttl_expiry(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("aiobsidian._cache.time.monotonic", lambda: now)
+    cache = CLICache(ttl=10)
+    key = put(cache, "files", None)
+    now += 9
+    assert cache.get(key) == b"x"
+    now += 2
+    assert cache.get(key) is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction_by_size():
+    cache = CLICache(max_bytes=3000)
+    a = put(cache, "read", {"path": "a.md"}, b"a" * 1000)
+    b = put(cache, "read", {"path": "b.md"}, b"b" * 1000)
+    cache.get(a)
+    c = put(cache, "read", {"path": "c.md"}, b"c" * 1000)
+    assert cache.get(b) is None
+    assert cache.get(a) is not None
+    assert cache.get(c) is not None
+    assert cache.stats().evictions == 1
+    assert cache.stats().size <= 3000
+
+
+def test_oversized_value_not_cached():
+    cache = CLICache(max_bytes=100)
+    key = put(cache, "read", {"path": "a.md"}, b"a" * 1000)
+    assert cache.get(key) is None
+
+
+def test_negative_caching(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("aiobsidian._cache.time.monotonic", lambda: now)
+    cache = CLICache(negative_ttl=5)
+    error = CommandError("read", 1, 'Error: File "missing.md" not found.')
+    key = put(cache, "read", {"path": "missing.md"}, error)
+    assert cache.get(key) is error
+    now += 6
+    assert cache.get(key) is None
+
+
+def test_negative_caching_disabled():
+    cache = CLICache(negative_ttl=0)
+    error = CommandError("read", 1, 'Error: File "a.md" not found.')
+    key = put(cache, "read", {"path": "a.md"}, error)
+    assert cache.get(key) is None
+
+
+def test_only_not_found_is_negative_cached():
+    cache = CLICache(negative_ttl=5)
+    busy = CommandError("read", 1, "Error: Obsidian is busy, try again.")
+    key = put(cache, "read", {"path": "a.md"}, busy)
+    assert cache.get(key) is None
+
+
+def test_write_invalidates_path_and_listings():
+    cache = CLICache()
+    a = put(cache, "read", {"path": "notes/a.md"})
+    a_links = put(cache, "links", {"file": "a"})
+    b = put(cache, "read", {"path": "notes/b.md"})
+    files = put(cache, "files", None)
+
+    cache.invalidate("append", {"path": "notes/a.md", "content": "x"})
+
+    assert cache.get(a) is None
+    assert cache.get(a_links) is None
+    assert cache.get(files) is None
+    assert cache.get(b) == b"x"
+
+
+def test_move_invalidates_destination():
+    cache = CLICache()
+    missing = put(
+        cache,
+        "read",
+        {"path": "archive/a.md"},
+        CommandError("read", 1, 'Error: File "x.md" not found.'),
+    )
+    other = put(cache, "read", {"path": "notes/b.md"})
+    cache.invalidate("move", {"path": "notes/a.md", "to": "archive"})
+    assert cache.get(missing) is None
+    assert cache.get(other) == b"x"
+
+
+def test_rename_invalidates_new_name():
+    cache = CLICache()
+    missing = put(
+        cache,
+        "read",
+        {"path": "notes/c.md"},
+        CommandError("read", 1, 'Error: File "x.md" not found.'),
+    )
+    cache.invalidate("rename", {"path": "notes/a.md", "new-name": "c"})
+    assert cache.get(missing) is None
+
+
+def test_vault_write_clears_everything():
+    cache = CLICache()
+    put(cache, "read", {"path": "a.md"})
+    put(cache, "tags", None)
+    cache.invalidate("tags:rename", {"old": "a", "new": "b"})
+    assert len(cache) == 0
+
+
+def test_read_commands_do_not_invalidate():
+    cache = CLICache()
+    put(cache, "read", {"path": "a.md"})
+    cache.invalidate("open", {"path": "a.md"})
+    assert len(cache) == 1
+
+
+def test_stale_result_after_invalidation_is_dropped():
+    cache = CLICache()
+    key = cache.key("read", {"path": "a.md"}, None)
+    assert key is not None
+    generation = cache.generation
+    cache.invalidate("delete", {"path": "a.md"})
+    cache.put(key, b"old", generation=generation)
+    assert cache.get(key) is None
+
+
+@pytest.fixture
+def cached_cli():
+    cli = ObsidianCLI("TestVault", binary="/usr/bin/obsidian", cache=CLICache())
+    cli._spawn = AsyncMock(return_value=b"[]")  # type: ignore[method-assign]
+    return cli
+
+
+async def test_cli_reads_are_cached(cached_cli):
+    assert await cached_cli.vault.list() == []
+    assert await cached_cli.vault.list() == []
+    assert cached_cli._spawn.await_count == 1
+
+
+async def test_cli_write_invalidates(cached_cli):
+    cached_cli._spawn.return_value = b"content"
+    await cached_cli.vault.read("a.md")
+    await cached_cli.vault.append("a.md", "more")
+    await cached_cli.vault.read("a.md")
+    assert cached_cli._spawn.await_count == 3
+
+
+async def test_cli_failed_write_still_invalidates(cached_cli):
+    cached_cli._spawn.return_value = b"content"
+    await cached_cli.vault.read("a.md")
+    cached_cli._spawn.side_effect = CLITimeoutError("delete", 1.0)
+    with pytest.raises(CLITimeoutError):
+        await cached_cli.vault.delete("a.md")
+    assert len(cached_cli.cache) == 0
+
+
+async def test_cli_not_found_is_cached(cached_cli):
+    cached_cli._spawn.side_effect = CommandError(
+        "read", 1, 'Error: File "missing.md" not found.'
+    )
+    for _ in range(2):
+        with pytest.raises(CommandError):
+            await cached_cli.vault.read("missing.md")
+    assert cached_cli._spawn.await_count == 1
+
+
+async def test_cli_other_errors_are_not_cached(cached_cli):
+    cached_cli._spawn.side_effect = CommandError("read", 1, "Plugin error")
+    for _ in range(2):
+        with pytest.raises(CommandError):
+            await cached_cli.vault.read("a.md")
+    assert cached_cli._spawn.await_count == 2
+
+
+async def test_cli_read_racing_write_is_not_cached(cached_cli):
+    release = asyncio.Event()
+
+    async def spawn(command, **kwargs):
+        if command == "read":
+            await release.wait()
+        return b"old"
+
+    cached_cli._spawn.side_effect = spawn
+    read = asyncio.create_task(cached_cli.vault.read("a.md"))
+    await asyncio.sleep(0)
+    await cached_cli.vault.prepend("a.md", "new")
+    release.set()
+    assert await read == "old"
+    assert len(cached_cli.cache) == 0
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -87,6 +88,7 @@ class TestExecute:
 
         mock_process = AsyncMock()
         mock_process.communicate.side_effect = TimeoutError
+        mock_process.returncode = None  # still running
         mock_process.kill = MagicMock()
         mock_process.wait = AsyncMock()
 
@@ -98,6 +100,31 @@ class TestExecute:
         assert exc_info.value.timeout == 1.0
         mock_process.kill.assert_called_once()
 
+    async def test_cancel_kills_process(self, make_binary, tmp_path):
+        pid_file = tmp_path / "pid"
+        binary = make_binary(
+            f"""
+            import os, sys, time
+            if sys.argv[1] == "read":
+                with open({str(pid_file)!r}, "w") as fh:
+                    fh.write(str(os.getpid()))
+                time.sleep(5)
+            print('"ok"')
+            """
+        )
+        cli = ObsidianCLI("TestVault", binary=binary, max_concurrency=1)
+        task = asyncio.create_task(cli._execute("read", params={"path": "a.md"}))
+        while not pid_file.exists() or not pid_file.read_text():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # The process is killed and reaped, and its slot is free again.
+        assert await asyncio.wait_for(cli._execute("version"), 2) == '"ok"\n'
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
+
     async def test_stderr_warning(self, caplog):
         cli = ObsidianCLI("TestVault", binary="/usr/bin/obsidian")
 
@@ -146,6 +173,7 @@ class TestExecute:
 
         mock_process = AsyncMock()
         mock_process.communicate.side_effect = TimeoutError
+        mock_process.returncode = None  # still running
         mock_process.kill = MagicMock()
         mock_process.wait = AsyncMock()
 
@@ -288,3 +316,135 @@ class TestResources:
         from aiobsidian.cli.bases import CLIBasesResource
 
         assert isinstance(cli.bases, CLIBasesResource)
+
+
+class TestStream:
+    async def test_iter_json(self, make_binary):
+        binary = make_binary(
+            """
+            import json, sys
+            assert sys.argv[1:4] == ["files", "vault=TestVault", "format=json"]
+            print(json.dumps([f"notes/{i}.md" for i in range(5000)]))
+            """
+        )
+        cli = ObsidianCLI("TestVault", binary=binary)
+        items = [item async for item in cli._iter_json("files")]
+        assert items == [f"notes/{i}.md" for i in range(5000)]
+        assert cli.scheduler.stats().in_flight == 0
+
+    async def test_stream_command_error(self, make_binary):
+        binary = make_binary(
+            """
+            import sys
+            sys.stdout.write("[1, 2]")
+            sys.stderr.write("boom")
+            sys.exit(3)
+            """
+        )
+        cli = ObsidianCLI("TestVault", binary=binary)
+        items = []
+        with pytest.raises(CommandError) as exc_info:
+            async for item in cli._iter_json("tasks"):
+                items.append(item)
+        assert items == [1, 2]
+        assert exc_info.value.exit_code == 3
+        assert exc_info.value.stderr == "boom"
+
+    async def test_early_close_kills_process(self, make_binary, tmp_path):
+        marker = tmp_path / "finished"
+        binary = make_binary(
+            f"""
+            import sys, time
+            sys.stdout.write("[")
+            for i in range(1000):
+                sys.stdout.write(f"{{i}},")
+                sys.stdout.flush()
+                time.sleep(0.01)
+            sys.stdout.write("0]")
+            open({str(marker)!r}, "w").close()
+            """
+        )
+        cli = ObsidianCLI("TestVault", binary=binary)
+        iterator = cli._iter_json("files")
+        first = await anext(iterator)
+        await iterator.aclose()
+
+        assert first == 0
+        assert cli.scheduler.stats().in_flight == 0
+        await asyncio.sleep(0.05)
+        assert not marker.exists()
+
+    async def test_stream_timeout(self, make_binary):
+        binary = make_binary(
+            """
+            import time
+            time.sleep(5)
+            """
+        )
+        cli = ObsidianCLI("TestVault", binary=binary, timeout=0.2)
+        with pytest.raises(CLITimeoutError):
+            async for _ in cli._stream("files"):
+                pass
+        assert cli.scheduler.stats().in_flight == 0
+
+    async def test_command_inside_stream_loop(self, make_binary):
+        binary = make_binary(
+            """
+            import json, sys
+            if sys.argv[1] == "files":
+                print(json.dumps(["a.md", "b.md"]))
+            else:
+                [path] = [a[5:] for a in sys.argv if a.startswith("path=")]
+                sys.stdout.write("content of " + path)
+            """
+        )
+        cli = ObsidianCLI("TestVault", binary=binary, max_concurrency=1)
+        contents = [
+            await asyncio.wait_for(cli.vault.read(path), 5)
+            async for path in cli.vault.iter_list()
+        ]
+        assert contents == ["content of a.md", "content of b.md"]
+        assert cli.scheduler.stats().in_flight == 0
+
+
+class TestCoalescing:
+    async def test_identical_reads_share_process(self):
+        cli = ObsidianCLI("TestVault", binary="/usr/bin/obsidian")
+        release = asyncio.Event()
+
+        async def spawn(command, **kwargs):
+            await release.wait()
+            return b"content"
+
+        cli._spawn = AsyncMock(side_effect=spawn)
+        reads = [asyncio.create_task(cli.vault.read("Index.md")) for _ in range(50)]
+        await asyncio.sleep(0)
+        release.set()
+        assert await asyncio.gather(*reads) == ["content"] * 50
+        assert cli._spawn.await_count == 1
+
+    async def test_writes_are_not_coalesced(self):
+        cli = ObsidianCLI("TestVault", binary="/usr/bin/obsidian")
+        cli._spawn = AsyncMock(return_value=b"")
+        await asyncio.gather(*(cli.vault.append("a.md", "x") for _ in range(3)))
+        assert cli._spawn.await_count == 3
+
+    async def test_read_after_write_does_not_join_earlier_read(self):
+        cli = ObsidianCLI("TestVault", binary="/usr/bin/obsidian")
+        release = asyncio.Event()
+
+        async def spawn(command, **kwargs):
+            if command == "read":
+                await release.wait()
+            return b"content"
+
+        cli._spawn = AsyncMock(side_effect=spawn)
+        before = asyncio.create_task(cli.vault.read("a.md"))
+        await asyncio.sleep(0)
+        await cli.vault.append("a.md", "x")
+        after = asyncio.create_task(cli.vault.read("a.md"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(before, after)
+        commands = [c.args[0] for c in cli._spawn.await_args_list]
+        assert commands.count("read") == 2
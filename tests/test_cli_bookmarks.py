@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 
+from aiobsidian.models.records import BookmarkRecord
+
 BOOKMARKS_LIST = [
     {"type": "file", "path": "notes/important.md", "title": "Important"},
     {"type": "folder", "path": "projects/"},
@@ -11,7 +13,10 @@ BOOKMARKS_LIST = [
 async def test_list(cli):
     cli._execute.return_value = json.dumps(BOOKMARKS_LIST)
     result = await cli.bookmarks.list()
-    assert result == BOOKMARKS_LIST
+    assert result == [
+        BookmarkRecord(type="file", path="notes/important.md", title="Important"),
+        BookmarkRecord(type="folder", path="projects/"),
+    ]
     cli._execute.assert_awaited_once_with("bookmarks")
 
 
@@ -49,3 +54,9 @@ async def test_add_with_subpath(cli):
     cli._execute.assert_awaited_once_with(
         "bookmark", params={"file": "note.md", "subpath": "#heading"}
     )
+
+
+async def test_list_raw(cli):
+    cli._execute.return_value = json.dumps(BOOKMARKS_LIST)
+    result = await cli.bookmarks.list(raw=True)
+    assert result == BOOKMARKS_LIST
@@ -125,3 +125,10 @@ async def test_cdp(cli):
         "dev:cdp",
         params={"method": "Page.navigate", "params": '{"url": "https://example.com"}'},
     )
+
+
+async def test_iter_console(cli):
+    cli._iter_json.items = CONSOLE_MSGS
+    result = [msg async for msg in cli.dev.iter_console(limit=10)]
+    assert result == CONSOLE_MSGS
+    cli._iter_json.assert_called_once_with("dev:console", params={"limit": "10"})
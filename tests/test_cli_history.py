@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 
+from aiobsidian.models.records import VersionRecord
+
 HISTORY_FILES = [
     {"path": "notes/todo.md", "versions": 3},
     {"path": "notes/ideas.md", "versions": 1},
@@ -15,10 +17,20 @@ async def test_versions(cli):
     ]
     cli._execute.return_value = json.dumps(versions)
     result = await cli.history.versions("notes/todo.md")
-    assert result == versions
+    assert result == [
+        VersionRecord(version="v1", date="2026-03-16T09:00:00Z"),
+        VersionRecord(version="v2", date="2026-03-16T10:00:00Z"),
+    ]
     cli._execute.assert_awaited_once_with("history", params={"path": "notes/todo.md"})
 
 
+async def test_versions_raw(cli):
+    versions = [{"version": "v1", "date": "2026-03-16T09:00:00Z"}]
+    cli._execute.return_value = json.dumps(versions)
+    result = await cli.history.versions("notes/todo.md", raw=True)
+    assert result == versions
+
+
 async def test_open(cli):
     cli._execute.return_value = ""
     await cli.history.open("notes/todo.md")
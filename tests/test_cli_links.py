@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 
+from aiobsidian.models.records import FileRecord, LinkRecord, UnresolvedLinkRecord
+
 OUTGOING = [
     {"path": "notes/setup.md", "display": "setup"},
     {"path": "notes/config.md", "display": "config"},
@@ -23,14 +25,17 @@ ORPHANS = [
 async def test_outgoing(cli):
     cli._execute.return_value = json.dumps(OUTGOING)
     result = await cli.links.outgoing("note.md")
-    assert result == OUTGOING
+    assert result == [
+        LinkRecord(path="notes/setup.md", display="setup"),
+        LinkRecord(path="notes/config.md", display="config"),
+    ]
     cli._execute.assert_awaited_once_with("links", params={"file": "note.md"})
 
 
 async def test_incoming(cli):
     cli._execute.return_value = json.dumps(INCOMING)
     result = await cli.links.incoming("note.md")
-    assert result == INCOMING
+    assert result == [LinkRecord(path="projects/main.md", display="main")]
     cli._execute.assert_awaited_once_with(
         "backlinks", params={"file": "note.md"}, flags=None
     )
@@ -39,7 +44,7 @@ async def test_incoming(cli):
 async def test_incoming_with_counts(cli):
     cli._execute.return_value = json.dumps(INCOMING)
     result = await cli.links.incoming("note.md", counts=True)
-    assert result == INCOMING
+    assert result == [LinkRecord(path="projects/main.md", display="main")]
     cli._execute.assert_awaited_once_with(
         "backlinks", params={"file": "note.md"}, flags=["--counts"]
     )
@@ -48,14 +53,16 @@ async def test_incoming_with_counts(cli):
 async def test_unresolved(cli):
     cli._execute.return_value = json.dumps(UNRESOLVED)
     result = await cli.links.unresolved()
-    assert result == UNRESOLVED
+    assert result == [
+        UnresolvedLinkRecord(source="notes/draft.md", target="missing-note")
+    ]
     cli._execute.assert_awaited_once_with("unresolved")
 
 
 async def test_orphans(cli):
     cli._execute.return_value = json.dumps(ORPHANS)
     result = await cli.links.orphans()
-    assert result == ORPHANS
+    assert result == [FileRecord(path="archive/old.md", name="old")]
     cli._execute.assert_awaited_once_with("orphans")
 
 
@@ -67,5 +74,24 @@ DEADENDS = [
 async def test_deadends(cli):
     cli._execute.return_value = json.dumps(DEADENDS)
     result = await cli.links.deadends()
-    assert result == DEADENDS
+    assert result == [FileRecord(path="notes/leaf.md", name="leaf")]
     cli._execute.assert_awaited_once_with("deadends")
+
+
+async def test_outgoing_many(cli):
+    cli._execute.return_value = json.dumps(OUTGOING)
+    result = await cli.links.outgoing_many(["a.md", "b.md"])
+    assert result == [LinkRecord.from_list(OUTGOING)] * 2
+    assert cli._execute.await_count == 2
+
+
+async def test_outgoing_raw(cli):
+    cli._execute.return_value = json.dumps(OUTGOING)
+    result = await cli.links.outgoing("note.md", raw=True)
+    assert result == OUTGOING
+
+
+async def test_outgoing_many_raw(cli):
+    cli._execute.return_value = json.dumps(OUTGOING)
+    result = await cli.links.outgoing_many(["a.md"], raw=True)
+    assert result == [OUTGOING]
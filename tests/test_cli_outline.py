@@ -14,3 +14,9 @@ async def test_get(cli):
     result = await cli.outline.get("notes/guide.md")
     assert result == OUTLINE
     cli._execute.assert_awaited_once_with("outline", params={"file": "notes/guide.md"})
+
+
+async def test_get_many(cli):
+    cli._execute.return_value = json.dumps(OUTLINE)
+    result = await cli.outline.get_many(["a.md"])
+    assert result == [OUTLINE]
@@ -35,3 +35,9 @@ async def test_remove(cli):
     cli._execute.assert_awaited_once_with(
         "property:remove", params={"path": "note.md", "property": "title"}
     )
+
+
+async def test_list_many(cli):
+    cli._execute.side_effect = [json.dumps({"title": "A"}), json.dumps({})]
+    result = await cli.properties.list_many(["a.md", "b.md"])
+    assert result == [{"title": "A"}, {}]
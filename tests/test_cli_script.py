@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from aiobsidian._exceptions import CLITimeoutError, CommandError
+from aiobsidian.cli import script as script_module
+from aiobsidian.cli.script import CLIScriptBatch, loads_eval_output
+
+PROPS = {"title": "Note", "tags": ["a"]}
+LINKS = [{"path": "notes/setup.md", "display": "setup"}]
+OUTLINE = [{"level": 1, "text": "Intro", "position": 0}]
+
+
+def test_script_factory(cli):
+    batch = cli.script()
+    assert isinstance(batch, CLIScriptBatch)
+    assert len(batch) == 0
+
+
+def test_compile_embeds_operations(cli):
+    batch = cli.script()
+    batch.read("a.md")
+    batch.links('quote".md')
+    (code,) = batch.compile()
+    assert '[["read", "a.md"], ["links", "quote\\".md"]]' in code
+    assert "cachedRead" in code
+
+
+async def test_run_single_eval(cli):
+    cli._execute.return_value = json.dumps(
+        [{"ok": "# A"}, {"ok": PROPS}, {"ok": LINKS}, {"ok": OUTLINE}]
+    )
+    batch = cli.script()
+    content = batch.read("a.md")
+    props = batch.properties("a.md")
+    links = batch.links("a.md")
+    outline = batch.outline("a.md")
+
+    results = await batch.run()
+
+    assert results == ["# A", PROPS, LINKS, OUTLINE]
+    assert content.result() == "# A"
+    assert props.result() == PROPS
+    assert links.result() == LINKS
+    assert outline.result() == OUTLINE
+    cli._execute.assert_awaited_once()
+    args, kwargs = cli._execute.await_args
+    assert args == ("eval",)
+    assert "code" in kwargs["params"]
+
+
+async def test_run_decodes_with_json_backend(cli):
+    cli._loads = MagicMock(side_effect=json.loads)
+    cli._execute.return_value = "=> " + json.dumps(json.dumps([{"ok": "# A"}]))
+    batch = cli.script()
+    batch.read("a.md")
+    assert await batch.run() == ["# A"]
+    assert cli._loads.call_count == 2
+
+
+async def test_run_item_error(cli):
+    cli._execute.return_value = json.dumps(
+        [{"ok": "# A"}, {"error": "File not found: missing.md"}]
+    )
+    batch = cli.script()
+    batch.read("a.md")
+    missing = batch.properties("missing.md")
+
+    results = await batch.run()
+
+    assert results[0] == "# A"
+    assert isinstance(results[1], CommandError)
+    assert results[1].command == "properties"
+    with pytest.raises(CommandError, match="File not found"):
+        missing.result()
+
+
+async def test_run_eval_failure(cli):
+    cli._execute.side_effect = CLITimeoutError("eval", 30.0)
+    batch = cli.script()
+    op = batch.read("a.md")
+    results = await batch.run()
+    assert isinstance(results[0], CLITimeoutError)
+    with pytest.raises(CLITimeoutError):
+        op.result()
+
+
+async def test_run_empty(cli):
+    assert await cli.script().run() == []
+    cli._execute.assert_not_awaited()
+
+
+def test_result_before_run(cli):
+    op = cli.script().read("a.md")
+    assert not op.done()
+    with pytest.raises(RuntimeError):
+        op.result()
+
+
+async def test_large_batch_is_split(cli, monkeypatch):
+    monkeypatch.setattr(script_module, "MAX_SCRIPT_LENGTH", 2000)
+
+    async def execute(command, **kwargs):
+        ops = json.loads(
+            kwargs["params"]["code"].split("const ops = ")[1].split(";")[0]
+        )
+        return json.dumps([{"ok": path} for _, path in ops])
+
+    cli._execute.side_effect = execute
+    batch = cli.script()
+    paths = [f"notes/note-{i:03}.md" for i in range(100)]
+    for path in paths:
+        batch.read(path)
+
+    assert len(batch.compile()) > 1
+    assert await batch.run() == paths
+
+
+def test_loads_eval_output():
+    assert loads_eval_output('=> "[1, 2]"') == [1, 2]
+    assert loads_eval_output("[1, 2]\n") == [1, 2]
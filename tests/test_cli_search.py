@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 
+from aiobsidian.models.records import SearchHitRecord
+
 
 async def test_open(cli):
     cli._execute.return_value = ""
@@ -13,7 +15,7 @@ async def test_query(cli):
     results = [{"file": "note.md", "score": 1.0}]
     cli._execute.return_value = json.dumps(results)
     result = await cli.search.query("test query")
-    assert result == results
+    assert [hit.to_dict() for hit in result] == results
     cli._execute.assert_awaited_once_with(
         "search", params={"query": "test query"}, flags=None
     )
@@ -29,7 +31,7 @@ async def test_query_with_path(cli):
     results = [{"file": "notes/a.md", "score": 0.8}]
     cli._execute.return_value = json.dumps(results)
     result = await cli.search.query("test", path="notes")
-    assert result == results
+    assert [hit.to_dict() for hit in result] == results
     cli._execute.assert_awaited_once_with(
         "search", params={"query": "test", "path": "notes"}, flags=None
     )
@@ -39,7 +41,7 @@ async def test_query_with_limit(cli):
     results = [{"file": "note.md", "score": 1.0}]
     cli._execute.return_value = json.dumps(results)
     result = await cli.search.query("test", limit=5)
-    assert result == results
+    assert [hit.to_dict() for hit in result] == results
     cli._execute.assert_awaited_once_with(
         "search", params={"query": "test", "limit": "5"}, flags=None
     )
@@ -49,7 +51,7 @@ async def test_query_case_sensitive(cli):
     results = [{"file": "note.md", "score": 1.0}]
     cli._execute.return_value = json.dumps(results)
     result = await cli.search.query("Test", case=True)
-    assert result == results
+    assert [hit.to_dict() for hit in result] == results
     cli._execute.assert_awaited_once_with(
         "search", params={"query": "Test"}, flags=["--case"]
     )
@@ -59,7 +61,7 @@ async def test_query_with_matches(cli):
     results = [{"file": "note.md", "score": 1.0, "matches": []}]
     cli._execute.return_value = json.dumps(results)
     result = await cli.search.query("test", matches=True)
-    assert result == results
+    assert [hit.to_dict() for hit in result] == results
     cli._execute.assert_awaited_once_with(
         "search", params={"query": "test"}, flags=["--matches"]
     )
@@ -71,7 +73,7 @@ async def test_query_all_params(cli):
     result = await cli.search.query(
         "test", path="notes", limit=10, case=True, matches=True
     )
-    assert result == results
+    assert [hit.to_dict() for hit in result] == results
     cli._execute.assert_awaited_once_with(
         "search",
         params={"query": "test", "path": "notes", "limit": "10"},
@@ -83,7 +85,7 @@ async def test_context(cli):
     results = [{"file": "note.md", "line": 5, "context": ["line4", "match", "line6"]}]
     cli._execute.return_value = json.dumps(results)
     result = await cli.search.context("test query")
-    assert result == results
+    assert [hit.to_dict() for hit in result] == results
     cli._execute.assert_awaited_once_with(
         "search:context", params={"query": "test query"}, flags=None
     )
@@ -93,7 +95,7 @@ async def test_context_with_lines(cli):
     results = [{"file": "note.md", "line": 5, "context": ["match"]}]
     cli._execute.return_value = json.dumps(results)
     result = await cli.search.context("test query", lines=3)
-    assert result == results
+    assert [hit.to_dict() for hit in result] == results
     cli._execute.assert_awaited_once_with(
         "search:context", params={"query": "test query", "lines": "3"}, flags=None
     )
@@ -103,7 +105,7 @@ async def test_context_with_path(cli):
     results = [{"file": "notes/a.md", "line": 1, "context": ["match"]}]
     cli._execute.return_value = json.dumps(results)
     result = await cli.search.context("test", path="notes")
-    assert result == results
+    assert [hit.to_dict() for hit in result] == results
     cli._execute.assert_awaited_once_with(
         "search:context",
         params={"query": "test", "path": "notes"},
@@ -115,7 +117,7 @@ async def test_context_with_limit(cli):
     results = [{"file": "note.md", "line": 1, "context": ["match"]}]
     cli._execute.return_value = json.dumps(results)
     result = await cli.search.context("test", limit=5)
-    assert result == results
+    assert [hit.to_dict() for hit in result] == results
     cli._execute.assert_awaited_once_with(
         "search:context",
         params={"query": "test", "limit": "5"},
@@ -127,7 +129,7 @@ async def test_context_case_sensitive(cli):
     results = [{"file": "note.md", "line": 1, "context": ["match"]}]
     cli._execute.return_value = json.dumps(results)
     result = await cli.search.context("Test", case=True)
-    assert result == results
+    assert [hit.to_dict() for hit in result] == results
     cli._execute.assert_awaited_once_with(
         "search:context", params={"query": "Test"}, flags=["--case"]
     )
@@ -139,9 +141,36 @@ async def test_context_all_params(cli):
     result = await cli.search.context(
         "test", lines=2, path="notes", limit=10, case=True
     )
-    assert result == results
+    assert [hit.to_dict() for hit in result] == results
     cli._execute.assert_awaited_once_with(
         "search:context",
         params={"query": "test", "lines": "2", "path": "notes", "limit": "10"},
         flags=["--case"],
     )
+
+
+async def test_iter_query(cli):
+    results = [{"file": "a.md", "score": 1.0}, {"file": "b.md", "score": 0.5}]
+    cli._iter_json.items = results
+    items = [item async for item in cli.search.iter_query("test", limit=2)]
+    assert items == [
+        SearchHitRecord(file="a.md", score=1.0),
+        SearchHitRecord(file="b.md", score=0.5),
+    ]
+    cli._iter_json.assert_called_once_with(
+        "search", params={"query": "test", "limit": "2"}, flags=None
+    )
+
+
+async def test_query_records(cli):
+    results = [{"file": "note.md", "score": 1.0, "matches": [[0, 4]]}]
+    cli._execute.return_value = json.dumps(results)
+    result = await cli.search.query("test", matches=True)
+    assert result == [SearchHitRecord(file="note.md", score=1.0, matches=[[0, 4]])]
+
+
+async def test_query_raw(cli):
+    results = [{"file": "note.md", "score": 1.0}]
+    cli._execute.return_value = json.dumps(results)
+    result = await cli.search.query("test", raw=True)
+    assert result == results
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian._exceptions import CommandError
+from aiobsidian.cli.snapshot import _EvalArrayParser, build_script
+from aiobsidian.models.records import NoteRecord
+
+ROWS = [
+    ["notes/a.md", 1, 2, 10, {"status": "active"}, ["python"], ["notes/b.md"]],
+    ["notes/b.md", 3, 4, 20, None, [], []],
+    ["projects/c.md", 5, 6, 30, {}, ["work", "project/alpha"], ["Missing"]],
+]
+
+
+@pytest.fixture()
+def fake_binary(make_binary):
+    """Stand-in `obsidian` executable that evaluates the snapshot prefix."""
+    return make_binary(
+        f"""
+        import json, re, sys
+        rows = {ROWS!r}
+        args = dict(a.split("=", 1) for a in sys.argv[2:] if "=" in a)
+        if sys.argv[1] != "eval" or args.get("vault") != "TestVault":
+            sys.stderr.write("unexpected command")
+            sys.exit(2)
+        prefix = json.loads(re.search(r"const prefix = (.*);", args["code"])[1])
+        rows = [r for r in rows if r[0].startswith(prefix)]
+        print(json.dumps(json.dumps(rows)))
+        """
+    )
+
+
+async def test_snapshot(fake_binary):
+    cli = ObsidianCLI("TestVault", binary=fake_binary)
+    records = [record async for record in cli.snapshot()]
+
+    assert [r.path for r in records] == ["notes/a.md", "notes/b.md", "projects/c.md"]
+    assert records[0] == NoteRecord(
+        "notes/a.md", 1, 2, 10, {"status": "active"}, ("python",), ("notes/b.md",)
+    )
+    assert records[1].frontmatter is None
+    assert records[2].frontmatter is None
+    assert records[2].tags == ("work", "project/alpha")
+
+
+async def test_snapshot_prefix(fake_binary):
+    cli = ObsidianCLI("TestVault", binary=fake_binary)
+    records = [record async for record in cli.snapshot("projects/")]
+    assert [r.path for r in records] == ["projects/c.md"]
+
+
+async def test_snapshot_command_error(fake_binary):
+    cli = ObsidianCLI("OtherVault", binary=fake_binary)
+    with pytest.raises(CommandError) as exc_info:
+        [record async for record in cli.snapshot()]
+    assert exc_info.value.exit_code == 2
+
+
+async def test_snapshot_streams_rows(make_binary, tmp_path):
+    marker = tmp_path / "first-row-seen"
+    binary = make_binary(
+        f"""
+        import json, os, sys, time
+        text = json.dumps(json.dumps({ROWS!r}))
+        half = text.rindex("notes/b.md") - 5  # just after the first row
+        sys.stdout.write("=> " + text[:half])
+        sys.stdout.flush()
+        deadline = time.monotonic() + 5
+        while not os.path.exists({str(marker)!r}):
+            if time.monotonic() > deadline:
+                sys.exit("first row was not streamed")
+            time.sleep(0.01)
+        sys.stdout.write(text[half:] + "\\n")
+        """
+    )
+    cli = ObsidianCLI("TestVault", binary=binary)
+    paths = []
+    async for record in cli.snapshot():
+        paths.append(record.path)
+        marker.touch()
+    assert paths == ["notes/a.md", "notes/b.md", "projects/c.md"]
+
+
+@pytest.mark.parametrize("quoted", [True, False])
+def test_eval_array_parser_chunks(quoted):
+    rows = [['a"b\\c\n', "caf\u00e9 \U0001f600"], {"x": [1.5, None]}, []]
+    text = json.dumps(rows)
+    output = ("=> " + json.dumps(text) if quoted else text) + "\n"
+    parser = _EvalArrayParser()
+    items = []
+    for byte in output.encode():
+        items += parser.feed(bytes([byte]))
+    assert items + parser.close() == rows
+
+
+def test_eval_array_parser_errors():
+    parser = _EvalArrayParser()
+    parser.feed(b'=> "[1, 2')
+    with pytest.raises(ValueError, match="Unterminated"):
+        parser.close()
+    with pytest.raises(ValueError, match="after eval output"):
+        _EvalArrayParser().feed(b'"[]" extra')
+
+
+def test_build_script_escapes_prefix():
+    assert 'const prefix = "a\\"b";' in build_script('a"b')
+
+
+def test_record_is_compact():
+    record = NoteRecord.from_row(ROWS[0])
+    assert not hasattr(record, "__dict__")
+    assert json.dumps(record.frontmatter) == '{"status": "active"}'
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 
+from aiobsidian.models.records import FileRecord, TagRecord
+
 TAGS_LIST = [
     {"name": "python", "count": 15},
     {"name": "obsidian", "count": 8},
@@ -12,39 +14,44 @@ TAG_NOTES = [
     {"path": "notes/setup.md", "name": "setup"},
 ]
 
+TAG_RECORDS = [TagRecord(name="python", count=15), TagRecord(name="obsidian", count=8)]
+
 
 async def test_list(cli):
     cli._execute.return_value = json.dumps(TAGS_LIST)
     result = await cli.tags.list()
-    assert result == TAGS_LIST
+    assert result == TAG_RECORDS
     cli._execute.assert_awaited_once_with("tags", params=None, flags=None)
 
 
 async def test_list_sorted(cli):
     cli._execute.return_value = json.dumps(TAGS_LIST)
     result = await cli.tags.list(sort="count")
-    assert result == TAGS_LIST
+    assert result == TAG_RECORDS
     cli._execute.assert_awaited_once_with("tags", params={"sort": "count"}, flags=None)
 
 
 async def test_list_with_path(cli):
     cli._execute.return_value = json.dumps(TAGS_LIST)
     result = await cli.tags.list(path="notes")
-    assert result == TAGS_LIST
+    assert result == TAG_RECORDS
     cli._execute.assert_awaited_once_with("tags", params={"path": "notes"}, flags=None)
 
 
 async def test_list_with_counts(cli):
     cli._execute.return_value = json.dumps(TAGS_LIST)
     result = await cli.tags.list(counts=True)
-    assert result == TAGS_LIST
+    assert result == TAG_RECORDS
     cli._execute.assert_awaited_once_with("tags", params=None, flags=["--counts"])
 
 
 async def test_get(cli):
     cli._execute.return_value = json.dumps(TAG_NOTES)
     result = await cli.tags.get("python")
-    assert result == TAG_NOTES
+    assert result == [
+        FileRecord(path="projects/cli.md", name="cli"),
+        FileRecord(path="notes/setup.md", name="setup"),
+    ]
     cli._execute.assert_awaited_once_with("tag", params={"tagname": "python"})
 
 
@@ -54,3 +61,16 @@ async def test_rename(cli):
     cli._execute.assert_awaited_once_with(
         "tags:rename", params={"old": "old-tag", "new": "new-tag"}
     )
+
+
+async def test_iter_list(cli):
+    cli._iter_json.items = TAGS_LIST
+    result = [tag async for tag in cli.tags.iter_list(counts=True)]
+    assert result == TAG_RECORDS
+    cli._iter_json.assert_called_once_with("tags", params=None, flags=["--counts"])
+
+
+async def test_list_raw(cli):
+    cli._execute.return_value = json.dumps(TAGS_LIST)
+    result = await cli.tags.list(raw=True)
+    assert result == TAGS_LIST
@@ -2,49 +2,62 @@ from __future__ import annotations
 
 import json
 
+from aiobsidian.models.records import TaskRecord
+
 TASKS = [
     {"id": "1", "content": "Buy milk", "completed": False},
     {"id": "2", "content": "Write docs", "completed": True},
 ]
 
+TASK_RECORDS = [
+    TaskRecord(id="1", content="Buy milk", completed=False),
+    TaskRecord(id="2", content="Write docs", completed=True),
+]
+
 
 async def test_list(cli):
     cli._execute.return_value = json.dumps(TASKS)
     result = await cli.tasks.list()
-    assert result == TASKS
+    assert result == TASK_RECORDS
     cli._execute.assert_awaited_once_with("tasks", params=None, flags=None)
 
 
 async def test_list_with_path(cli):
     cli._execute.return_value = json.dumps(TASKS)
     result = await cli.tasks.list(path="notes")
-    assert result == TASKS
+    assert result == TASK_RECORDS
     cli._execute.assert_awaited_once_with("tasks", params={"path": "notes"}, flags=None)
 
 
 async def test_list_daily(cli):
     cli._execute.return_value = json.dumps(TASKS)
     result = await cli.tasks.list(daily=True)
-    assert result == TASKS
+    assert result == TASK_RECORDS
     cli._execute.assert_awaited_once_with("tasks", params=None, flags=["--daily"])
 
 
 async def test_list_done(cli):
     cli._execute.return_value = json.dumps(TASKS)
     result = await cli.tasks.list(done=True)
-    assert result == TASKS
+    assert result == TASK_RECORDS
     cli._execute.assert_awaited_once_with("tasks", params=None, flags=["--done"])
 
 
 async def test_list_all_flags(cli):
     cli._execute.return_value = json.dumps(TASKS)
     result = await cli.tasks.list(path="notes", daily=True, done=True)
-    assert result == TASKS
+    assert result == TASK_RECORDS
     cli._execute.assert_awaited_once_with(
         "tasks", params={"path": "notes"}, flags=["--daily", "--done"]
     )
 
 
+async def test_list_raw(cli):
+    cli._execute.return_value = json.dumps(TASKS)
+    result = await cli.tasks.list(raw=True)
+    assert result == TASKS
+
+
 async def test_toggle(cli):
     cli._execute.return_value = ""
     await cli.tasks.toggle("todo.md", 5)
@@ -71,3 +84,18 @@ async def test_complete(cli):
     cli._execute.return_value = ""
     await cli.tasks.complete("1")
     cli._execute.assert_awaited_once_with("task:complete", params={"task": "1"})
+
+
+async def test_iter(cli):
+    cli._iter_json.items = TASKS
+    result = [task async for task in cli.tasks.iter(path="notes", done=True)]
+    assert result == TASK_RECORDS
+    cli._iter_json.assert_called_once_with(
+        "tasks", params={"path": "notes"}, flags=["--done"]
+    )
+
+
+async def test_iter_raw(cli):
+    cli._iter_json.items = TASKS
+    result = [task async for task in cli.tasks.iter(raw=True)]
+    assert result == TASKS
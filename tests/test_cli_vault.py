@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 
+from aiobsidian._exceptions import CommandError
+
 
 async def test_open(cli):
     cli._execute.return_value = ""
@@ -223,3 +225,17 @@ async def test_wordcount(cli):
     result = await cli.vault.wordcount("note.md")
     assert result == counts
     cli._execute.assert_awaited_once_with("wordcount", params={"file": "note.md"})
+
+
+async def test_read_many(cli):
+    cli._execute.side_effect = ["# A", CommandError("read", 1, "not found")]
+    result = await cli.vault.read_many(["a.md", "missing.md"])
+    assert result[0] == "# A"
+    assert isinstance(result[1], CommandError)
+
+
+async def test_iter_list(cli):
+    cli._iter_json.items = ["a.md", "b.md"]
+    result = [path async for path in cli.vault.iter_list(ext="md")]
+    assert result == ["a.md", "b.md"]
+    cli._iter_json.assert_called_once_with("files", params={"ext": "md"})
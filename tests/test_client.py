@@ -1,3 +1,5 @@
+import asyncio
+
 import httpx
 import pytest
 import respx
@@ -109,3 +111,24 @@ async def test_repr_does_not_contain_api_key():
     assert "9999" in r
     assert "http" in r
     await client.aclose()
+
+
+async def test_identical_gets_are_coalesced(mock_api, client):
+    release = asyncio.Event()
+
+    async def respond(request):
+        await release.wait()
+        return httpx.Response(200, text="# Index")
+
+    route = mock_api.get("/vault/Index.md").mock(side_effect=respond)
+    reads = [asyncio.create_task(client.vault.get("Index.md")) for _ in range(10)]
+    await asyncio.sleep(0.01)
+    release.set()
+    assert await asyncio.gather(*reads) == ["# Index"] * 10
+    assert route.call_count == 1
+
+
+async def test_writes_are_not_coalesced(mock_api, client):
+    route = mock_api.put("/vault/a.md").respond(204)
+    await asyncio.gather(*(client.vault.update("a.md", "x") for _ in range(3)))
+    assert route.call_count == 3
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import datetime
+import shutil
+
+import pytest
+
+from aiobsidian._client import ObsidianClient
+from aiobsidian._exceptions import APIError, AuthenticationError, NotFoundError
+from aiobsidian._types import ContentType, PatchOperation, Period, TargetType
+from aiobsidian.testing import FakeRESTServer
+
+NOTE = """\
+---
+tags: [project]
+status: draft
+---
+# Plan
+
+Intro line ^intro
+
+## Tasks
+
+- [ ] write tests
+
+## Notes
+
+Some #idea here.
+"""
+
+
+@pytest.fixture
+def vault(tmp_path):
+    root = tmp_path / "vault"
+    (root / "Projects").mkdir(parents=True)
+    (root / ".obsidian").mkdir()
+    (root / "Projects" / "plan.md").write_text(NOTE)
+    (root / "readme.md").write_text("Welcome to the vault\n")
+    return root
+
+
+@pytest.fixture
+def server(vault):
+    with FakeRESTServer(vault) as server:
+        yield server
+
+
+@pytest.fixture
+async def client(server):
+    async with server.client() as client:
+        yield client
+
+
+async def test_status_without_auth(server):
+    async with server.client() as client:
+        status = await client.system.status()
+    assert status.status == "OK"
+    assert status.authenticated is True
+
+    wrong = ObsidianClient("wrong", host=server.host, port=server.port, scheme="http")
+    async with wrong:
+        assert (await wrong.system.status()).authenticated is False
+        with pytest.raises(AuthenticationError):
+            await wrong.vault.get("readme.md")
+
+
+async def test_vault_crud(client, vault):
+    assert await client.vault.get("readme.md") == "Welcome to the vault\n"
+
+    await client.vault.update("New Folder/new note.md", "# New\n")
+    await client.vault.append("New Folder/new note.md", "more\n")
+    assert (vault / "New Folder" / "new note.md").read_text() == "# New\nmore\n"
+
+    listing = await client.vault.list()
+    assert listing.files == ["New Folder/", "Projects/", "readme.md"]
+    assert (await client.vault.list("Projects")).files == ["plan.md"]
+
+    await client.vault.delete("New Folder/new note.md")
+    with pytest.raises(NotFoundError):
+        await client.vault.get("New Folder/new note.md")
+    with pytest.raises(NotFoundError):
+        await client.vault.append("missing.md", "x")
+
+
+async def test_note_json_and_document_map(client):
+    note = await client.vault.get(
+        "Projects/plan.md", content_type=ContentType.NOTE_JSON
+    )
+    assert note.frontmatter == {"tags": ["project"], "status": "draft"}
+    assert note.tags == ["project", "idea"]
+    assert note.stat.size == len(NOTE)
+
+    document = await client.vault.get(
+        "Projects/plan.md", content_type=ContentType.DOCUMENT_MAP
+    )
+    assert document.headings == ["Plan", "Plan::Tasks", "Plan::Notes"]
+    assert document.blocks == ["intro"]
+    assert document.frontmatter_fields == ["tags", "status"]
+
+
+async def test_patch_heading_block_frontmatter(client, vault):
+    path = "Projects/plan.md"
+    await client.vault.patch(
+        path,
+        "- [ ] ship it",
+        operation=PatchOperation.APPEND,
+        target_type=TargetType.HEADING,
+        target="Plan::Tasks",
+    )
+    await client.vault.patch(
+        path,
+        "New intro",
+        operation=PatchOperation.REPLACE,
+        target_type=TargetType.BLOCK,
+        target="intro",
+    )
+    await client.vault.patch(
+        path,
+        '"final"',
+        operation=PatchOperation.REPLACE,
+        target_type=TargetType.FRONTMATTER,
+        target="status",
+    )
+    text = (vault / path).read_text()
+    assert "- [ ] write tests\n- [ ] ship it\n\n## Notes" in text
+    assert "New intro ^intro\n" in text
+    assert "status: final\n" in text
+
+    with pytest.raises(APIError) as exc_info:
+        await client.vault.patch(
+            path,
+            "x",
+            operation=PatchOperation.APPEND,
+            target_type=TargetType.HEADING,
+            target="Missing",
+        )
+    assert exc_info.value.status_code == 400
+
+
+async def test_open_and_active(client):
+    with pytest.raises(NotFoundError):
+        await client.active.get()
+    await client.open.open("readme.md")
+    await client.active.append("Bye\n")
+    assert await client.active.get() == "Welcome to the vault\nBye\n"
+
+
+async def test_periodic(client, vault):
+    date = datetime.date(2024, 3, 5)
+    with pytest.raises(NotFoundError):
+        await client.periodic.get(Period.DAILY, date=date)
+    await client.periodic.append(Period.DAILY, "- standup\n", date=date)
+    await client.periodic.update(Period.WEEKLY, "# Week\n", date=date)
+
+    assert (vault / "Daily" / "2024-03-05.md").read_text() == "- standup\n"
+    assert (vault / "Weekly" / "2024-W10.md").exists()
+    assert await client.periodic.get(Period.DAILY, date=date) == "- standup\n"
+
+
+async def test_search(client):
+    results = await client.search.simple("welcome", context_length=3)
+    assert [r.filename for r in results] == ["readme.md"]
+    assert results[0].matches[0].match.start == 0
+    assert results[0].matches[0].context == "Welcome to"
+
+    results = await client.search.jsonlogic(
+        {
+            "and": [
+                {"glob": ["Projects/*", {"var": "path"}]},
+                {"in": ["project", {"var": "tags"}]},
+            ]
+        }
+    )
+    assert [r.filename for r in results] == ["Projects/plan.md"]
+
+    with pytest.raises(APIError):
+        await client.search.dataview("LIST")
+
+
+async def test_commands(client):
+    commands = await client.commands.list()
+    assert "editor:save-file" in [c.id for c in commands]
+    await client.commands.execute("editor:save-file")
+    with pytest.raises(NotFoundError):
+        await client.commands.execute("nope:nope")
+
+
+async def test_connection_reuse_and_stats(server, client):
+    for _ in range(5):
+        await client.vault.get("readme.md")
+    stats = server.stats()
+    assert stats.connections == 1
+    assert stats.requests == 5
+    assert stats.requests_per_connection == 5
+    assert stats.routes == {"GET /vault/{path}": 5}
+
+    server.reset_stats()
+    assert server.stats().requests == 0
+
+
+async def test_route_latency(vault):
+    with FakeRESTServer(vault, route_latency={"PUT /vault/{path}": 0.05}) as server:
+        async with server.client(metrics=True) as client:
+            await client.vault.get("readme.md")
+            await client.vault.update("readme.md", "x")
+            metrics = client.metrics()
+    assert metrics.get("PUT /vault/{path}", "rest").latency.min >= 0.05
+    assert metrics.get("GET /vault/{path}", "rest").latency.max < 0.05
+
+
+@pytest.mark.skipif(shutil.which("openssl") is None, reason="needs openssl")
+async def test_tls(vault):
+    with FakeRESTServer(vault, tls=True) as server:
+        assert server.base_url.startswith("https://")
+        async with server.client() as client:
+            assert await client.vault.get("readme.md") == "Welcome to the vault\n"
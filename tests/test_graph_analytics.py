@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from aiobsidian._cli import ObsidianCLI  # noqa: E402
+from aiobsidian.index import GraphAnalytics, LinkGraph  # noqa: E402
+from aiobsidian.testing import generate_vault  # noqa: E402
+
+LINKS = {
+    "a.md": ["b.md", "c.md"],
+    "b.md": ["c.md"],
+    "c.md": ["a.md", "missing"],
+    "d.md": ["c.md", "e.md", "e.md"],
+    "e.md": [],
+    "f.md": ["g.md"],
+    "g.md": ["f.md"],
+    "h.md": [],
+}
+
+
+@pytest.fixture
+def graph():
+    return GraphAnalytics.from_links(LINKS)
+
+
+def reference_pagerank(links, damping=0.85, iterations=200):
+    """Textbook power iteration on dicts."""
+    nodes = list(links)
+    edges = {n: list(dict.fromkeys(t for t in links[n] if t in links)) for n in nodes}
+    rank = dict.fromkeys(nodes, 1 / len(nodes))
+    for _ in range(iterations):
+        dangling = sum(rank[n] for n in nodes if not edges[n])
+        updated = dict.fromkeys(nodes, (1 - damping + damping * dangling) / len(nodes))
+        for n in nodes:
+            for t in edges[n]:
+                updated[t] += damping * rank[n] / len(edges[n])
+        rank = updated
+    return rank
+
+
+def test_csr_from_links(graph):
+    offsets, targets = graph.csr()
+    assert len(graph) == 8 and graph.edges == 8  # repeats and "missing" dropped
+    assert offsets.tolist() == [0, 2, 3, 4, 6, 6, 7, 8, 8]
+    assert targets.tolist() == [1, 2, 2, 0, 2, 4, 6, 5]
+    offsets, sources = graph.csr(reverse=True)
+    c = graph.paths.index("c.md")
+    assert sorted(graph.paths[n] for n in sources[offsets[c] : offsets[c + 1]]) == [
+        "a.md",
+        "b.md",
+        "d.md",
+    ]
+    with pytest.raises(ValueError, match="CSR"):
+        GraphAnalytics(["a.md"], [0, 1], [1])
+
+
+def test_pagerank_matches_reference(graph):
+    ranks = graph.pagerank(tol=1e-12)
+    expected = reference_pagerank(LINKS)
+    assert list(ranks) == sorted(expected, key=lambda n: -expected[n])
+    assert ranks == pytest.approx(expected, abs=1e-9)
+    assert sum(ranks.values()) == pytest.approx(1.0)
+
+    personal = graph.pagerank(personalization={"f": 1.0})
+    assert set(list(personal)[:2]) == {"f.md", "g.md"}
+    assert personal["a.md"] == 0.0
+    with pytest.raises(ValueError, match="positive"):
+        graph.pagerank(personalization={"a.md": 0})
+
+
+def test_random_graph_pagerank():
+    rng = random.Random(7)
+    nodes = [f"n{i}.md" for i in range(300)]
+    links = {n: rng.sample(nodes, rng.randrange(0, 6)) for n in nodes}
+    ranks = GraphAnalytics.from_links(links).pagerank(tol=1e-13, max_iter=500)
+    assert ranks == pytest.approx(reference_pagerank(links, iterations=500), abs=1e-9)
+
+
+def test_random_graph_shortest_paths():
+    rng = random.Random(3)
+    nodes = [f"n{i}.md" for i in range(200)]
+    links = {n: rng.sample(nodes, rng.randrange(0, 3)) for n in nodes}
+    graph = GraphAnalytics.from_links(links)
+    for _ in range(50):
+        source, target = rng.sample(nodes, 2)
+        distance = {source: 0, **graph.neighbourhood(source, len(nodes))}.get(target)
+        path = graph.shortest_path(source, target)
+        if distance is None:
+            assert path is None
+            continue
+        assert path is not None and len(path) == distance + 1
+        assert path[0] == source and path[-1] == target
+        assert all(b in links[a] for a, b in zip(path, path[1:], strict=False))
+
+
+def test_components(graph):
+    assert graph.components() == [
+        ["a.md", "b.md", "c.md", "d.md", "e.md"],
+        ["f.md", "g.md"],
+        ["h.md"],
+    ]
+    assert graph.strongly_connected() == [
+        ["a.md", "b.md", "c.md"],
+        ["f.md", "g.md"],
+        ["d.md"],
+        ["e.md"],
+        ["h.md"],
+    ]
+
+
+def test_long_chain_does_not_recurse():
+    count = 20_000
+    links = {f"{i}.md": [f"{(i + 1) % count}.md"] for i in range(count)}
+    graph = GraphAnalytics.from_links(links)
+    assert [len(c) for c in graph.strongly_connected()] == [count]
+    assert len(graph.shortest_path("0", f"{count - 1}") or []) == count
+
+
+def test_neighbourhood_and_shortest_path(graph):
+    assert graph.neighbourhood("d") == {"c.md": 1, "e.md": 1}
+    assert graph.neighbourhood("d", 2) == {"c.md": 1, "e.md": 1, "a.md": 2}
+    assert graph.neighbourhood("c", direction="in") == {"a.md": 1, "b.md": 1, "d.md": 1}
+    assert graph.neighbourhood("e.md", 3, direction="both") == {
+        "d.md": 1,
+        "c.md": 2,
+        "a.md": 3,
+        "b.md": 3,
+    }
+    assert graph.shortest_path("d.md", "b.md") == ["d.md", "c.md", "a.md", "b.md"]
+    assert graph.shortest_path("b.md", "d.md") is None
+    assert graph.shortest_path("b.md", "d.md", direction="both") == [
+        "b.md",
+        "c.md",
+        "d.md",
+    ]
+    assert graph.shortest_path("a.md", "a.md") == ["a.md"]
+    with pytest.raises(KeyError):
+        graph.shortest_path("a.md", "nowhere")
+
+
+def test_from_link_graph_skips_removed_notes(vault):
+    links = LinkGraph(vault)
+    links.build()
+    for path in ("folder-00/note-00003.md", "folder-01/note-00004.md"):
+        (vault / path).unlink()
+        links.remove(path)
+    graph = GraphAnalytics.from_link_graph(links)
+    live = []
+    for node in range(links.size):
+        try:
+            live.append(links.path(node))
+        except KeyError:
+            pass
+    assert len(live) < links.size and graph.paths == live
+    reference = GraphAnalytics.from_links(
+        {path: [link["path"] for link in links.outgoing(path)] for path in live}
+    )
+    assert graph.csr()[0].tolist() == reference.csr()[0].tolist()
+    assert graph.csr()[1].tolist() == reference.csr()[1].tolist()
+
+
+async def test_cli_analytics(binary, tmp_path):
+    # Without a link graph, every note costs one `links` command.
+    generate_vault(tmp_path / "vaults" / "Small", notes=15, folders=2)
+    async with ObsidianCLI("Small", binary=binary) as cli:
+        fetched = await cli.links.analytics()
+    async with ObsidianCLI("Small", binary=binary, link_graph=True) as cli:
+        local = await cli.links.analytics()
+    assert len(fetched) == len(local) == 16
+    assert sorted(fetched.paths) == sorted(local.paths)
+    assert fetched.edges == local.edges > 0
+    assert fetched.pagerank() == pytest.approx(local.pagerank())
+    assert sorted(map(sorted, fetched.components())) == sorted(
+        map(sorted, local.components())
+    )
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from contextlib import aclosing
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian._exceptions import CommandError, NotFoundError
+from aiobsidian._hooks import CommandEvent, CommandHooks
+
+
+class Recorder(CommandHooks):
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, CommandEvent, BaseException | None]] = []
+
+    def on_start(self, event):
+        self.calls.append(("start", event, None))
+
+    def on_finish(self, event):
+        self.calls.append(("finish", event, None))
+
+    def on_error(self, event, error):
+        self.calls.append(("error", event, error))
+
+
+@pytest.fixture
+def fake_binary(make_binary):
+    return make_binary(
+        """
+        import sys
+        args = dict(a.split("=", 1) for a in sys.argv[2:] if "=" in a)
+        if sys.argv[1] == "read" and args.get("path") == "missing.md":
+            sys.stderr.write("File not found")
+            sys.exit(3)
+        sys.stdout.write("[" + ",".join(['"x"'] * 1000) + "]")
+        """
+    )
+
+
+async def test_cli_finish_event(fake_binary):
+    recorder = Recorder()
+    cli = ObsidianCLI("TestVault", binary=fake_binary, hooks=[recorder])
+    await cli.vault.list(folder="notes")
+
+    assert [kind for kind, _, _ in recorder.calls] == ["start", "finish"]
+    event = recorder.calls[1][1]
+    assert event.transport == "cli"
+    assert event.command == "files"
+    assert event.param_keys == ("folder",)
+    assert event.exit_code == 0
+    assert event.stdout_bytes == 4001
+    assert event.stderr_bytes == 0
+    assert event.queue_time is not None and event.queue_time >= 0
+    assert event.spawn_latency is not None and event.spawn_latency > 0
+    assert event.ttfb is not None and event.ttfb > 0
+    assert event.wall_time is not None
+    assert event.wall_time >= event.spawn_latency + event.ttfb
+
+
+async def test_cli_error_event(fake_binary):
+    recorder = Recorder()
+    cli = ObsidianCLI("TestVault", binary=fake_binary, hooks=[recorder])
+    with pytest.raises(CommandError):
+        await cli.vault.read("missing.md")
+
+    kind, event, error = recorder.calls[-1]
+    assert kind == "error"
+    assert isinstance(error, CommandError)
+    assert event.exit_code == 3
+    assert event.stderr_bytes == len("File not found")
+
+
+async def test_cli_stream_event(fake_binary):
+    recorder = Recorder()
+    cli = ObsidianCLI("TestVault", binary=fake_binary)
+    cli.add_hook(recorder)
+    items = [item async for item in cli.vault.iter_list()]
+
+    assert len(items) == 1000
+    kind, event, _ = recorder.calls[-1]
+    assert kind == "finish"
+    assert event.stdout_bytes == 4001
+    assert event.ttfb is not None
+
+
+async def test_cli_stream_closed_early(fake_binary):
+    recorder = Recorder()
+    cli = ObsidianCLI("TestVault", binary=fake_binary, hooks=[recorder])
+    async with aclosing(cli.vault.iter_list()) as items:
+        async for _ in items:
+            break
+    assert recorder.calls[-1][0] == "finish"
+
+
+async def test_hook_errors_do_not_break_commands(fake_binary, caplog):
+    class Broken(CommandHooks):
+        def on_finish(self, event):
+            raise RuntimeError("bug in hook")
+
+    recorder = Recorder()
+    cli = ObsidianCLI("TestVault", binary=fake_binary, hooks=[Broken(), recorder])
+    assert len(await cli.vault.list()) == 1000
+    assert "bug in hook" in caplog.text
+    assert recorder.calls[-1][0] == "finish"
+
+
+async def test_remove_hook(fake_binary):
+    recorder = Recorder()
+    cli = ObsidianCLI("TestVault", binary=fake_binary, hooks=[recorder])
+    cli.remove_hook(recorder)
+    await cli.vault.list()
+    assert recorder.calls == []
+    with pytest.raises(ValueError):
+        cli.remove_hook(recorder)
+
+
+async def test_rest_finish_event(mock_api, client):
+    recorder = Recorder()
+    client.add_hook(recorder)
+    mock_api.get("/vault/note.md").respond(200, text="# Note")
+    await client.vault.get("note.md")
+
+    kind, event, _ = recorder.calls[-1]
+    assert kind == "finish"
+    assert event.transport == "rest"
+    assert event.command == "GET"
+    assert event.path == "/vault/note.md"
+    assert event.route == "/vault/{path}"
+    assert event.status_code == 200
+    assert event.response_size == len("# Note")
+    assert event.ttfb is not None and event.wall_time is not None
+
+
+async def test_rest_error_event(mock_api, client):
+    recorder = Recorder()
+    client.add_hook(recorder)
+    mock_api.get("/vault/missing.md").respond(404, json={"message": "Not Found"})
+    with pytest.raises(NotFoundError):
+        await client.vault.get("missing.md")
+
+    kind, event, error = recorder.calls[-1]
+    assert kind == "error"
+    assert isinstance(error, NotFoundError)
+    assert event.status_code == 404
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import aiobsidian
+
+
+def _loaded_after(statement: str) -> set[str]:
+    script = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def test_import_is_lazy():
+    loaded = _loaded_after("import aiobsidian")
+    assert "aiobsidian._cli" not in loaded
+    assert "aiobsidian._client" not in loaded
+
+
+def test_cli_path_does_not_import_pydantic_or_httpx():
+    loaded = _loaded_after(
+        "from aiobsidian import ObsidianCLI, TaskRecord\n"
+        "cli = ObsidianCLI('Vault', binary=sys.executable)\n"
+        "cli.vault, cli.tasks, cli.search, cli.links, cli.script()"
+    )
+    assert "aiobsidian._cli" in loaded
+    assert not {name for name in loaded if name.startswith(("pydantic", "httpx"))}
+    assert "aiobsidian._metrics" not in loaded
+
+
+def test_model_access_imports_pydantic():
+    loaded = _loaded_after("from aiobsidian import NoteJson")
+    assert "pydantic" in loaded
+
+
+@pytest.mark.parametrize("name", aiobsidian.__all__)
+def test_all_exports_resolve(name):
+    value = getattr(aiobsidian, name)
+    assert getattr(value, "__name__", name) == name
+    assert name in dir(aiobsidian)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        aiobsidian.Missing
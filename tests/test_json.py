@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+import sys
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian._client import ObsidianClient
+from aiobsidian._json import get_loads
+
+
+def test_stdlib_backend():
+    loads = get_loads("json")
+    assert loads is json.loads
+    assert loads(b'{"path": "caf\xc3\xa9.md"}') == {"path": "café.md"}
+
+
+def test_orjson_backend():
+    pytest.importorskip("orjson")
+    loads = get_loads("orjson")
+    assert loads(b'[{"path": "a.md", "size": 1}]') == [{"path": "a.md", "size": 1}]
+    assert loads("[1, 2]") == [1, 2]
+
+
+def test_auto_prefers_installed_backend(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    assert get_loads("auto") is json.loads
+
+
+def test_missing_backend(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    with pytest.raises(ImportError, match="aiobsidian\\[speedups\\]"):
+        get_loads("orjson")
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        get_loads("simdjson")  # type: ignore[arg-type]
+
+
+def test_cli_json_backend():
+    cli = ObsidianCLI("TestVault", binary="/usr/bin/obsidian", json_backend="json")
+    assert cli._loads is json.loads
+
+
+async def test_client_json_backend():
+    async with ObsidianClient(api_key="test-key", json_backend="json") as client:
+        assert client._loads is json.loads
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from aiobsidian._jsonstream import JSONArrayParser
+
+DATA = [
+    {"path": "notes/ünïcode.md", "tags": ["a", "b"], "line": 12},
+    "plain string with , and ] inside",
+    12345,
+    -1.5e3,
+    None,
+    True,
+    [1, [2, 3]],
+]
+
+
+def parse(chunks: list[bytes]) -> list:
+    parser = JSONArrayParser()
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+    return items
+
+
+def test_single_chunk():
+    assert parse([json.dumps(DATA).encode()]) == DATA
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_split_chunks(size):
+    raw = json.dumps(DATA, ensure_ascii=False, indent=2).encode()
+    chunks = [raw[i : i + size] for i in range(0, len(raw), size)]
+    assert parse(chunks) == DATA
+
+
+def test_elements_emitted_early():
+    parser = JSONArrayParser()
+    assert parser.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+    assert parser.feed(b": 2}") == [{"b": 2}]
+    assert parser.feed(b"]") == []
+    assert parser.close() == []
+
+
+def test_trailing_number_waits_for_delimiter():
+    parser = JSONArrayParser()
+    assert parser.feed(b"[12") == []
+    assert parser.feed(b"3,4") == [123]
+    assert parser.feed(b"]") == [4]
+
+
+def test_empty_array():
+    assert parse([b"  [ ]\n"]) == []
+
+
+def test_not_an_array():
+    with pytest.raises(ValueError):
+        parse([b'{"a": 1}'])
+
+
+def test_truncated():
+    with pytest.raises(ValueError):
+        parse([b'[1, {"a":'])
+
+
+def test_trailing_garbage():
+    with pytest.raises(ValueError):
+        parse([b"[1] x"])
+
+
+def test_large_output_compacts_buffer():
+    items = [{"path": f"notes/{i}.md"} for i in range(20000)]
+    raw = json.dumps(items).encode()
+    chunks = [raw[i : i + 4096] for i in range(0, len(raw), 4096)]
+    assert parse(chunks) == items
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian._exceptions import CommandError
+from aiobsidian.index import LinkGraph
+from aiobsidian.models.records import LinkRecord
+
+
+@pytest.fixture
+def notes(tmp_path):
+    root = tmp_path / "Notes"
+    (root / "Projects").mkdir(parents=True)
+    (root / "Home.md").write_text(
+        "---\nlinks: [[Ignored]]\n---\n"
+        "See [[Plan|the plan]], [[Projects/Plan#Goals]] and [[Missing]].\n"
+        "Also [notes](Projects/Notes.md), [spec](<Projects/Spec%20v2.md>),\n"
+        "![diagram](img/flow.png), [site](https://example.com) and [[Home]]."
+    )
+    (root / "Projects" / "Plan.md").write_text("Back to [[Home]].")
+    (root / "Projects" / "Notes.md").write_text("[up](../Home.md)")
+    (root / "Projects" / "Spec v2.md").write_text("no links")
+    (root / "Lonely.md").write_text("[[Missing]] [[Missing]]")
+    return root
+
+
+def build(root):
+    graph = LinkGraph(root)
+    graph.build()
+    return graph
+
+
+def snapshot(graph):
+    """Every query, keyed by path so that node ids do not matter."""
+    paths = sorted(graph.path(node) for node in range(graph.size) if _live(graph, node))
+    return (
+        {path: graph.outgoing(path) for path in paths},
+        {path: graph.backlinks(path, counts=True) for path in paths},
+        graph.unresolved(),
+        graph.orphans(),
+        graph.deadends(),
+        {
+            (graph.path(node), graph.path(target))
+            for node in range(graph.size)
+            if _live(graph, node)
+            for target in _neighbours(graph, node)
+        },
+    )
+
+
+def _live(graph, node):
+    try:
+        graph.path(node)
+    except KeyError:
+        return False
+    return True
+
+
+def _neighbours(graph, node, reverse=False):
+    offsets, targets = graph.adjacency(reverse=reverse)
+    return targets[offsets[node] : offsets[node + 1]]
+
+
+def test_wikilinks_and_markdown_links(notes):
+    graph = build(notes)
+    assert graph.outgoing("Home") == [
+        {"path": "Projects/Plan.md", "display": "the plan"},
+        {"path": "Projects/Plan.md", "display": "Projects/Plan"},
+        {"path": "Missing", "display": "Missing"},
+        {"path": "Projects/Notes.md", "display": "notes"},
+        {"path": "Projects/Spec v2.md", "display": "spec"},
+        {"path": "img/flow.png", "display": "diagram"},
+        {"path": "Home.md", "display": "Home"},
+    ]
+    assert graph.backlinks("Projects/Plan.md", counts=True) == [
+        {"path": "Home.md", "display": "Home", "count": 2}
+    ]
+    assert graph.unresolved() == [
+        {"source": "Home.md", "target": "Missing"},
+        {"source": "Lonely.md", "target": "Missing"},
+        {"source": "Lonely.md", "target": "Missing"},
+    ]
+    assert graph.orphans() == [{"path": "Lonely.md", "name": "Lonely"}]
+    assert graph.deadends() == [
+        {"path": "Lonely.md", "name": "Lonely"},
+        {"path": "Projects/Spec v2.md", "name": "Spec v2"},
+    ]
+    with pytest.raises(KeyError):
+        graph.outgoing("Nowhere")
+
+
+def test_adjacency_arrays(notes):
+    graph = build(notes)
+    home = graph.node("Home.md")
+    plan = graph.node("Plan")
+    assert sorted(graph.path(n) for n in _neighbours(graph, home)) == [
+        "Home.md",
+        "Projects/Notes.md",
+        "Projects/Plan.md",
+        "Projects/Spec v2.md",
+    ]
+    assert [graph.path(n) for n in _neighbours(graph, plan, reverse=True)] == [
+        "Home.md"
+    ]
+    offsets, targets = graph.adjacency()
+    assert len(offsets) == graph.size + 1 and offsets[-1] == len(targets)
+    assert graph.stats().edges == len(targets) == 6
+
+
+def test_incremental_updates_match_rebuild(notes):
+    graph = build(notes)
+    (notes / "Missing.md").write_text("Found [[Lonely]].")
+    graph.update("Missing.md")
+    assert graph.unresolved() == []
+    assert graph.orphans() == []
+    assert {"path": "Missing.md", "display": "Missing"} in graph.outgoing("Home")
+    assert snapshot(graph) == snapshot(build(notes))
+
+    (notes / "Projects" / "Plan.md").unlink()
+    (notes / "Plan.md").write_text("Moved; see [[Spec v2]].")
+    (notes / "Lonely.md").write_text("")
+    graph.refresh()
+    assert graph.outgoing("Home")[0] == {"path": "Plan.md", "display": "the plan"}
+    assert snapshot(graph) == snapshot(build(notes))
+
+    # Ids of removed notes are reused.
+    node, size = graph.node("Plan.md"), graph.size
+    graph.remove("Plan.md")
+    graph.update("Plan.md")
+    assert (graph.node("Plan.md"), graph.size) == (node, size)
+
+
+def test_incremental_updates_on_generated_vault(vault):
+    graph = build(vault)
+    for path in ("folder-00/note-00003.md", "folder-01/note-00004.md"):
+        (vault / path).unlink()
+        graph.remove(path)
+    (vault / "folder-02" / "note-00004.md").write_text(
+        "[[note-00003]] [[Templates/Meeting]]"
+    )
+    graph.update("folder-02/note-00004.md")
+    assert snapshot(graph) == snapshot(build(vault))
+
+
+def test_embeds_and_heading_links(tmp_path):
+    (tmp_path / "Sub").mkdir()
+    (tmp_path / "Other").mkdir()
+    (tmp_path / "A.md").write_text(
+        "![[B]] ![[pic.png|200]] [[B#Intro|intro]] [[#Local]] [[Sub/C#^blk|c]]\n"
+        "[[ B ]] [[b]] [[sub/c]] [C](Sub/C.md#Heading) [x](#local) ![i](pic.png)"
+    )
+    (tmp_path / "B.md").write_text("[[A#Top|up]] [[missing]]")
+    (tmp_path / "Sub" / "C.md").write_text("")
+    (tmp_path / "Other" / "b.md").write_text("")
+    graph = build(tmp_path)
+    assert graph.outgoing("A") == [
+        {"path": "B.md", "display": "B"},
+        {"path": "pic.png", "display": "200"},
+        {"path": "B.md", "display": "intro"},
+        {"path": "Sub/C.md", "display": "c"},
+        {"path": "B.md", "display": "B"},
+        # Letter case is ignored, but an exact match wins.
+        {"path": "Other/b.md", "display": "b"},
+        {"path": "Sub/C.md", "display": "sub/c"},
+        {"path": "Sub/C.md", "display": "C"},
+        {"path": "pic.png", "display": "i"},
+    ]
+    assert graph.backlinks("B", counts=True) == [
+        {"path": "A.md", "display": "A", "count": 3}
+    ]
+    assert graph.backlinks("Sub/C.md", counts=True) == [
+        {"path": "A.md", "display": "A", "count": 3}
+    ]
+    # Attachments are neither notes nor unresolved links.
+    assert graph.unresolved() == [{"source": "B.md", "target": "missing"}]
+    assert graph.orphans() == []
+    assert graph.deadends() == [
+        {"path": "Other/b.md", "name": "b"},
+        {"path": "Sub/C.md", "name": "C"},
+    ]
+
+
+async def test_cli_links_from_graph(binary, vault):
+    async with ObsidianCLI(
+        "Bench", binary=binary, link_graph=True, metrics=True
+    ) as cli:
+        links = await cli.links.outgoing("folder-00/note-00000.md")
+        assert links and isinstance(links[0], LinkRecord)
+        assert cli.link_graph is not None
+        await cli.links.orphans()
+        assert [c.name for c in cli.metrics().commands] == ["vaults"]
+
+        with pytest.raises(CommandError, match='File "Nowhere" not found'):
+            await cli.links.incoming("Nowhere")
+        [found, missing] = await cli.links.outgoing_many(["note-00001", "Nowhere"])
+        assert isinstance(missing, CommandError) and not isinstance(found, CommandError)
+
+        await cli.vault.create("Zoo.md", content="[[folder-00/note-00000]]")
+        backlinks = await cli.links.incoming("folder-00/note-00000.md", raw=True)
+        assert {"path": "Zoo.md", "display": "Zoo"} in backlinks
+        await cli.vault.delete("Zoo.md")
+        assert {"path": "Zoo.md", "display": "Zoo"} not in await cli.links.incoming(
+            "folder-00/note-00000.md", raw=True
+        )
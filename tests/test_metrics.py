@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian._client import ObsidianClient
+from aiobsidian._exceptions import CLITimeoutError, CommandError, NotFoundError
+from aiobsidian._hooks import CommandEvent, route_template
+from aiobsidian._metrics import LatencyHistogram, MetricsRegistry
+
+
+@pytest.fixture
+def fake_binary(make_binary):
+    return make_binary(
+        """
+        import sys, time
+        args = dict(a.split("=", 1) for a in sys.argv[2:] if "=" in a)
+        if args.get("path") == "missing.md":
+            sys.stderr.write("File not found")
+            sys.exit(3)
+        if args.get("path") == "slow.md":
+            time.sleep(5)
+        sys.stdout.write("content")
+        """
+    )
+
+
+def cli_event(command: str, wall_time: float) -> CommandEvent:
+    return CommandEvent("cli", command, (), 0.0, wall_time=wall_time)
+
+
+class TestLatencyHistogram:
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(0.99) == 0.0
+        assert histogram.summary().count == 0
+
+    def test_percentiles_within_relative_error(self):
+        histogram = LatencyHistogram()
+        values = [i / 1000 for i in range(1, 1001)]  # 1 ms .. 1 s
+        for value in values:
+            histogram.record(value)
+
+        summary = histogram.summary()
+        assert summary.count == 1000
+        assert summary.min == 0.001
+        assert summary.max == 1.0
+        assert summary.sum == pytest.approx(sum(values))
+        for q, expected in ((0.5, 0.5), (0.95, 0.95), (0.99, 0.99)):
+            assert histogram.percentile(q) == pytest.approx(expected, rel=0.02)
+
+    def test_small_values_are_exact(self):
+        histogram = LatencyHistogram()
+        for _ in range(10):
+            histogram.record(0.000_050)
+        assert histogram.percentile(0.5) == pytest.approx(0.000_050)
+
+    def test_percentile_clamped_to_observed_range(self):
+        histogram = LatencyHistogram()
+        histogram.record(3.0)
+        assert histogram.percentile(0.5) == 3.0
+
+
+class TestRegistry:
+    def test_counts_and_in_flight(self):
+        registry = MetricsRegistry()
+        first, second = cli_event("read", 0.01), cli_event("read", 0.02)
+        registry.on_start(first)
+        registry.on_start(second)
+        assert registry.snapshot().in_flight == {"cli": 2, "rest": 0}
+
+        first.stdout_bytes = 10
+        registry.on_finish(first)
+        registry.on_error(second, CommandError("read", 3, "File not found"))
+
+        snapshot = registry.snapshot()
+        assert snapshot.in_flight == {"cli": 0, "rest": 0}
+        read = snapshot.get("read")
+        assert read is not None
+        assert read.calls == 2
+        assert read.errors == {"3": 1}
+        assert read.timeouts == 0
+        assert read.output_bytes == 10
+        assert read.latency.count == 2
+
+    def test_timeouts_and_cancellation(self):
+        registry = MetricsRegistry()
+        for error in (
+            CLITimeoutError("search", 1.0),
+            httpx.ReadTimeout("timed out"),
+            asyncio.CancelledError(),
+        ):
+            event = cli_event("search", 1.0)
+            registry.on_start(event)
+            registry.on_error(event, error)
+
+        search = registry.snapshot().get("search")
+        assert search is not None
+        assert search.timeouts == 2
+        assert search.errors == {
+            "CLITimeoutError": 1,
+            "ReadTimeout": 1,
+            "cancelled": 1,
+        }
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        event = cli_event("read", 0.01)
+        registry.on_start(event)
+        registry.on_finish(event)
+        registry.reset()
+        assert registry.snapshot().commands == []
+
+    def test_render_prometheus(self):
+        registry = MetricsRegistry()
+        event = cli_event('say "hi"', 0.25)
+        registry.on_start(event)
+        registry.on_error(event, CommandError("x", 2, ""))
+
+        text = registry.render_prometheus()
+        assert text.endswith("\n")
+        assert "# TYPE aiobsidian_in_flight gauge" in text
+        assert 'aiobsidian_in_flight{transport="cli"} 0' in text
+        labels = 'transport="cli",command="say \\"hi\\""'
+        assert f"aiobsidian_calls_total{{{labels}}} 1" in text
+        assert f'aiobsidian_errors_total{{{labels},code="2"}} 1' in text
+        assert "# TYPE aiobsidian_duration_seconds summary" in text
+        assert f'aiobsidian_duration_seconds{{{labels},quantile="0.99"}}' in text
+        assert f"aiobsidian_duration_seconds_count{{{labels}}} 1" in text
+        assert "aiobsidian_timeouts_total{" not in text
+
+
+@pytest.mark.parametrize(
+    ("path", "route"),
+    [
+        ("/", "/"),
+        ("/vault/", "/vault/"),
+        ("/vault/Daily/2024-01-01.md", "/vault/{path}"),
+        ("/vault/Daily/", "/vault/{path}/"),
+        ("/active/", "/active/"),
+        ("/periodic/daily/", "/periodic/{period}/"),
+        ("/periodic/daily/2024/1/2/", "/periodic/{period}/{year}/{month}/{day}/"),
+        ("/commands/", "/commands/"),
+        ("/commands/editor:save-file/", "/commands/{commandId}/"),
+        ("/search/simple/", "/search/simple/"),
+        ("/open/note.md", "/open/{filename}"),
+    ],
+)
+def test_route_template(path, route):
+    assert route_template(path) == route
+
+
+async def test_cli_metrics(fake_binary):
+    cli = ObsidianCLI("TestVault", binary=fake_binary, timeout=1.0, metrics=True)
+    await cli.vault.read("note.md")
+    with pytest.raises(CommandError):
+        await cli.vault.read("missing.md")
+    with pytest.raises(CLITimeoutError):
+        await cli.vault.read("slow.md")
+
+    read = cli.metrics().get("read")
+    assert read is not None
+    assert read.calls == 3
+    assert read.timeouts == 1
+    assert read.errors == {"3": 1, "CLITimeoutError": 1}
+    assert read.output_bytes == len("content")
+    assert read.latency.max >= 1.0
+    assert cli.metrics().in_flight["cli"] == 0
+
+
+async def test_rest_metrics(mock_api):
+    mock_api.get("/vault/a.md").respond(200, text="# A")
+    mock_api.get("/vault/missing.md").respond(404, json={"message": "Not Found"})
+    registry = MetricsRegistry()
+    http = httpx.AsyncClient(base_url="https://127.0.0.1:27124")
+    async with ObsidianClient("key", http_client=http, metrics=registry) as client:
+        await client.vault.get("a.md")
+        with pytest.raises(NotFoundError):
+            await client.vault.get("missing.md")
+
+    assert client.metrics_registry is registry
+    endpoint = client.metrics().get("GET /vault/{path}", transport="rest")
+    assert endpoint is not None
+    assert endpoint.calls == 2
+    assert endpoint.errors == {"404": 1}
+    assert endpoint.output_bytes > len("# A")
+
+
+def test_metrics_disabled():
+    cli = ObsidianCLI("TestVault", binary="/usr/bin/obsidian")
+    assert cli.metrics_registry is None
+    with pytest.raises(RuntimeError):
+        cli.metrics()
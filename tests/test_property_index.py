@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import datetime
+import os
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian.index import PropertyIndex
+
+
+@pytest.fixture
+def small(tmp_path):
+    root = tmp_path / "Small"
+    (root / "Projects").mkdir(parents=True)
+    (root / "a.md").write_text(
+        "---\nstatus: active\npriority: 3\ndue: 2024-05-01\ntags: [x, y]\n---\n"
+    )
+    (root / "b.md").write_text("---\nstatus: done\npriority: 1\nflag: true\n---\n")
+    (root / "Projects" / "c.md").write_text(
+        "---\nstatus: active\npriority: 4.5\ndue: 2025-01-10\nflag: 1\n---\n"
+    )
+    (root / "d.md").write_text("no frontmatter")
+    return root
+
+
+def build(root, **kwargs):
+    index = PropertyIndex(root, **kwargs)
+    index.build()
+    return index
+
+
+def test_equality_and_ranges(small):
+    index = build(small)
+    assert index.where(("status", "==", "active")) == ["a.md", "Projects/c.md"]
+    assert index.where(("status", "==", "active"), ("priority", ">", 3)) == [
+        "Projects/c.md"
+    ]
+    assert index.where(("priority", "<=", 3)) == ["a.md", "b.md"]
+    assert index.where(("priority", ">=", 3), path="Projects") == ["Projects/c.md"]
+    assert index.where(("due", "<", datetime.date(2025, 1, 1))) == ["a.md"]
+    assert index.where(("due", ">", "2024")) == ["a.md", "Projects/c.md"]
+    assert index.where(("tags", "==", "y")) == ["a.md"]
+    assert index.where(("status", "in", ["done", "idea"])) == ["b.md"]
+    assert index.where(("status", "!=", "done")) == ["a.md", "Projects/c.md"]
+    assert index.where(("status", "exists", False)) == ["d.md"]
+    assert index.where() == ["a.md", "b.md", "d.md", "Projects/c.md"]
+    assert index.where(("missing", "==", 1)) == []
+
+
+def test_typed_values(small):
+    index = build(small)
+    # `true` and `1` are different values.
+    assert index.where(("flag", "==", True)) == ["b.md"]
+    assert index.where(("flag", "==", 1)) == ["Projects/c.md"]
+    assert index.where(("priority", "==", 4.5)) == ["Projects/c.md"]
+    assert index.where(("priority", "==", "1")) == []
+    assert index.get("a.md")["tags"] == ["x", "y"]
+    assert index.keys() == {"due": 2, "flag": 2, "priority": 3, "status": 3, "tags": 1}
+    with pytest.raises(ValueError, match="Unknown operator"):
+        index.where(("status", "~", "a"))  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="Cannot compare"):
+        index.where(("priority", ">", None))
+
+
+def test_filtering_candidates_matches_index(vault):
+    index = build(vault)
+    # After a selective condition, the others are checked per note.
+    for condition in (
+        ("status", "!=", "idea"),
+        ("priority", ">=", 2),
+        ("created", "<", datetime.date(2024, 2, 1)),
+        ("tags", "in", ["status/active", "status/done"]),
+        ("done", "==", False),
+        ("done", "exists", True),
+        ("done", "exists", False),
+    ):
+        matching = index.where(condition)
+        for title in ("Note 7", "Note 12", "Note 40"):
+            selected = index.where(("title", "==", title))
+            expected = [path for path in matching if path in selected]
+            assert index.where(("title", "==", title), condition) == expected
+
+
+def test_incremental_updates_match_rebuild(vault):
+    index = build(vault)
+    note = vault / "folder-00" / "note-00000.md"
+    note.write_text("---\nstatus: archived\npriority: 99\n---\n")
+    index.update("folder-00/note-00000.md")
+    assert index.where(("priority", ">", 50)) == ["folder-00/note-00000.md"]
+
+    for _ in range(300):  # enough removals to trigger compaction
+        index.update("folder-01/note-00001.md")
+    (vault / "folder-02" / "note-00002.md").unlink()
+    index.refresh()
+    fresh = build(vault)
+    for conditions in (
+        [("status", "==", "active"), ("priority", ">=", 3)],
+        [("created", "<", "2024-01-20")],
+        [("done", "==", True), ("status", "!=", "idea")],
+        [("priority", ">", 50)],
+    ):
+        assert index.where(*conditions) == fresh.where(*conditions)
+    assert index.keys() == fresh.keys()
+    assert index.stats().files == fresh.stats().files == len(fresh)
+
+
+def test_max_age_refreshes_on_sync(small):
+    index = build(small, max_age=0.0)
+    assert index.needs_sync
+    note = small / "b.md"
+    note.write_text("---\nstatus: active\n---\n")
+    os.utime(note, ns=(0, 0))  # make sure the modification time changes
+    index.sync()
+    assert index.where(("status", "==", "done")) == []
+
+    index.max_age = None
+    assert not index.needs_sync
+
+
+def test_quoted_and_escaped_values(tmp_path):
+    (tmp_path / "q.md").write_text(
+        "---\n"
+        'title: "Say \\"hi\\"\\tnow"\n'
+        "code: '007'\n"
+        'count: "3"\n'
+        "size: 1_000\n"
+        "ratio: .5\n"
+        "owner:\n"
+        "tags:\n  - a b\n  - 'c, d'\n"
+        "---\n"
+    )
+    index = build(tmp_path)
+    assert index.get("q.md") == {
+        "title": 'Say "hi"\tnow',
+        "code": "007",
+        "count": "3",
+        "size": "1_000",
+        "ratio": 0.5,
+        "owner": None,
+        "tags": ["a b", "c, d"],
+    }
+    assert index.where(("count", "==", "3")) == ["q.md"]
+    assert index.where(("count", "==", 3)) == []
+    assert index.where(("size", ">", 10)) == []
+    assert index.where(("ratio", "<", 1)) == ["q.md"]
+    assert index.where(("owner", "==", None), ("owner", "exists", True)) == ["q.md"]
+    assert index.where(("tags", "==", "c, d")) == ["q.md"]
+
+
+async def test_cli_where(binary, vault):
+    async with ObsidianCLI(
+        "Bench", binary=binary, property_index=True, metrics=True
+    ) as cli:
+        active = await cli.properties.where(("status", "==", "active"))
+        assert active and cli.property_index is not None
+        assert [c.name for c in cli.metrics().commands] == ["vaults"]
+
+        path = "folder-00/note-00003.md"
+        await cli.properties.set(path, "priority", "42")
+        assert await cli.properties.where(("priority", "==", 42)) == [path]
+        await cli.properties.remove(path, "priority")
+        assert path in await cli.properties.where(("priority", "exists", False))
+
+    async with ObsidianCLI("Bench", binary=binary) as plain:
+        with pytest.raises(RuntimeError, match="property_index"):
+            await plain.properties.where(("status", "==", "active"))
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian.index import QuickSwitcher, SwitcherMatch
+from aiobsidian.index._frontmatter import parse_frontmatter
+
+
+@pytest.fixture
+def notes(tmp_path):
+    root = tmp_path / "Notes"
+    (root / "Projects").mkdir(parents=True)
+    (root / "Projects" / "Project Plan.md").write_text(
+        "---\naliases: [Roadmap, plan 2026]\n---\nbody"
+    )
+    (root / "Projects" / "Planning notes.md").write_text("planning")
+    (root / "Meeting notes.md").write_text("---\naliases:\n  - standup\n---\n")
+    (root / "meetingNotesArchive.md").write_text("---\nalias: archive\n---\n")
+    return root
+
+
+def build(root):
+    switcher = QuickSwitcher(root)
+    switcher.build()
+    return switcher
+
+
+def paths(matches):
+    return [match.path for match in matches]
+
+
+def test_parse_frontmatter():
+    text = '---\ntitle: "A: b"\nn: 3\nok: true\ntags:\n  - x\n  - 2\n---\nBody'
+    data, body = parse_frontmatter(text)
+    assert data == {"title": "A: b", "n": 3, "ok": True, "tags": ["x", 2]}
+    assert text[body:] == "Body"
+    assert parse_frontmatter("no frontmatter") == ({}, 0)
+    assert parse_frontmatter("---\nunterminated: 1") == ({}, 0)
+
+
+def test_parse_frontmatter_yaml_scalars():
+    text = (
+        "---\n"
+        'tab: "a\tb"\n'
+        'esc: "\\e[1m \\x41\\u00e9\\N \\q"\n'
+        "quote: 'it''s'\n"
+        "big: 1_000\n"
+        "nan: nan\n"
+        "inf: Infinity\n"
+        "exp: -1.5e3\n"
+        "yes: True\n"
+        "empty:\n"
+        "---\n"
+    )
+    data, _ = parse_frontmatter(text)
+    assert data == {
+        "tab": "a\tb",
+        "esc": "\x1b[1m A\xe9\x85 \\q",
+        "quote": "it's",
+        "big": "1_000",
+        "nan": "nan",
+        "inf": "Infinity",
+        "exp": -1500.0,
+        "yes": True,
+        "empty": None,
+    }
+
+
+def test_escaped_aliases_do_not_abort_build(tmp_path):
+    (tmp_path / "a.md").write_text('---\naliases: ["Tab\there", "\\e"]\n---\n')
+    switcher = build(tmp_path)
+    assert switcher.aliases("a.md") == ["Tab\there", "\x1b"]
+
+
+def test_word_and_alias_matches(notes):
+    switcher = build(notes)
+    [first, second] = switcher.match("proj plan")
+    assert first == SwitcherMatch(
+        path="Projects/Project Plan.md",
+        text="Projects/Project Plan",
+        alias=False,
+        score=first.score,
+        positions=(0, 1, 2, 3, 17, 18, 19, 20),
+    )
+    assert second.path == "Projects/Planning notes.md"
+    assert first.score > second.score
+
+    [roadmap] = switcher.match("ROAD")
+    assert (roadmap.path, roadmap.text, roadmap.alias) == (
+        "Projects/Project Plan.md",
+        "Roadmap",
+        True,
+    )
+    assert paths(switcher.match("standup")) == ["Meeting notes.md"]
+    assert switcher.aliases("Projects/Project Plan.md") == ["Roadmap", "plan 2026"]
+    assert switcher.aliases("meetingNotesArchive.md") == ["archive"]
+
+
+def test_scattered_matches(notes):
+    switcher = build(notes)
+    # Initials match word starts, including camelCase humps.
+    [match] = switcher.match("mna")
+    assert match.path == "meetingNotesArchive.md"
+    assert match.positions == (0, 7, 12)
+    assert set(paths(switcher.match("mn"))) == {
+        "Meeting notes.md",
+        "meetingNotesArchive.md",
+    }
+    assert switcher.match("zq") == switcher.match("") == []
+    assert switcher.match("notes", limit=1)[0].path == "Meeting notes.md"
+    assert switcher.match("plan", limit=0) == []
+
+
+def test_every_match_is_a_subsequence(vault):
+    switcher = build(vault)
+    for query in ("note 12", "f1n3", "n4", "templ", "folder-02/note"):
+        needle = query.replace(" ", "")
+        matches = switcher.match(query, limit=1000)
+        assert matches
+        for match in matches:
+            assert "".join(match.text[i] for i in match.positions).lower() == needle
+        scores = [match.score for match in matches]
+        assert scores == sorted(scores, reverse=True)
+
+
+def test_incremental_updates_match_rebuild(vault):
+    switcher = build(vault)
+    (vault / "folder-00" / "Quokka.md").write_text("---\naliases: [Wallaby]\n---\n")
+    switcher.update("folder-00/Quokka.md")
+    assert paths(switcher.match("wallaby")) == ["folder-00/Quokka.md"]
+
+    for _ in range(300):  # enough removals to trigger compaction
+        switcher.update("folder-01/note-00001.md")
+    (vault / "folder-02" / "note-00002.md").unlink()
+    (vault / "folder-00" / "Quokka.md").rename(vault / "Quokka.md")
+    switcher.refresh()
+    fresh = build(vault)
+    for query in ("quokka", "wallaby", "note 2", "n1"):
+        assert switcher.match(query, limit=100) == fresh.match(query, limit=100)
+    assert switcher.stats().files == fresh.stats().files == len(fresh)
+
+
+def test_alias_edge_cases(tmp_path):
+    (tmp_path / "a.md").write_text(
+        "---\naliases: [\"Ünïcode Café\", 'it''s', 2024, \"x\\ty\"]\n---\n"
+    )
+    (tmp_path / "b.md").write_text("---\nalias: ŒUVRE\n---\n")
+    (tmp_path / "c.md").write_text("---\naliases:\ntitle: none\n---\n")
+    switcher = build(tmp_path)
+    assert switcher.aliases("a.md") == ["Ünïcode Café", "it's", "2024", "x\ty"]
+    assert switcher.aliases("b.md") == ["ŒUVRE"]
+    assert switcher.aliases("c.md") == []
+
+    [match] = switcher.match("ÜNÏCODE CAFÉ")
+    assert (match.path, match.text, match.alias) == ("a.md", "Ünïcode Café", True)
+    assert match.positions == (0, 1, 2, 3, 4, 5, 6, 8, 9, 10, 11)
+    [match] = switcher.match("œuvre")
+    assert (match.text, match.positions) == ("ŒUVRE", (0, 1, 2, 3, 4))
+    assert paths(switcher.match("it's")) == ["a.md"]
+    assert switcher.match("unicode") == []  # accents are not folded away
+
+
+async def test_cli_quick_switch(binary, vault):
+    async with ObsidianCLI(
+        "Bench", binary=binary, quick_switcher=True, metrics=True
+    ) as cli:
+        [match] = await cli.vault.quick_switch("note-00042")
+        assert match.path == "folder-00/note-00042.md"
+        assert cli.quick_switcher is not None
+        assert [c.name for c in cli.metrics().commands] == ["vaults"]
+
+        await cli.vault.create("Zoo/Quokka.md", content="---\naliases: [qk]\n---\n")
+        [created] = await cli.vault.quick_switch("qk", limit=1)
+        assert created.path == "Zoo/Quokka.md" and created.alias
+        await cli.vault.move("Zoo/Quokka.md", "Quokka.md")
+        assert paths(await cli.vault.quick_switch("quokka")) == ["Quokka.md"]
+        await cli.vault.delete("Quokka.md")
+        assert await cli.vault.quick_switch("quokka") == []
+
+    async with ObsidianCLI("Bench", binary=binary) as plain:
+        with pytest.raises(RuntimeError, match="quick_switcher"):
+            await plain.vault.quick_switch("note")
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from aiobsidian.models.records import LinkRecord, SearchHitRecord, TaskRecord
+
+
+def test_from_dict_known_fields():
+    task = TaskRecord.from_dict({"id": "1", "content": "Buy milk", "completed": False})
+    assert task == TaskRecord(id="1", content="Buy milk", completed=False)
+    assert task.extra is None
+
+
+def test_unknown_keys_kept_in_extra():
+    link = LinkRecord.from_dict({"path": "a.md", "display": "a", "count": 3})
+    assert link.path == "a.md"
+    assert link.extra == {"count": 3}
+    assert link.to_dict() == {"path": "a.md", "display": "a", "count": 3}
+
+
+def test_to_dict_omits_missing_fields():
+    hit = SearchHitRecord.from_dict({"file": "note.md", "score": 1.0})
+    assert hit.to_dict() == {"file": "note.md", "score": 1.0}
+
+
+def test_to_dict_keeps_explicit_nulls():
+    data = {"file": "note.md", "score": None, "line": None, "rank": None}
+    hit = SearchHitRecord.from_dict(data)
+    assert hit.score is None and hit.extra == {"rank": None}
+    assert hit.to_dict() == data
+    assert hit == SearchHitRecord(file="note.md", extra={"rank": None})
+    assert SearchHitRecord(file="note.md").to_dict() == {"file": "note.md"}
+
+
+def test_paths_are_interned():
+    tasks = TaskRecord.from_list(
+        [{"path": "".join(["notes/", "todo.md"]), "line": n} for n in range(2)]
+    )
+    assert tasks[0].path is tasks[1].path
+
+
+def test_records_are_slotted_and_frozen():
+    task = TaskRecord(id="1")
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        task.id = "2"  # type: ignore[misc]
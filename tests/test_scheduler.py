@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian._scheduler import CLIScheduler
+from aiobsidian._types import Priority
+
+
+def test_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        CLIScheduler(0)
+
+
+async def test_acquire_within_capacity():
+    scheduler = CLIScheduler(2)
+    await scheduler.acquire()
+    await scheduler.acquire()
+    stats = scheduler.stats()
+    assert stats.in_flight == 2
+    assert stats.queued == 0
+    assert stats.lanes[Priority.INTERACTIVE].started == 2
+    assert stats.lanes[Priority.INTERACTIVE].waited == 0
+
+
+async def test_queue_when_full():
+    scheduler = CLIScheduler(1)
+    await scheduler.acquire()
+    waiter = asyncio.create_task(scheduler.acquire(Priority.BACKGROUND))
+    await asyncio.sleep(0)
+
+    stats = scheduler.stats()
+    assert stats.queued == 1
+    assert stats.lanes[Priority.BACKGROUND].queued == 1
+
+    scheduler.release()
+    await waiter
+    stats = scheduler.stats()
+    assert stats.in_flight == 1
+    assert stats.queued == 0
+    assert stats.lanes[Priority.BACKGROUND].waited == 1
+    assert stats.lanes[Priority.BACKGROUND].wait_time_total > 0
+
+
+async def test_interactive_lane_first():
+    scheduler = CLIScheduler(1)
+    order: list[str] = []
+
+    async def job(name: str, priority: Priority) -> None:
+        async with scheduler.slot(priority):
+            order.append(name)
+
+    await scheduler.acquire()
+    tasks = [
+        asyncio.create_task(job("bulk-1", Priority.BACKGROUND)),
+        asyncio.create_task(job("bulk-2", Priority.BACKGROUND)),
+        asyncio.create_task(job("ui", Priority.INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["ui", "bulk-1", "bulk-2"]
+    assert scheduler.stats().in_flight == 0
+
+
+async def test_cancelled_waiter_leaves_queue():
+    scheduler = CLIScheduler(1)
+    await scheduler.acquire()
+    waiter = asyncio.create_task(scheduler.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert scheduler.stats().queued == 0
+    scheduler.release()
+    assert scheduler.stats().in_flight == 0
+
+
+async def test_unbounded():
+    scheduler = CLIScheduler(None)
+    for _ in range(100):
+        await scheduler.acquire()
+    assert scheduler.stats().in_flight == 100
+    assert scheduler.stats().max_concurrency is None
+
+
+async def test_lane_context():
+    assert CLIScheduler.current_priority() is Priority.INTERACTIVE
+    with CLIScheduler.lane(Priority.BACKGROUND):
+        assert CLIScheduler.current_priority() is Priority.BACKGROUND
+    assert CLIScheduler.current_priority() is Priority.INTERACTIVE
+
+
+async def test_execute_limits_processes():
+    cli = ObsidianCLI("TestVault", binary="/usr/bin/obsidian", max_concurrency=2)
+    running = 0
+    peak = 0
+
+    async def communicate():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return (b"ok", b"")
+
+    def spawn(*args, **kwargs):
+        process = AsyncMock()
+        process.communicate.side_effect = communicate
+        process.returncode = 0
+        return process
+
+    with patch("asyncio.create_subprocess_exec", side_effect=spawn):
+        with cli.lane(Priority.BACKGROUND):
+            results = await asyncio.gather(
+                *(cli._execute("read", params={"path": f"{i}.md"}) for i in range(6))
+            )
+
+    assert results == ["ok"] * 6
+    assert peak == 2
+    stats = cli.scheduler.stats()
+    assert stats.in_flight == 0
+    assert stats.lanes[Priority.BACKGROUND].started == 6
+    assert stats.lanes[Priority.BACKGROUND].waited == 4
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian.index import SearchIndex, TextMatch, VaultIndex
+from aiobsidian.models.records import SearchHitRecord
+
+MIXED = "folder-01/nested/mixed.md"
+TAIL = "folder-01/nested/tail.md"
+
+
+@pytest.fixture
+def notes(vault):
+    """The shared vault plus hand-written notes in `folder-01/nested`."""
+    nested = vault / "folder-01" / "nested"
+    nested.mkdir()
+    (nested / "mixed.md").write_text(
+        "Latency LATENCY latency\nlatencylatency\n\nTail line\r\nİstanbul latency\n",
+        newline="",
+    )
+    (nested / "tail.md").write_text("Tail line, tail LINE\n")
+    (vault / "folder-01" / "image.png").write_bytes(b"latency")
+    return vault
+
+
+@pytest.fixture
+def index(notes):
+    index = SearchIndex(notes)
+    index.build()
+    return index
+
+
+def test_scores_and_order(index):
+    nested = "folder-01/nested"
+    assert index.search("latency", path=nested) == [{"file": MIXED, "score": 6}]
+    assert index.search("LATENCY", path=nested, case=True) == [
+        {"file": MIXED, "score": 1}
+    ]
+    # Best score first, then by path.
+    assert index.search("tail line", path=nested, matches=True) == [
+        {
+            "file": TAIL,
+            "score": 2,
+            "matches": [{"line": 1, "text": "Tail line, tail LINE"}],
+        },
+        {
+            "file": MIXED,
+            "score": 1,
+            "matches": [{"line": 4, "text": "Tail line"}],
+        },
+    ]
+    assert index.search("tail", path=nested, limit=1) == [{"file": TAIL, "score": 2}]
+    # Attachments are not searched.
+    hits = index.search("latency", path="folder-01")
+    assert {"file": MIXED, "score": 6} in hits
+    assert all(hit["file"].endswith(".md") for hit in hits)
+    assert index.search("no such phrase") == index.search("") == []
+
+
+def test_dotted_capital_i(index):
+    # "İ" has no one-character lower case, so it only matches itself.
+    assert index.search("istanbul") == []
+    line = {"line": 5, "text": "İstanbul latency"}
+    expected = [{"file": MIXED, "score": 1, "matches": [line]}]
+    assert index.search("İSTANBUL", matches=True) == expected
+    assert index.search("stanbul L", matches=True) == expected
+    assert index.search("İstanbul", case=True) == [{"file": MIXED, "score": 1}]
+
+
+def test_context(index):
+    nested = "folder-01/nested"
+    assert index.context("latency", path=nested) == [
+        {
+            "file": MIXED,
+            "line": 1,
+            "context": ["Latency LATENCY latency", "latencylatency"],
+        },
+        {
+            "file": MIXED,
+            "line": 2,
+            "context": ["Latency LATENCY latency", "latencylatency", ""],
+        },
+        {"file": MIXED, "line": 5, "context": ["Tail line", "İstanbul latency"]},
+    ]
+    # Vault order: files before subfolders, then by name.
+    assert index.context("tail line", path="folder-01", lines=0) == [
+        {"file": MIXED, "line": 4, "context": ["Tail line"]},
+        {"file": TAIL, "line": 1, "context": ["Tail line, tail LINE"]},
+    ]
+    assert index.context("latency", path=nested, lines=2, limit=1) == [
+        {
+            "file": MIXED,
+            "line": 1,
+            "context": ["Latency LATENCY latency", "latencylatency", ""],
+        }
+    ]
+    assert index.context("LATENCY", path=nested, case=True, lines=0) == [
+        {"file": MIXED, "line": 1, "context": ["Latency LATENCY latency"]}
+    ]
+
+
+async def test_records_and_iter_query(binary, notes):
+    async with ObsidianCLI("Bench", binary=binary, search_index=True) as indexed:
+        records = await indexed.search.query("tail line", path="folder-01/nested")
+        assert records == [
+            SearchHitRecord(file=TAIL, score=2),
+            SearchHitRecord(file=MIXED, score=1),
+        ]
+        streamed = [
+            hit
+            async for hit in indexed.search.iter_query(
+                "tail line", path="folder-01/nested"
+            )
+        ]
+        assert streamed == records
+        assert await indexed.search.context(
+            "tail line", path="folder-01", lines=0, raw=True
+        ) == [
+            {"file": MIXED, "line": 4, "context": ["Tail line"]},
+            {"file": TAIL, "line": 1, "context": ["Tail line, tail LINE"]},
+        ]
+
+
+async def test_search_spawns_no_process(binary, vault):
+    async with ObsidianCLI(
+        "Bench", binary=binary, search_index=True, vault_path=vault, metrics=True
+    ) as indexed:
+        await indexed.search.query("latency")
+        await indexed.search.context("latency")
+        assert indexed.metrics().commands == []
+        assert indexed.search_index is not None
+        assert indexed.search_index.built
+
+
+async def test_follows_cli_writes(binary, vault):
+    async with ObsidianCLI("Bench", binary=binary, search_index=True) as indexed:
+        assert await indexed.search.query("zebra") == []
+
+        await indexed.vault.append("folder-00/note-00000.md", "a zebra crossing")
+        await indexed.vault.create("Zoo/new.md", content="zebra zebra")
+        assert await indexed.search.query("zebra", raw=True) == [
+            {"file": "Zoo/new.md", "score": 2},
+            {"file": "folder-00/note-00000.md", "score": 1},
+        ]
+
+        await indexed.vault.move("Zoo/new.md", "Archive/old.md")
+        await indexed.vault.delete("folder-00/note-00000.md")
+        assert await indexed.search.query("zebra", matches=True, raw=True) == [
+            {
+                "file": "Archive/old.md",
+                "score": 2,
+                "matches": [{"line": 1, "text": "zebra zebra"}],
+            }
+        ]
+
+
+def test_find_reports_spans(index, notes):
+    matches = index.find("latency", path="folder-01/nested")
+    assert matches[:3] == [
+        TextMatch("folder-01/nested/mixed.md", 1, 0, 0, 7, "Latency LATENCY latency"),
+        TextMatch("folder-01/nested/mixed.md", 1, 8, 8, 15, "Latency LATENCY latency"),
+        TextMatch(
+            "folder-01/nested/mixed.md", 1, 16, 16, 23, "Latency LATENCY latency"
+        ),
+    ]
+    text = (notes / matches[0].file).read_text()
+    for match in matches:
+        assert text[match.start : match.end].lower() == "latency"
+    assert [m.column for m in index.find("LATENCY", case=True)] == [8]
+    assert len(index.find("latency", limit=2)) == 2
+
+
+def test_overlapping_and_short_queries(index):
+    hits = index.search("latencylatency", matches=True)
+    assert hits == [
+        {
+            "file": "folder-01/nested/mixed.md",
+            "score": 1,
+            "matches": [{"line": 2, "text": "latencylatency"}],
+        }
+    ]
+    assert index.search("ab\ncd") == []
+    assert index.search("y", path="folder-01/nested")[0]["score"] == 6
+
+
+def test_incremental_updates(index, vault):
+    note = vault / "folder-02" / "note-00002.md"
+    note.write_text("fresh content about quokkas\n")
+    assert index.search("quokka") == []
+    index.update("folder-02/note-00002.md")
+    assert index.search("quokka") == [{"file": "folder-02/note-00002.md", "score": 1}]
+
+    note.unlink()
+    index.update("folder-02/note-00002.md")
+    assert index.search("quokka") == []
+    assert "folder-02/note-00002.md" not in index
+
+    (vault / "outside.md").write_text("quokka")
+    (vault / "folder-00" / "note-00003.md").unlink()
+    assert index.refresh() == 2
+    assert [hit["file"] for hit in index.search("quokka")] == ["outside.md"]
+    assert index.refresh() == 0
+
+
+def test_compaction_keeps_results(index, vault):
+    before = index.search("latency")
+    files = len(index)
+    for _ in range(300):
+        index.update("folder-00/note-00000.md")
+    assert index.search("latency") == before
+    assert len(index) == files
+    stats = index.stats()
+    assert stats.files == files
+    assert stats.memory > stats.characters > 0
+    assert stats.build_time > 0
+
+
+def test_requires_root():
+    index = SearchIndex()
+    with pytest.raises(RuntimeError, match="root="):
+        index.build()
+
+
+def test_subclass_must_implement_hooks():
+    class Partial(VaultIndex):
+        def _add(self, path, text):
+            pass
+
+        def _remove(self, path):
+            pass
+
+    with pytest.raises(TypeError, match="_clear"):
+        Partial()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from aiobsidian._singleflight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_operation():
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def operation() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    waiters = [asyncio.create_task(flight.run("k", operation)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*waiters) == [42] * 5
+    assert calls == 1
+    assert flight.coalesced == 4
+    assert len(flight) == 0
+
+
+async def test_different_keys_run_separately():
+    flight: SingleFlight[str, str] = SingleFlight()
+
+    async def operation(value: str) -> str:
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(
+        flight.run("a", lambda: operation("a")), flight.run("b", lambda: operation("b"))
+    )
+    assert results == ["a", "b"]
+    assert flight.coalesced == 0
+
+
+async def test_sequential_calls_rerun():
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+
+    async def operation() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flight.run("k", operation) == 1
+    assert await flight.run("k", operation) == 2
+
+
+async def test_exception_reaches_every_waiter():
+    flight: SingleFlight[str, int] = SingleFlight()
+
+    async def operation() -> int:
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.run("k", operation), flight.run("k", operation), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(flight) == 0
+
+
+async def test_cancelling_one_waiter_keeps_others():
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def operation() -> int:
+        await release.wait()
+        return 1
+
+    first = asyncio.create_task(flight.run("k", operation))
+    second = asyncio.create_task(flight.run("k", operation))
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    release.set()
+    assert await second == 1
+
+
+async def test_last_waiter_cancels_operation():
+    flight: SingleFlight[str, int] = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def operation() -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return 1
+
+    waiter = asyncio.create_task(flight.run("k", operation))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert len(flight) == 0
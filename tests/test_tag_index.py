@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian.index import TagIndex
+from aiobsidian.models.records import TagRecord
+
+
+@pytest.fixture
+def notes(tmp_path):
+    root = tmp_path / "Notes"
+    (root / "Work").mkdir(parents=True)
+    (root / "a.md").write_text(
+        "---\ntags: [project/alpha, '#todo']\n---\n#project/alpha/beta and #todo"
+    )
+    (root / "b.md").write_text("---\ntags: project, idea\n---\nSee x#not-a-tag")
+    (root / "Work" / "c.md").write_text("#project/gamma #project-x #todo")
+    (root / "d.md").write_text("no tags")
+    return root
+
+
+def build(root):
+    index = TagIndex(root)
+    index.build()
+    return index
+
+
+def test_prefix_queries(notes):
+    index = build(notes)
+    assert index.files("project") == ["a.md", "b.md", "Work/c.md"]
+    assert index.files("#project/") == index.files("project")
+    assert index.files("project/alpha") == ["a.md"]
+    assert index.files("proj") == index.files("project/delta") == []
+    assert index.get("project/gamma") == [{"path": "Work/c.md", "name": "c"}]
+    assert index.count("project") == 4
+    assert index.count("project", nested=False) == 1
+    assert index.count("todo") == 3
+    assert index.children() == ["idea", "project", "project-x", "todo"]
+    assert index.children("project") == ["project/alpha", "project/gamma"]
+    assert index.tags(prefix="project/alpha", counts=True) == [
+        {"name": "project/alpha", "count": 1},
+        {"name": "project/alpha/beta", "count": 1},
+    ]
+
+
+def test_list_sort_and_path(notes):
+    index = build(notes)
+    assert [tag["name"] for tag in index.tags()] == [
+        "idea",
+        "project",
+        "project-x",
+        "project/alpha",
+        "project/alpha/beta",
+        "project/gamma",
+        "todo",
+    ]
+    assert index.tags(sort="count", counts=True)[0] == {"name": "todo", "count": 3}
+    assert index.tags(path="Work", counts=True) == [
+        {"name": "project-x", "count": 1},
+        {"name": "project/gamma", "count": 1},
+        {"name": "todo", "count": 1},
+    ]
+    assert index.tags(path="Work", prefix="project") == [{"name": "project/gamma"}]
+    assert index.stats().tags == 7
+
+
+def test_incremental_updates_match_rebuild(notes):
+    index = build(notes)
+    # Materialise the ordered lists, which are then kept up to date.
+    assert index.files("project") == ["a.md", "b.md", "Work/c.md"]
+    assert index.tags(path="Work") == index.tags(path="Work/c.md")
+    (notes / "a.md").write_text("#project/delta")
+    index.update("a.md")
+    assert index.children("project") == ["project/delta", "project/gamma"]
+    assert index.files("project/alpha") == []
+    (notes / "Work" / "c.md").unlink()
+    index.refresh()
+    fresh = build(notes)
+    assert index.tags(counts=True) == fresh.tags(counts=True)
+    assert (
+        index.stats().nodes == fresh.stats().nodes == 3
+    )  # idea, project, project/delta
+    for tag in ("project", "project/gamma", "todo", "idea"):
+        assert index.files(tag) == fresh.files(tag)
+    (notes / "Work" / "e.md").write_text("#project")
+    index.update("Work/e.md")
+    assert index.files("project") == ["a.md", "b.md", "Work/e.md"]
+    assert index.tags(path="Work/") == [{"name": "project"}]
+
+
+def test_nested_tag_edge_cases(tmp_path):
+    (tmp_path / "a.md").write_text(
+        "---\ntags:\n  - a/b/c\n  - '#a/b/'\n---\n"
+        "#a/b/c/ #a//x #a/b-c #2024 #2024/q #y2024 (#paren) foo#no [[n#h]] #café/ü"
+    )
+    (tmp_path / "b.md").write_text("---\ntags: a/b, a\n---\n# Heading\n#A/b")
+    index = build(tmp_path)
+    assert index.tags(counts=True) == [
+        {"name": "2024/q", "count": 1},
+        {"name": "A/b", "count": 1},
+        {"name": "a", "count": 1},
+        {"name": "a/b", "count": 2},
+        {"name": "a/b-c", "count": 1},
+        {"name": "a/b/c", "count": 2},
+        {"name": "a/x", "count": 1},
+        {"name": "café/ü", "count": 1},
+        {"name": "paren", "count": 1},
+        {"name": "y2024", "count": 1},
+    ]
+    # Empty levels are dropped, so nothing nests under "a/" or "a/b/".
+    assert index.children("a") == ["a/b", "a/b-c", "a/x"]
+    assert index.children("a/b/") == ["a/b/c"]
+    assert index.count("a") == 7
+    assert index.count("a/b", nested=False) == 2
+    assert index.files("a/b/c") == ["a.md"]
+    assert index.files("café") == ["a.md"]
+    assert index.files("2024") == ["a.md"]  # parent of a real tag
+    assert index.files("y") == index.files("a/b/c/d") == []
+
+
+async def test_cli_tags_from_index(binary, vault):
+    async with ObsidianCLI("Bench", binary=binary, tag_index=True, metrics=True) as cli:
+        tags = await cli.tags.list(counts=True)
+        assert tags and isinstance(tags[0], TagRecord)
+        assert [tag async for tag in cli.tags.iter_list(counts=True)] == tags
+        assert cli.tag_index is not None
+        assert [c.name for c in cli.metrics().commands] == ["vaults"]
+
+        await cli.vault.create("Zoo.md", content="#zoo/quokka")
+        [record] = await cli.tags.get("zoo")
+        assert record.path == "Zoo.md"
+        await cli.tags.rename("zoo", "park")
+        assert await cli.tags.get("zoo") == []
+        assert await cli.tags.get("park/quokka", raw=True) == [
+            {"path": "Zoo.md", "name": "Zoo"}
+        ]
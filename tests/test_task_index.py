@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import datetime
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian.index import TaskIndex
+from aiobsidian.models.records import TaskRecord
+
+
+@pytest.fixture
+def notes(tmp_path):
+    root = tmp_path / "Notes"
+    (root / "Work").mkdir(parents=True)
+    (root / "a.md").write_text(
+        "---\ntags: [plan]\n---\n# Plan\n"
+        "- [ ] write #work/report 📅 2024-05-03\n"
+        "  * [x] draft #work\n"
+        "- [ ] call mum [due:: 2024-05-01]\n"
+        "-[ ] not a task\n"
+    )
+    (root / "Work" / "b.md").write_text(
+        "+ [X] ship #work (due:: 2024-04-30)\n- [ ] review #work/report\n"
+    )
+    (root / "c.md").write_text("no tasks")
+    return root
+
+
+def build(root):
+    index = TaskIndex(root)
+    index.build()
+    return index
+
+
+def lines(tasks):
+    return [f"{task['path']}:{task['line']}" for task in tasks]
+
+
+def test_parse_and_filter(notes):
+    index = build(notes)
+    assert lines(index.tasks()) == ["a.md:5", "a.md:7", "Work/b.md:2"]
+    assert lines(index.tasks(done=True)) == [
+        "a.md:5",
+        "a.md:6",
+        "a.md:7",
+        "Work/b.md:1",
+        "Work/b.md:2",
+    ]
+    [task] = index.query(completed=True, path="Work")
+    assert task == {
+        "id": "Work/b.md:1",
+        "content": "ship #work (due:: 2024-04-30)",
+        "completed": True,
+        "path": "Work/b.md",
+        "line": 1,
+        "status": "X",
+        "tags": ["work"],
+        "due": "2024-04-30",
+    }
+    assert lines(index.query(tag="#work/report")) == ["a.md:5", "Work/b.md:2"]
+    assert len(index.query(tag="work")) == 4
+    assert index.query(tag="plan") == []  # frontmatter tags are not task tags
+    assert lines(index.query(due_from="2024-05-01")) == ["a.md:5", "a.md:7"]
+    assert lines(index.query(due_to=datetime.date(2024, 5, 1), sort="due")) == [
+        "Work/b.md:1",
+        "a.md:7",
+    ]
+    assert lines(index.query(sort="due", limit=4)) == [
+        "Work/b.md:1",
+        "a.md:7",
+        "a.md:5",
+        "a.md:6",
+    ]
+    stats = index.stats()
+    assert (stats.files, stats.tasks, stats.open) == (3, 5, 3)
+    with pytest.raises(ValueError, match="date"):
+        index.query(due_to="soon")
+
+
+def test_updates_and_compaction(notes):
+    index = build(notes)
+    (notes / "a.md").write_text("- [x] done #work 📅 2024-06-01\n")
+    index.update("a.md")
+    assert lines(index.query(tag="work")) == ["a.md:1", "Work/b.md:1", "Work/b.md:2"]
+    (notes / "Work" / "b.md").unlink()
+    (notes / "d.md").write_text("- [ ] new")
+    index.refresh()
+    fresh = build(notes)
+    assert index.query() == fresh.query()
+    assert index.stats().rows > fresh.stats().rows
+    # Removed rows are compacted away once they outnumber live ones.
+    for _ in range(300):
+        index.update("d.md")
+    assert index.query() == fresh.query()
+    assert index.stats().rows < 300
+
+
+def test_custom_statuses(tmp_path):
+    (tmp_path / "a.md").write_text(
+        "- [-] dropped #work/old\n"
+        "- [/] halfway 📅 2024-05-02\n"
+        "\t- [>] deferred\n"
+        "- [ ] open #work/a/\n"
+        "- [] empty box\n"
+        "- [ab] two characters\n"
+        "- [?]no space\n"
+        "- [[link]] not a box\n"
+    )
+    index = build(tmp_path)
+    # Any character but a space checks the task off.
+    assert lines(index.tasks()) == ["a.md:4"]
+    assert [
+        (task["line"], task["status"], task["completed"], task["content"])
+        for task in index.query()
+    ] == [
+        (1, "-", True, "dropped #work/old"),
+        (2, "/", True, "halfway 📅 2024-05-02"),
+        (3, ">", True, "deferred"),
+        (4, " ", False, "open #work/a/"),
+    ]
+    assert [task["tags"] for task in index.query(tag="work")] == [
+        ["work/old"],
+        ["work/a"],
+    ]
+    assert lines(index.query(due_from="2024-05-01", completed=True)) == ["a.md:2"]
+    assert index.stats().open == 1
+
+    # Statuses survive compaction.
+    for _ in range(300):
+        (tmp_path / "b.md").write_text("- [ ] filler\n" * 3)
+        index.update("b.md")
+    assert [task["status"] for task in index.query(path="a.md")] == list("-/> ")
+
+
+async def test_cli_tasks_from_index(binary, vault):
+    async with ObsidianCLI("Bench", binary=binary, metrics=True) as cli:
+        with pytest.raises(RuntimeError, match="task_index"):
+            await cli.tasks.query()
+    async with ObsidianCLI(
+        "Bench", binary=binary, task_index=True, metrics=True
+    ) as cli:
+        tasks = await cli.tasks.list()
+        assert tasks and isinstance(tasks[0], TaskRecord)
+        assert [task async for task in cli.tasks.iter()] == tasks
+        assert cli.task_index is not None
+        assert [c.name for c in cli.metrics().commands] == ["vaults"]
+
+        first = tasks[0]
+        await cli.tasks.toggle(first.path, first.line)
+        [record] = await cli.tasks.query(completed=True, path=first.path, limit=1)
+        assert record.id == first.id and record.completed
+        assert "tags" in record.extra and "due" in record.extra
+        assert first.id not in [task.id for task in await cli.tasks.list()]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian._exceptions import CommandError
+from aiobsidian.testing import generate_vault
+from aiobsidian.testing.fake_obsidian import run, split_frontmatter
+
+
+@pytest.fixture
+def fake_cli(binary):
+    return ObsidianCLI("Bench", binary=binary)
+
+
+def test_generate_vault_is_deterministic(tmp_path):
+    first = generate_vault(tmp_path / "a", notes=10, folders=2)
+    second = generate_vault(tmp_path / "b", notes=10, folders=2)
+    files = sorted(p.relative_to(first) for p in first.rglob("*.md"))
+    assert len(files) == 11
+    assert files == sorted(p.relative_to(second) for p in second.rglob("*.md"))
+    for path in files:
+        assert (first / path).read_text() == (second / path).read_text()
+
+
+def test_generate_vault_frontmatter(vault):
+    text = (vault / "folder-01" / "note-00001.md").read_text()
+    data, body, _ = split_frontmatter(text)
+    assert data["title"] == "Note 1"
+    assert data["aliases"] == ["N1"]
+    assert isinstance(data["priority"], int)
+    assert isinstance(data["done"], bool)
+    assert body.startswith("# Note 1")
+
+
+def test_run_unknown_vault(tmp_path):
+    stdout, stderr, code = run(
+        ["read", "vault=Nope", "path=a.md"],
+        {"AIOBSIDIAN_FAKE_VAULTS": str(tmp_path)},
+    )
+    assert (stdout, code) == ("", 1)
+    assert "Vault" in stderr
+
+
+async def test_read_and_list(fake_cli, vault):
+    content = await fake_cli.vault.read("folder-00/note-00000.md")
+    assert content == (vault / "folder-00" / "note-00000.md").read_text()
+
+    files = await fake_cli.vault.list(folder="folder-01")
+    assert len(files) == 20
+    assert all(path.startswith("folder-01/") for path in files)
+
+
+async def test_missing_file_exit_code(fake_cli):
+    with pytest.raises(CommandError) as exc_info:
+        await fake_cli.vault.read("folder-00/missing.md")
+    assert exc_info.value.exit_code == 1
+    assert "not found" in exc_info.value.stderr
+
+
+async def test_writes_persist(fake_cli, vault):
+    await fake_cli.vault.create("new.md", "# New\n")
+    await fake_cli.vault.append("new.md", "more")
+    await fake_cli.properties.set("new.md", "status", "draft")
+
+    assert await fake_cli.properties.read("new.md", "status") == "draft"
+    text = (vault / "new.md").read_text()
+    assert text.startswith("---\nstatus: draft\n---\n")
+    assert "more" in text
+
+
+async def test_search(fake_cli):
+    results = await fake_cli.search.query("cache", limit=5)
+    assert 0 < len(results) <= 5
+
+
+async def test_links_and_tasks(fake_cli):
+    outgoing = await fake_cli.links.outgoing("folder-00/note-00000.md")
+    assert outgoing
+    unresolved = await fake_cli.links.unresolved()
+    assert unresolved
+
+    everything = await fake_cli.tasks.list(path="folder-02", done=True)
+    assert len(everything) == 20 * 3
+    todo = await fake_cli.tasks.list(path="folder-02")
+    assert todo == [task for task in everything if not task.completed]
+
+
+async def test_script_and_snapshot(fake_cli):
+    batch = fake_cli.script()
+    batch.read("folder-00/note-00000.md")
+    batch.outline("folder-00/note-00000.md")
+    content, outline = await batch.run()
+    assert content.startswith("---")
+    assert outline
+
+    notes = [note async for note in fake_cli.snapshot("folder-02/")]
+    assert len(notes) == 20
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from aiobsidian._batch import CLICall
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian._client import ObsidianClient
+from aiobsidian._exceptions import CommandError, NotFoundError
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind, StatusCode  # noqa: E402
+
+from aiobsidian._tracing import TracingHooks  # noqa: E402
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracing(exporter):
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return TracingHooks(provider)
+
+
+@pytest.fixture
+def fake_binary(make_binary):
+    return make_binary(
+        """
+        import sys
+        args = dict(a.split("=", 1) for a in sys.argv[2:] if "=" in a)
+        if args.get("path") == "missing.md":
+            sys.stderr.write("File not found")
+            sys.exit(3)
+        sys.stdout.write("content")
+        """
+    )
+
+
+async def test_cli_span(fake_binary, tracing, exporter):
+    cli = ObsidianCLI("TestVault", binary=fake_binary, tracing=tracing)
+    await cli.vault.read("note.md")
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "obsidian read"
+    assert span.kind == SpanKind.CLIENT
+    assert span.attributes["obsidian.command"] == "read"
+    assert span.attributes["obsidian.vault"] == "TestVault"
+    assert span.attributes["obsidian.exit_code"] == 0
+    assert span.attributes["obsidian.stdout_bytes"] == len("content")
+    assert "note.md" not in str(dict(span.attributes))
+
+
+async def test_cli_error_span(fake_binary, tracing, exporter):
+    cli = ObsidianCLI("TestVault", binary=fake_binary, tracing=tracing)
+    with pytest.raises(CommandError):
+        await cli.vault.read("missing.md")
+
+    (span,) = exporter.get_finished_spans()
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.attributes["error.type"] == "3"
+
+
+async def test_batch_parent_span(fake_binary, tracing, exporter):
+    cli = ObsidianCLI("TestVault", binary=fake_binary, tracing=tracing)
+    results = await cli.run_many(
+        CLICall("read", params={"path": path})
+        for path in ("a.md", "b.md", "missing.md")
+    )
+    assert isinstance(results[2], CommandError)
+
+    spans = exporter.get_finished_spans()
+    (batch,) = [span for span in spans if span.name == "obsidian batch"]
+    children = [span for span in spans if span.name == "obsidian read"]
+    assert len(children) == 3
+    assert all(span.parent.span_id == batch.context.span_id for span in children)
+    assert batch.attributes["obsidian.batch.calls"] == 3
+    assert batch.attributes["obsidian.batch.errors"] == 1
+    assert batch.status.status_code != StatusCode.ERROR
+
+
+async def test_rest_span(mock_api, tracing, exporter):
+    mock_api.get("/vault/a.md").respond(200, text="# A")
+    mock_api.get("/vault/missing.md").respond(404, json={"message": "Not Found"})
+    http = httpx.AsyncClient(base_url="https://127.0.0.1:27124")
+    async with ObsidianClient("key", http_client=http, tracing=tracing) as client:
+        await client.vault.get("a.md")
+        with pytest.raises(NotFoundError):
+            await client.vault.get("missing.md")
+
+    ok, failed = exporter.get_finished_spans()
+    assert ok.name == "GET /vault/{path}"
+    assert ok.attributes["http.request.method"] == "GET"
+    assert ok.attributes["http.route"] == "/vault/{path}"
+    assert ok.attributes["http.response.status_code"] == 200
+    assert failed.attributes["http.response.status_code"] == 404
+    assert failed.status.status_code == StatusCode.ERROR
+
+
+def test_tracing_disabled_by_default():
+    cli = ObsidianCLI("TestVault", binary="/usr/bin/obsidian")
+    assert cli._tracing is None
+    assert not cli._hooks
+
+
+def test_tracing_true_creates_hooks():
+    cli = ObsidianCLI("TestVault", binary="/usr/bin/obsidian", tracing=True)
+    client = ObsidianClient("key", tracing=True)
+    assert isinstance(cli._tracing, TracingHooks)
+    assert isinstance(client._tracing, TracingHooks)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian._exceptions import CLIError, CommandError
+
+CRLF_NOTE = "---\r\ntags: [a]\r\n---\r\nhello world\r\n"
+
+
+@pytest.fixture
+def notes(vault):
+    """The shared vault plus a hand-written `Zoo` folder."""
+    zoo = vault / "Zoo"
+    (zoo / "Sub" / "Deep").mkdir(parents=True)
+    (zoo / "A Sub").mkdir()
+    (zoo / "a.md").write_text(CRLF_NOTE, newline="")
+    (zoo / "b.md").write_text("---\nx: 1\n---\nx y")
+    (zoo / "img.png").write_bytes(b"\x89PNG")
+    (zoo / ".hidden.md").write_text("hidden")
+    (zoo / "A Sub" / "d.md").write_text("---\nunterminated\nd")
+    (zoo / "Sub" / "c.md").write_text("one two  three")
+    (zoo / "Sub" / "Deep" / "e.md").write_text("")
+    (vault / ".obsidian" / "app.json").write_text("{}")
+    os.utime(zoo / "a.md", ns=(1_700_000_000_000_000_000, 1_700_000_000_123_000_000))
+    return vault
+
+
+@pytest.fixture
+async def direct(binary, notes):
+    async with ObsidianCLI("Bench", binary=binary, read_backend="filesystem") as cli:
+        yield cli
+
+
+async def test_list_and_folders(direct):
+    # Depth-first: a folder's files by name, then its subfolders.
+    assert await direct.vault.list("Zoo") == [
+        "Zoo/a.md",
+        "Zoo/b.md",
+        "Zoo/img.png",
+        "Zoo/A Sub/d.md",
+        "Zoo/Sub/c.md",
+        "Zoo/Sub/Deep/e.md",
+    ]
+    assert await direct.vault.list(folder="Zoo/Sub", ext="md") == [
+        "Zoo/Sub/c.md",
+        "Zoo/Sub/Deep/e.md",
+    ]
+    assert await direct.vault.list(ext="png") == ["Zoo/img.png"]
+    assert await direct.vault.list("missing") == []
+    assert await direct.vault.list("Zoo/Sub", folder="Zoo/A Sub") == []
+    # Folders by name too: "Templates" and "Zoo" sort before "folder-00".
+    everything = await direct.vault.list()
+    assert len(everything) == 1 + 6 + 60
+    assert everything[:1] == ["Templates/Meeting.md"]
+    assert everything[1:7] == await direct.vault.list("Zoo")
+    assert everything[7:9] == ["folder-00/note-00000.md", "folder-00/note-00003.md"]
+
+    assert await direct.vault.folders("Zoo") == [
+        "Zoo/A Sub",
+        "Zoo/Sub",
+        "Zoo/Sub/Deep",
+    ]
+    assert await direct.vault.folders() == [
+        "Templates",
+        "Zoo",
+        "Zoo/A Sub",
+        "Zoo/Sub",
+        "Zoo/Sub/Deep",
+        "folder-00",
+        "folder-01",
+        "folder-02",
+    ]
+
+
+async def test_read_and_file_info(direct):
+    assert await direct.vault.read("Zoo/a.md") == CRLF_NOTE
+    info = await direct.vault.file_info("/Zoo/a.md")
+    assert info.pop("ctime") > 0
+    assert info == {
+        "path": "Zoo/a.md",
+        "name": "a",
+        "extension": "md",
+        "size": len(CRLF_NOTE.encode()),
+        "mtime": 1_700_000_000_123,
+    }
+    info = await direct.vault.file_info("Zoo/img.png")
+    assert (info["name"], info["extension"], info["size"]) == ("img", "png", 4)
+
+
+async def test_wordcount(direct):
+    # The frontmatter block is not counted, whatever the line endings.
+    assert await direct.vault.wordcount("Zoo/a.md") == {
+        "words": 2,
+        "characters": len("hello world\r\n"),
+    }
+    assert await direct.vault.wordcount("Zoo/b.md") == {"words": 2, "characters": 3}
+    # Unterminated frontmatter is body text.
+    assert await direct.vault.wordcount("Zoo/A Sub/d.md") == {
+        "words": 3,
+        "characters": 18,
+    }
+    # By note name, anywhere in the vault.
+    assert await direct.vault.wordcount("c") == {"words": 3, "characters": 14}
+    assert await direct.vault.wordcount("e") == {"words": 0, "characters": 0}
+
+
+async def test_iter_list_and_read_many(direct, notes):
+    assert [p async for p in direct.vault.iter_list("Zoo/Sub")] == [
+        "Zoo/Sub/c.md",
+        "Zoo/Sub/Deep/e.md",
+    ]
+
+    paths = ["Zoo/b.md", "missing.md", "Zoo/Sub/c.md"]
+    first, missing, last = await direct.vault.read_many(paths)
+    assert (first, last) == ("---\nx: 1\n---\nx y", "one two  three")
+    assert isinstance(missing, CommandError)
+    assert missing.exit_code == 1
+    assert missing.stderr == 'Error: File "missing.md" not found.'
+
+
+async def test_errors(direct):
+    cases = [
+        (direct.vault.read("missing.md"), 'Error: File "missing.md" not found.'),
+        (direct.vault.read("Zoo"), 'Error: File "Zoo" not found.'),
+        (direct.vault.file_info("Zoo/Sub"), 'Error: File "Zoo/Sub" not found.'),
+        (direct.vault.wordcount("nope"), 'Error: File "nope" not found.'),
+        (
+            direct.vault.read("../../etc/passwd"),
+            'Error: Path "../../etc/passwd" is outside the vault.',
+        ),
+    ]
+    for call, message in cases:
+        with pytest.raises(CommandError) as exc_info:
+            await call
+        assert exc_info.value.exit_code == 1
+        assert exc_info.value.stderr == message
+
+
+async def test_random_read(direct, notes):
+    content = await direct.random.read()
+    assert content in {p.read_text() for p in notes.rglob("*.md")}
+
+
+async def test_writes_go_through_cli(direct):
+    await direct.vault.append("folder-00/note-00000.md", "appended line")
+    assert (await direct.vault.read("folder-00/note-00000.md")).endswith(
+        "appended line"
+    )
+
+
+async def test_vault_located_once(binary, vault):
+    async with ObsidianCLI(
+        "Bench", binary=binary, read_backend="filesystem", metrics=True
+    ) as direct:
+        await direct.vault.list()
+        await direct.vault.read("folder-00/note-00000.md")
+        assert await direct._fs.root() == str(vault)
+        assert [c.name for c in direct.metrics().commands] == ["vaults"]
+
+
+async def test_explicit_vault_path(notes):
+    async with ObsidianCLI(
+        "Other", binary="/nonexistent", read_backend="filesystem", vault_path=notes
+    ) as direct:
+        assert await direct.vault.folders("Zoo/Sub") == ["Zoo/Sub/Deep"]
+
+
+async def test_unknown_vault(binary):
+    direct = ObsidianCLI("Nope", binary=binary, read_backend="filesystem")
+    with pytest.raises(CLIError, match="vault_path="):
+        await direct.vault.read("a.md")
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="read backend"):
+        ObsidianCLI("Vault", binary="/usr/bin/obsidian", read_backend="sql")
+
+
+async def test_raw_content_and_bad_files(direct, notes):
+    (notes / "crlf.md").write_bytes(b"one\r\ntwo\r\n")
+    (notes / "latin1.md").write_bytes("caf\xe9".encode("latin-1"))
+    assert await direct.vault.read("crlf.md") == "one\r\ntwo\r\n"
+
+    text, bad = await direct.vault.read_many(["crlf.md", "latin1.md"])
+    assert text == "one\r\ntwo\r\n"
+    assert isinstance(bad, CommandError)
+    assert bad.stderr == 'Error: File "latin1.md" is not a UTF-8 text file.'
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+from aiobsidian._cache import CLICache
+from aiobsidian._cli import ObsidianCLI
+from aiobsidian._watch import VaultEvent, VaultWatcher, _Batch
+from aiobsidian.testing import generate_vault, write_fake_binary
+
+linux = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+def merged(*changes):
+    batch = _Batch()
+    for change in changes:
+        batch.add(*change)
+    return [(e.kind, e.path, e.dest) for e in batch.drain()]
+
+
+def test_batch_coalescing():
+    assert merged(("created", "a.md"), ("modified", "a.md")) == [
+        ("created", "a.md", None)
+    ]
+    assert merged(("created", "a.md"), ("deleted", "a.md")) == []
+    assert merged(("deleted", "a.md"), ("created", "a.md")) == [
+        ("modified", "a.md", None)
+    ]
+    assert merged(("moved", "a.md", "b.md"), ("moved", "b.md", "c.md")) == [
+        ("moved", "a.md", "c.md")
+    ]
+    assert merged(("moved", "a.md", "b.md"), ("moved", "b.md", "a.md")) == [
+        ("modified", "a.md", None)
+    ]
+    assert merged(("created", ".tmp"), ("moved", ".tmp", "a.md")) == [
+        ("created", "a.md", None)
+    ]
+    assert merged(("moved", "a.md", "b.md"), ("deleted", "b.md")) == [
+        ("deleted", "a.md", None)
+    ]
+
+
+async def watch(watcher, *steps, settle=0.3):
+    """Run each step, letting the watcher catch up, and return all events."""
+    async with watcher:
+        events = watcher.events()
+        for step in steps:
+            step()
+            await asyncio.sleep(settle)
+    return [(e.kind, e.path, e.dest) async for e in events]
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@linux
+async def test_inotify_events(tmp_path):
+    write(tmp_path / "A" / "old.md", "x")
+    watcher = VaultWatcher(tmp_path, backend="inotify", debounce=0.02)
+
+    def edits():
+        write(tmp_path / "n.md", "a")
+        with open(tmp_path / "n.md", "a") as fh:
+            fh.write("b")
+        write(tmp_path / "tmp.md", "t")
+        os.remove(tmp_path / "tmp.md")
+        os.rename(tmp_path / "A" / "old.md", tmp_path / "A" / "new.md")
+        write(tmp_path / "B" / "x.md", "1")
+
+    def moves():
+        os.rename(tmp_path / "B", tmp_path / "C")
+        write(tmp_path / ".obsidian" / "workspace.json", "{}")
+
+    def later():
+        write(tmp_path / "C" / "x.md", "2")
+        (tmp_path / ".trash").mkdir()
+        os.rename(tmp_path / "n.md", tmp_path / ".trash" / "n.md")
+
+    assert await watch(watcher, edits, moves, later) == [
+        ("created", "n.md", None),
+        ("moved", "A/old.md", "A/new.md"),
+        ("created", "B", None),
+        ("created", "B/x.md", None),
+        ("moved", "B", "C"),
+        ("modified", "C/x.md", None),
+        ("deleted", "n.md", None),
+    ]
+    assert watcher.backend is None
+
+
+async def test_polling_events(tmp_path):
+    write(tmp_path / "a.md", "a")
+    write(tmp_path / "b.md", "b")
+    watcher = VaultWatcher(tmp_path, backend="polling", interval=0.05)
+
+    def edits():
+        write(tmp_path / "a.md", "changed")
+        os.rename(tmp_path / "b.md", tmp_path / "Sub" / "b.md")
+
+    def more():
+        os.remove(tmp_path / "a.md")
+        write(tmp_path / ".obsidian" / "app.json", "{}")
+
+    (tmp_path / "Sub").mkdir()
+    assert await watch(watcher, edits, more) == [
+        ("moved", "b.md", "Sub/b.md"),
+        ("modified", "a.md", None),
+        ("deleted", "a.md", None),
+    ]
+
+
+async def test_reported_changes_hide_their_echo(tmp_path):
+    watcher = VaultWatcher(tmp_path, debounce=0.02, interval=0.05)
+
+    def create():
+        write(tmp_path / "Zoo.md", "z")
+        watcher.invalidate("create", {"path": "Zoo.md", "content": "z"})
+
+    def rename():
+        os.rename(tmp_path / "Zoo.md", tmp_path / "Park.md")
+        watcher.invalidate("rename", {"path": "Zoo.md", "new-name": "Park"})
+
+    def edit():
+        # Not reported: seen on disk.
+        write(tmp_path / "Park.md", "edited elsewhere")
+
+    assert await watch(watcher, create, rename, edit) == [
+        ("created", "Zoo.md", None),
+        ("moved", "Zoo.md", "Park.md"),
+        ("modified", "Park.md", None),
+    ]
+
+
+@pytest.mark.parametrize("backend", ["auto", "polling"])
+async def test_edit_right_after_reported_change_is_delivered(tmp_path, backend):
+    write(tmp_path / "a.md", "a")
+    watcher = VaultWatcher(tmp_path, backend=backend, debounce=0.02, interval=0.05)
+
+    def both():
+        write(tmp_path / "a.md", "a+client")
+        watcher.report("modified", "a.md")
+        write(tmp_path / "a.md", "a+client, then an external edit")
+
+    assert await watch(watcher, both) == [
+        ("modified", "a.md", None),
+        ("modified", "a.md", None),
+    ]
+
+
+@linux
+async def test_inotify_rename_split_across_reads(tmp_path):
+    from aiobsidian._watch import _IN_MOVED_FROM, _IN_MOVED_TO, _Inotify
+
+    emitted = []
+    inotify = _Inotify(str(tmp_path), lambda *args: emitted.append(args))
+    inotify.start(asyncio.get_running_loop())
+    try:
+        root = inotify._watches[""]
+        inotify._handle(root, _IN_MOVED_FROM, 7, b"a.md")
+        await asyncio.sleep(0.01)  # the other half comes with the next read
+        inotify._handle(root, _IN_MOVED_TO, 7, b"b.md")
+        inotify._handle(root, _IN_MOVED_FROM, 8, b"c.md")
+        await asyncio.sleep(0.2)
+    finally:
+        await inotify.close()
+    assert emitted == [
+        ("moved", "a.md", "b.md", False),
+        ("deleted", "c.md", None, False),
+    ]
+
+
+async def test_events_after_close_end(tmp_path):
+    watcher = VaultWatcher(tmp_path, backend="polling")
+    await watcher.start()
+    assert watcher.running and watcher.backend == "polling"
+    await watcher.close()
+    assert [event async for event in watcher.events()] == []
+    with pytest.raises(ValueError, match="backend"):
+        VaultWatcher(tmp_path, backend="fsevents")  # type: ignore[arg-type]
+
+
+async def test_cli_follows_external_changes(tmp_path):
+    vault = generate_vault(tmp_path / "vaults" / "Bench", notes=20, folders=2)
+    binary = write_fake_binary(tmp_path / "bin", tmp_path / "vaults")
+    watcher = VaultWatcher(debounce=0.02, interval=0.05)
+    async with ObsidianCLI(
+        "Bench",
+        binary=binary,
+        cache=CLICache(),
+        tag_index=True,
+        watcher=watcher,
+        metrics=True,
+    ) as cli:
+        assert cli.watcher is watcher and watcher.root == str(vault)
+        events = watcher.events()
+        assert await cli.tags.get("zebra") == []
+        assert await cli.vault.read("folder-00/note-00000.md") != "new"
+
+        (vault / "Zebra.md").write_text("#zebra")
+        (vault / "folder-00" / "note-00000.md").write_text("new")
+        await asyncio.sleep(0.5)
+        [record] = await cli.tags.get("zebra")
+        assert record.path == "Zebra.md"
+        assert await cli.vault.read("folder-00/note-00000.md") == "new"
+
+        await cli.vault.create("Zoo.md", content="#zoo")
+        await asyncio.sleep(0.5)
+        assert [record.path for record in await cli.tags.get("zoo")] == ["Zoo.md"]
+
+        # An external edit right after a client write is not taken for
+        # its echo.
+        await cli.vault.append("Zoo.md", "#koala")
+        (vault / "Zoo.md").write_text("#wombat")
+        await asyncio.sleep(0.5)
+        assert [record.path for record in await cli.tags.get("wombat")] == ["Zoo.md"]
+    seen = [event async for event in events]
+    assert VaultEvent("created", "Zoo.md", source="client") in seen
+    assert [(e.kind, e.path) for e in seen].count(("created", "Zoo.md")) == 1
+    assert not watcher.running